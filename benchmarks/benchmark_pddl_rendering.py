@@ -0,0 +1,143 @@
+
+""" PDDL Rendering Benchmark
+    renders actions with a growing number of conditions and effects
+    and growing lists of facts into a shared buffer; the time per
+    condition and per fact should stay flat as the sizes grow
+
+    python3 benchmarks/benchmark_pddl_rendering.py  (with kant installed)
+"""
+
+import io
+import time
+from typing import Callable, Iterator, List
+
+from kant.kant_dto import (
+    Dto,
+    TypeDto,
+    ObjectDto,
+    FluentDto,
+    FactDto,
+    ConditionEffectDto,
+    ActionDto
+)
+
+ROBOT_TYPE = TypeDto("robot")
+WP_TYPE = TypeDto("wp")
+
+ROBOT_AT = FluentDto("robot_at", [ROBOT_TYPE, WP_TYPE])
+BATTERY_LEVEL = FluentDto("battery_level", [ROBOT_TYPE], is_numeric=True)
+
+
+def create_action(size: int) -> ActionDto:
+    """ create an action with some conditions and effects
+
+    Args:
+        size (int): number of conditions, and of effects
+
+    Returns:
+        ActionDto: action
+    """
+
+    r = ObjectDto(ROBOT_TYPE, "r")
+    wps = [ObjectDto(WP_TYPE, "wp" + str(i)) for i in range(size)]
+
+    conditions = [ConditionEffectDto(ROBOT_AT, [r, wp],
+                                     time=ConditionEffectDto.AT_START)
+                  for wp in wps]
+    effects = [ConditionEffectDto(BATTERY_LEVEL, [r], 1.0,
+                                  time=ConditionEffectDto.AT_END,
+                                  condition_effect=ConditionEffectDto.DECREASE)
+               for _ in wps]
+
+    return ActionDto("navigation", [r] + wps, conditions, effects)
+
+
+def iter_facts(size: int) -> Iterator[FactDto]:
+    """ create facts one by one, so big lists are not kept in memory
+
+    Args:
+        size (int): number of facts
+
+    Yields:
+        Iterator[FactDto]: fact
+    """
+
+    r = ObjectDto(ROBOT_TYPE, "r")
+    wps = [ObjectDto(WP_TYPE, "wp" + str(i)) for i in range(1000)]
+
+    for i in range(size):
+        if i % 2:
+            yield FactDto(ROBOT_AT, [r, wps[i % 1000]])
+        else:
+            yield FactDto(BATTERY_LEVEL, [r], i)
+
+
+def measure(function: Callable[[], None], repeat: int = 3) -> float:
+    """ best wall time of some runs
+
+    Args:
+        function (Callable[[], None]): function to run
+        repeat (int, optional): number of runs. Defaults to 3.
+
+    Returns:
+        float: seconds
+    """
+
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def report(title: str, sizes: List[int], times: List[float]) -> None:
+    """ print the time and the time per item of each size
+
+    Args:
+        title (str): benchmark title
+        sizes (List[int]): sizes
+        times (List[float]): seconds of each size
+    """
+
+    print(title)
+    print("%12s %12s %16s" % ("size", "seconds", "us/item"))
+
+    for size, seconds in zip(sizes, times):
+        print("%12d %12.4f %16.3f" % (size, seconds, seconds / size * 1e6))
+
+    print()
+
+
+def main() -> None:
+
+    # actions
+    sizes = [100, 200, 400, 800, 1600]
+    times = []
+
+    for size in sizes:
+        action_dto = create_action(size)
+        times.append(measure(lambda: action_dto.to_pddl()))
+
+    report("ActionDto.to_pddl by conditions", sizes, times)
+
+    # facts, the DTOs are created while they are written
+    sizes = [10 ** 4, 10 ** 5, 10 ** 6]
+    times = []
+
+    for size in sizes:
+        facts_time = measure(lambda: Dto.write_pddl_list(
+            io.StringIO(), iter_facts(size), "\t"), 1)
+        creation_time = measure(lambda: sum(1 for _ in iter_facts(size)), 1)
+        times.append(facts_time - creation_time)
+
+    report("Dto.write_pddl_list by facts", sizes, times)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 
-from typing import List
+from typing import Dict, List
 from kant.kant_dao import DaoFactoryMethod
 
 from kant.kant_dto import *
@@ -153,40 +153,31 @@ class Location:
     def get(name: str) -> "Location":
         dao_factory = DaoFactoryMethod.get_dao_factory()
         fact_dao = dao_factory.create_fact_dao()
-        object_dao = dao_factory.create_object_dao()
-
-        location = object_dao.get(name)
-
-        p_x = Location._find_fact(
-            location, fact_dao.get_by_fluent(pose_x.name)).value
-        p_y = Location._find_fact(
-            location, fact_dao.get_by_fluent(pose_y.name)).value
-        p_z = Location._find_fact(
-            location, fact_dao.get_by_fluent(pose_z.name)).value
-
-        q_x = Location._find_fact(
-            location, fact_dao.get_by_fluent(quaternion_x.name)).value
-        q_y = Location._find_fact(
-            location, fact_dao.get_by_fluent(quaternion_y.name)).value
-        q_z = Location._find_fact(
-            location, fact_dao.get_by_fluent(quaternion_z.name)).value
-        q_w = Location._find_fact(
-            location, fact_dao.get_by_fluent(quaternion_w.name)).value
-
-        if (p_x is None or p_y is None or p_z is None or
-                q_x is None or q_y is None or q_z is None or q_w is None):
-            return None
-
-        return Location(name,
-                        p_x, p_y, p_z,
-                        q_x, q_y, q_z, q_w)
+
+        # one indexed query for all the facts of the location
+        fact_dict = Location._get_fact_dict(fact_dao.get_by_object(name, 0))
+
+        values = []
+        for fluent_dto in (pose_x, pose_y, pose_z,
+                           quaternion_x, quaternion_y,
+                           quaternion_z, quaternion_w):
+
+            fact_dto = fact_dict.get(fluent_dto.name)
+
+            if fact_dto is None or fact_dto.value is None:
+                return None
+
+            values.append(fact_dto.value)
+
+        return Location(name, *values)
 
     @staticmethod
-    def _find_fact(object_dto: ObjectDto, fact_list: List[FactDto]) -> FactDto:
+    def _get_fact_dict(fact_list: List[FactDto]) -> Dict[str, FactDto]:
 
-        for fact_dto in fact_list:
+        fact_dict = {}
 
-            if object_dto in fact_dto.objects:
-                return fact_dto
+        for fact_dto in fact_list:
+            if not fact_dto.is_goal:
+                fact_dict[fact_dto.fluent.name] = fact_dto
 
-        return None
+        return fact_dict
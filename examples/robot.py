@@ -26,15 +26,12 @@ class Robot(WorldObject):
     def get(name: str) -> "Robot":
         dao_factory = DaoFactoryMethod.get_dao_factory()
         fact_dao = dao_factory.create_fact_dao()
-        object_dao = dao_factory.create_object_dao()
 
         robot = Robot(name)
 
         # search for robots facts
-        robot_object = object_dao.get(name)
-
-        at_fact = Location._find_fact(
-            robot_object, fact_dao.get_by_fluent(at.name))
+        at_fact = Location._get_fact_dict(
+            fact_dao.get_by_object(name, 0)).get(at.name)
 
         if at_fact:
             robot.at = Location.get(
@@ -83,15 +83,12 @@ class WorldObject:
     def get(name: str) -> "WorldObject":
         dao_factory = DaoFactoryMethod.get_dao_factory()
         fact_dao = dao_factory.create_fact_dao()
-        object_dao = dao_factory.create_object_dao()
 
         world_object = WorldObject(name)
 
         # search for world_objects facts
-        world_object_object = object_dao.get(name)
-
-        at_fact = Location._find_fact(
-            world_object_object, fact_dao.get_by_fluent(at.name))
+        at_fact = Location._get_fact_dict(
+            fact_dao.get_by_object(name, 0)).get(at.name)
 
         if at_fact:
             world_object.at = Location.get(
@@ -4,3 +4,12 @@ from kant.kant_dao.dao_factory.dao_factories.dao_factory import DaoFactory
 from kant.kant_dao.dao_factory.dao_factories.mongo_dao_factory import (
     MongoDaoFactory
 )
+from kant.kant_dao.dao_factory.dao_factories.memory_dao_factory import (
+    MemoryDaoFactory
+)
+from kant.kant_dao.dao_factory.dao_factories.sqlite_dao_factory import (
+    SqliteDaoFactory
+)
+from kant.kant_dao.dao_factory.dao_factories.mongo_raw_dao_factory import (
+    MongoRawDaoFactory
+)
@@ -53,3 +53,13 @@ class DaoFactory(ABC):
         Returns:
             FactDao: dao for fact
         """
+
+    def get_domain_version(self) -> int:
+        """ get the domain version, it changes with every write
+            of a type, a fluent or an action
+
+        Returns:
+            int: domain version, None if the factory does not track it
+        """
+
+        return None
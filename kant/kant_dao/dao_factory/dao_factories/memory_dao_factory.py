@@ -0,0 +1,84 @@
+
+""" Memory Dao Facory """
+
+from kant.kant_dao.memory_dao import (
+    MemoryStore,
+    MemoryTypeDao,
+    MemoryObjectDao,
+    MemoryFluentDao,
+    MemoryFactDao,
+    MemoryActionDao
+)
+
+from kant.kant_dao.dao_factory.dao_factories.dao_factory import DaoFactory
+
+
+class MemoryDaoFactory(DaoFactory):
+    """ Memory Dao Facory Class """
+
+    def __init__(self) -> None:
+        self._memory_store = MemoryStore()
+
+    def get_memory_store(self) -> MemoryStore:
+        """ memory store getter
+
+        Returns:
+            MemoryStore: store shared by the DAOs of this factory
+        """
+
+        return self._memory_store
+
+    def get_domain_version(self) -> int:
+        """ get the domain version, it changes with every write
+            of a type, a fluent or an action
+
+        Returns:
+            int: domain version
+        """
+
+        return self._memory_store.domain_version
+
+    def create_type_dao(self) -> MemoryTypeDao:
+        """ create a memory dao type object
+
+        Returns:
+            MemoryTypeDao: memory dao for type
+        """
+
+        return MemoryTypeDao(self._memory_store)
+
+    def create_fluent_dao(self) -> MemoryFluentDao:
+        """ create a memory dao fluent object
+
+        Returns:
+            MemoryFluentDao: memory dao for fluent
+        """
+
+        return MemoryFluentDao(self._memory_store)
+
+    def create_action_dao(self) -> MemoryActionDao:
+        """ create a memory dao action object
+
+        Returns:
+            MemoryActionDao: memory dao for action
+        """
+
+        return MemoryActionDao(self._memory_store)
+
+    def create_object_dao(self) -> MemoryObjectDao:
+        """ create a memory dao object object
+
+        Returns:
+            MemoryObjectDao: memory dao for object
+        """
+
+        return MemoryObjectDao(self._memory_store)
+
+    def create_fact_dao(self) -> MemoryFactDao:
+        """ create a memory dao fact object
+
+        Returns:
+            MemoryFactDao: memory dao for fact
+        """
+
+        return MemoryFactDao(self._memory_store)
@@ -1,9 +1,15 @@
 
 """ Mongo Dao Facory """
 
-from mongoengine import disconnect, connect
+import threading
+from typing import Dict, Type
+from mongoengine.connection import DEFAULT_CONNECTION_NAME
 
 from kant.kant_dao.mongo_dao import (
+    NumericStorage,
+    MongoTypeIndex,
+    MongoSavedIndex,
+    MongoDao,
     MongoTypeDao,
     MongoObjectDao,
     MongoFluentDao,
@@ -11,22 +17,124 @@ from kant.kant_dao.mongo_dao import (
     MongoActionDao
 )
 
+from kant.kant_dao.mongo_dao.mongo_connection import (
+    connect,
+    get_database,
+    use_alias
+)
+from kant.kant_dao.mongo_dao.mongo_models import (
+    ensure_indexes,
+    get_domain_version,
+    get_numeric_storage,
+    migrate_numeric_values,
+    set_numeric_storage
+)
+
 from kant.kant_dao.dao_factory.dao_factories.dao_factory import DaoFactory
 
 
 class MongoDaoFactory(DaoFactory):
-    """ Mongo Dao Facory Class """
-
-    def __init__(self, uri: str = "mongodb://localhost:27017/kant") -> None:
+    """ Mongo Dao Facory Class
+        each DAO is created once per uri and shared by all the callers;
+        the factory uses its own mongoengine alias, so factories with
+        different aliases do not close each other's connection and
+        their DAOs can be used from many threads; creating a DAO does
+        not connect, the indexes are created by the first query
+    """
+
+    def __init__(self, uri: str = "mongodb://localhost:27017/kant",
+                 numeric_storage: NumericStorage = None,
+                 alias: str = DEFAULT_CONNECTION_NAME) -> None:
+        self._daos: Dict[Type[MongoDao], MongoDao] = {}
+        self._daos_lock = threading.Lock()
+        self._alias = alias
         self.set_uri(uri)
-        self.connect()
+
+        # the mode is kept by alias, it is only changed if given
+        if numeric_storage is not None:
+            self.set_numeric_storage(numeric_storage)
 
     def connect(self):
-        """ connect to current uri
+        """ connect the alias to current uri, the client is created and
+            the indexes are created on the first query; it does nothing
+            if the alias is already connected to the uri
+        """
+
+        if connect(self._uri, self._alias, ensure_indexes):
+            with use_alias(self._alias):
+                MongoTypeIndex.get_type_index().invalidate()
+                MongoSavedIndex.get_saved_index().invalidate()
+
+    def ensure_indexes(self) -> None:
+        """ create the indexes of the mongo models now instead of on
+            the first query, it does nothing if they are already created
+        """
+
+        self.connect()
+        get_database(self._alias)
+
+    def migrate_documents(self) -> None:
+        """ backfill the ancestors of the types and objects stored by
+            previous versions; it reads every type and object, so it is
+            not called by the factory, and it is idempotent
         """
 
-        disconnect()
-        connect(host=self._uri)
+        self.connect()
+
+        with use_alias(self._alias):
+            MongoTypeDao._update_ancestors(check_objects=True)
+
+    def migrate_numeric_values(self) -> None:
+        """ rewrite the stored numeric values of facts and actions
+            with the current numeric storage mode, it is idempotent
+        """
+
+        self.connect()
+
+        with use_alias(self._alias):
+            migrate_numeric_values()
+
+    def get_domain_version(self) -> int:
+        """ get the domain version, it changes with every write
+            of a type, a fluent or an action
+
+        Returns:
+            int: domain version
+        """
+
+        self.connect()
+
+        with use_alias(self._alias):
+            return get_domain_version()
+
+    def get_alias(self) -> str:
+        """ alias getter
+
+        Returns:
+            str: mongoengine alias of the factory
+        """
+
+        return self._alias
+
+    def get_numeric_storage(self) -> NumericStorage:
+        """ numeric storage getter
+
+        Returns:
+            NumericStorage: numeric storage mode
+        """
+
+        return get_numeric_storage(self._alias)
+
+    def set_numeric_storage(self, numeric_storage: NumericStorage) -> None:
+        """ numeric storage setter, DOUBLE and DECIMAL128 modes
+            store native BSON values and read numeric values as float;
+            the mode is kept for the alias of the factory
+
+        Args:
+            numeric_storage (NumericStorage): numeric storage mode
+        """
+
+        set_numeric_storage(numeric_storage, self._alias)
 
     def get_uri(self) -> str:
         """ uri getter
@@ -38,43 +146,66 @@ class MongoDaoFactory(DaoFactory):
         return self._uri
 
     def set_uri(self, uri: str):
-        """ uri setter
+        """ uri setter, the cached DAOs are discarded and the new uri
+            is connected when the next DAO is created
 
         Args:
             uri (str): uri str
         """
 
-        self._uri = uri
+        with self._daos_lock:
+            self._uri = uri
+            self._daos.clear()
+
+    def _get_dao(self, dao_class: Type[MongoDao]) -> MongoDao:
+        """ get the shared DAO of a class, it is created on the first call
+            and only registers the uri, nothing is sent to the server
+
+        Args:
+            dao_class (Type[MongoDao]): mongo dao class
+
+        Returns:
+            MongoDao: mongo dao
+        """
+
+        with self._daos_lock:
+            self.connect()
+
+            if dao_class not in self._daos:
+                self._daos[dao_class] = dao_class(
+                    uri=self._uri, connect=False, alias=self._alias)
+
+            return self._daos[dao_class]
 
     def create_type_dao(self) -> MongoTypeDao:
-        """ create a mongo dao type object
+        """ get the shared mongo dao type object
 
         Returns:
             MongoTypeDao: mongoengine dao for type
         """
 
-        return MongoTypeDao(uri=self._uri, connect=False)
+        return self._get_dao(MongoTypeDao)
 
     def create_fluent_dao(self) -> MongoFluentDao:
-        """ create a mongo dao fluent object
+        """ get the shared mongo dao fluent object
 
         Returns:
             MongoFluentDao: mongoengine dao for fluent
         """
 
-        return MongoFluentDao(uri=self._uri, connect=False)
+        return self._get_dao(MongoFluentDao)
 
     def create_action_dao(self) -> MongoActionDao:
-        """ create a mongo dao action object
+        """ get the shared mongo dao action object
 
         Returns:
             MongoActionDao: mongoengine dao for action
         """
 
-        return MongoActionDao(uri=self._uri, connect=False)
+        return self._get_dao(MongoActionDao)
 
     def create_object_dao(self) -> MongoObjectDao:
-        """ create a mongo dao object object
+        """ get the shared mongo dao object object
 
         Args:
             uri (str, optional): Mongo uri. Defaults to None.
@@ -83,13 +214,13 @@ class MongoDaoFactory(DaoFactory):
             MongoObjectDao: mongoengine dao for object
         """
 
-        return MongoObjectDao(uri=self._uri, connect=False)
+        return self._get_dao(MongoObjectDao)
 
     def create_fact_dao(self) -> MongoFactDao:
-        """ create a mongo dao fact object
+        """ get the shared mongo dao fact object
 
         Returns:
             MongoFactDao: mongoengine dao for fact
         """
 
-        return MongoFactDao(uri=self._uri, connect=False)
+        return self._get_dao(MongoFactDao)
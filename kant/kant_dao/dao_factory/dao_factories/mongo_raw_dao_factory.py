@@ -0,0 +1,66 @@
+
+""" Mongo Raw Dao Facory """
+
+from kant.kant_dao.mongo_raw_dao import (
+    MongoRawTypeDao,
+    MongoRawObjectDao,
+    MongoRawFluentDao,
+    MongoRawFactDao,
+    MongoRawActionDao
+)
+
+from kant.kant_dao.dao_factory.dao_factories.mongo_dao_factory import (
+    MongoDaoFactory
+)
+
+
+class MongoRawDaoFactory(MongoDaoFactory):
+    """ Mongo Raw Dao Facory Class
+        its DAOs write with Mongoengine and read raw BSON documents,
+        each DAO is created once per uri and shared by all the callers
+    """
+
+    def create_type_dao(self) -> MongoRawTypeDao:
+        """ get the shared mongo raw dao type object
+
+        Returns:
+            MongoRawTypeDao: mongo raw dao for type
+        """
+
+        return self._get_dao(MongoRawTypeDao)
+
+    def create_fluent_dao(self) -> MongoRawFluentDao:
+        """ get the shared mongo raw dao fluent object
+
+        Returns:
+            MongoRawFluentDao: mongo raw dao for fluent
+        """
+
+        return self._get_dao(MongoRawFluentDao)
+
+    def create_action_dao(self) -> MongoRawActionDao:
+        """ get the shared mongo raw dao action object
+
+        Returns:
+            MongoRawActionDao: mongo raw dao for action
+        """
+
+        return self._get_dao(MongoRawActionDao)
+
+    def create_object_dao(self) -> MongoRawObjectDao:
+        """ get the shared mongo raw dao object object
+
+        Returns:
+            MongoRawObjectDao: mongo raw dao for object
+        """
+
+        return self._get_dao(MongoRawObjectDao)
+
+    def create_fact_dao(self) -> MongoRawFactDao:
+        """ get the shared mongo raw dao fact object
+
+        Returns:
+            MongoRawFactDao: mongo raw dao for fact
+        """
+
+        return self._get_dao(MongoRawFactDao)
@@ -0,0 +1,94 @@
+
+""" Sqlite Dao Facory """
+
+from kant.kant_dao.sqlite_dao import (
+    SqliteDatabase,
+    SqliteTypeDao,
+    SqliteObjectDao,
+    SqliteFluentDao,
+    SqliteFactDao,
+    SqliteActionDao
+)
+
+from kant.kant_dao.dao_factory.dao_factories.dao_factory import DaoFactory
+
+
+class SqliteDaoFactory(DaoFactory):
+    """ Sqlite Dao Facory Class """
+
+    def __init__(self, uri: str = "kant.db") -> None:
+        self._sqlite_database = SqliteDatabase(uri)
+
+    def get_uri(self) -> str:
+        """ uri getter
+
+        Returns:
+            str: uri str
+        """
+
+        return self._sqlite_database.get_uri()
+
+    def get_sqlite_database(self) -> SqliteDatabase:
+        """ sqlite database getter
+
+        Returns:
+            SqliteDatabase: database shared by the DAOs of this factory
+        """
+
+        return self._sqlite_database
+
+    def get_domain_version(self) -> int:
+        """ get the domain version, it changes with every write
+            of a type, a fluent or an action
+
+        Returns:
+            int: domain version
+        """
+
+        return self._sqlite_database.fetch_one(
+            "SELECT value FROM version WHERE name = 'domain'")[0]
+
+    def create_type_dao(self) -> SqliteTypeDao:
+        """ create a sqlite dao type object
+
+        Returns:
+            SqliteTypeDao: sqlite dao for type
+        """
+
+        return SqliteTypeDao(self._sqlite_database)
+
+    def create_fluent_dao(self) -> SqliteFluentDao:
+        """ create a sqlite dao fluent object
+
+        Returns:
+            SqliteFluentDao: sqlite dao for fluent
+        """
+
+        return SqliteFluentDao(self._sqlite_database)
+
+    def create_action_dao(self) -> SqliteActionDao:
+        """ create a sqlite dao action object
+
+        Returns:
+            SqliteActionDao: sqlite dao for action
+        """
+
+        return SqliteActionDao(self._sqlite_database)
+
+    def create_object_dao(self) -> SqliteObjectDao:
+        """ create a sqlite dao object object
+
+        Returns:
+            SqliteObjectDao: sqlite dao for object
+        """
+
+        return SqliteObjectDao(self._sqlite_database)
+
+    def create_fact_dao(self) -> SqliteFactDao:
+        """ create a sqlite dao fact object
+
+        Returns:
+            SqliteFactDao: sqlite dao for fact
+        """
+
+        return SqliteFactDao(self._sqlite_database)
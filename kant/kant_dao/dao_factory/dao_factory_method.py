@@ -1,11 +1,16 @@
 
 """ Dao Factory of Factories """
 
+import threading
+
 from kant.kant_dao.dao_factory.dao_families import DaoFamilies
 
 from kant.kant_dao.dao_factory.dao_factories import (
     DaoFactory,
-    MongoDaoFactory
+    MongoDaoFactory,
+    MongoRawDaoFactory,
+    MemoryDaoFactory,
+    SqliteDaoFactory
 )
 
 
@@ -13,15 +18,29 @@ class DaoFactoryMethod:
     """ Dao Factory of Factories Class """
 
     __shared_dao_factory: DaoFactory = None
+    __lock = threading.Lock()
 
     def __init__(self, family: int, **kwargs):
 
+        with DaoFactoryMethod.__lock:
+            self.__create_dao_factory(family, **kwargs)
+
+    def __create_dao_factory(self, family: int, **kwargs) -> None:
+        """ create the shared dao factory, only one thread at a time
+
+        Args:
+            family (int): dao family
+        """
+
         if not DaoFactoryMethod.__shared_dao_factory is None:
             raise Exception("This class is a singleton")
         else:
 
             self.__families_to_factory = {
-                DaoFamilies.MONGO: MongoDaoFactory
+                DaoFamilies.MONGO: MongoDaoFactory,
+                DaoFamilies.MEMORY: MemoryDaoFactory,
+                DaoFamilies.SQLITE: SqliteDaoFactory,
+                DaoFamilies.MONGO_RAW: MongoRawDaoFactory
             }
 
             args_dict = {}
@@ -56,4 +75,5 @@ class DaoFactoryMethod:
             clear the dao factory
         """
 
-        DaoFactoryMethod.__shared_dao_factory = None
+        with DaoFactoryMethod.__lock:
+            DaoFactoryMethod.__shared_dao_factory = None
@@ -12,3 +12,6 @@ class DaoFamilies(IntEnum):
         return count
 
     MONGO = auto()
+    MEMORY = auto()
+    SQLITE = auto()
+    MONGO_RAW = auto()
@@ -2,6 +2,7 @@
 """ Action Dao Interface """
 
 from abc import abstractmethod
+from typing import List
 from kant.kant_dto import ActionDto
 from kant.kant_dao.dao_interface import Dao
 
@@ -20,3 +21,16 @@ class ActionDao(Dao):
         Returns:
             ActionDto: ActionDto of the action name
         """
+
+    @abstractmethod
+    def get_page(self, after: str = None, limit: int = 100) -> List[ActionDto]:
+        """ get a page of ActionDto sorted by action name
+
+        Args:
+            after (str, optional): last action name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max ActionDto in the page. Defaults to 100.
+
+        Returns:
+            List[ActionDto]: list of ActionDto
+        """
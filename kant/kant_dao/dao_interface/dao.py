@@ -17,6 +17,15 @@ class Dao(ABC):
             List[Dto]: list of all Dto
         """
 
+    def count_all(self) -> int:
+        """ count all Dto
+
+        Returns:
+            int: number of Dto
+        """
+
+        return len(self.get_all())
+
     @abstractmethod
     def _save(self, pdd_dto: Dto) -> bool:
         """ save a Dto
@@ -53,6 +62,18 @@ class Dao(ABC):
             bool: succeed
         """
 
+    def save_many(self, pdd_dto_list: List[Dto]) -> List[bool]:
+        """ save or update a list of Dto
+
+        Args:
+            pdd_dto_list (List[Dto]): list of Dto to save or update
+
+        Returns:
+            List[bool]: succeed of each Dto
+        """
+
+        return [self.save(ele) for ele in pdd_dto_list]
+
     @abstractmethod
     def delete(self, pdd_dto: Dto) -> bool:
         """ delete a Dto
@@ -65,6 +86,18 @@ class Dao(ABC):
             bool: succeed
         """
 
+    def delete_many(self, pdd_dto_list: List[Dto]) -> List[bool]:
+        """ delete a list of Dto
+
+        Args:
+            pdd_dto_list (List[Dto]): list of Dto to delete
+
+        Returns:
+            List[bool]: succeed of each Dto
+        """
+
+        return [self.delete(ele) for ele in pdd_dto_list]
+
     @abstractmethod
     def delete_all(self) -> bool:
         """ delete all dtos
@@ -1,11 +1,15 @@
 
 """ Proposition Dao Interface """
 
+import datetime
 from abc import abstractmethod
-from typing import List
+from typing import Iterator, List, Tuple
 from kant.kant_dto import FactDto
 from kant.kant_dao.dao_interface import Dao
 
+# natural key of a fact: fluent name, object names and is_goal
+FactKey = Tuple[str, Tuple[str, ...], bool]
+
 
 class FactDao(Dao):
     """ Proposition Dao Abstract Class """
@@ -21,6 +25,58 @@ class FactDao(Dao):
             List[FactDto]: list of FactDto
         """
 
+    @abstractmethod
+    def get_by_object(self, object_name: str,
+                      position: int = None) -> List[FactDto]:
+        """ get all FactDto that have a given object as argument
+
+        Args:
+            object_name (str): object name
+            position (int, optional): argument position of the object,
+                                      None for any position. Defaults to None.
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+    @abstractmethod
+    def get_by_fluent_and_objects(self, fluent_name: str,
+                                  object_names: List[str]) -> List[FactDto]:
+        """ get all FactDto with a given fluent name and arguments,
+            that is, the fact and the goal if they exist
+
+        Args:
+            fluent_name (str): fluent name
+            object_names (List[str]): object names of the arguments
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+    def count_by_fluent(self, fluent_name: str) -> int:
+        """ count all FactDto with a given fluent name
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return len(self.get_by_fluent(fluent_name))
+
+    def exists_by_object(self, object_name: str) -> bool:
+        """ check if any FactDto has a given object as argument
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            bool: any FactDto with the object?
+        """
+
+        return len(self.get_by_object(object_name)) > 0
+
     @abstractmethod
     def get_goals(self) -> List[FactDto]:
         """ get all FactDto that are goals
@@ -29,6 +85,15 @@ class FactDao(Dao):
             List[FactDto]: list of FactDto
         """
 
+    def count_goals(self) -> int:
+        """ count all FactDto that are goals
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return len(self.get_goals())
+
     @abstractmethod
     def get_no_goals(self) -> List[FactDto]:
         """ get all FactDto that are not goals
@@ -45,6 +110,60 @@ class FactDao(Dao):
             List[FactDto]: list of FactDto
         """
 
+    def iter_by_fluent(self, fluent_name: str,
+                       batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto with a given fluent name,
+            facts are read and checked in batches
+
+        Args:
+            fluent_name (str): fluent name
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        yield from self.get_by_fluent(fluent_name)
+
+    def iter_goals(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto that are goals,
+            facts are read and checked in batches
+
+        Args:
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        yield from self.get_goals()
+
+    def iter_no_goals(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto that are not goals,
+            facts are read and checked in batches
+
+        Args:
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        yield from self.get_no_goals()
+
+    def iter_all(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto,
+            facts are read and checked in batches
+
+        Args:
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        yield from self.get_all()
+
     @abstractmethod
     def get_bool_facts(self) -> List[FactDto]:
         """ get all bool facts (facts with bool value)
@@ -60,3 +179,32 @@ class FactDao(Dao):
         Returns:
             List[FactDto]: list of FactDto
         """
+
+    def get_updated_since(self, date: datetime.datetime) -> List[FactDto]:
+        """ get all FactDto saved at or after a date
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[FactDto]: list of FactDto,
+                           None if the DAO does not keep the save dates
+        """
+
+        return None
+
+    def get_deleted_since(self, date: datetime.datetime) -> List[FactKey]:
+        """ get the natural keys of the facts deleted at or after a date;
+            deletions are only kept for a while and the ones cascaded
+            from other elements may be missing, so the caller must
+            check the number of facts
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[FactKey]: (fluent name, object names, is_goal) of each fact,
+                           None if the DAO does not keep the deletions
+        """
+
+        return None
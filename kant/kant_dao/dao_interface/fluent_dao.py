@@ -2,6 +2,7 @@
 """ Predicate Dao Interface """
 
 from abc import abstractmethod
+from typing import List
 from kant.kant_dto import FluentDto
 from kant.kant_dao.dao_interface import Dao
 
@@ -20,3 +21,16 @@ class FluentDao(Dao):
         Returns:
             FluentDto: FluentDto of the predicate name
         """
+
+    @abstractmethod
+    def get_page(self, after: str = None, limit: int = 100) -> List[FluentDto]:
+        """ get a page of FluentDto sorted by fluent name
+
+        Args:
+            after (str, optional): last fluent name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max FluentDto in the page. Defaults to 100.
+
+        Returns:
+            List[FluentDto]: list of FluentDto
+        """
@@ -1,7 +1,9 @@
 
 """ Object Dao Interface """
 
+import datetime
 from abc import abstractmethod
+from typing import List
 from kant.kant_dto import ObjectDto
 from kant.kant_dao.dao_interface import Dao
 
@@ -20,3 +22,43 @@ class ObjectDao(Dao):
         Returns:
             ObjectDto: ObjectDto of the object name
         """
+
+    @abstractmethod
+    def get_by_type(self, type_name: str,
+                    include_subtypes: bool = True) -> List[ObjectDto]:
+        """ get all ObjectDto of a given type sorted by object name
+
+        Args:
+            type_name (str): type name
+            include_subtypes (bool, optional): get also the objects of
+                                               the subtypes? Defaults to True.
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+    @abstractmethod
+    def get_page(self, after: str = None, limit: int = 100) -> List[ObjectDto]:
+        """ get a page of ObjectDto sorted by object name
+
+        Args:
+            after (str, optional): last object name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max ObjectDto in the page. Defaults to 100.
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+    def get_updated_since(self, date: datetime.datetime) -> List[ObjectDto]:
+        """ get all ObjectDto saved at or after a date
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto,
+                             None if the DAO does not keep the save dates
+        """
+
+        return None
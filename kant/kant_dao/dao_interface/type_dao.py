@@ -2,6 +2,7 @@
 """ Type Dao Interface """
 
 from abc import abstractmethod
+from typing import List
 from kant.kant_dto import TypeDto
 from kant.kant_dao.dao_interface import Dao
 
@@ -20,3 +21,16 @@ class TypeDao(Dao):
         Returns:
             TypeDto: TypeDto of the type name
         """
+
+    @abstractmethod
+    def get_page(self, after: str = None, limit: int = 100) -> List[TypeDto]:
+        """ get a page of TypeDto sorted by type name
+
+        Args:
+            after (str, optional): last type name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max TypeDto in the page. Defaults to 100.
+
+        Returns:
+            List[TypeDto]: list of TypeDto
+        """
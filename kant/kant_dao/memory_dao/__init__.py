@@ -0,0 +1,8 @@
+
+from kant.kant_dao.memory_dao.memory_store import MemoryStore
+from kant.kant_dao.memory_dao.memory_dao import MemoryDao
+from kant.kant_dao.memory_dao.memory_type_dao import MemoryTypeDao
+from kant.kant_dao.memory_dao.memory_object_dao import MemoryObjectDao
+from kant.kant_dao.memory_dao.memory_fluent_dao import MemoryFluentDao
+from kant.kant_dao.memory_dao.memory_fact_dao import MemoryFactDao
+from kant.kant_dao.memory_dao.memory_action_dao import MemoryActionDao
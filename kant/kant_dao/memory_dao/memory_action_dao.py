@@ -0,0 +1,503 @@
+
+""" Memory Action Dao """
+
+from typing import Dict, List
+
+from kant.kant_dao.dao_interface import ActionDao
+from kant.kant_dao.memory_dao import (
+    MemoryDao,
+    MemoryStore,
+    MemoryTypeDao,
+    MemoryFluentDao,
+    MemoryFactDao
+)
+
+from kant.kant_dao.memory_dao.memory_models import (
+    ActionModel,
+    ConditionEffectModel,
+    ParameterModel
+)
+
+from kant.kant_dto import (
+    ConditionEffectDto,
+    ActionDto,
+    ObjectDto,
+    FluentDto,
+    TypeDto
+)
+
+
+class MemoryActionDao(ActionDao, MemoryDao):
+    """ Memory Action Dao Class """
+
+    def __init__(self, memory_store: MemoryStore = None) -> None:
+
+        ActionDao.__init__(self)
+        MemoryDao.__init__(self, memory_store)
+
+        self._mem_type_dao = MemoryTypeDao(self.memory_store)
+        self._mem_fluent_dao = MemoryFluentDao(self.memory_store)
+
+    def __condition_effect_model_to_dto(self,
+                                        condition_effect_model: ConditionEffectModel,
+                                        parameter_dict: Dict[str, ObjectDto]
+                                        ) -> ConditionEffectDto:
+        """ convert a memory condition/effect model into a ConditionEffectDto
+
+        Args:
+            condition_effect_model
+            (ConditionEffectModel): memory condition/effect model
+
+            parameter_dict
+            (Dict[str, ObjectDto]): action parameters by name
+
+        Returns:
+            ConditionEffectDto: ConditionEffectDto
+        """
+
+        fluent_dto = self._mem_fluent_dao._model_to_dto(
+            self.memory_store.fluents[condition_effect_model.fluent])
+
+        condition_effect_dto = ConditionEffectDto(
+            fluent_dto,
+            condition_effect=condition_effect_model.condition_effect,
+            time=condition_effect_model.time)
+
+        if fluent_dto.is_numeric:
+            condition_effect_dto.value = condition_effect_model.numeric_value
+        else:
+            condition_effect_dto.value = condition_effect_model.bool_value
+
+        condition_effect_dto.objects = [
+            parameter_dict[parameter_name]
+            for parameter_name in condition_effect_model.parameters]
+
+        return condition_effect_dto
+
+    def _model_to_dto(self, action_model: ActionModel) -> ActionDto:
+        """ convert a memory action model into a ActionDto
+
+        Args:
+            action_model (ActionModel): memory action model
+
+        Returns:
+            ActionDto: ActionDto
+        """
+
+        action_dto = ActionDto(action_model.action_name)
+        action_dto.duration = action_model.duration
+        action_dto.durative = action_model.durative
+
+        parameters_list = []
+        conditions_list = []
+        effects_list = []
+        parameter_dict = {}
+
+        # ACTION PARAMS
+        for parameter_model in action_model.parameters:
+            type_dto = self._mem_type_dao._model_to_dto(
+                self.memory_store.types[parameter_model.type])
+            object_dto = ObjectDto(type_dto, parameter_model.name)
+            parameter_dict[parameter_model.name] = object_dto
+            parameters_list.append(object_dto)
+
+        # ACTION CONDIS
+        for condition_model in action_model.conditions:
+            condition_effect_dto = self.__condition_effect_model_to_dto(
+                condition_model, parameter_dict)
+            conditions_list.append(condition_effect_dto)
+
+        # ACTION EFFECTS
+        for effect_model in action_model.effects:
+            condition_effect_dto = self.__condition_effect_model_to_dto(
+                effect_model, parameter_dict)
+            effects_list.append(condition_effect_dto)
+
+        # SET SAME OBJECT FOR FLUENTS AND TYPES
+
+        fluent_dict = {}
+        type_dict = {}
+
+        # conditions/effct
+        for condition_effect_dto in list(conditions_list + effects_list):
+
+            fluent_dto: FluentDto = condition_effect_dto.fluent
+
+            # new fluent
+            if not fluent_dto.name in fluent_dict:
+
+                type_list = []
+                for type_dto in fluent_dto.types:
+
+                    # new type
+                    if not type_dto.name in type_dict:
+                        type_dict[type_dto.name] = type_dto
+
+                    # type already exists
+                    else:
+                        type_dto = type_dict[type_dto.name]
+
+                    type_list.append(type_dto)
+
+                fluent_dto.types = type_list
+                fluent_dict[fluent_dto.name] = fluent_dto
+
+            # fluent alrredy exists
+            else:
+                fluent_dto = fluent_dict[fluent_dto.name]
+
+            condition_effect_dto.fluent = fluent_dto
+
+        # parameters
+        for parameter_dto in parameters_list:
+
+            type_dto: TypeDto = parameter_dto.type
+
+            if not type_dto.name in type_dict:
+                type_dict[type_dto.name] = type_dto
+            else:
+                type_dto = type_dict[type_dto.name]
+                parameter_dto.type = type_dto
+
+        action_dto.parameters = parameters_list
+        action_dto.conditions = conditions_list
+        action_dto.effects = effects_list
+
+        return action_dto
+
+    @staticmethod
+    def __condition_effect_dto_to_model(condition_effect_dto: ConditionEffectDto
+                                        ) -> ConditionEffectModel:
+        """ convert a ConditionEffectDto into a memory condition/effect model
+
+        Args:
+            condition_effect_dto (ConditionEffectDto): ConditionEffectDto
+
+        Returns:
+            ConditionEffectModel: memory condition/effect model
+        """
+
+        parameter_names = [
+            object_dto.name for object_dto in condition_effect_dto.objects]
+
+        if condition_effect_dto.fluent.is_numeric:
+            return ConditionEffectModel(
+                condition_effect_dto.fluent.name, parameter_names,
+                numeric_value=condition_effect_dto.value,
+                condition_effect=condition_effect_dto.condition_effect,
+                time=condition_effect_dto.time)
+
+        return ConditionEffectModel(
+            condition_effect_dto.fluent.name, parameter_names,
+            bool_value=condition_effect_dto.value,
+            condition_effect=condition_effect_dto.condition_effect,
+            time=condition_effect_dto.time)
+
+    @staticmethod
+    def _dto_to_model(action_dto: ActionDto) -> ActionModel:
+        """ convert a ActionDto into a memory action model
+
+        Args:
+            action_dto (ActionDto): ActionDto
+
+        Returns:
+            ActionModel: memory action model
+        """
+
+        return ActionModel(
+            action_dto.name,
+            duration=action_dto.duration,
+            durative=action_dto.durative,
+            parameters=[ParameterModel(param.name, param.type.name)
+                        for param in action_dto.parameters],
+            conditions=[MemoryActionDao.__condition_effect_dto_to_model(
+                condition_dto) for condition_dto in action_dto.conditions],
+            effects=[MemoryActionDao.__condition_effect_dto_to_model(
+                effect_dto) for effect_dto in action_dto.effects])
+
+    @staticmethod
+    def _check_condition_efect_dto(condition_effect_dto: ConditionEffectDto,
+                                   parameter_dtos: List[ObjectDto]) -> bool:
+        """ check if the types of the objects of a codition/effect dto are
+            the same as the types of its fluent and if that objects are action parameters
+
+        Args:
+            condition_effect_dto
+            (ConditionEffectDto): ConditionEffectDto
+
+            parameter_dtos
+            (List[ObjectDto]): action parameters
+
+        Returns:
+            bool: condition/effect is correct?
+        """
+
+        # check if fact is correct
+        if(len(condition_effect_dto.objects) !=
+           len(condition_effect_dto.fluent.types)):
+            return False
+
+        object_dtos = condition_effect_dto.objects
+        type_dtos = condition_effect_dto.fluent.types
+
+        for object_dto, type_dto in zip(object_dtos, type_dtos):
+
+            # check if condition/effect object type is a parameter
+            if not object_dto in parameter_dtos:
+                return False
+
+            # check if condition/effect object type is correct
+            if not MemoryFactDao._check_type_dto(object_dto.type, type_dto):
+                return False
+
+        return True
+
+    @staticmethod
+    def _check_action_dto(action_dto: ActionDto) -> bool:
+        """ check if a ActionDto is correct:
+            condition and effect must be correct (similar to fact)
+
+        Args:
+            action_dto (ActionDto): ActionDto to check
+
+        Returns:
+            bool: is ActionDto correct?
+        """
+
+        for condi_effect_dto in (action_dto.conditions +
+                                 action_dto.effects):
+            if(not action_dto.durative and condi_effect_dto.time):
+                return False
+            elif(action_dto.durative and not condi_effect_dto.time):
+                return False
+
+            if not MemoryActionDao._check_condition_efect_dto(condi_effect_dto,
+                                                              action_dto.parameters):
+                return False
+
+        return True
+
+    def _exist_in_memory(self, action_dto: ActionDto) -> bool:
+        """ check if ActionDto exists
+
+        Args:
+            action_dto (ActionDto): ActionDto
+
+        Returns:
+            bool: ActionDto exists?
+        """
+
+        return action_dto.name in self.memory_store.actions
+
+    def _get_model(self, action_dto: ActionDto) -> ActionModel:
+        """ get the memory action model corresponding to a give ActionDto
+
+        Args:
+            action_dto (ActionDto): ActionDto
+
+        Returns:
+            ActionModel: memory action model
+        """
+
+        return self.memory_store.actions.get(action_dto.name)
+
+    def get(self, action_name: str) -> ActionDto:
+        """ get a ActionDto with a given action name
+            return None if there is no with that action name
+
+        Args:
+            action_name (str): action name
+
+        Returns:
+            ActionDto: ActionDto of the action name
+        """
+
+        action_model = self.memory_store.actions.get(action_name)
+
+        # check if action exists
+        if action_model:
+
+            action_dto = self._model_to_dto(action_model)
+
+            if not MemoryActionDao._check_action_dto(action_dto):
+                return None
+
+            return action_dto
+
+        return None
+
+    def get_all(self) -> List[ActionDto]:
+        """ get all ActionDto
+
+        Returns:
+            List[ActionDto]: list of all ActionDto
+        """
+
+        action_dto_list = []
+
+        for action_name in self.memory_store.action_names:
+            action_dto = self._model_to_dto(
+                self.memory_store.actions[action_name])
+            if MemoryActionDao._check_action_dto(action_dto):
+                action_dto_list.append(action_dto)
+
+        return action_dto_list
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[ActionDto]:
+        """ get a page of ActionDto sorted by action name
+
+        Args:
+            after (str, optional): last action name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max ActionDto in the page. Defaults to 100.
+
+        Returns:
+            List[ActionDto]: list of ActionDto
+        """
+
+        action_dto_list = []
+
+        for action_name in self.memory_store.get_page_names(
+                self.memory_store.action_names, after, limit):
+            action_dto = self._model_to_dto(
+                self.memory_store.actions[action_name])
+            if MemoryActionDao._check_action_dto(action_dto):
+                action_dto_list.append(action_dto)
+
+        return action_dto_list
+
+    def count_all(self) -> int:
+        """ count all ActionDto,
+            stored actions are counted without checking them
+
+        Returns:
+            int: number of ActionDto
+        """
+
+        return len(self.memory_store.actions)
+
+    def _propagate_saving(self, action_dto: ActionDto) -> bool:
+        """ save the types of the parameters and the fluents of the
+            conditions/effects of a ActionDto
+
+        Args:
+            action_dto (ActionDto): ActionDto
+
+        Returns:
+            bool: succeed
+        """
+
+        for parameter_dto in action_dto.parameters:
+            if not self._mem_type_dao.save(parameter_dto.type):
+                return False
+
+        fluent_dict = {}
+        for condi_effect_dto in (action_dto.conditions +
+                                 action_dto.effects):
+            fluent_dict[condi_effect_dto.fluent.name] = condi_effect_dto.fluent
+
+        for fluent_dto in fluent_dict.values():
+            if not self._mem_fluent_dao.save(fluent_dto):
+                return False
+
+        return True
+
+    def _save(self, action_dto: ActionDto) -> bool:
+        """ save a ActionDto
+            if the ActionDto is already saved return False, else return True
+
+        Args:
+            action_dto (ActionDto): ActionDto to save
+
+        Returns:
+            bool: succeed
+        """
+
+        if not self._check_action_dto(action_dto):
+            return False
+
+        if self._exist_in_memory(action_dto):
+            return False
+
+        # propagate saving
+        if not self._propagate_saving(action_dto):
+            return False
+
+        # saving
+        action_model = MemoryActionDao._dto_to_model(action_dto)
+        self.memory_store.save_action(action_model)
+        return True
+
+    def _update(self, action_dto: ActionDto) -> bool:
+        """ update a ActionDto
+            if the ActionDto is not saved return False, else return True
+
+        Args:
+            action_dto (ActionDto): ActionDto to update
+
+        Returns:
+            bool: succeed
+        """
+
+        if not self._check_action_dto(action_dto):
+            return False
+
+        # check if action exists
+        if self._exist_in_memory(action_dto):
+
+            # propagate saving
+            if not self._propagate_saving(action_dto):
+                return False
+
+            # updating
+            action_model = MemoryActionDao._dto_to_model(action_dto)
+            self.memory_store.save_action(action_model)
+            return True
+
+        return False
+
+    def save(self, action_dto: ActionDto) -> bool:
+        """ save or update a ActionDto
+            if the ActionDto is not saved it will be saved, else it will be updated
+
+        Args:
+            action_dto (ActionDto): ActionDto to save or update
+
+        Returns:
+            bool: succeed
+        """
+
+        if self._exist_in_memory(action_dto):
+            return self._update(action_dto)
+
+        return self._save(action_dto)
+
+    def delete(self, action_dto: ActionDto) -> bool:
+        """ delete a ActionDto
+            if the ActionDto is not saved return False, else return True
+
+        Args:
+            action_dto (ActionDto): ActionDto to delete
+
+        Returns:
+            bool: succeed
+        """
+
+        # check if action exists
+        if self._exist_in_memory(action_dto):
+            self.memory_store.delete_action(action_dto.name)
+            return True
+
+        return False
+
+    def delete_all(self) -> bool:
+        """ delete all actions
+
+        Returns:
+            bool: succeed
+        """
+
+        for action_name in list(self.memory_store.actions):
+            self.memory_store.delete_action(action_name)
+
+        return True
@@ -0,0 +1,70 @@
+
+""" Memory Dao Interface """
+
+from abc import ABC, abstractmethod
+from kant.kant_dao.memory_dao.memory_models import BaseModel
+from kant.kant_dao.memory_dao.memory_store import MemoryStore
+from kant.kant_dto import Dto
+
+
+class MemoryDao(ABC):
+    """ Memory Dao Abstract Class """
+
+    def __init__(self, memory_store: MemoryStore = None) -> None:
+
+        if memory_store is None:
+            memory_store = MemoryStore()
+
+        self.memory_store = memory_store
+
+    @property
+    def memory_store(self) -> MemoryStore:
+        return self._memory_store
+
+    @memory_store.setter
+    def memory_store(self, memory_store: MemoryStore) -> None:
+        self._memory_store = memory_store
+
+    @abstractmethod
+    def _get_model(self, dto: Dto) -> BaseModel:
+        """ get the memory model corresponding to a give Dto
+
+        Args:
+            dto (Dto): Dto
+
+        Returns:
+            BaseModel: memory model
+        """
+
+    @abstractmethod
+    def _exist_in_memory(self, dto: Dto) -> bool:
+        """ check if Dto exists
+
+        Args:
+            dto (Dto): Dto
+
+        Returns:
+            bool: Dto exists?
+        """
+
+    @abstractmethod
+    def _model_to_dto(self, model: BaseModel) -> Dto:
+        """ convert a memory model into a Dto
+
+        Args:
+            model (BaseModel): memory model
+
+        Returns:
+            Dto: Dto
+        """
+
+    @abstractmethod
+    def _dto_to_model(self, dto: Dto) -> BaseModel:
+        """ convert a Dto into a memory model
+
+        Args:
+            dto (Dto): Dto
+
+        Returns:
+            BaseModel: memory model
+        """
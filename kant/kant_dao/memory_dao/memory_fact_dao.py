@@ -0,0 +1,581 @@
+
+""" Memory Fact Dao """
+
+import datetime
+from typing import Iterable, Iterator, List, Dict
+
+from kant.kant_dao.dao_interface import FactDao
+from kant.kant_dao.dao_interface.fact_dao import FactKey
+from kant.kant_dao.memory_dao import (
+    MemoryDao,
+    MemoryStore,
+    MemoryFluentDao,
+    MemoryObjectDao
+)
+
+from kant.kant_dao.memory_dao.memory_models import FactModel
+
+from kant.kant_dto import FactDto
+from kant.kant_dto.type_dto import TypeDto
+
+
+class MemoryFactDao(FactDao, MemoryDao):
+    """ Memory Fact Dao Class """
+
+    def __init__(self, memory_store: MemoryStore = None) -> None:
+
+        FactDao.__init__(self)
+        MemoryDao.__init__(self, memory_store)
+
+        self._mem_object_dao = MemoryObjectDao(self.memory_store)
+        self._mem_fluent_dao = MemoryFluentDao(self.memory_store)
+
+    @staticmethod
+    def _add_fathers(type_dto: TypeDto, type_dict: Dict[str, TypeDto]) -> None:
+        """ add recursively type fathers to a dictionary
+
+        Args:
+            type_dto (TypeDto): starter type
+            type_dict (Dict[str, TypeDto]): dictionary
+        """
+
+        if not type_dto.name in type_dict:
+            type_dict[type_dto.name] = type_dto
+
+        if not type_dto.father is None:
+            MemoryFactDao._add_fathers(type_dto.father, type_dict)
+
+    def _model_to_dto(self, fact_model: FactModel) -> FactDto:
+        """ convert a memory fact model into a FactDto
+
+        Args:
+            fact_model (FactModel): memory fact model
+
+        Returns:
+            FactDto: FactDto
+        """
+
+        object_list = []
+        type_dict = {}
+
+        fluent_dto = self._mem_fluent_dao._model_to_dto(
+            self.memory_store.fluents[fact_model.fluent])
+
+        for type_dto in fluent_dto.types:
+            type_dict[type_dto.name] = type_dto
+
+        for object_name in fact_model.arguments:
+
+            object_dto = self._mem_object_dao._model_to_dto(
+                self.memory_store.objects[object_name])
+
+            MemoryFactDao._add_fathers(object_dto.type, type_dict)
+
+            object_dto.type = type_dict[object_dto.type.name]
+
+            object_list.append(object_dto)
+
+        fact_dto = FactDto(
+            fluent_dto, object_list)
+
+        fact_dto.is_goal = fact_model.is_goal
+
+        if fact_dto.fluent.is_numeric:
+            fact_dto.value = fact_model.numeric_value
+        else:
+            fact_dto.value = fact_model.bool_value
+
+        return fact_dto
+
+    @staticmethod
+    def _dto_to_model(fact_dto: FactDto) -> FactModel:
+        """ convert a FactDto into a memory fact model
+
+        Args:
+            fact_dto (FactDto): FactDto
+
+        Returns:
+            FactModel: memory fact model
+        """
+
+        object_names = [object_dto.name for object_dto in fact_dto.objects]
+
+        # value
+        if fact_dto.fluent.is_numeric:
+            return FactModel(fact_dto.fluent.name, object_names,
+                             numeric_value=fact_dto.value,
+                             is_goal=fact_dto.is_goal)
+
+        return FactModel(fact_dto.fluent.name, object_names,
+                         bool_value=fact_dto.value,
+                         is_goal=fact_dto.is_goal)
+
+    @staticmethod
+    def _check_type_dto(type_dto_1: TypeDto, type_dto_2: TypeDto) -> bool:
+        """ check if a type is or inherit from another type
+
+        Args:
+            type_dto_1 (TypeDto): type to check
+            type_dto_2 (TypeDto): target type
+
+        Returns:
+            bool: is or inherit?
+        """
+
+        if type_dto_1 == type_dto_2:
+            return True
+        else:
+            if not type_dto_1.father is None:
+                return MemoryFactDao._check_type_dto(type_dto_1.father, type_dto_2)
+            else:
+                return False
+
+    @staticmethod
+    def _check_fact_dto(fact_dto: FactDto) -> bool:
+        """ check if the types of the objects of a fact dto are
+            the same as the types of its fluent
+
+        Args:
+            fact_dto (FactDto): fact dto
+
+        Returns:
+            bool: poposition is correct?
+        """
+
+        # check if fact is correct
+        if(len(fact_dto.objects) != len(fact_dto.fluent.types)):
+            return False
+
+        object_dtos = fact_dto.objects
+        type_dtos = fact_dto.fluent.types
+
+        for object_dto, type_dto in zip(object_dtos, type_dtos):
+            # check if fact is correct
+            if not MemoryFactDao._check_type_dto(object_dto.type, type_dto):
+                return False
+
+        return True
+
+    def _exist_in_memory(self, fact_dto: FactDto) -> bool:
+        """ check if FactDto exists
+
+        Args:
+            fact_dto (FactDto): FactDto
+
+        Returns:
+            bool: FactDto exists?
+        """
+
+        return self._get_model(fact_dto) is not None
+
+    def _get_model(self, fact_dto: FactDto) -> FactModel:
+        """ get the memory fact model corresponding to a give FactDto
+
+        Args:
+            fact_dto (FactDto): FactDto
+
+        Returns:
+            FactModel: memory fact model
+        """
+
+        fact_key = (fact_dto.fluent.name,
+                    tuple(object_dto.name for object_dto in fact_dto.objects),
+                    fact_dto.is_goal)
+
+        return self.memory_store.facts.get(fact_key)
+
+    def _iter_models_to_dtos(self,
+                             fact_models: Iterable[FactModel]) -> Iterator[FactDto]:
+        """ convert memory fact models into correct FactDtos one by one
+
+        Args:
+            fact_models (Iterable[FactModel]): memory fact models
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        for ele in fact_models:
+            fact_dto = self._model_to_dto(ele)
+            if MemoryFactDao._check_fact_dto(fact_dto):
+                yield fact_dto
+
+    def _models_to_dtos(self, fact_models: List[FactModel]) -> List[FactDto]:
+        """ convert memory fact models into correct FactDtos
+
+        Args:
+            fact_models (List[FactModel]): memory fact models
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return list(self._iter_models_to_dtos(fact_models))
+
+    def get_by_fluent(self, fluent_name: str) -> List[FactDto]:
+        """ get all FactDto with a given fluent name
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._models_to_dtos(
+            self.memory_store.get_facts_by_fluent(fluent_name))
+
+    def count_by_fluent(self, fluent_name: str) -> int:
+        """ count all FactDto with a given fluent name,
+            stored facts are counted without checking them
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return len(self.memory_store.facts_by_fluent.get(fluent_name, ()))
+
+    def get_by_object(self, object_name: str,
+                      position: int = None) -> List[FactDto]:
+        """ get all FactDto that have a given object as argument
+
+        Args:
+            object_name (str): object name
+            position (int, optional): argument position of the object,
+                                      None for any position. Defaults to None.
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        fact_models = self.memory_store.get_facts_by_object(object_name)
+
+        if position is not None:
+            fact_models = [ele for ele in fact_models
+                           if position < len(ele.arguments) and
+                           ele.arguments[position] == object_name]
+
+        return self._models_to_dtos(fact_models)
+
+    def exists_by_object(self, object_name: str) -> bool:
+        """ check if any stored fact has a given object as argument
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            bool: any FactDto with the object?
+        """
+
+        return bool(self.memory_store.facts_by_object.get(object_name))
+
+    def get_by_fluent_and_objects(self, fluent_name: str,
+                                  object_names: List[str]) -> List[FactDto]:
+        """ get all FactDto with a given fluent name and arguments,
+            that is, the fact and the goal if they exist
+
+        Args:
+            fluent_name (str): fluent name
+            object_names (List[str]): object names of the arguments
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        fact_models = []
+
+        for is_goal in (False, True):
+            fact_model = self.memory_store.facts.get(
+                (fluent_name, tuple(object_names), is_goal))
+
+            if fact_model:
+                fact_models.append(fact_model)
+
+        return self._models_to_dtos(fact_models)
+
+    def _get_all(self, is_goal: bool = None) -> List[FactDto]:
+        """ get all FactDto
+            is_goal == None -> get all fact
+            is_goal == True -> gel all goals
+            is_goal == False -> getl no goals
+
+        Args:
+            is_goal (bool, optional): get all, all goals, all no goals?. Defaults to None.
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        if(is_goal is None):
+            fact_models = list(self.memory_store.facts.values())
+        else:
+            fact_models = self.memory_store.get_facts_by_goal(is_goal)
+
+        return self._models_to_dtos(fact_models)
+
+    def get_goals(self) -> List[FactDto]:
+        """ get all FactDto that are goals
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._get_all(is_goal=True)
+
+    def count_goals(self) -> int:
+        """ count all FactDto that are goals,
+            stored facts are counted without checking them
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return len(self.memory_store.facts_by_goal[True])
+
+    def get_no_goals(self) -> List[FactDto]:
+        """ get all FactDto that are not goals
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._get_all(is_goal=False)
+
+    def get_all(self) -> List[FactDto]:
+        """ get all FactDto
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._get_all()
+
+    def count_all(self) -> int:
+        """ count all FactDto,
+            stored facts are counted without checking them
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return len(self.memory_store.facts)
+
+    def iter_by_fluent(self, fluent_name: str,
+                       batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto with a given fluent name,
+            models are already in memory so they are converted one by one
+
+        Args:
+            fluent_name (str): fluent name
+            batch_size (int, optional): not used. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_models_to_dtos(
+            self.memory_store.get_facts_by_fluent(fluent_name))
+
+    def iter_goals(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto that are goals,
+            models are already in memory so they are converted one by one
+
+        Args:
+            batch_size (int, optional): not used. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_models_to_dtos(
+            self.memory_store.get_facts_by_goal(True))
+
+    def iter_no_goals(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto that are not goals,
+            models are already in memory so they are converted one by one
+
+        Args:
+            batch_size (int, optional): not used. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_models_to_dtos(
+            self.memory_store.get_facts_by_goal(False))
+
+    def iter_all(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto,
+            models are already in memory so they are converted one by one
+
+        Args:
+            batch_size (int, optional): not used. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_models_to_dtos(
+            list(self.memory_store.facts.values()))
+
+    def get_bool_facts(self) -> List[FactDto]:
+        """ get all bool facts (facts with bool value)
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._models_to_dtos(
+            [ele for ele in self.memory_store.get_facts_by_goal(False)
+             if not self.memory_store.fluents[ele.fluent].is_numeric])
+
+    def get_numeric_facts(self) -> List[FactDto]:
+        """ get all numeric functions (facts with numeric value)
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._models_to_dtos(
+            [ele for ele in self.memory_store.get_facts_by_goal(False)
+             if self.memory_store.fluents[ele.fluent].is_numeric])
+
+    def get_updated_since(self, date: datetime.datetime) -> List[FactDto]:
+        """ get all FactDto saved at or after a date
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._models_to_dtos(
+            self.memory_store.get_facts_updated_since(date))
+
+    def get_deleted_since(self, date: datetime.datetime) -> List[FactKey]:
+        """ get the natural keys of the facts deleted at or after a date
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[FactKey]: (fluent name, object names, is_goal) of each fact
+        """
+
+        return [(fluent_name, tuple(object_names), bool(is_goal))
+                for fluent_name, object_names, is_goal
+                in self.memory_store.get_facts_deleted_since(date)]
+
+    def _save(self, fact_dto: FactDto) -> bool:
+        """ save a FactDto
+            if the FactDto is already saved return False, else return True
+
+        Args:
+            fact_dto (FactDto): FactDto to save
+
+        Returns:
+            bool: succeed
+        """
+
+        if self._exist_in_memory(fact_dto):
+            return False
+
+        if not MemoryFactDao._check_fact_dto(fact_dto):
+            return False
+
+        # propagating saving
+        for object_dto in fact_dto.objects:
+            if not self._mem_object_dao.save(object_dto):
+                return False
+
+        if not self._mem_fluent_dao.save(fact_dto.fluent):
+            return False
+
+        # saving
+        fact_model = MemoryFactDao._dto_to_model(fact_dto)
+        self.memory_store.save_fact(fact_model)
+        return True
+
+    def _update(self, fact_dto: FactDto) -> bool:
+        """ update a FactDto
+            if the FactDto is not saved return False, else return True
+
+        Args:
+            fact_dto (FactDto): FactDto to update
+
+        Returns:
+            bool: succeed
+        """
+
+        if not MemoryFactDao._check_fact_dto(fact_dto):
+            return False
+
+        # check if fact exists
+        if self._exist_in_memory(fact_dto):
+
+            # propagating saving
+            for object_dto in fact_dto.objects:
+                if not self._mem_object_dao.save(object_dto):
+                    return False
+
+            if not self._mem_fluent_dao.save(fact_dto.fluent):
+                return False
+
+            # updating
+            fact_model = MemoryFactDao._dto_to_model(fact_dto)
+            self.memory_store.save_fact(fact_model)
+            return True
+
+        return False
+
+    def save(self, fact_dto: FactDto) -> bool:
+        """ save or update a FactDto
+            if the FactDto is not saved it will be saved, else it will be updated
+
+        Args:
+            fact_dto (FactDto): FactDto to save or update
+
+        Returns:
+            bool: succeed
+        """
+
+        if self._exist_in_memory(fact_dto):
+            return self._update(fact_dto)
+
+        return self._save(fact_dto)
+
+    def delete(self, fact_dto: FactDto) -> bool:
+        """ delete a FactDto
+            if the FactDto is not saved return False, else return True
+
+        Args:
+            fact_dto (FactDto): FactDto to delete
+
+        Returns:
+            bool: succeed
+        """
+
+        fact_model = self._get_model(fact_dto)
+
+        # check if fact exists
+        if fact_model:
+            self.memory_store.delete_fact(fact_model.key)
+            return True
+
+        return False
+
+    def delete_all(self) -> bool:
+        """ delete all facts
+
+        Returns:
+            bool: succeed
+        """
+
+        for fact_key in list(self.memory_store.facts):
+            self.memory_store.delete_fact(fact_key)
+
+        return True
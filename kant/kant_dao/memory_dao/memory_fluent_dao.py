@@ -0,0 +1,252 @@
+
+""" Memory Fluent Dao """
+
+from typing import List
+
+from kant.kant_dao.dao_interface import FluentDao
+from kant.kant_dao.memory_dao import (
+    MemoryDao,
+    MemoryStore,
+    MemoryTypeDao
+)
+
+from kant.kant_dao.memory_dao.memory_models import FluentModel
+
+from kant.kant_dto import FluentDto
+
+
+class MemoryFluentDao(FluentDao, MemoryDao):
+    """ Memory Fluent Dao Class """
+
+    def __init__(self, memory_store: MemoryStore = None) -> None:
+
+        FluentDao.__init__(self)
+        MemoryDao.__init__(self, memory_store)
+
+        self._mem_type_dao = MemoryTypeDao(self.memory_store)
+
+    def _model_to_dto(self, fluent_model: FluentModel) -> FluentDto:
+        """ convert a memory fluent model into a FluentDto
+
+        Args:
+            fluent_model (FluentModel): memory fluent model
+
+        Returns:
+            FluentDto: FluentDto
+        """
+
+        type_dto_list = []
+
+        for type_name in fluent_model.types:
+            type_dto = self._mem_type_dao._model_to_dto(
+                self.memory_store.types[type_name])
+            type_dto_list.append(type_dto)
+
+        fluent_dto = FluentDto(
+            fluent_model.name,
+            type_dto_list,
+            fluent_model.is_numeric)
+
+        return fluent_dto
+
+    @staticmethod
+    def _dto_to_model(fluent_dto: FluentDto) -> FluentModel:
+        """ convert a FluentDto into a memory fluent model
+
+        Args:
+            fluent_dto (FluentDto): FluentDto
+
+        Returns:
+            FluentModel: memory fluent model
+        """
+
+        return FluentModel(
+            fluent_dto.name,
+            [type_dto.name for type_dto in fluent_dto.types],
+            fluent_dto.is_numeric)
+
+    def _exist_in_memory(self, fluent_dto: FluentDto) -> bool:
+        """ check if FluentDto exists
+
+        Args:
+            fluent_dto (FluentDto): FluentDto
+
+        Returns:
+            bool: FluentDto exists?
+        """
+
+        return fluent_dto.name in self.memory_store.fluents
+
+    def _get_model(self, fluent_dto: FluentDto) -> FluentModel:
+        """ get the memory fluent model corresponding to a give FluentDto
+
+        Args:
+            fluent_dto (FluentDto): FluentDto
+
+        Returns:
+            FluentModel: memory fluent model
+        """
+
+        return self.memory_store.fluents.get(fluent_dto.name)
+
+    def get(self, fluent_name: str) -> FluentDto:
+        """ get a FluentDto with a given fluent name
+            return None if there is no with that fluent name
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            FluentDto: FluentDto of the fluent name
+        """
+
+        fluent_model = self.memory_store.fluents.get(fluent_name)
+
+        # check if fluent exist
+        if fluent_model:
+            return self._model_to_dto(fluent_model)
+
+        return None
+
+    def get_all(self) -> List[FluentDto]:
+        """ get all FluentDto
+
+        Returns:
+            List[FluentDto]: list of all FluentDto
+        """
+
+        fluent_dto_list = []
+
+        for fluent_name in self.memory_store.fluent_names:
+            fluent_dto = self._model_to_dto(
+                self.memory_store.fluents[fluent_name])
+            fluent_dto_list.append(fluent_dto)
+
+        return fluent_dto_list
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[FluentDto]:
+        """ get a page of FluentDto sorted by fluent name
+
+        Args:
+            after (str, optional): last fluent name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max FluentDto in the page. Defaults to 100.
+
+        Returns:
+            List[FluentDto]: list of FluentDto
+        """
+
+        fluent_dto_list = []
+
+        for fluent_name in self.memory_store.get_page_names(
+                self.memory_store.fluent_names, after, limit):
+            fluent_dto = self._model_to_dto(
+                self.memory_store.fluents[fluent_name])
+            fluent_dto_list.append(fluent_dto)
+
+        return fluent_dto_list
+
+    def count_all(self) -> int:
+        """ count all FluentDto
+
+        Returns:
+            int: number of FluentDto
+        """
+
+        return len(self.memory_store.fluents)
+
+    def _save(self, fluent_dto: FluentDto) -> bool:
+        """ save a FluentDto
+            if the FluentDto is already saved return False, else return True
+
+        Args:
+            fluent_dto (FluentDto): FluentDto to save
+
+        Returns:
+            bool: succeed
+        """
+
+        if self._exist_in_memory(fluent_dto):
+            return False
+
+        # propagating saving
+        for type_dto in fluent_dto.types:
+            if not self._mem_type_dao.save(type_dto):
+                return False
+
+        # saving
+        fluent_model = MemoryFluentDao._dto_to_model(fluent_dto)
+        self.memory_store.save_fluent(fluent_model)
+        return True
+
+    def _update(self, fluent_dto: FluentDto) -> bool:
+        """ update a FluentDto
+            if the FluentDto is not saved return False, else return True
+
+        Args:
+            fluent_dto (FluentDto): FluentDto to update
+
+        Returns:
+            bool: succeed
+        """
+
+        # check if fluent exists
+        if self._exist_in_memory(fluent_dto):
+
+            # propagating saving
+            for type_dto in fluent_dto.types:
+                if not self._mem_type_dao.save(type_dto):
+                    return False
+
+            # updating
+            fluent_model = MemoryFluentDao._dto_to_model(fluent_dto)
+            self.memory_store.save_fluent(fluent_model)
+            return True
+
+        return False
+
+    def save(self, fluent_dto: FluentDto) -> bool:
+        """ save or update a FluentDto
+            if the FluentDto is not saved it will be saved, else it will be updated
+
+        Args:
+            fluent_dto (FluentDto): FluentDto to save or update
+
+        Returns:
+            bool: succeed
+        """
+
+        if self._exist_in_memory(fluent_dto):
+            return self._update(fluent_dto)
+
+        return self._save(fluent_dto)
+
+    def delete(self, fluent_dto: FluentDto) -> bool:
+        """ delete a FluentDto
+            if the FluentDto is not saved return False, else return True
+
+        Args:
+            fluent_dto (FluentDto): FluentDto to delete
+
+        Returns:
+            bool: succeed
+        """
+
+        # check if fluent exists
+        if self._exist_in_memory(fluent_dto):
+            self.memory_store.delete_fluent(fluent_dto.name)
+            return True
+
+        return False
+
+    def delete_all(self) -> bool:
+        """ delete all fluents
+
+        Returns:
+            bool: succeed
+        """
+
+        for fluent_name in list(self.memory_store.fluents):
+            self.memory_store.delete_fluent(fluent_name)
+
+        return True
@@ -0,0 +1,143 @@
+
+""" Memory models """
+
+import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from typing import List, Tuple, Union
+
+
+def to_decimal(value: Union[float, Decimal]) -> Decimal:
+    """ convert a numeric value into a Decimal with 2 decimal places,
+        as mongoengine DecimalField does
+
+    Args:
+        value (Union[float, Decimal]): numeric value
+
+    Returns:
+        Decimal: decimal value
+    """
+
+    if value is None:
+        return None
+
+    return Decimal("%s" % value).quantize(Decimal("0.01"),
+                                          rounding=ROUND_HALF_UP)
+
+
+class BaseModel:
+    """ base model """
+
+    def __init__(self) -> None:
+        self.creation_date = datetime.datetime.now()
+        self.update_date = self.creation_date
+
+
+class TypeModel(BaseModel):
+    """ type model """
+
+    def __init__(self, name: str, father: str = None) -> None:
+        super().__init__()
+        self.name = name
+        self.father = father
+
+
+class ObjectModel(BaseModel):
+    """ object model """
+
+    def __init__(self, name: str, type: str) -> None:
+        super().__init__()
+        self.name = name
+        self.type = type
+
+
+class FluentModel(BaseModel):
+    """ fluent model """
+
+    def __init__(self, name: str,
+                 types: List[str] = None,
+                 is_numeric: bool = False) -> None:
+        super().__init__()
+        self.name = name
+        self.types = tuple(types or ())
+        self.is_numeric = is_numeric
+
+
+class FactModel(BaseModel):
+    """ fact model """
+
+    def __init__(self, fluent: str,
+                 arguments: List[str] = None,
+                 bool_value: bool = None,
+                 numeric_value: Decimal = None,
+                 is_goal: bool = False) -> None:
+        super().__init__()
+        self.fluent = fluent
+        self.arguments = tuple(arguments or ())
+        self.bool_value = bool_value
+        self.numeric_value = to_decimal(numeric_value)
+        self.is_goal = is_goal
+
+    @property
+    def key(self) -> Tuple[str, Tuple[str], bool]:
+        """ natural key of the fact (fluent, arguments, is_goal)
+
+        Returns:
+            Tuple[str, Tuple[str], bool]: fact key
+        """
+
+        return (self.fluent, self.arguments, self.is_goal)
+
+
+class ParameterModel:
+    """ parameter model """
+
+    def __init__(self, name: str, type: str) -> None:
+        self.name = name
+        self.type = type
+
+
+class ConditionEffectModel:
+    """ contion/effect model """
+
+    def __init__(self, fluent: str,
+                 parameters: List[str] = None,
+                 bool_value: bool = None,
+                 numeric_value: Decimal = None,
+                 condition_effect: str = None,
+                 time: str = None) -> None:
+        self.fluent = fluent
+        self.parameters = tuple(parameters or ())
+        self.bool_value = bool_value
+        self.numeric_value = to_decimal(numeric_value)
+        self.condition_effect = condition_effect
+        self.time = time
+
+
+class ActionModel(BaseModel):
+    """ action model """
+
+    def __init__(self, action_name: str,
+                 duration: int = 10,
+                 durative: bool = True,
+                 parameters: List[ParameterModel] = None,
+                 conditions: List[ConditionEffectModel] = None,
+                 effects: List[ConditionEffectModel] = None) -> None:
+        super().__init__()
+        self.action_name = action_name
+        self.duration = duration
+        self.durative = durative
+        self.parameters = tuple(parameters or ())
+        self.conditions = tuple(conditions or ())
+        self.effects = tuple(effects or ())
+
+    @property
+    def fluents(self) -> List[str]:
+        """ names of the fluents used in conditions and effects
+
+        Returns:
+            List[str]: fluent names without duplicates
+        """
+
+        return list(dict.fromkeys(
+            condi_effect.fluent
+            for condi_effect in self.conditions + self.effects))
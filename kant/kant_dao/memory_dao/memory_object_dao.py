@@ -0,0 +1,284 @@
+
+""" Memory Object Dao """
+
+import datetime
+from typing import List
+
+from kant.kant_dao.dao_interface import ObjectDao
+from kant.kant_dao.memory_dao import (
+    MemoryDao,
+    MemoryStore,
+    MemoryTypeDao
+)
+
+from kant.kant_dao.memory_dao.memory_models import ObjectModel
+
+from kant.kant_dto import ObjectDto
+
+
+class MemoryObjectDao(ObjectDao, MemoryDao):
+    """ Memory Object Dao Class """
+
+    def __init__(self, memory_store: MemoryStore = None) -> None:
+
+        ObjectDao.__init__(self)
+        MemoryDao.__init__(self, memory_store)
+
+        self._mem_type_dao = MemoryTypeDao(self.memory_store)
+
+    def _model_to_dto(self, object_model: ObjectModel) -> ObjectDto:
+        """ convert a memory object model into a ObjectDto
+
+        Args:
+            object_model (ObjectModel): memory object model
+
+        Returns:
+            ObjectDto: ObjectDto
+        """
+
+        type_dto = self._mem_type_dao._model_to_dto(
+            self.memory_store.types[object_model.type])
+
+        object_dto = ObjectDto(type_dto,
+                               object_model.name)
+
+        return object_dto
+
+    @staticmethod
+    def _dto_to_model(object_dto: ObjectDto) -> ObjectModel:
+        """ convert a ObjectDto into a memory object model
+
+        Args:
+            object_dto (ObjectDto): ObjectDto
+
+        Returns:
+            ObjectModel: memory object model
+        """
+
+        return ObjectModel(object_dto.name, object_dto.type.name)
+
+    def _exist_in_memory(self, object_dto: ObjectDto) -> bool:
+        """ check if ObjectDto exists
+
+        Args:
+            object_dto (ObjectDto): ObjectDto
+
+        Returns:
+            bool: ObjectDto exists?
+        """
+
+        return object_dto.name in self.memory_store.objects
+
+    def _get_model(self, object_dto: ObjectDto) -> ObjectModel:
+        """ get the memory object model corresponding to a give ObjectDto
+
+        Args:
+            object_dto (ObjectDto): ObjectDto
+
+        Returns:
+            ObjectModel: memory object model
+        """
+
+        return self.memory_store.objects.get(object_dto.name)
+
+    def get(self, object_name: str) -> ObjectDto:
+        """ get a ObjectDto with a given object name
+            return None if there is no with that object name
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            ObjectDto: ObjectDto of the object name
+        """
+
+        object_model = self.memory_store.objects.get(object_name)
+
+        # check if object exists
+        if object_model:
+            return self._model_to_dto(object_model)
+
+        return None
+
+    def get_all(self) -> List[ObjectDto]:
+        """ get all ObjectDto
+
+        Returns:
+            List[ObjectDto]: list of all ObjectDto
+        """
+
+        object_dto_list = []
+
+        for object_name in self.memory_store.object_names:
+            object_dto = self._model_to_dto(
+                self.memory_store.objects[object_name])
+            object_dto_list.append(object_dto)
+
+        return object_dto_list
+
+    def get_by_type(self, type_name: str,
+                    include_subtypes: bool = True) -> List[ObjectDto]:
+        """ get all ObjectDto of a given type sorted by object name
+
+        Args:
+            type_name (str): type name
+            include_subtypes (bool, optional): get also the objects of
+                                               the subtypes? Defaults to True.
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+        type_names = [type_name]
+        if include_subtypes:
+            type_names = self.memory_store.get_subtypes(type_name)
+
+        object_models = []
+        for ele in type_names:
+            object_models.extend(self.memory_store.get_objects_by_type(ele))
+
+        object_dto_list = []
+
+        for object_model in sorted(object_models, key=lambda ele: ele.name):
+            object_dto = self._model_to_dto(object_model)
+            object_dto_list.append(object_dto)
+
+        return object_dto_list
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[ObjectDto]:
+        """ get a page of ObjectDto sorted by object name
+
+        Args:
+            after (str, optional): last object name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max ObjectDto in the page. Defaults to 100.
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+        object_dto_list = []
+
+        for object_name in self.memory_store.get_page_names(
+                self.memory_store.object_names, after, limit):
+            object_dto = self._model_to_dto(
+                self.memory_store.objects[object_name])
+            object_dto_list.append(object_dto)
+
+        return object_dto_list
+
+    def count_all(self) -> int:
+        """ count all ObjectDto
+
+        Returns:
+            int: number of ObjectDto
+        """
+
+        return len(self.memory_store.objects)
+
+    def get_updated_since(self, date: datetime.datetime) -> List[ObjectDto]:
+        """ get all ObjectDto saved at or after a date
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+        return [self._model_to_dto(ele) for ele
+                in self.memory_store.get_objects_updated_since(date)]
+
+    def _save(self, object_dto: ObjectDto) -> bool:
+        """ save a ObjectDto
+            if the ObjectDto is already saved return False, else return True
+
+        Args:
+            object_dto (ObjectDto): ObjectDto to save
+
+        Returns:
+            bool: succeed
+        """
+
+        if self._exist_in_memory(object_dto):
+            return False
+
+        # propagating saving
+        if not self._mem_type_dao.save(object_dto.type):
+            return False
+
+        # saving
+        object_model = MemoryObjectDao._dto_to_model(object_dto)
+        self.memory_store.save_object(object_model)
+        return True
+
+    def _update(self, object_dto: ObjectDto) -> bool:
+        """ update a ObjectDto
+            if the ObjectDto is not saved return False, else return True
+
+        Args:
+            object_dto (ObjectDto): ObjectDto to update
+
+        Returns:
+            bool: succeed
+        """
+
+        # check if object exists
+        if self._exist_in_memory(object_dto):
+
+            # propagating saving
+            if not self._mem_type_dao.save(object_dto.type):
+                return False
+
+            # updating
+            object_model = MemoryObjectDao._dto_to_model(object_dto)
+            self.memory_store.save_object(object_model)
+            return True
+
+        return False
+
+    def save(self, object_dto: ObjectDto) -> bool:
+        """ save or update a ObjectDto
+            if the ObjectDto is not saved it will be saved, else it will be updated
+
+        Args:
+            object_dto (ObjectDto): ObjectDto to save or update
+
+        Returns:
+            bool: succeed
+        """
+
+        if self._exist_in_memory(object_dto):
+            return self._update(object_dto)
+
+        return self._save(object_dto)
+
+    def delete(self, object_dto: ObjectDto) -> bool:
+        """ delete a ObjectDto
+            if the ObjectDto is not saved return False, else return True
+
+        Args:
+            object_dto (ObjectDto): ObjectDto to delete
+
+        Returns:
+            bool: succeed
+        """
+
+        # check if object exists
+        if self._exist_in_memory(object_dto):
+            self.memory_store.delete_object(object_dto.name)
+            return True
+
+        return False
+
+    def delete_all(self) -> bool:
+        """ delete all objects
+
+        Returns:
+            bool: succeed
+        """
+
+        for object_name in list(self.memory_store.objects):
+            self.memory_store.delete_object(object_name)
+
+        return True
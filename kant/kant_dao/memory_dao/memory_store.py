@@ -0,0 +1,584 @@
+
+""" Memory Store """
+
+import bisect
+import datetime
+from typing import Dict, Hashable, List, Tuple
+
+from kant.kant_dao.memory_dao.memory_models import (
+    BaseModel,
+    TypeModel,
+    ObjectModel,
+    FluentModel,
+    FactModel,
+    ActionModel
+)
+
+
+FactKey = Tuple[str, Tuple[str], bool]
+
+# how long the keys of the deleted facts are kept
+DELETED_FACTS_RETENTION = datetime.timedelta(minutes=10)
+
+
+class MemoryStore:
+    """ Memory Store Class
+        dict-based storage shared by the memory DAOs of a factory;
+        it keeps hash indexes to answer lookups in O(1), sorted names
+        to slice pages and applies the same cascade rules as the Mongo
+        models on deletion
+    """
+
+    def __init__(self) -> None:
+
+        self.types: Dict[str, TypeModel] = {}
+        self.objects: Dict[str, ObjectModel] = {}
+        self.fluents: Dict[str, FluentModel] = {}
+        self.facts: Dict[FactKey, FactModel] = {}
+        self.actions: Dict[str, ActionModel] = {}
+
+        # indexes, dicts are used as insertion-ordered sets
+        self.types_by_father: Dict[str, Dict[str, None]] = {}
+        self.objects_by_type: Dict[str, Dict[str, None]] = {}
+        self.fluents_by_type: Dict[str, Dict[str, None]] = {}
+        self.facts_by_fluent: Dict[str, Dict[FactKey, None]] = {}
+        self.facts_by_goal: Dict[bool, Dict[FactKey, None]] = {
+            True: {}, False: {}}
+        self.facts_by_object: Dict[str, Dict[FactKey, None]] = {}
+        self.actions_by_fluent: Dict[str, Dict[str, None]] = {}
+
+        # sorted names, pages are sliced from them
+        self.type_names: List[str] = []
+        self.object_names: List[str] = []
+        self.fluent_names: List[str] = []
+        self.action_names: List[str] = []
+
+        # objects and facts by save order and deletion date of the
+        # deleted facts, all from the oldest to the newest
+        self.objects_by_update: Dict[str, None] = {}
+        self.facts_by_update: Dict[FactKey, None] = {}
+        self.deleted_facts: Dict[FactKey, datetime.datetime] = {}
+
+        # increased by every write that changes the domain,
+        # that is the types, the fluents or the actions
+        self.domain_version = 0
+
+    @staticmethod
+    def _index_add(index: Dict[Hashable, Dict[Hashable, None]],
+                   key: Hashable, value: Hashable) -> None:
+        """ add a value to an index entry
+
+        Args:
+            index (Dict[Hashable, Dict[Hashable, None]]): index
+            key (Hashable): index key
+            value (Hashable): value to add
+        """
+
+        if key not in index:
+            index[key] = {}
+
+        index[key][value] = None
+
+    @staticmethod
+    def _index_remove(index: Dict[Hashable, Dict[Hashable, None]],
+                      key: Hashable, value: Hashable) -> None:
+        """ remove a value from an index entry
+
+        Args:
+            index (Dict[Hashable, Dict[Hashable, None]]): index
+            key (Hashable): index key
+            value (Hashable): value to remove
+        """
+
+        values = index.get(key)
+
+        if values is None:
+            return
+
+        values.pop(value, None)
+
+        if not values:
+            del index[key]
+
+    @staticmethod
+    def _index_get(index: Dict[Hashable, Dict[Hashable, None]],
+                   key: Hashable) -> List[Hashable]:
+        """ get a copy of the values of an index entry
+
+        Args:
+            index (Dict[Hashable, Dict[Hashable, None]]): index
+            key (Hashable): index key
+
+        Returns:
+            List[Hashable]: values
+        """
+
+        return list(index.get(key, ()))
+
+    @staticmethod
+    def _sorted_add(names: List[str], name: str) -> None:
+        """ insert a name into a sorted list of names
+
+        Args:
+            names (List[str]): sorted names
+            name (str): name to insert
+        """
+
+        index = bisect.bisect_left(names, name)
+
+        if index == len(names) or names[index] != name:
+            names.insert(index, name)
+
+    @staticmethod
+    def _sorted_remove(names: List[str], name: str) -> None:
+        """ remove a name from a sorted list of names
+
+        Args:
+            names (List[str]): sorted names
+            name (str): name to remove
+        """
+
+        index = bisect.bisect_left(names, name)
+
+        if index < len(names) and names[index] == name:
+            del names[index]
+
+    @staticmethod
+    def get_page_names(names: List[str], after: str = None,
+                       limit: int = 100) -> List[str]:
+        """ get a page of a sorted list of names
+
+        Args:
+            names (List[str]): sorted names
+            after (str, optional): last name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max names in the page. Defaults to 100.
+
+        Returns:
+            List[str]: names of the page
+        """
+
+        start = 0
+
+        if after is not None:
+            start = bisect.bisect_right(names, after)
+
+        return names[start:start + limit]
+
+    @staticmethod
+    def _stamp(new_model: BaseModel, old_model: BaseModel) -> None:
+        """ keep the creation date of a replaced model and refresh its update date
+
+        Args:
+            new_model (BaseModel): new model
+            old_model (BaseModel): replaced model
+        """
+
+        if old_model is not None:
+            new_model.creation_date = old_model.creation_date
+
+        new_model.update_date = datetime.datetime.now()
+
+    # TYPES
+    def save_type(self, type_model: TypeModel) -> None:
+        """ insert or replace a type
+
+        Args:
+            type_model (TypeModel): type model
+        """
+
+        old_model = self.types.get(type_model.name)
+
+        if old_model is None or old_model.father != type_model.father:
+            self.domain_version += 1
+
+        if old_model is None:
+            self._sorted_add(self.type_names, type_model.name)
+
+        else:
+            self._index_remove(self.types_by_father,
+                               old_model.father, old_model.name)
+
+        self._stamp(type_model, old_model)
+        self.types[type_model.name] = type_model
+
+        if type_model.father is not None:
+            self._index_add(self.types_by_father,
+                            type_model.father, type_model.name)
+
+    def get_child_types(self, type_name: str) -> List[str]:
+        """ get the names of the direct child types of a type
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            List[str]: child type names
+        """
+
+        return self._index_get(self.types_by_father, type_name)
+
+    def get_subtypes(self, type_name: str) -> List[str]:
+        """ get the names of a type and all its descendant types
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            List[str]: type names
+        """
+
+        type_names = [type_name]
+        seen_names = {type_name}
+
+        for ele in type_names:
+            for child_name in self.types_by_father.get(ele, ()):
+                if child_name not in seen_names:
+                    seen_names.add(child_name)
+                    type_names.append(child_name)
+
+        return type_names
+
+    def get_objects_by_type(self, type_name: str) -> List[ObjectModel]:
+        """ get the objects of a type
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            List[ObjectModel]: object models
+        """
+
+        return [self.objects[object_name] for object_name
+                in self.objects_by_type.get(type_name, ())]
+
+    def delete_type(self, type_name: str) -> None:
+        """ delete a type cascading to its objects and fluents
+
+        Args:
+            type_name (str): type name
+        """
+
+        type_model = self.types.pop(type_name, None)
+
+        if type_model is None:
+            return
+
+        self.domain_version += 1
+        self._sorted_remove(self.type_names, type_name)
+        self._index_remove(self.types_by_father,
+                           type_model.father, type_model.name)
+
+        for object_name in self._index_get(self.objects_by_type, type_name):
+            self.delete_object(object_name)
+
+        for fluent_name in self._index_get(self.fluents_by_type, type_name):
+            self.delete_fluent(fluent_name)
+
+    # OBJECTS
+    def save_object(self, object_model: ObjectModel) -> None:
+        """ insert or replace an object
+
+        Args:
+            object_model (ObjectModel): object model
+        """
+
+        old_model = self.objects.get(object_model.name)
+
+        if old_model is None:
+            self._sorted_add(self.object_names, object_model.name)
+
+        else:
+            self._index_remove(self.objects_by_type,
+                               old_model.type, old_model.name)
+
+        self._stamp(object_model, old_model)
+        self.objects[object_model.name] = object_model
+        self._index_add(self.objects_by_type,
+                        object_model.type, object_model.name)
+
+        self.objects_by_update.pop(object_model.name, None)
+        self.objects_by_update[object_model.name] = None
+
+    def get_objects_updated_since(
+            self, date: datetime.datetime) -> List[ObjectModel]:
+        """ get the objects saved at or after a date,
+            only those objects are visited
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[ObjectModel]: object models
+        """
+
+        object_models = []
+
+        for object_name in reversed(self.objects_by_update):
+            object_model = self.objects[object_name]
+
+            if object_model.update_date < date:
+                break
+
+            object_models.append(object_model)
+
+        return object_models
+
+    def delete_object(self, object_name: str) -> None:
+        """ delete an object cascading to its facts
+
+        Args:
+            object_name (str): object name
+        """
+
+        object_model = self.objects.pop(object_name, None)
+
+        if object_model is None:
+            return
+
+        self._sorted_remove(self.object_names, object_name)
+        self._index_remove(self.objects_by_type,
+                           object_model.type, object_model.name)
+        self.objects_by_update.pop(object_name, None)
+
+        for fact_key in self._index_get(self.facts_by_object, object_name):
+            self.delete_fact(fact_key)
+
+    # FLUENTS
+    def save_fluent(self, fluent_model: FluentModel) -> None:
+        """ insert or replace a fluent
+
+        Args:
+            fluent_model (FluentModel): fluent model
+        """
+
+        old_model = self.fluents.get(fluent_model.name)
+
+        if (old_model is None or
+                old_model.types != fluent_model.types or
+                bool(old_model.is_numeric) != bool(fluent_model.is_numeric)):
+            self.domain_version += 1
+
+        if old_model is None:
+            self._sorted_add(self.fluent_names, fluent_model.name)
+
+        else:
+            for type_name in old_model.types:
+                self._index_remove(self.fluents_by_type,
+                                   type_name, old_model.name)
+
+        self._stamp(fluent_model, old_model)
+        self.fluents[fluent_model.name] = fluent_model
+
+        for type_name in fluent_model.types:
+            self._index_add(self.fluents_by_type,
+                            type_name, fluent_model.name)
+
+    def delete_fluent(self, fluent_name: str) -> None:
+        """ delete a fluent cascading to its facts and actions
+
+        Args:
+            fluent_name (str): fluent name
+        """
+
+        fluent_model = self.fluents.pop(fluent_name, None)
+
+        if fluent_model is None:
+            return
+
+        self.domain_version += 1
+        self._sorted_remove(self.fluent_names, fluent_name)
+
+        for type_name in fluent_model.types:
+            self._index_remove(self.fluents_by_type,
+                               type_name, fluent_model.name)
+
+        for fact_key in self._index_get(self.facts_by_fluent, fluent_name):
+            self.delete_fact(fact_key)
+
+        for action_name in self._index_get(self.actions_by_fluent,
+                                           fluent_name):
+            self.delete_action(action_name)
+
+    # FACTS
+    def save_fact(self, fact_model: FactModel) -> None:
+        """ insert or replace a fact
+
+        Args:
+            fact_model (FactModel): fact model
+        """
+
+        fact_key = fact_model.key
+        old_model = self.facts.get(fact_key)
+
+        self._stamp(fact_model, old_model)
+        self.facts[fact_key] = fact_model
+
+        self.facts_by_update.pop(fact_key, None)
+        self.facts_by_update[fact_key] = None
+
+        if old_model is None:
+            self._index_add(self.facts_by_fluent, fact_model.fluent, fact_key)
+            self.facts_by_goal[bool(fact_model.is_goal)][fact_key] = None
+
+            for object_name in fact_model.arguments:
+                self._index_add(self.facts_by_object, object_name, fact_key)
+
+    def get_facts_by_fluent(self, fluent_name: str) -> List[FactModel]:
+        """ get the facts of a fluent
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            List[FactModel]: fact models
+        """
+
+        return [self.facts[fact_key] for fact_key
+                in self.facts_by_fluent.get(fluent_name, ())]
+
+    def get_facts_by_goal(self, is_goal: bool) -> List[FactModel]:
+        """ get the facts that are goals or that are not goals
+
+        Args:
+            is_goal (bool): goals or no goals?
+
+        Returns:
+            List[FactModel]: fact models
+        """
+
+        return [self.facts[fact_key] for fact_key
+                in self.facts_by_goal[bool(is_goal)]]
+
+    def get_facts_by_object(self, object_name: str) -> List[FactModel]:
+        """ get the facts that have an object as argument
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            List[FactModel]: fact models
+        """
+
+        return [self.facts[fact_key] for fact_key
+                in self.facts_by_object.get(object_name, ())]
+
+    def get_facts_updated_since(self,
+                                date: datetime.datetime) -> List[FactModel]:
+        """ get the facts saved at or after a date,
+            only those facts are visited
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[FactModel]: fact models
+        """
+
+        fact_models = []
+
+        for fact_key in reversed(self.facts_by_update):
+            fact_model = self.facts[fact_key]
+
+            if fact_model.update_date < date:
+                break
+
+            fact_models.append(fact_model)
+
+        return fact_models
+
+    def get_facts_deleted_since(self,
+                                date: datetime.datetime) -> List[FactKey]:
+        """ get the keys of the facts deleted at or after a date
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[FactKey]: fact natural keys
+        """
+
+        fact_keys = []
+
+        for fact_key in reversed(self.deleted_facts):
+
+            if self.deleted_facts[fact_key] < date:
+                break
+
+            fact_keys.append(fact_key)
+
+        return fact_keys
+
+    def delete_fact(self, fact_key: FactKey) -> None:
+        """ delete a fact
+
+        Args:
+            fact_key (FactKey): fact natural key
+        """
+
+        fact_model = self.facts.pop(fact_key, None)
+
+        if fact_model is None:
+            return
+
+        self._index_remove(self.facts_by_fluent, fact_model.fluent, fact_key)
+        self.facts_by_goal[bool(fact_model.is_goal)].pop(fact_key, None)
+        self.facts_by_update.pop(fact_key, None)
+
+        now = datetime.datetime.now()
+        self.deleted_facts.pop(fact_key, None)
+        self.deleted_facts[fact_key] = now
+
+        # forget the oldest deletions, the last one is always kept
+        old_key = next(iter(self.deleted_facts))
+        while now - self.deleted_facts[old_key] >= DELETED_FACTS_RETENTION:
+            del self.deleted_facts[old_key]
+            old_key = next(iter(self.deleted_facts))
+
+        for object_name in fact_model.arguments:
+            self._index_remove(self.facts_by_object, object_name, fact_key)
+
+    # ACTIONS
+    def save_action(self, action_model: ActionModel) -> None:
+        """ insert or replace an action
+
+        Args:
+            action_model (ActionModel): action model
+        """
+
+        old_model = self.actions.get(action_model.action_name)
+        self.domain_version += 1
+
+        if old_model is None:
+            self._sorted_add(self.action_names, action_model.action_name)
+
+        else:
+            for fluent_name in old_model.fluents:
+                self._index_remove(self.actions_by_fluent,
+                                   fluent_name, old_model.action_name)
+
+        self._stamp(action_model, old_model)
+        self.actions[action_model.action_name] = action_model
+
+        for fluent_name in action_model.fluents:
+            self._index_add(self.actions_by_fluent,
+                            fluent_name, action_model.action_name)
+
+    def delete_action(self, action_name: str) -> None:
+        """ delete an action
+
+        Args:
+            action_name (str): action name
+        """
+
+        action_model = self.actions.pop(action_name, None)
+
+        if action_model is None:
+            return
+
+        self.domain_version += 1
+        self._sorted_remove(self.action_names, action_name)
+
+        for fluent_name in action_model.fluents:
+            self._index_remove(self.actions_by_fluent,
+                               fluent_name, action_model.action_name)
@@ -0,0 +1,255 @@
+
+""" Memory Type Dao """
+
+from typing import List
+
+from kant.kant_dao.dao_interface import TypeDao
+from kant.kant_dao.memory_dao import (
+    MemoryDao,
+    MemoryStore
+)
+
+from kant.kant_dao.memory_dao.memory_models import TypeModel
+
+from kant.kant_dto import TypeDto
+
+
+class MemoryTypeDao(TypeDao, MemoryDao):
+    """ Memory Type Dao Class """
+
+    def __init__(self, memory_store: MemoryStore = None) -> None:
+
+        TypeDao.__init__(self)
+        MemoryDao.__init__(self, memory_store)
+
+    def _model_to_dto(self, type_model: TypeModel) -> TypeDto:
+        """ convert a memory type model into a TypeDto
+
+        Args:
+            type_model (TypeModel): memory type model
+
+        Returns:
+            TypeDto: TypeDto
+        """
+
+        type_dto = TypeDto(type_model.name)
+
+        if type_model.father:
+            father_model = self.memory_store.types.get(type_model.father)
+
+            if father_model is not None:
+                type_dto.father = self._model_to_dto(father_model)
+
+        return type_dto
+
+    @staticmethod
+    def _dto_to_model(type_dto: TypeDto) -> TypeModel:
+        """ convert a TypeDto into a memory type model
+
+        Args:
+            type_dto (TypeDto): TypeDto
+
+        Returns:
+            TypeModel: memory type model
+        """
+
+        type_model = TypeModel(type_dto.name)
+
+        if type_dto.father:
+            type_model.father = type_dto.father.name
+
+        return type_model
+
+    def _exist_in_memory(self, type_dto: TypeDto) -> bool:
+        """ check if TypeDto exists
+
+        Args:
+            type_dto (TypeDto): TypeDto
+
+        Returns:
+            bool: TypeDto exists?
+        """
+
+        return type_dto.name in self.memory_store.types
+
+    def _get_model(self, type_dto: TypeDto) -> TypeModel:
+        """ get the memory type model corresponding to a give TypeDto
+
+        Args:
+            type_dto (TypeDto): TypeDto
+
+        Returns:
+            TypeModel: memory type model
+        """
+
+        return self.memory_store.types.get(type_dto.name)
+
+    def get(self, type_name: str) -> TypeDto:
+        """ get a TypeDto with a given type name
+            return None if there is no with that type name
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            TypeDto: TypeDto of the type name
+        """
+
+        type_model = self.memory_store.types.get(type_name)
+
+        if type_model:
+            return self._model_to_dto(type_model)
+
+        return None
+
+    def get_all(self) -> List[TypeDto]:
+        """ get all TypeDto
+
+        Returns:
+            List[TypeDto]: list of all TypeDto
+        """
+
+        type_dto_list = []
+
+        for type_name in self.memory_store.type_names:
+            type_dto = self._model_to_dto(self.memory_store.types[type_name])
+            type_dto_list.append(type_dto)
+
+        return type_dto_list
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[TypeDto]:
+        """ get a page of TypeDto sorted by type name
+
+        Args:
+            after (str, optional): last type name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max TypeDto in the page. Defaults to 100.
+
+        Returns:
+            List[TypeDto]: list of TypeDto
+        """
+
+        type_dto_list = []
+
+        for type_name in self.memory_store.get_page_names(
+                self.memory_store.type_names, after, limit):
+            type_dto = self._model_to_dto(self.memory_store.types[type_name])
+            type_dto_list.append(type_dto)
+
+        return type_dto_list
+
+    def count_all(self) -> int:
+        """ count all TypeDto
+
+        Returns:
+            int: number of TypeDto
+        """
+
+        return len(self.memory_store.types)
+
+    def _save(self, type_dto: TypeDto) -> bool:
+        """ save a TypeDto
+            if the TypeDto is already saved return False, else return True
+
+        Args:
+            type_dto (TypeDto): TypeDto to save
+
+        Returns:
+            bool: succeed
+        """
+
+        if self._exist_in_memory(type_dto):
+            return False
+
+        # propagating saving
+        if type_dto.father:
+            if not self.save(type_dto.father):
+                return False
+
+        # saving
+        type_model = MemoryTypeDao._dto_to_model(type_dto)
+        self.memory_store.save_type(type_model)
+        return True
+
+    def _update(self, type_dto: TypeDto) -> bool:
+        """ update a TypeDto
+            if the TypeDto is not saved return False, else return True
+
+        Args:
+            type_dto (TypeDto): TypeDto to update
+
+        Returns:
+            bool: succeed
+        """
+
+        # check if type exists
+        if self._exist_in_memory(type_dto):
+
+            # a type without father keeps the stored one
+            if not type_dto.father:
+                return True
+
+            # propagating saving
+            if not self.save(type_dto.father):
+                return False
+
+            # updating
+            type_model = MemoryTypeDao._dto_to_model(type_dto)
+            self.memory_store.save_type(type_model)
+            return True
+
+        return False
+
+    def save(self, type_dto: TypeDto) -> bool:
+        """ save or update a TypeDto
+            if the TypeDto is not saved it will be saved, else it will be updated
+
+        Args:
+            type_dto (TypeDto): TypeDto to save or update
+
+        Returns:
+            bool: succeed
+        """
+
+        if self._exist_in_memory(type_dto):
+            return self._update(type_dto)
+
+        return self._save(type_dto)
+
+    def delete(self, type_dto: TypeDto) -> bool:
+        """ delete a TypeDto
+            if the TypeDto is not saved return False, else return True
+
+        Args:
+            type_dto (TypeDto): TypeDto to delete
+
+        Returns:
+            bool: succeed
+        """
+
+        # check if type exists
+        if self._exist_in_memory(type_dto):
+
+            # delete childs
+            child_names = self.memory_store.get_child_types(type_dto.name)
+
+            self.memory_store.delete_type(type_dto.name)
+
+            for child_name in child_names:
+                self.memory_store.delete_type(child_name)
+
+            return True
+
+        return False
+
+    def delete_all(self) -> bool:
+        """ delete all types
+
+        Returns:
+            bool: succeed
+        """
+
+        for type_name in list(self.memory_store.types):
+            self.memory_store.delete_type(type_name)
+
+        return True
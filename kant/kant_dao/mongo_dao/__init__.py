@@ -1,4 +1,8 @@
+from kant.kant_dao.mongo_dao.numeric_storage import NumericStorage
 
+from kant.kant_dao.mongo_dao.mongo_identity_map import MongoIdentityMap
+from kant.kant_dao.mongo_dao.mongo_type_index import MongoTypeIndex
+from kant.kant_dao.mongo_dao.mongo_saved_index import MongoSavedIndex
 from kant.kant_dao.mongo_dao.mongo_dao import MongoDao
 from kant.kant_dao.mongo_dao.mongo_type_dao import MongoTypeDao
 from kant.kant_dao.mongo_dao.mongo_object_dao import MongoObjectDao
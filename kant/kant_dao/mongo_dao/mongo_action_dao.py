@@ -3,10 +3,14 @@
 
 
 from typing import List
+from mongoengine import QuerySet
+from mongoengine.connection import DEFAULT_CONNECTION_NAME
 
 from kant.kant_dao.dao_interface import ActionDao
 from kant.kant_dao.mongo_dao import(
     MongoDao,
+    MongoIdentityMap,
+    MongoTypeIndex,
     MongoFactDao,
     MongoTypeDao,
     MongoFluentDao
@@ -15,7 +19,8 @@ from kant.kant_dao.mongo_dao import(
 from kant.kant_dao.mongo_dao.mongo_models import (
     ActionModel,
     ConditionEffectModel,
-    ParameterModel
+    ParameterModel,
+    increase_domain_version
 )
 from kant.kant_dao.mongo_dao.mongo_object_dao import MongoObjectDao
 
@@ -24,36 +29,34 @@ from kant.kant_dto import (
     ActionDto,
     ObjectDto
 )
-from kant.kant_dto.fluent_dto import FluentDto
-from kant.kant_dto.type_dto import TypeDto
 
 
 class MongoActionDao(ActionDao, MongoDao):
     """ Mongo Dao Action Class """
 
-    def __init__(self, uri: str = None, connect: bool = True):
+    def __init__(self, uri: str = None, connect: bool = True,
+                 alias: str = DEFAULT_CONNECTION_NAME):
 
         ActionDao.__init__(self)
-        MongoDao.__init__(self, uri, connect)
-
-        self._me_type_dao = MongoTypeDao(uri, connect=False)
-        self._me_fluent_dao = MongoFluentDao(uri, connect=False)
+        MongoDao.__init__(self, uri, connect, alias)
 
     @staticmethod
     def __condition_effect_model_to_dto(condition_effect_model: ConditionEffectModel,
-                                        parameter_dict: dict) -> ConditionEffectDto:
+                                        parameter_dict: dict,
+                                        identity_map: MongoIdentityMap) -> ConditionEffectDto:
         """ convert a Mongoengine condition/effect document into a ConditionEffectDto
 
         Args:
             condition_effect_model
             (ConditionEffectModel): Mongoengine condition/effect document
+            identity_map (MongoIdentityMap): identity map
 
         Returns:
             ConditionEffectDto: ConditionEffectDto
         """
 
-        fluent_dto = MongoFluentDao._model_to_dto(
-            condition_effect_model.fluent)
+        fluent_dto = identity_map.get_fluent_dto(
+            MongoIdentityMap.get_reference(condition_effect_model, "fluent"))
 
         condition_effect_dto = ConditionEffectDto(
             fluent_dto,
@@ -76,16 +79,22 @@ class MongoActionDao(ActionDao, MongoDao):
         return condition_effect_dto
 
     @staticmethod
-    def _model_to_dto(action_model: ActionModel) -> ActionDto:
-        """ convert a Mongoengine action document into a ActionDto
+    def _model_to_dto(action_model: ActionModel,
+                      identity_map: MongoIdentityMap = None) -> ActionDto:
+        """ convert a Mongoengine action document into a ActionDto,
+            types and fluents are shared through the identity map
 
         Args:
             action_model (ActionModel): Mongoengine action document
+            identity_map (MongoIdentityMap, optional): identity map. Defaults to None.
 
         Returns:
             ActionDto: ActionDto
         """
 
+        if identity_map is None:
+            identity_map = MongoIdentityMap()
+
         action_dto = ActionDto(action_model.action_name)
         action_dto.duration = action_model.duration
         action_dto.durative = action_model.durative
@@ -96,69 +105,26 @@ class MongoActionDao(ActionDao, MongoDao):
         parameter_dict = {}
 
         # ACTION PARAMS
+        # parameters are local to the action, they are not shared
         for parameter_model in action_model.parameters:
-            object_dto = MongoObjectDao._model_to_dto(parameter_model)
+            type_dto = identity_map.get_type_dto(
+                MongoIdentityMap.get_reference(parameter_model, "type"))
+            object_dto = ObjectDto(type_dto, parameter_model.name)
             parameter_dict[parameter_model.name] = object_dto
             parameters_list.append(object_dto)
 
         # ACTION CONDIS
         for condition_model in action_model.conditions:
             condition_effect_dto = MongoActionDao.__condition_effect_model_to_dto(
-                condition_model, parameter_dict)
+                condition_model, parameter_dict, identity_map)
             conditions_list.append(condition_effect_dto)
 
         # ACTION EFFECTS
         for effect_model in action_model.effects:
             condition_effect_dto = MongoActionDao.__condition_effect_model_to_dto(
-                effect_model, parameter_dict)
+                effect_model, parameter_dict, identity_map)
             effects_list.append(condition_effect_dto)
 
-        # SET SAME OBJECT FOR FLUENTS AND TYPES
-
-        fluent_dict = {}
-        type_dict = {}
-
-        # conditions/effct
-        for condition_effect_dto in list(conditions_list + effects_list):
-
-            fluent_dto: FluentDto = condition_effect_dto.fluent
-
-            # new fluent
-            if not fluent_dto.name in fluent_dict:
-
-                type_list = []
-                for type_dto in fluent_dto.types:
-
-                    # new type
-                    if not type_dto.name in type_dict:
-                        type_dict[type_dto.name] = type_dto
-
-                    # type already exists
-                    else:
-                        type_dto = type_dict[type_dto.name]
-
-                    type_list.append(type_dto)
-
-                fluent_dto.types = type_list
-                fluent_dict[fluent_dto.name] = fluent_dto
-
-            # fluent alrredy exists
-            else:
-                fluent_dto = fluent_dict[fluent_dto.name]
-
-            condition_effect_dto.fluent = fluent_dto
-
-        # parameters
-        for parameter_dto in parameters_list:
-
-            type_dto: TypeDto = parameter_dto.type
-
-            if not type_dto.name in type_dict:
-                type_dict[type_dto.name] = type_dto
-            else:
-                type_dto = type_dict[type_dto.name]
-                parameter_dto.type = type_dto
-
         action_dto.parameters = parameters_list
         action_dto.conditions = conditions_list
         action_dto.effects = effects_list
@@ -257,7 +223,8 @@ class MongoActionDao(ActionDao, MongoDao):
 
     @staticmethod
     def _check_condition_efect_dto(condition_effect_dto: ConditionEffectDto,
-                                   parameter_dtos: ObjectDto) -> bool:
+                                   parameter_dtos: ObjectDto,
+                                   type_index: MongoTypeIndex = None) -> bool:
         """ check if the types of the objects of a codition/effect dto are
             the same as the types of its fluent and if that objects are action parameters
 
@@ -268,6 +235,9 @@ class MongoActionDao(ActionDao, MongoDao):
             parameter_dtos
             (ObjectDto): ObjectDto
 
+            type_index
+            (MongoTypeIndex, optional): type index. Defaults to None.
+
         Returns:
             bool: condition/effect is correct?
         """
@@ -287,18 +257,26 @@ class MongoActionDao(ActionDao, MongoDao):
                 return False
 
             # check if condition/effect object type is correct
-            if not MongoFactDao._check_type_dto(object_dto.type, type_dto):
+            if type_index is not None:
+                if not type_index.is_subtype(object_dto.type.name,
+                                             type_dto.name):
+                    return False
+
+            elif not MongoFactDao._check_type_dto(object_dto.type, type_dto):
                 return False
 
         return True
 
     @staticmethod
-    def _check_action_dto(action_dto: ActionDto) -> bool:
+    def _check_action_dto(action_dto: ActionDto,
+                          type_index: MongoTypeIndex = None) -> bool:
         """ check if a ActionDto is correct:
-            condition and effect must be correct (similar to fact)
+            condition and effect must be correct (similar to fact),
+            stored actions are checked with the type index
 
         Args:
             action_dto (ActionDto): ActionDto to check
+            type_index (MongoTypeIndex, optional): type index. Defaults to None.
 
         Returns:
             bool: is ActionDto correct?
@@ -312,7 +290,8 @@ class MongoActionDao(ActionDao, MongoDao):
                 return False
 
             if not MongoActionDao._check_condition_efect_dto(condi_effect_dto,
-                                                             action_dto.parameters):
+                                                             action_dto.parameters,
+                                                             type_index):
                 return False
 
         return True
@@ -365,68 +344,87 @@ class MongoActionDao(ActionDao, MongoDao):
         if action_model:
 
             action_model = action_model[0]
-            action_dto = MongoActionDao._model_to_dto(action_model)
+            action_dto = MongoActionDao._model_to_dto(
+                action_model, self._get_identity_map())
 
-            if not MongoActionDao._check_action_dto(action_dto):
+            if not MongoActionDao._check_action_dto(
+                    action_dto, MongoTypeIndex.get_type_index()):
                 return None
 
             return action_dto
 
         return None
 
-    def get_all(self) -> List[ActionDto]:
-        """ get all ActionDto
+    def _get_by_queryset(self, action_model: QuerySet) -> List[ActionDto]:
+        """ get all ActionDto of a Mongoengine query
+
+        Args:
+            action_model (QuerySet): Mongoengine query
 
         Returns:
-            List[ActionDto]: list of all ActionDto
+            List[ActionDto]: list of ActionDto
         """
 
-        action_model = ActionModel.objects.order_by("action_name")
         action_dto_list = []
+        identity_map = self._get_identity_map()
+        type_index = MongoTypeIndex.get_type_index()
 
         for ele in action_model:
-            action_dto = MongoActionDao._model_to_dto(ele)
-            if MongoActionDao._check_action_dto(action_dto):
+            action_dto = MongoActionDao._model_to_dto(ele, identity_map)
+            if MongoActionDao._check_action_dto(action_dto, type_index):
                 action_dto_list.append(action_dto)
 
         return action_dto_list
 
-    def _save(self, action_dto: ActionDto) -> bool:
-        """ save a ActionDto
-            if the ActionDto is already saved return False, else return True
+    def get_all(self) -> List[ActionDto]:
+        """ get all ActionDto
+
+        Returns:
+            List[ActionDto]: list of all ActionDto
+        """
+
+        return self._get_by_queryset(ActionModel.objects.order_by("action_name"))
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[ActionDto]:
+        """ get a page of ActionDto sorted by action name
 
         Args:
-            action_dto (ActionDto): ActionDto to save
+            after (str, optional): last action name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max ActionDto in the page. Defaults to 100.
 
         Returns:
-            bool: succeed
+            List[ActionDto]: list of ActionDto
         """
 
-        if not self._check_action_dto(action_dto):
-            return False
+        return self._get_by_queryset(
+            MongoDao._get_page_queryset(ActionModel, "action_name", after, limit))
 
-        if self._exist_in_mongo(action_dto):
-            return False
+    def count_all(self) -> int:
+        """ count all ActionDto without hydrating them,
+            stored actions are counted without checking them
 
-        action_model = self._dto_to_model(
-            action_dto)
+        Returns:
+            int: number of ActionDto
+        """
 
-        # propagate saving
-        for parameter_dto in action_dto.parameters:
-            if not self._me_type_dao.save(parameter_dto.type):
-                return False
+        return ActionModel.objects.count()
 
-        for fluent_model in action_model._fluents:
+    def _save(self, action_dto: ActionDto) -> bool:
+        """ save a ActionDto
+            if the ActionDto is already saved return False, else return True
 
-            fluent_dto = MongoFluentDao._model_to_dto(fluent_model)
+        Args:
+            action_dto (ActionDto): ActionDto to save
 
-            if not self._me_fluent_dao.save(fluent_dto):
-                return False
+        Returns:
+            bool: succeed
+        """
 
-        # saving
-        action_model.save()
+        if self._exist_in_mongo(action_dto):
+            return False
 
-        return True
+        return self.save(action_dto)
 
     def _update(self, action_dto: ActionDto) -> bool:
         """ update a ActionDto
@@ -439,47 +437,84 @@ class MongoActionDao(ActionDao, MongoDao):
             bool: succeed
         """
 
-        if not self._check_action_dto(action_dto):
+        if not self._exist_in_mongo(action_dto):
             return False
 
-        action_model = self._get_model(action_dto)
+        return self.save(action_dto)
 
-        # check if action exists
-        if action_model:
+    def save(self, action_dto: ActionDto) -> bool:
+        """ save or update a ActionDto
+            if the ActionDto is not saved it will be saved, else it will be updated
 
-            # propagate saving
-            for parameter_dto in action_dto.parameters:
-                if not self._me_type_dao.save(parameter_dto.type):
-                    return False
+        Args:
+            action_dto (ActionDto): ActionDto to save or update
 
-            for fluent_model in action_model._fluents:
+        Returns:
+            bool: succeed
+        """
 
-                fluent_dto = MongoFluentDao._model_to_dto(fluent_model)
+        return self.save_many([action_dto])[0]
 
-                if not self._me_fluent_dao.save(fluent_dto):
-                    return False
+    def save_many(self, action_dto_list: List[ActionDto]) -> List[bool]:
+        """ save or update a list of ActionDto with one bulk write
+            per collection: types, fluents and actions
 
-            # updating
-            new_action_model = MongoActionDao._dto_to_model(action_dto)
+        Args:
+            action_dto_list (List[ActionDto]): list of ActionDto to save or update
 
-            action_model.action_name = new_action_model.action_name
-            action_model.durative = new_action_model.durative
-            action_model.duration = new_action_model.duration
-            action_model.parameters = new_action_model.parameters
-            action_model.conditions = new_action_model.conditions
-            action_model.effects = new_action_model.effects
-            action_model.save()
+        Returns:
+            List[bool]: succeed of each ActionDto
+        """
 
-            return True
+        results = []
+        action_dict = {}
 
-        return False
+        for action_dto in action_dto_list:
+            is_valid = self._check_action_dto(action_dto)
+            results.append(is_valid)
 
-    def save(self, action_dto: ActionDto) -> bool:
+            if is_valid:
+                action_dict[action_dto.name] = action_dto
 
-        if self._exist_in_mongo(action_dto):
-            return self._update(action_dto)
+        # propagate saving
+        type_dto_list = []
+        fluent_dto_list = []
+
+        for action_dto in action_dict.values():
+            type_dto_list.extend(ele.type for ele in action_dto.parameters)
 
-        return self._save(action_dto)
+            for condition_effect_dto in (action_dto.conditions +
+                                         action_dto.effects):
+                fluent_dto = condition_effect_dto.fluent
+                type_dto_list.extend(fluent_dto.types)
+                fluent_dto_list.append(fluent_dto)
+
+        failed_types = MongoTypeDao._upsert_types(type_dto_list)
+        failed_fluents = MongoFluentDao._upsert_fluents(
+            fluent_dto_list, failed_types)
+
+        # saving
+        failed_indexes = MongoDao._bulk_upsert(
+            ActionModel,
+            [MongoDao._to_upsert(MongoActionDao._dto_to_model(ele))
+             for ele in action_dict.values()])[1]
+        failed_names = MongoDao._get_failed_keys(
+            list(action_dict), failed_indexes)
+
+        if action_dict:
+            increase_domain_version()
+
+        for index, action_dto in enumerate(action_dto_list):
+            if results[index]:
+                results[index] = not (
+                    action_dto.name in failed_names or
+                    any(ele.type.name in failed_types
+                        for ele in action_dto.parameters) or
+                    any(ele.fluent.name in failed_fluents
+                        for ele in (action_dto.conditions +
+                                    action_dto.effects)))
+
+        return results
 
     def delete(self, action_dto: ActionDto) -> bool:
         """ save or update a ActionDto
@@ -497,10 +532,32 @@ class MongoActionDao(ActionDao, MongoDao):
         # check if action exists
         if action_model:
             action_model.delete()
+            increase_domain_version()
             return True
 
         return False
 
+    def delete_many(self, action_dto_list: List[ActionDto]) -> List[bool]:
+        """ delete a list of ActionDto with a bulk delete
+
+        Args:
+            action_dto_list (List[ActionDto]): list of ActionDto to delete
+
+        Returns:
+            List[bool]: succeed of each ActionDto
+        """
+
+        action_names = [ele.name for ele in action_dto_list]
+        deleted_names = set(
+            ActionModel.objects(action_name__in=action_names).scalar(
+                "action_name"))
+
+        if deleted_names:
+            ActionModel.objects(action_name__in=list(deleted_names)).delete()
+            increase_domain_version()
+
+        return MongoDao._delete_results(action_names, deleted_names)
+
     def delete_all(self) -> bool:
         """ delete all actions
 
@@ -508,9 +565,6 @@ class MongoActionDao(ActionDao, MongoDao):
             bool: succeed
         """
 
-        action_dto_list = self.get_all()
-
-        for ele in action_dto_list:
-            self.delete(ele)
-
+        ActionModel._get_collection().delete_many({})
+        increase_domain_version()
         return True
@@ -0,0 +1,206 @@
+
+""" Mongo Connection """
+
+import functools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from inspect import isgenerator
+from typing import Any, Callable, Dict, Iterator, Set
+
+import mongoengine.connection
+from mongoengine.connection import DEFAULT_CONNECTION_NAME
+from pymongo.database import Database
+
+# mongoengine keeps its connections in module dicts without locks
+_connection_lock = threading.RLock()
+
+# uri registered for each alias and database of each connected alias
+_uris: Dict[str, str] = {}
+_databases: Dict[str, Database] = {}
+
+# hooks run by the first query of each alias, aliases whose hook
+# has run and aliases whose hook is running
+_prepares: Dict[str, Callable[[], None]] = {}
+_prepared: Set[str] = set()
+_preparing: Set[str] = set()
+
+# alias used by the models, each thread and task has its own value
+_current_alias: ContextVar[str] = ContextVar("kant_mongo_alias",
+                                             default=DEFAULT_CONNECTION_NAME)
+
+
+def connect(uri: str, alias: str = DEFAULT_CONNECTION_NAME,
+            prepare: Callable[[], None] = None) -> bool:
+    """ register a mongoengine alias for an uri, the client is created
+        on the first query and clients are reused by uri; connecting
+        an alias again to the same uri does nothing and the connections
+        of other aliases are not closed
+
+    Args:
+        uri (str): Mongo uri
+        alias (str, optional): mongoengine alias. Defaults to "default".
+        prepare (Callable[[], None], optional): hook run with the alias
+            by its first query, once per uri. Defaults to None.
+
+    Returns:
+        bool: the alias is connected to a new uri?
+    """
+
+    with _connection_lock:
+        if _uris.get(alias) == uri:
+            if prepare is not None and alias not in _prepared:
+                _prepares[alias] = prepare
+                _databases.pop(alias, None)
+            return False
+
+        # the client is only closed if no other alias uses it
+        mongoengine.connection.disconnect(alias)
+        _databases.pop(alias, None)
+        _prepared.discard(alias)
+        _prepares.pop(alias, None)
+
+        if prepare is not None:
+            _prepares[alias] = prepare
+
+        mongoengine.connection.register_connection(alias, host=uri,
+                                                   connect=False)
+        _uris[alias] = uri
+        return True
+
+
+def disconnect(alias: str = DEFAULT_CONNECTION_NAME) -> None:
+    """ forget a mongoengine alias, its client is closed
+        if no other alias uses it
+
+    Args:
+        alias (str, optional): mongoengine alias. Defaults to "default".
+    """
+
+    with _connection_lock:
+        mongoengine.connection.disconnect(alias)
+        _databases.pop(alias, None)
+        _uris.pop(alias, None)
+        _prepares.pop(alias, None)
+        _prepared.discard(alias)
+
+
+def get_database(alias: str) -> Database:
+    """ get the database of a mongoengine alias, its client is created
+        and its prepare hook is run by the first call; the other threads
+        wait for the hook, and it is run again by the next call if it fails
+
+    Args:
+        alias (str): mongoengine alias
+
+    Returns:
+        Database: pymongo database
+    """
+
+    database = _databases.get(alias)
+
+    if database is None:
+        with _connection_lock:
+            database = _databases.get(alias)
+
+            if database is None:
+                database = mongoengine.connection.get_db(alias)
+
+                # the queries of the hook use the database unpublished
+                if alias in _preparing:
+                    return database
+
+                prepare = _prepares.pop(alias, None)
+
+                if prepare is not None:
+                    _preparing.add(alias)
+                    try:
+                        with use_alias(alias):
+                            prepare()
+                    except BaseException:
+                        _prepares[alias] = prepare
+                        raise
+                    finally:
+                        _preparing.discard(alias)
+
+                    _prepared.add(alias)
+
+                _databases[alias] = database
+
+    return database
+
+
+def get_alias() -> str:
+    """ get the mongoengine alias used by the models in this context
+
+    Returns:
+        str: mongoengine alias
+    """
+
+    return _current_alias.get()
+
+
+@contextmanager
+def use_alias(alias: str) -> Iterator[None]:
+    """ make the models use a mongoengine alias inside a with block,
+        only the current thread or task is affected
+
+    Args:
+        alias (str): mongoengine alias
+    """
+
+    token = _current_alias.set(alias)
+    try:
+        yield
+    finally:
+        _current_alias.reset(token)
+
+
+def _iter_with_alias(alias: str, generator: Iterator[Any]) -> Iterator[Any]:
+    """ resume a generator with an alias, the alias is not kept
+        between items so the consumer code is not affected
+
+    Args:
+        alias (str): mongoengine alias
+        generator (Iterator[Any]): generator
+
+    Yields:
+        Iterator[Any]: generator items
+    """
+
+    while True:
+        with use_alias(alias):
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+        yield item
+
+
+def bind_alias(method: Callable) -> Callable:
+    """ wrap a DAO method so it runs with the alias of its DAO
+
+    Args:
+        method (Callable): DAO method
+
+    Returns:
+        Callable: wrapped method
+    """
+
+    @functools.wraps(method)
+    def wrapper(dao: Any, *args, **kwargs) -> Any:
+        alias = dao.alias
+
+        if alias == _current_alias.get():
+            result = method(dao, *args, **kwargs)
+
+        else:
+            with use_alias(alias):
+                result = method(dao, *args, **kwargs)
+
+        if isgenerator(result):
+            return _iter_with_alias(alias, result)
+
+        return result
+
+    return wrapper
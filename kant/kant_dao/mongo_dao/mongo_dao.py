@@ -2,28 +2,57 @@
 """ Mongo Dao Interface """
 
 from abc import ABC, abstractmethod, abstractstaticmethod
-from mongoengine import Document, disconnect, connect
+from datetime import datetime
+from typing import Hashable, List, Set, Tuple, Type
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from types import FunctionType
+from mongoengine import Document, QuerySet
+from mongoengine.connection import DEFAULT_CONNECTION_NAME
+from kant.kant_dao.mongo_dao import mongo_connection
+from kant.kant_dao.mongo_dao.mongo_identity_map import MongoIdentityMap
+from kant.kant_dao.mongo_dao.mongo_saved_index import MongoSavedIndex
+from kant.kant_dao.mongo_dao.mongo_type_index import MongoTypeIndex
 from kant.kant_dto import Dto
 
 
 class MongoDao(ABC):
-    """ Mongo Dao Abstract Class """
+    """ Mongo Dao Abstract Class
+        public methods, _save and _update run with the mongoengine alias
+        of the DAO, so DAOs of different aliases can be used from
+        different threads at the same time
+    """
 
     def __init__(self,
                  uri: str = "mongodb://localhost:27017/kant",
-                 connect: bool = True
+                 connect: bool = True,
+                 alias: str = DEFAULT_CONNECTION_NAME
                  ) -> None:
         self.uri = uri
+        self.alias = alias
+        self._identity_map = None
 
         if connect:
             self.connect()
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        for name, value in list(cls.__dict__.items()):
+            if (isinstance(value, FunctionType) and
+                    (not name.startswith("_") or name in ("_save", "_update"))):
+                setattr(cls, name, mongo_connection.bind_alias(value))
+
     def connect(self) -> None:
-        """ connect to current uri
+        """ connect the alias to current uri, the client is created
+            on the first query; it does nothing if the alias is
+            already connected to the uri
         """
 
-        disconnect()
-        connect(host=self.uri)
+        if mongo_connection.connect(self.uri, self.alias):
+            with mongo_connection.use_alias(self.alias):
+                MongoTypeIndex.get_type_index().invalidate()
+                MongoSavedIndex.get_saved_index().invalidate()
 
     @property
     def uri(self) -> str:
@@ -33,6 +62,42 @@ class MongoDao(ABC):
     def uri(self, uri: str) -> None:
         self._uri = uri
 
+    @property
+    def alias(self) -> str:
+        return self._alias
+
+    @alias.setter
+    def alias(self, alias: str) -> None:
+        self._alias = alias
+
+    @property
+    def identity_map(self) -> MongoIdentityMap:
+        return self._identity_map
+
+    @identity_map.setter
+    def identity_map(self, identity_map: MongoIdentityMap) -> None:
+        """ set a session identity map shared by all reads,
+            None to use a new identity map per query;
+            the DAOs of a factory are shared, so it is seen by every caller
+
+        Args:
+            identity_map (MongoIdentityMap): session identity map
+        """
+
+        self._identity_map = identity_map
+
+    def _get_identity_map(self) -> MongoIdentityMap:
+        """ get the identity map for a query
+
+        Returns:
+            MongoIdentityMap: session identity map or a new one
+        """
+
+        if self._identity_map is None:
+            return MongoIdentityMap()
+
+        return self._identity_map
+
     @abstractmethod
     def _get_model(self, dto: Dto) -> Document:
         """ get the Mongoengine document corresponding to a give Dto
@@ -76,3 +141,182 @@ class MongoDao(ABC):
         Returns:
             Document: Mongoengine document
         """
+
+    @staticmethod
+    def _get_page_queryset(model_class: Type[Document],
+                           key_field: str,
+                           after: str = None,
+                           limit: int = 100) -> QuerySet:
+        """ build the query of a page of documents sorted by their primary key,
+            the page starts after a key so it is read from the _id index
+            without skipping the previous pages
+
+        Args:
+            model_class (Type[Document]): Mongoengine document class
+            key_field (str): primary key field
+            after (str, optional): last key of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max documents in the page. Defaults to 100.
+
+        Returns:
+            QuerySet: Mongoengine query
+        """
+
+        queryset = model_class.objects
+
+        if after is not None:
+            queryset = queryset(**{key_field + "__gt": after})
+
+        return queryset.order_by(key_field).limit(limit)
+
+    @staticmethod
+    def _to_upsert(model: Document,
+                   key_fields: Tuple[str] = ("_id",),
+                   skip_fields: Tuple[str] = ()) -> UpdateOne:
+        """ build an upsert operation, keyed on the natural key,
+            that writes a Mongoengine document
+
+        Args:
+            model (Document): Mongoengine document
+            key_fields (Tuple[str]): mongo fields of the natural key
+            skip_fields (Tuple[str], optional): mongo fields that are not written. Defaults to ().
+
+        Returns:
+            UpdateOne: upsert operation
+        """
+
+        document = model.to_mongo().to_dict()
+        key = {field: document.pop(field) for field in key_fields}
+
+        for field in skip_fields:
+            document.pop(field, None)
+
+        now = datetime.now()
+        document.pop("creation_date", None)
+        document["update_date"] = now
+
+        return UpdateOne(key,
+                         {"$set": document,
+                          "$setOnInsert": {"creation_date": now}},
+                         upsert=True)
+
+    @staticmethod
+    def _now() -> datetime:
+        """ current date as it is stored by mongo, with milliseconds,
+            so written documents can be found by their update date
+
+        Returns:
+            datetime: current date
+        """
+
+        now = datetime.now()
+        return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+    @staticmethod
+    def _to_upserts_if_changed(model: Document,
+                               compare_fields: Tuple[str],
+                               now: datetime) -> List[UpdateOne]:
+        """ build the operations that write a Mongoengine document, keyed
+            on its _id, only if it is not stored or any compared field
+            changed; saving an unchanged document writes nothing, fields
+            missing in the document are kept and the written documents
+            get the given update date
+
+        Args:
+            model (Document): Mongoengine document
+            compare_fields (Tuple[str]): mongo fields compared with the stored
+                                         ones, none to only insert it
+            now (datetime): update date
+
+        Returns:
+            List[UpdateOne]: update and insert operations
+        """
+
+        document = model.to_mongo().to_dict()
+        key = {"_id": document.pop("_id")}
+
+        document.pop("creation_date", None)
+        document["update_date"] = now
+
+        inserted = dict(document)
+        inserted["creation_date"] = now
+        operations = [UpdateOne(key, {"$setOnInsert": inserted}, upsert=True)]
+
+        if compare_fields:
+            changed = dict(key)
+            changed["$or"] = [{field: {"$ne": document.get(field)}}
+                              for field in compare_fields]
+            operations.insert(0, UpdateOne(changed, {"$set": document}))
+
+        return operations
+
+    @staticmethod
+    def _bulk_upsert(model_class: Type[Document],
+                     operations: List[UpdateOne]) -> Tuple[int, Set[int]]:
+        """ run upsert operations in a single round trip,
+            the operations that fail do not stop the others
+
+        Args:
+            model_class (Type[Document]): Mongoengine document class
+            operations (List[UpdateOne]): upsert operations
+
+        Returns:
+            Tuple[int, Set[int]]: number of documents inserted or changed
+                                  and indexes of the failed operations
+        """
+
+        if not operations:
+            return 0, set()
+
+        try:
+            details = model_class._get_collection().bulk_write(
+                operations, ordered=False).bulk_api_result
+
+        except BulkWriteError as error:
+            details = error.details
+
+            if details.get("writeConcernErrors"):
+                raise
+
+        return (details["nModified"] + details["nUpserted"],
+                set(ele["index"] for ele in details["writeErrors"]))
+
+    @staticmethod
+    def _get_failed_keys(keys: List[Hashable],
+                         failed_indexes: Set[int],
+                         operations_per_key: int = 1) -> Set[Hashable]:
+        """ get the keys of the Dtos whose upsert operations failed
+
+        Args:
+            keys (List[Hashable]): keys of the Dtos, in the order of their operations
+            failed_indexes (Set[int]): indexes of the failed operations
+            operations_per_key (int, optional): operations of each Dto. Defaults to 1.
+
+        Returns:
+            Set[Hashable]: keys of the Dtos not saved
+        """
+
+        return set(keys[index // operations_per_key]
+                   for index in failed_indexes)
+
+    @staticmethod
+    def _delete_results(keys: List[Hashable],
+                        deleted_keys: Set[Hashable]) -> List[bool]:
+        """ get the per-item results of a bulk delete,
+            a repeated key only succeeds the first time
+
+        Args:
+            keys (List[Hashable]): keys of the Dtos to delete
+            deleted_keys (Set[Hashable]): keys that existed and were deleted
+
+        Returns:
+            List[bool]: succeed of each Dto
+        """
+
+        results = []
+
+        for key in keys:
+            results.append(key in deleted_keys)
+            deleted_keys.discard(key)
+
+        return results
@@ -1,17 +1,26 @@
 
 """ Mongo Fact Dao """
 
-from typing import List, Dict
+import datetime
+from typing import Iterator, List, Tuple
+from mongoengine.connection import DEFAULT_CONNECTION_NAME
 
 from kant.kant_dao.dao_interface import FactDao
+from kant.kant_dao.dao_interface.fact_dao import FactKey
 from kant.kant_dao.mongo_dao import (
     MongoDao,
+    MongoIdentityMap,
+    MongoTypeIndex,
+    MongoTypeDao,
     MongoFluentDao,
     MongoObjectDao
 )
 
 from kant.kant_dao.mongo_dao.mongo_models import (
-    FactModel
+    FactModel,
+    FactTombstoneModel,
+    arguments_key,
+    save_fact_tombstones
 )
 
 from kant.kant_dto import FactDto
@@ -21,58 +30,51 @@ from kant.kant_dto.type_dto import TypeDto
 class MongoFactDao(FactDao, MongoDao):
     """ Mongo Fact Dao Class """
 
-    def __init__(self, uri: str = None, connect: bool = True) -> None:
+    def __init__(self, uri: str = None, connect: bool = True,
+                 alias: str = DEFAULT_CONNECTION_NAME) -> None:
 
         FactDao.__init__(self)
-        MongoDao.__init__(self, uri, connect)
-
-        self._me_object_dao = MongoObjectDao(uri, connect=False)
-        self._me_fluent_dao = MongoFluentDao(uri, connect=False)
+        MongoDao.__init__(self, uri, connect, alias)
 
     @staticmethod
-    def _add_fathers(type_dto: TypeDto, type_dict: Dict[str, TypeDto]) -> None:
-        """ add recursively type fathers to a dictionary
+    def _get_natural_key(fact_dto: FactDto) -> Tuple[str, str, bool]:
+        """ get the natural key of a FactDto as it is stored in mongo
 
         Args:
-            type_dto (TypeDto): starter type
-            type_dict (Dict[str, TypeDto]): dictionary
-        """
+            fact_dto (FactDto): FactDto
 
-        if not type_dto.name in type_dict:
-            type_dict[type_dto.name] = type_dto
+        Returns:
+            Tuple[str, str, bool]: fluent name, arguments key and is goal
+        """
 
-        if not type_dto.father is None:
-            MongoFactDao._add_fathers(type_dto.father, type_dict)
+        return (fact_dto.fluent.name,
+                arguments_key([ele.name for ele in fact_dto.objects]),
+                fact_dto.is_goal)
 
     @staticmethod
-    def _model_to_dto(fact_model: FactModel) -> FactDto:
-        """ convert a Mongoengine type document into a FactDto
+    def _model_to_dto(fact_model: FactModel,
+                      identity_map: MongoIdentityMap = None) -> FactDto:
+        """ convert a Mongoengine type document into a FactDto,
+            types, objects and fluents are shared through the identity map
 
         Args:
             fact_model (FactModel): Mongoengine fact document
+            identity_map (MongoIdentityMap, optional): identity map. Defaults to None.
 
         Returns:
             FactDto: FactDto
         """
 
-        object_list = []
-        type_dict = {}
-
-        fluent_dto = MongoFluentDao._model_to_dto(fact_model.fluent)
-
-        for type_dto in fluent_dto.types:
-            type_dict[type_dto.name] = type_dto
-
-        for object_model in fact_model.arguments:
-
-            object_dto = MongoObjectDao._model_to_dto(
-                object_model)
+        if identity_map is None:
+            identity_map = MongoIdentityMap()
 
-            MongoFactDao._add_fathers(object_dto.type, type_dict)
+        fluent_dto = identity_map.get_fluent_dto(
+            MongoIdentityMap.get_reference(fact_model, "fluent"))
 
-            object_dto.type = type_dict[object_dto.type.name]
-
-            object_list.append(object_dto)
+        object_list = []
+        for object_reference in MongoIdentityMap.get_reference(fact_model,
+                                                               "arguments"):
+            object_list.append(identity_map.get_object_dto(object_reference))
 
         fact_dto = FactDto(
             fluent_dto, object_list)
@@ -108,6 +110,7 @@ class MongoFactDao(FactDao, MongoDao):
         fact_model.is_goal = fact_dto.is_goal
 
         # value
+        fact_model.is_numeric = bool(fact_dto.fluent.is_numeric)
         if fact_dto.fluent.is_numeric:
             fact_model.numeric_value = fact_dto.value
         else:
@@ -121,6 +124,9 @@ class MongoFactDao(FactDao, MongoDao):
             fact_model.arguments.append(
                 object_model)
 
+        fact_model.arguments_key = arguments_key(
+            [ele.name for ele in fact_dto.objects])
+
         return fact_model
 
     @staticmethod
@@ -143,12 +149,15 @@ class MongoFactDao(FactDao, MongoDao):
             else:
                 return False
 
-    def _check_fact_dto(fact_dto: FactDto) -> bool:
+    def _check_fact_dto(fact_dto: FactDto,
+                        type_index: MongoTypeIndex = None) -> bool:
         """ check if the types of the objects of a fact dto are
-            the same as the types of its fluent
+            the same as the types of its fluent,
+            stored facts are checked with the type index
 
         Args:
             fact_dto (FactDto): fact dto
+            type_index (MongoTypeIndex, optional): type index. Defaults to None.
 
         Returns:
             bool: poposition is correct?
@@ -163,7 +172,12 @@ class MongoFactDao(FactDao, MongoDao):
 
         for object_dto, type_dto in zip(object_dtos, type_dtos):
             # check if fact is correct
-            if not MongoFactDao._check_type_dto(object_dto.type, type_dto):
+            if type_index is not None:
+                if not type_index.is_subtype(object_dto.type.name,
+                                             type_dto.name):
+                    return False
+
+            elif not MongoFactDao._check_type_dto(object_dto.type, type_dto):
                 return False
 
         return True
@@ -198,10 +212,10 @@ class MongoFactDao(FactDao, MongoDao):
         for object_dto in objects_dto_list:
             objects_list.append(object_dto.name)
 
-        # getting fact
+        # getting fact by its natural key
         fact_model = FactModel.objects(
             fluent=fact_dto.fluent.name,
-            arguments=objects_list,
+            arguments_key=arguments_key(objects_list),
             is_goal=fact_dto.is_goal)
 
         # check if fact exist
@@ -210,6 +224,45 @@ class MongoFactDao(FactDao, MongoDao):
 
         return fact_model[0]
 
+    def _iter_by_query(self, batch_size: int = None,
+                       **query) -> Iterator[FactDto]:
+        """ iterate over all correct FactDto that match a Mongoengine query,
+            documents are hydrated and checked while the cursor is read
+
+        Args:
+            batch_size (int, optional): documents per cursor batch,
+                                        None for the driver default. Defaults to None.
+            query: Mongoengine query
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        fact_model = FactModel.objects(**query)
+
+        if batch_size is not None:
+            fact_model = fact_model.batch_size(batch_size)
+
+        identity_map = self._get_identity_map()
+        type_index = MongoTypeIndex.get_type_index()
+
+        for ele in fact_model:
+            fact_dto = MongoFactDao._model_to_dto(ele, identity_map)
+            if MongoFactDao._check_fact_dto(fact_dto, type_index):
+                yield fact_dto
+
+    def _get_by_query(self, **query) -> List[FactDto]:
+        """ get all correct FactDto that match a Mongoengine query
+
+        Args:
+            query: Mongoengine query
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return list(self._iter_by_query(**query))
+
     def get_by_fluent(self, fluent_name: str) -> List[FactDto]:
         """ get all FactDto with a given fluent name
 
@@ -220,17 +273,70 @@ class MongoFactDao(FactDao, MongoDao):
             List[FactDto]: list of FactDto
         """
 
-        fact_model = FactModel.objects(
-            fluent=fluent_name)
+        return self._get_by_query(fluent=fluent_name)
 
-        fact_dto_list = []
+    def count_by_fluent(self, fluent_name: str) -> int:
+        """ count all FactDto with a given fluent name,
+            stored facts are counted without hydrating nor checking them
 
-        for ele in fact_model:
-            fact_dto = MongoFactDao._model_to_dto(ele)
-            if MongoFactDao._check_fact_dto(fact_dto):
-                fact_dto_list.append(fact_dto)
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return FactModel.objects(fluent=fluent_name).count()
 
-        return fact_dto_list
+    def get_by_object(self, object_name: str,
+                      position: int = None) -> List[FactDto]:
+        """ get all FactDto that have a given object as argument,
+            the objects index is used even if a position is given
+
+        Args:
+            object_name (str): object name
+            position (int, optional): argument position of the object,
+                                      None for any position. Defaults to None.
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        query = {"arguments": object_name}
+
+        if position is not None:
+            query["arguments__" + str(position)] = object_name
+
+        return self._get_by_query(**query)
+
+    def exists_by_object(self, object_name: str) -> bool:
+        """ check if any stored fact has a given object as argument
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            bool: any FactDto with the object?
+        """
+
+        return FactModel._get_collection().find_one(
+            {"objects": object_name}, {"_id": 1}) is not None
+
+    def get_by_fluent_and_objects(self, fluent_name: str,
+                                  object_names: List[str]) -> List[FactDto]:
+        """ get all FactDto with a given fluent name and arguments,
+            that is, the fact and the goal if they exist
+
+        Args:
+            fluent_name (str): fluent name
+            object_names (List[str]): object names of the arguments
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._get_by_query(fluent=fluent_name,
+                                  arguments_key=arguments_key(object_names))
 
     def _get_all(self, is_goal: bool = None) -> List[FactDto]:
         """ get all FactDto
@@ -246,19 +352,9 @@ class MongoFactDao(FactDao, MongoDao):
         """
 
         if(is_goal is None):
-            fact_model = FactModel.objects()
-        else:
-            fact_model = FactModel.objects(
-                is_goal=is_goal)
+            return self._get_by_query()
 
-        fact_dto_list = []
-
-        for ele in fact_model:
-            fact_dto = MongoFactDao._model_to_dto(ele)
-            if MongoFactDao._check_fact_dto(fact_dto):
-                fact_dto_list.append(fact_dto)
-
-        return fact_dto_list
+        return self._get_by_query(is_goal=is_goal)
 
     def get_goals(self) -> List[FactDto]:
         """ get all FactDto that are goals
@@ -269,6 +365,16 @@ class MongoFactDao(FactDao, MongoDao):
 
         return self._get_all(is_goal=True)
 
+    def count_goals(self) -> int:
+        """ count all FactDto that are goals,
+            stored facts are counted without hydrating nor checking them
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return FactModel.objects(is_goal=True).count()
+
     def get_no_goals(self) -> List[FactDto]:
         """ get all FactDto that are not goals
 
@@ -287,6 +393,70 @@ class MongoFactDao(FactDao, MongoDao):
 
         return self._get_all()
 
+    def count_all(self) -> int:
+        """ count all FactDto,
+            stored facts are counted without hydrating nor checking them
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return FactModel.objects.count()
+
+    def iter_by_fluent(self, fluent_name: str,
+                       batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto with a given fluent name,
+            facts are read and checked in batches
+
+        Args:
+            fluent_name (str): fluent name
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_by_query(batch_size, fluent=fluent_name)
+
+    def iter_goals(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto that are goals,
+            facts are read and checked in batches
+
+        Args:
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_by_query(batch_size, is_goal=True)
+
+    def iter_no_goals(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto that are not goals,
+            facts are read and checked in batches
+
+        Args:
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_by_query(batch_size, is_goal=False)
+
+    def iter_all(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto,
+            facts are read and checked in batches
+
+        Args:
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_by_query(batch_size)
+
     def get_bool_facts(self) -> List[FactDto]:
         """ get all bool facts (facts with bool value)
 
@@ -294,14 +464,7 @@ class MongoFactDao(FactDao, MongoDao):
             List[FactDto]: list of FactDto
         """
 
-        fact_list = self.get_no_goals()
-
-        proposition_list = []
-        for ele in fact_list:
-            if not ele.fluent.is_numeric:
-                proposition_list.append(ele)
-
-        return proposition_list
+        return self._get_by_query(is_goal=False, is_numeric=False)
 
     def get_numeric_facts(self) -> List[FactDto]:
         """ get all numeric functions (facts with numeric value)
@@ -310,14 +473,35 @@ class MongoFactDao(FactDao, MongoDao):
             List[FactDto]: list of FactDto
         """
 
-        fact_list = self.get_no_goals()
+        return self._get_by_query(is_goal=False, is_numeric=True)
+
+    def get_updated_since(self, date: datetime.datetime) -> List[FactDto]:
+        """ get all FactDto saved at or after a date
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
 
-        numeric_list = []
-        for ele in fact_list:
-            if ele.fluent.is_numeric:
-                numeric_list.append(ele)
+        return self._get_by_query(update_date__gte=date)
 
-        return numeric_list
+    def get_deleted_since(self, date: datetime.datetime) -> List[FactKey]:
+        """ get the natural keys of the facts deleted at or after a date,
+            they are kept by the fact_tombstone collection for 10 minutes
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[FactKey]: (fluent name, object names, is_goal) of each fact
+        """
+
+        return [(ele["fluent"], tuple(ele["arguments"]), bool(ele["is_goal"]))
+                for ele in FactTombstoneModel._get_collection().find(
+                    {"date": {"$gte": date}},
+                    {"_id": 0, "fluent": 1, "arguments": 1, "is_goal": 1})]
 
     def _save(self, fact_dto: FactDto) -> bool:
         """ save a FactDto
@@ -333,23 +517,7 @@ class MongoFactDao(FactDao, MongoDao):
         if self._exist_in_mongo(fact_dto):
             return False
 
-        if not MongoFactDao._check_fact_dto(fact_dto):
-            return False
-
-       # propagating saving
-        for object_dto in fact_dto.objects:
-            if not self._me_object_dao.save(object_dto):
-                return False
-
-        if not self._me_fluent_dao.save(fact_dto.fluent):
-            return False
-
-        # saving
-        fact_model = MongoFactDao._dto_to_model(
-            fact_dto)
-
-        fact_model.save(cascade=True)
-        return True
+        return self.save(fact_dto)
 
     def _update(self, fact_dto: FactDto) -> bool:
         """ update a FactDto
@@ -362,34 +530,10 @@ class MongoFactDao(FactDao, MongoDao):
             bool: succeed
         """
 
-        if not MongoFactDao._check_fact_dto(fact_dto):
+        if not self._exist_in_mongo(fact_dto):
             return False
 
-        fact_model = self._get_model(
-            fact_dto)
-
-        # check if fact exists
-        if fact_model:
-
-            # propagating saving
-            for object_dto in fact_dto.objects:
-                if not self._me_object_dao.save(object_dto):
-                    return False
-
-            if not self._me_fluent_dao.save(fact_dto.fluent):
-                return False
-
-            # updating
-            new_fact_model = MongoFactDao._dto_to_model(
-                fact_dto)
-            fact_model.fluent = new_fact_model.fluent
-            fact_model.arguments = new_fact_model.arguments
-            fact_model.is_goal = new_fact_model.is_goal
-            fact_model.save()
-
-            return True
-
-        return False
+        return self.save(fact_dto)
 
     def save(self, fact_dto: FactDto) -> bool:
         """ save or update a FactDto
@@ -402,10 +546,63 @@ class MongoFactDao(FactDao, MongoDao):
             bool: succeed
         """
 
-        if self._exist_in_mongo(fact_dto):
-            return self._update(fact_dto)
+        return self.save_many([fact_dto])[0]
 
-        return self._save(fact_dto)
+    def save_many(self, fact_dto_list: List[FactDto]) -> List[bool]:
+        """ save or update a list of FactDto with one bulk write
+            per collection: types, objects, fluents and facts
+
+        Args:
+            fact_dto_list (List[FactDto]): list of FactDto to save or update
+
+        Returns:
+            List[bool]: succeed of each FactDto
+        """
+
+        results = []
+        fact_dict = {}
+
+        for fact_dto in fact_dto_list:
+            is_valid = MongoFactDao._check_fact_dto(fact_dto)
+            results.append(is_valid)
+
+            if is_valid:
+                fact_dict[MongoFactDao._get_natural_key(fact_dto)] = fact_dto
+
+        # propagating saving
+        type_dto_list = []
+        object_dto_list = []
+        fluent_dto_list = []
+
+        for fact_dto in fact_dict.values():
+            type_dto_list.extend(ele.type for ele in fact_dto.objects)
+            type_dto_list.extend(fact_dto.fluent.types)
+            object_dto_list.extend(fact_dto.objects)
+            fluent_dto_list.append(fact_dto.fluent)
+
+        failed_types = MongoTypeDao._upsert_types(type_dto_list)
+        failed_objects = MongoObjectDao._upsert_objects(
+            object_dto_list, failed_types)
+        failed_fluents = MongoFluentDao._upsert_fluents(
+            fluent_dto_list, failed_types)
+
+        # saving, keyed on the fact natural key
+        failed_indexes = MongoDao._bulk_upsert(
+            FactModel,
+            [MongoDao._to_upsert(MongoFactDao._dto_to_model(ele),
+                                 ("fluent", "arguments_key", "is_goal"))
+             for ele in fact_dict.values()])[1]
+        failed_keys = MongoDao._get_failed_keys(
+            list(fact_dict), failed_indexes)
+
+        for index, fact_dto in enumerate(fact_dto_list):
+            if results[index]:
+                results[index] = not (
+                    MongoFactDao._get_natural_key(fact_dto) in failed_keys or
+                    fact_dto.fluent.name in failed_fluents or
+                    any(ele.name in failed_objects for ele in fact_dto.objects))
+
+        return results
 
     def delete(self, fact_dto: FactDto) -> bool:
         """ delete a FactDto
@@ -424,10 +621,47 @@ class MongoFactDao(FactDao, MongoDao):
         # check if fact exists
         if fact_model:
             fact_model.delete()
+            save_fact_tombstones([MongoFactDao._get_natural_key(fact_dto)])
             return True
 
         return False
 
+    def delete_many(self, fact_dto_list: List[FactDto]) -> List[bool]:
+        """ delete a list of FactDto with a bulk delete
+
+        Args:
+            fact_dto_list (List[FactDto]): list of FactDto to delete
+
+        Returns:
+            List[bool]: succeed of each FactDto
+        """
+
+        fact_keys = [MongoFactDao._get_natural_key(ele)
+                     for ele in fact_dto_list]
+        deleted_keys = set()
+
+        if fact_keys:
+            fact_collection = FactModel._get_collection()
+
+            fact_docs = fact_collection.find(
+                {"$or": [{"fluent": ele[0],
+                          "arguments_key": ele[1],
+                          "is_goal": ele[2]} for ele in set(fact_keys)]},
+                {"fluent": 1, "arguments_key": 1, "is_goal": 1})
+
+            fact_ids = []
+            for fact_doc in fact_docs:
+                fact_ids.append(fact_doc["_id"])
+                deleted_keys.add((fact_doc["fluent"],
+                                  fact_doc["arguments_key"],
+                                  fact_doc["is_goal"]))
+
+            if fact_ids:
+                fact_collection.delete_many({"_id": {"$in": fact_ids}})
+                save_fact_tombstones(list(deleted_keys))
+
+        return MongoDao._delete_results(fact_keys, deleted_keys)
+
     def delete_all(self) -> bool:
         """ delete all facts
 
@@ -435,9 +669,5 @@ class MongoFactDao(FactDao, MongoDao):
             bool: succeed
         """
 
-        fact_dto_list = self.get_all()
-
-        for ele in fact_dto_list:
-            self.delete(ele)
-
+        FactModel._get_collection().delete_many({})
         return True
@@ -1,54 +1,54 @@
 
 """ Mongo fluent Dao """
 
-from typing import List
+from typing import Dict, List, Set
+from mongoengine import QuerySet
+from pymongo import UpdateMany
+from mongoengine.connection import DEFAULT_CONNECTION_NAME
 
 from kant.kant_dao.dao_interface import FluentDao
 from kant.kant_dao.mongo_dao import (
     MongoDao,
+    MongoIdentityMap,
+    MongoSavedIndex,
     MongoTypeDao
 )
 
-from kant.kant_dao.mongo_dao.mongo_models import FluentModel
-
-from kant.kant_dto import (
-    FluentDto,
-    TypeDto
+from kant.kant_dao.mongo_dao.mongo_models import (
+    FluentModel,
+    FactModel,
+    ActionModel,
+    increase_domain_version
 )
 
+from kant.kant_dto import FluentDto
+
 
 class MongoFluentDao(FluentDao, MongoDao):
     """ Mongo fluent Dao Class """
 
-    def __init__(self, uri: str = None, connect: bool = True) -> None:
+    def __init__(self, uri: str = None, connect: bool = True,
+                 alias: str = DEFAULT_CONNECTION_NAME) -> None:
 
         FluentDao.__init__(self)
-        MongoDao.__init__(self, uri, connect)
-
-        self._me_type_dao = MongoTypeDao(uri, connect=False)
+        MongoDao.__init__(self, uri, connect, alias)
 
-    def _model_to_dto(fluent_model: FluentModel) -> FluentDto:
+    def _model_to_dto(fluent_model: FluentModel,
+                      identity_map: MongoIdentityMap = None) -> FluentDto:
         """ convert a Mongoengine fluent document into a FluentDto
 
         Args:
             fluent_model (FluentModel): Mongoengine fluent document
+            identity_map (MongoIdentityMap, optional): identity map. Defaults to None.
 
         Returns:
             FluentDto: FluentDto
         """
 
-        type_dto_list = []
-
-        for type_model in fluent_model.types:
-            type_dto = MongoTypeDao._model_to_dto(type_model)
-            type_dto_list.append(type_dto)
-
-        fluent_dto = FluentDto(
-            fluent_model.name,
-            type_dto_list,
-            fluent_model.is_numeric)
+        if identity_map is None:
+            identity_map = MongoIdentityMap()
 
-        return fluent_dto
+        return identity_map.get_fluent_dto(fluent_model)
 
     def _dto_to_model(fluent_dto: FluentDto) -> FluentModel:
         """ convert a FluentDto into a Mongoengine fluent document
@@ -121,26 +121,63 @@ class MongoFluentDao(FluentDao, MongoDao):
         if fluent_model:
             fluent_model = fluent_model[0]
             fluent_dto = MongoFluentDao._model_to_dto(
-                fluent_model)
+                fluent_model, self._get_identity_map())
             return fluent_dto
 
         return None
 
-    def get_all(self) -> List[FluentDto]:
-        """ get all FluentDto
+    def _get_by_queryset(self, fluent_model: QuerySet) -> List[FluentDto]:
+        """ get all FluentDto of a Mongoengine query
+
+        Args:
+            fluent_model (QuerySet): Mongoengine query
 
         Returns:
-            List[FluentDto]: list of all FluentDto
+            List[FluentDto]: list of FluentDto
         """
-        fluent_model = FluentModel.objects.order_by("name")
+
         fluent_dto_list = []
+        identity_map = self._get_identity_map()
 
         for ele in fluent_model:
-            fluent_dto = MongoFluentDao._model_to_dto(ele)
+            fluent_dto = MongoFluentDao._model_to_dto(ele, identity_map)
             fluent_dto_list.append(fluent_dto)
 
         return fluent_dto_list
 
+    def get_all(self) -> List[FluentDto]:
+        """ get all FluentDto
+
+        Returns:
+            List[FluentDto]: list of all FluentDto
+        """
+
+        return self._get_by_queryset(FluentModel.objects.order_by("name"))
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[FluentDto]:
+        """ get a page of FluentDto sorted by fluent name
+
+        Args:
+            after (str, optional): last fluent name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max FluentDto in the page. Defaults to 100.
+
+        Returns:
+            List[FluentDto]: list of FluentDto
+        """
+
+        return self._get_by_queryset(
+            MongoDao._get_page_queryset(FluentModel, "name", after, limit))
+
+    def count_all(self) -> int:
+        """ count all FluentDto without hydrating them
+
+        Returns:
+            int: number of FluentDto
+        """
+
+        return FluentModel.objects.count()
+
     def _save(self, fluent_dto: FluentDto) -> bool:
         """ save a FluentDto
             if the FluentDto is already saved return False, else return True
@@ -155,49 +192,97 @@ class MongoFluentDao(FluentDao, MongoDao):
         if self._exist_in_mongo(fluent_dto):
             return False
 
-        fluent_model = MongoFluentDao._dto_to_model(
-            fluent_dto)
-
-        # propagating saving
-        for type_dto in fluent_dto.types:
-            if not self._me_type_dao.save(type_dto):
-                return False
-
-        # saving
-        fluent_model.save(cascade=True)
-        return True
+        return self.save(fluent_dto)
 
     def _update(self, fluent_dto: FluentDto) -> bool:
         """ update a FluentDto
-             if the FluentDto is not saved return False, else return True
+            if the FluentDto is not saved return False, else return True
 
-         Args:
-             fluent_dto (FluentDto): FluentDto to update
+        Args:
+            fluent_dto (FluentDto): FluentDto to update
 
-         Returns:
-             bool: succeed
-         """
+        Returns:
+            bool: succeed
+        """
 
-        fluent_model = self._get_model(fluent_dto)
+        if not self._exist_in_mongo(fluent_dto):
+            return False
 
-        # check if fluent exists
-        if fluent_model:
+        return self.save(fluent_dto)
 
-            # propagating saving
-            for type_dto in fluent_dto.types:
-                if not self._me_type_dao.save(type_dto):
-                    return False
+    @staticmethod
+    def _update_facts(fluent_dict: Dict[str, FluentDto]) -> None:
+        """ copy the is_numeric of some fluents into the facts
+            that do not have it
 
-            # updating
-            new_fluent_model = MongoFluentDao._dto_to_model(
-                fluent_dto)
-            fluent_model.name = new_fluent_model.name
-            fluent_model.types = new_fluent_model.types
-            fluent_model.save()
+        Args:
+            fluent_dict (Dict[str, FluentDto]): FluentDto by fluent name
+        """
 
-            return True
+        if fluent_dict:
+            FactModel._get_collection().bulk_write(
+                [UpdateMany({"fluent": name,
+                             "is_numeric": {"$ne": bool(ele.is_numeric)}},
+                            {"$set": {"is_numeric": bool(ele.is_numeric)}})
+                 for name, ele in fluent_dict.items()],
+                ordered=False)
+
+    @staticmethod
+    def _upsert_fluents(fluent_dto_list: List[FluentDto],
+                        failed_types: Set[str] = frozenset()) -> Set[str]:
+        """ upsert FluentDtos, without their types, in a single round trip;
+            fluents already in the saved index with the same fields are
+            not sent and unchanged fluents are not written, and if any
+            fluent is new or changed the domain version is increased and
+            the facts of the fluents are updated
 
-        return False
+        Args:
+            fluent_dto_list (List[FluentDto]): list of FluentDto
+            failed_types (Set[str], optional): names of the types not saved. Defaults to frozenset().
+
+        Returns:
+            Set[str]: names of the FluentDto not saved, or whose types were not
+        """
+
+        fluent_dict = {ele.name: ele for ele in fluent_dto_list}
+        saved_index = MongoSavedIndex.get_saved_index()
+        fluent_fields = {}
+        now = MongoDao._now()
+        fluent_names = []
+        operations = []
+
+        for fluent_name, fluent_dto in fluent_dict.items():
+            fluent_fields[fluent_name] = (
+                bool(fluent_dto.is_numeric),
+                tuple(ele.name for ele in fluent_dto.types))
+
+            if saved_index.is_fluent_saved(fluent_name,
+                                           fluent_fields[fluent_name]):
+                continue
+
+            fluent_names.extend([fluent_name] * 2)
+            operations.extend(MongoDao._to_upserts_if_changed(
+                MongoFluentDao._dto_to_model(fluent_dto),
+                ("is_numeric", "types"), now))
+
+        written, failed_indexes = MongoDao._bulk_upsert(
+            FluentModel, operations)
+
+        if written:
+            MongoFluentDao._update_facts(
+                {name: fluent_dict[name] for name in fluent_names})
+            increase_domain_version()
+
+        failed_names = MongoDao._get_failed_keys(fluent_names, failed_indexes)
+
+        failed_names.update(
+            name for name, fluent_dto in fluent_dict.items()
+            if any(ele.name in failed_types for ele in fluent_dto.types))
+
+        for fluent_name in set(fluent_names) - failed_names:
+            saved_index.set_fluent(fluent_name, fluent_fields[fluent_name])
+
+        return failed_names
 
     def save(self, fluent_dto: FluentDto) -> bool:
         """ save or update a FluentDto
@@ -210,10 +295,29 @@ class MongoFluentDao(FluentDao, MongoDao):
             bool: succeed
         """
 
-        if self._exist_in_mongo(fluent_dto):
-            return self._update(fluent_dto)
+        return self.save_many([fluent_dto])[0]
 
-        return self._save(fluent_dto)
+    def save_many(self, fluent_dto_list: List[FluentDto]) -> List[bool]:
+        """ save or update a list of FluentDto with one bulk write
+            per collection
+
+        Args:
+            fluent_dto_list (List[FluentDto]): list of FluentDto to save or update
+
+        Returns:
+            List[bool]: succeed of each FluentDto
+        """
+
+        # propagating saving
+        type_dto_list = []
+        for fluent_dto in fluent_dto_list:
+            type_dto_list.extend(fluent_dto.types)
+
+        failed_types = MongoTypeDao._upsert_types(type_dto_list)
+
+        # saving
+        failed_names = self._upsert_fluents(fluent_dto_list, failed_types)
+        return [ele.name not in failed_names for ele in fluent_dto_list]
 
     def delete(self, fluent_dto: FluentDto) -> bool:
         """ delete a FluentDto
@@ -231,10 +335,34 @@ class MongoFluentDao(FluentDao, MongoDao):
         # check if fluent exists
         if fluent_model:
             fluent_model.delete()
+            MongoSavedIndex.get_saved_index().invalidate()
+            increase_domain_version()
             return True
 
         return False
 
+    def delete_many(self, fluent_dto_list: List[FluentDto]) -> List[bool]:
+        """ delete a list of FluentDto with bulk deletes,
+            the facts and actions using them are deleted too
+
+        Args:
+            fluent_dto_list (List[FluentDto]): list of FluentDto to delete
+
+        Returns:
+            List[bool]: succeed of each FluentDto
+        """
+
+        fluent_names = [ele.name for ele in fluent_dto_list]
+        deleted_names = set(
+            FluentModel.objects(name__in=fluent_names).scalar("name"))
+
+        if deleted_names:
+            FluentModel.objects(name__in=list(deleted_names)).delete()
+            MongoSavedIndex.get_saved_index().invalidate()
+            increase_domain_version()
+
+        return MongoDao._delete_results(fluent_names, deleted_names)
+
     def delete_all(self) -> bool:
         """ delete all fluents
 
@@ -242,9 +370,12 @@ class MongoFluentDao(FluentDao, MongoDao):
             bool: succeed
         """
 
-        fluent_dto_list = self.get_all()
-
-        for ele in fluent_dto_list:
-            self.delete(ele)
+        # cascading, every fact has a fluent
+        FactModel._get_collection().delete_many({})
+        ActionModel._get_collection().delete_many(
+            {"_fluents.0": {"$exists": True}})
 
+        FluentModel._get_collection().delete_many({})
+        MongoSavedIndex.get_saved_index().invalidate()
+        increase_domain_version()
         return True
@@ -0,0 +1,182 @@
+
+""" Mongo Identity Map """
+
+from typing import Any, Dict, Type, Union
+from bson import DBRef
+from mongoengine import Document
+
+from kant.kant_dao.mongo_dao.mongo_models import (
+    TypeModel,
+    ObjectModel,
+    FluentModel
+)
+
+from kant.kant_dto import (
+    TypeDto,
+    ObjectDto,
+    FluentDto
+)
+
+
+class MongoIdentityMap:
+    """ Mongo Identity Map Class
+        each type, object and fluent document is hydrated once and
+        the Dto is shared by reference; references are resolved by id
+        so already hydrated documents are not dereferenced again
+    """
+
+    def __init__(self) -> None:
+        self._type_dtos: Dict[str, TypeDto] = {}
+        self._object_dtos: Dict[str, ObjectDto] = {}
+        self._fluent_dtos: Dict[str, FluentDto] = {}
+
+    def clear(self) -> None:
+        """ forget all hydrated Dtos
+        """
+
+        self._type_dtos.clear()
+        self._object_dtos.clear()
+        self._fluent_dtos.clear()
+
+    @staticmethod
+    def get_reference(model: Document, field_name: str) -> Any:
+        """ get the value of a reference field without dereferencing it
+
+        Args:
+            model (Document): Mongoengine document
+            field_name (str): reference field name
+
+        Returns:
+            Any: DBRef, Mongoengine document or list of them
+        """
+
+        return model._data.get(field_name)
+
+    @staticmethod
+    def _get_id(reference: Union[DBRef, Document]) -> str:
+        """ get the id of a reference
+
+        Args:
+            reference (Union[DBRef, Document]): reference
+
+        Returns:
+            str: id of the referenced document
+        """
+
+        if isinstance(reference, DBRef):
+            return reference.id
+
+        return reference.pk
+
+    @staticmethod
+    def _get_model(model_class: Type[Document],
+                   reference: Union[DBRef, Document]) -> Document:
+        """ get the document of a reference, querying it if needed
+
+        Args:
+            model_class (Type[Document]): Mongoengine document class
+            reference (Union[DBRef, Document]): reference
+
+        Returns:
+            Document: Mongoengine document, None if it does not exist
+        """
+
+        if isinstance(reference, model_class):
+            return reference
+
+        return model_class.objects(pk=reference.id).first()
+
+    def get_type_dto(self, type_reference: Union[DBRef, TypeModel]) -> TypeDto:
+        """ get the TypeDto, with its fathers, of a type reference
+
+        Args:
+            type_reference (Union[DBRef, TypeModel]): type reference
+
+        Returns:
+            TypeDto: TypeDto, None if the type does not exist
+        """
+
+        if type_reference is None:
+            return None
+
+        type_name = MongoIdentityMap._get_id(type_reference)
+
+        if type_name in self._type_dtos:
+            return self._type_dtos[type_name]
+
+        type_model = MongoIdentityMap._get_model(TypeModel, type_reference)
+
+        if type_model is None:
+            return None
+
+        type_dto = TypeDto(type_model.name)
+        self._type_dtos[type_name] = type_dto
+
+        type_dto.father = self.get_type_dto(
+            MongoIdentityMap.get_reference(type_model, "father"))
+
+        return type_dto
+
+    def get_object_dto(self,
+                       object_reference: Union[DBRef, ObjectModel]) -> ObjectDto:
+        """ get the ObjectDto of an object reference
+
+        Args:
+            object_reference (Union[DBRef, ObjectModel]): object reference
+
+        Returns:
+            ObjectDto: ObjectDto, None if the object does not exist
+        """
+
+        object_name = MongoIdentityMap._get_id(object_reference)
+
+        if object_name in self._object_dtos:
+            return self._object_dtos[object_name]
+
+        object_model = MongoIdentityMap._get_model(
+            ObjectModel, object_reference)
+
+        if object_model is None:
+            return None
+
+        object_dto = ObjectDto(
+            self.get_type_dto(
+                MongoIdentityMap.get_reference(object_model, "type")),
+            object_model.name)
+        self._object_dtos[object_name] = object_dto
+
+        return object_dto
+
+    def get_fluent_dto(self,
+                       fluent_reference: Union[DBRef, FluentModel]) -> FluentDto:
+        """ get the FluentDto of a fluent reference
+
+        Args:
+            fluent_reference (Union[DBRef, FluentModel]): fluent reference
+
+        Returns:
+            FluentDto: FluentDto, None if the fluent does not exist
+        """
+
+        fluent_name = MongoIdentityMap._get_id(fluent_reference)
+
+        if fluent_name in self._fluent_dtos:
+            return self._fluent_dtos[fluent_name]
+
+        fluent_model = MongoIdentityMap._get_model(
+            FluentModel, fluent_reference)
+
+        if fluent_model is None:
+            return None
+
+        type_dto_list = []
+        for type_reference in MongoIdentityMap.get_reference(fluent_model,
+                                                             "types"):
+            type_dto_list.append(self.get_type_dto(type_reference))
+
+        fluent_dto = FluentDto(fluent_model.name,
+                               type_dto_list,
+                               fluent_model.is_numeric)
+        self._fluent_dtos[fluent_name] = fluent_dto
+
+        return fluent_dto
@@ -1,9 +1,17 @@
 
 """ Mongo models"""
 
+from typing import Any, Dict, List, Tuple
+from bson import Decimal128
+from pymongo import UpdateMany, UpdateOne
 import mongoengine
+from pymongo.collection import Collection
+from pymongo.database import Database
 import datetime
 
+from kant.kant_dao.mongo_dao.mongo_connection import get_alias, get_database
+from kant.kant_dao.mongo_dao.numeric_storage import NumericStorage
+
 
 class BaseModel:
     creation_date = mongoengine.DateTimeField(default=datetime.datetime.now)
@@ -16,28 +24,125 @@ class BaseModel:
         return super(BaseModel, self).save(*args, **kwargs)
 
 
-class TypeModel(mongoengine.Document, BaseModel):
+class AliasDocument(mongoengine.Document):
+    """ document stored in the database of the mongoengine alias
+        of the current thread or task, instead of the one in its meta
+    """
+
+    meta = {"abstract": True}
+
+    @classmethod
+    def _get_db(cls) -> Database:
+        return get_database(get_alias())
+
+    @classmethod
+    def _get_collection(cls) -> Collection:
+        # _collection is only kept because mongoengine compares it
+        # to detect self references when cascading deletes
+        cls._collection = cls._get_db()[cls._get_collection_name()]
+        return cls._collection
+
+
+# numeric storage mode of each mongoengine alias
+_numeric_storages: Dict[str, NumericStorage] = {}
+
+
+def get_numeric_storage(alias: str = None) -> NumericStorage:
+    """ get the numeric storage mode of a mongoengine alias
+
+    Args:
+        alias (str, optional): mongoengine alias, None for the alias
+                               of the current context. Defaults to None.
+
+    Returns:
+        NumericStorage: numeric storage mode, DECIMAL if it was not set
+    """
+
+    if alias is None:
+        alias = get_alias()
+
+    return _numeric_storages.get(alias, NumericStorage.DECIMAL)
+
+
+def set_numeric_storage(numeric_storage: NumericStorage,
+                        alias: str = None) -> None:
+    """ set the numeric storage mode of a mongoengine alias
+
+    Args:
+        numeric_storage (NumericStorage): numeric storage mode
+        alias (str, optional): mongoengine alias, None for the alias
+                               of the current context. Defaults to None.
+    """
+
+    if alias is None:
+        alias = get_alias()
+
+    _numeric_storages[alias] = NumericStorage(numeric_storage)
+
+
+class NumericField(mongoengine.DecimalField):
+    """ numeric value field, stored as the storage mode of the current
+        alias says; values stored with any mode are read with the current one
+    """
+
+    def to_python(self, value: Any) -> Any:
+        if value is None or get_numeric_storage() == NumericStorage.DECIMAL:
+            return super().to_python(value)
+
+        if isinstance(value, Decimal128):
+            value = value.to_decimal()
+
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return value
+
+    def to_mongo(self, value: Any) -> Any:
+        storage = get_numeric_storage()
+
+        if storage == NumericStorage.DOUBLE:
+            return self.to_python(value)
+
+        if storage == NumericStorage.DECIMAL128:
+            return Decimal128("%s" % self.to_python(value))
+
+        return super().to_mongo(value)
+
+
+class TypeModel(AliasDocument, BaseModel):
     """ type model """
 
-    meta = {"collection": "type"}
+    meta = {"collection": "type",
+            "auto_create_index": False,
+            "indexes": ["father", "ancestors"]}
     name = mongoengine.StringField(primary_key=True)
     father = mongoengine.ReferenceField(
         "self", reverse_delete_rule=mongoengine.DO_NOTHING)
 
+    # names of the type and its fathers, from the type to the root
+    ancestors = mongoengine.ListField(mongoengine.StringField())
+
 
-class ObjectModel(mongoengine.Document, BaseModel):
+class ObjectModel(AliasDocument, BaseModel):
     """ object model """
 
-    meta = {"collection": "object"}
+    meta = {"collection": "object",
+            "auto_create_index": False,
+            "indexes": ["type", ["ancestors", "name"], "update_date"]}
     name = mongoengine.StringField(primary_key=True)
     type = mongoengine.ReferenceField(
         TypeModel, reverse_delete_rule=mongoengine.CASCADE)
 
+    # names of the object type and its fathers, from the type to the root
+    ancestors = mongoengine.ListField(mongoengine.StringField())
+
 
-class FluentModel(mongoengine.Document, BaseModel):
+class FluentModel(AliasDocument, BaseModel):
     """ predicate model """
 
-    meta = {"collection": "fluent"}
+    meta = {"collection": "fluent",
+            "auto_create_index": False,
+            "indexes": ["types"]}
     name = mongoengine.StringField(primary_key=True)
     is_numeric = mongoengine.BooleanField()
     types = mongoengine.ListField(
@@ -45,19 +150,35 @@ class FluentModel(mongoengine.Document, BaseModel):
                                    reverse_delete_rule=mongoengine.CASCADE))
 
 
-class FactModel(mongoengine.Document, BaseModel):
+class FactModel(AliasDocument, BaseModel):
     """ proposition model """
 
-    meta = {"collection": "fact"}
+    # arguments is an array, so a unique index over it would be multikey
+    # and would reject facts sharing any object; the natural key uses
+    # arguments_key, the space-joined object names, instead;
+    # is_numeric is copied from the fluent so bool and numeric
+    # facts are filtered without reading their fluents
+    meta = {"collection": "fact",
+            "auto_create_index": False,
+            "indexes": [
+                {"fields": ["fluent", "arguments_key", "is_goal"],
+                 "unique": True},
+                "arguments",
+                ["is_goal", "fluent"],
+                ["is_goal", "is_numeric"],
+                "update_date"
+            ]}
     fluent = mongoengine.ReferenceField(
         FluentModel, reverse_delete_rule=mongoengine.CASCADE)
     arguments = mongoengine.ListField(
         mongoengine.ReferenceField(
             ObjectModel, reverse_delete_rule=mongoengine.CASCADE),
         db_field="objects")
+    arguments_key = mongoengine.StringField()
 
+    is_numeric = mongoengine.BooleanField()
     bool_value = mongoengine.BooleanField()
-    numeric_value = mongoengine.DecimalField()
+    numeric_value = NumericField()
 
     is_goal = mongoengine.BooleanField()
 
@@ -75,8 +196,9 @@ class ConditionEffectModel(mongoengine.EmbeddedDocument):
 
     meta = {"collection": "condition_effect"}
 
+    is_numeric = mongoengine.BooleanField()
     bool_value = mongoengine.BooleanField()
-    numeric_value = mongoengine.DecimalField()
+    numeric_value = NumericField()
 
     condition_effect = mongoengine.StringField()
     time = mongoengine.StringField()
@@ -85,10 +207,12 @@ class ConditionEffectModel(mongoengine.EmbeddedDocument):
     parameters = mongoengine.EmbeddedDocumentListField(ParameterModel)
 
 
-class ActionModel(mongoengine.Document, BaseModel):
+class ActionModel(AliasDocument, BaseModel):
     """ action model """
 
-    meta = {"collection": "action"}
+    meta = {"collection": "action",
+            "auto_create_index": False,
+            "indexes": ["_fluents"]}
 
     action_name = mongoengine.StringField(primary_key=True)
     duration = mongoengine.IntField(default=10)
@@ -103,3 +227,180 @@ class ActionModel(mongoengine.Document, BaseModel):
         ConditionEffectModel)
     effects = mongoengine.EmbeddedDocumentListField(
         ConditionEffectModel)
+
+
+class VersionModel(AliasDocument):
+    """ version model, a counter increased by the writes of a set
+        of collections so its readers can keep what they build from them
+    """
+
+    meta = {"collection": "version",
+            "auto_create_index": False}
+    name = mongoengine.StringField(primary_key=True)
+    value = mongoengine.IntField(default=0)
+
+
+class FactTombstoneModel(AliasDocument):
+    """ deleted fact model, the natural key of a deleted fact
+        kept for 10 minutes by a TTL index so its readers can
+        forget what they built from it
+    """
+
+    meta = {"collection": "fact_tombstone",
+            "auto_create_index": False,
+            "indexes": [{"fields": ["date"], "expireAfterSeconds": 600}]}
+    fluent = mongoengine.StringField()
+    arguments = mongoengine.ListField(mongoengine.StringField())
+    is_goal = mongoengine.BooleanField()
+    date = mongoengine.DateTimeField()
+
+
+def save_fact_tombstones(fact_keys: List[Tuple[str, str, bool]]) -> None:
+    """ save the natural keys of deleted facts
+
+    Args:
+        fact_keys (List[Tuple[str, str, bool]]): fluent name,
+                                                 arguments key and is goal
+    """
+
+    if not fact_keys:
+        return
+
+    now = datetime.datetime.now()
+
+    FactTombstoneModel._get_collection().insert_many(
+        [{"fluent": fluent_name,
+          "arguments": object_names.split(),
+          "is_goal": is_goal,
+          "date": now}
+         for fluent_name, object_names, is_goal in fact_keys],
+        ordered=False)
+
+
+def increase_domain_version() -> None:
+    """ increase the domain version, after a write
+        of the types, the fluents or the actions
+    """
+
+    VersionModel._get_collection().update_one(
+        {"_id": "domain"}, {"$inc": {"value": 1}}, upsert=True)
+
+
+def get_domain_version() -> int:
+    """ get the domain version
+
+    Returns:
+        int: domain version
+    """
+
+    version_doc = VersionModel._get_collection().find_one(
+        {"_id": "domain"}, {"value": 1})
+
+    if version_doc is None:
+        return 0
+
+    return version_doc["value"]
+
+
+def arguments_key(object_names: List[str]) -> str:
+    """ join object names into the fact natural key,
+        PDDL names cannot contain blanks
+
+    Args:
+        object_names (List[str]): object names
+
+    Returns:
+        str: arguments key
+    """
+
+    return " ".join(object_names)
+
+
+def _backfill_facts() -> None:
+    """ backfill the facts stored before arguments_key and is_numeric
+        existed, only those facts and their fluents are read
+    """
+
+    fact_collection = FactModel._get_collection()
+
+    operations = []
+    for fact_doc in fact_collection.find(
+            {"arguments_key": {"$exists": False}}, {"objects": 1}):
+        operations.append(UpdateOne(
+            {"_id": fact_doc["_id"]},
+            {"$set": {"arguments_key":
+                      arguments_key(fact_doc.get("objects", []))}}))
+
+    fluent_names = fact_collection.distinct(
+        "fluent", {"is_numeric": {"$exists": False}})
+
+    for fluent_doc in FluentModel._get_collection().find(
+            {"_id": {"$in": fluent_names}}, {"is_numeric": 1}):
+        operations.append(UpdateMany(
+            {"fluent": fluent_doc["_id"], "is_numeric": {"$exists": False}},
+            {"$set": {"is_numeric": bool(fluent_doc.get("is_numeric"))}}))
+
+    if operations:
+        fact_collection.bulk_write(operations, ordered=False)
+
+
+def ensure_indexes() -> None:
+    """ create the indexes declared in the models meta, it is idempotent;
+        the facts stored before arguments_key and is_numeric existed are
+        backfilled first, so they do not collide on the unique fact key
+        and they are found by the queries
+    """
+
+    _backfill_facts()
+
+    for model_class in (TypeModel, ObjectModel, FluentModel,
+                        FactModel, ActionModel, FactTombstoneModel):
+        model_class.ensure_indexes()
+
+
+def migrate_numeric_values() -> None:
+    """ rewrite the numeric values of the stored facts and actions
+        with the current numeric storage mode, it is idempotent
+    """
+
+    field = FactModel._fields["numeric_value"]
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        return field.to_mongo(field.to_python(value))
+
+    fact_collection = FactModel._get_collection()
+
+    operations = []
+    for fact_doc in fact_collection.find(
+            {"numeric_value": {"$ne": None}}, {"numeric_value": 1}):
+        operations.append(UpdateOne(
+            {"_id": fact_doc["_id"]},
+            {"$set": {"numeric_value": convert(fact_doc["numeric_value"])}}))
+
+    if operations:
+        fact_collection.bulk_write(operations, ordered=False)
+
+    action_collection = ActionModel._get_collection()
+
+    operations = []
+    for action_doc in action_collection.find(
+            {"$or": [{"conditions.numeric_value": {"$exists": True}},
+                     {"effects.numeric_value": {"$exists": True}}]},
+            {"conditions": 1, "effects": 1}):
+
+        update = {}
+        for field_name in ("conditions", "effects"):
+            condition_effect_docs = action_doc.get(field_name, [])
+            for condition_effect_doc in condition_effect_docs:
+                if "numeric_value" in condition_effect_doc:
+                    condition_effect_doc["numeric_value"] = convert(
+                        condition_effect_doc["numeric_value"])
+            update[field_name] = condition_effect_docs
+
+        operations.append(UpdateOne({"_id": action_doc["_id"]},
+                                    {"$set": update}))
+
+    if operations:
+        action_collection.bulk_write(operations, ordered=False)
@@ -1,54 +1,59 @@
 
 """ Mongo Object Dao """
 
-from typing import List
+import datetime
+from typing import List, Set
+from mongoengine import QuerySet
+from mongoengine.connection import DEFAULT_CONNECTION_NAME
 
 from kant.kant_dao.dao_interface import ObjectDao
 from kant.kant_dao.mongo_dao import (
     MongoDao,
+    MongoIdentityMap,
+    MongoSavedIndex,
     MongoTypeDao
 )
 
-from kant.kant_dao.mongo_dao.mongo_models import ObjectModel
+from kant.kant_dao.mongo_dao.mongo_models import (
+    ObjectModel,
+    FactModel
+)
 
 
-from kant.kant_dto import (
-    ObjectDto,
-    TypeDto
-)
+from kant.kant_dto import ObjectDto
 
 
 class MongoObjectDao(ObjectDao, MongoDao):
     """ Mongo Object Dao Class """
 
-    def __init__(self, uri: str = None, connect: bool = True) -> None:
+    def __init__(self, uri: str = None, connect: bool = True,
+                 alias: str = DEFAULT_CONNECTION_NAME) -> None:
 
         ObjectDao.__init__(self)
-        MongoDao.__init__(self, uri, connect)
-
-        self._me_type_dao = MongoTypeDao(uri, connect=False)
+        MongoDao.__init__(self, uri, connect, alias)
 
     @staticmethod
-    def _model_to_dto(object_model: ObjectModel) -> ObjectDto:
+    def _model_to_dto(object_model: ObjectModel,
+                      identity_map: MongoIdentityMap = None) -> ObjectDto:
         """ convert a Mongoengine object document into a ObjectDto
 
         Args:
             object_model (ObjectModel): Mongoengine object document
+            identity_map (MongoIdentityMap, optional): identity map. Defaults to None.
 
         Returns:
             ObjectDto: ObjectDto
         """
 
-        type_dto = MongoTypeDao._model_to_dto(object_model.type)
+        if identity_map is None:
+            identity_map = MongoIdentityMap()
 
-        object_dto = ObjectDto(type_dto,
-                               object_model.name)
-
-        return object_dto
+        return identity_map.get_object_dto(object_model)
 
     @staticmethod
     def _dto_to_model(object_dto: ObjectDto) -> ObjectModel:
-        """ convert a ObjectDto into a Mongoengine object document
+        """ convert a ObjectDto into a Mongoengine object document,
+            its ancestors are the father chain of its type
 
         Args:
             object_dto (ObjectDto): ObjectDto
@@ -66,6 +71,8 @@ class MongoObjectDao(ObjectDao, MongoDao):
 
         object_model.type = type_model
 
+        object_model.ancestors = MongoTypeDao._get_chain(object_dto.type)
+
         return object_model
 
     def _exist_in_mongo(self, object_dto: ObjectDto) -> bool:
@@ -117,27 +124,97 @@ class MongoObjectDao(ObjectDao, MongoDao):
         if object_model:
             object_model = object_model[0]
             object_dto = MongoObjectDao._model_to_dto(
-                object_model)
+                object_model, self._get_identity_map())
             return object_dto
 
         return None
 
-    def get_all(self) -> List[ObjectDto]:
-        """ get all ObjectDto
+    def _get_by_queryset(self, object_model: QuerySet) -> List[ObjectDto]:
+        """ get all ObjectDto of a Mongoengine query
+
+        Args:
+            object_model (QuerySet): Mongoengine query
 
         Returns:
-            List[ObjectDto]: list of all ObjectDto
+            List[ObjectDto]: list of ObjectDto
         """
 
-        object_model = ObjectModel.objects.order_by("name")
         object_dto_list = []
+        identity_map = self._get_identity_map()
 
         for ele in object_model:
-            object_dto = MongoObjectDao._model_to_dto(ele)
+            object_dto = MongoObjectDao._model_to_dto(ele, identity_map)
             object_dto_list.append(object_dto)
 
         return object_dto_list
 
+    def get_all(self) -> List[ObjectDto]:
+        """ get all ObjectDto
+
+        Returns:
+            List[ObjectDto]: list of all ObjectDto
+        """
+
+        return self._get_by_queryset(ObjectModel.objects.order_by("name"))
+
+    def get_by_type(self, type_name: str,
+                    include_subtypes: bool = True) -> List[ObjectDto]:
+        """ get all ObjectDto of a given type sorted by object name,
+            subtypes are found with the ancestors index
+
+        Args:
+            type_name (str): type name
+            include_subtypes (bool, optional): get also the objects of
+                                               the subtypes? Defaults to True.
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+        if include_subtypes:
+            object_model = ObjectModel.objects(ancestors=type_name)
+        else:
+            object_model = ObjectModel.objects(type=type_name)
+
+        return self._get_by_queryset(object_model.order_by("name"))
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[ObjectDto]:
+        """ get a page of ObjectDto sorted by object name
+
+        Args:
+            after (str, optional): last object name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max ObjectDto in the page. Defaults to 100.
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+        return self._get_by_queryset(
+            MongoDao._get_page_queryset(ObjectModel, "name", after, limit))
+
+    def count_all(self) -> int:
+        """ count all ObjectDto without hydrating them
+
+        Returns:
+            int: number of ObjectDto
+        """
+
+        return ObjectModel.objects.count()
+
+    def get_updated_since(self, date: datetime.datetime) -> List[ObjectDto]:
+        """ get all ObjectDto saved at or after a date
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+        return self._get_by_queryset(
+            ObjectModel.objects(update_date__gte=date).order_by("update_date"))
+
     def _save(self, object_dto: ObjectDto) -> bool:
         """ save a ObjectDto
             if the ObjectDto is already saved return False, else return True
@@ -152,16 +229,7 @@ class MongoObjectDao(ObjectDao, MongoDao):
         if self._exist_in_mongo(object_dto):
             return False
 
-        object_model = MongoObjectDao._dto_to_model(
-            object_dto)
-
-        # propagating saving
-        if not self._me_type_dao.save(object_dto.type):
-            return False
-
-        # saving
-        object_model.save()
-        return True
+        return self.save(object_dto)
 
     def _update(self, object_dto: ObjectDto) -> bool:
         """ update a ObjectDto
@@ -174,26 +242,56 @@ class MongoObjectDao(ObjectDao, MongoDao):
             bool: succeed
         """
 
-        object_model = self._get_model(object_dto)
+        if not self._exist_in_mongo(object_dto):
+            return False
 
-        # check if object exists
-        if object_model:
+        return self.save(object_dto)
 
-            # propagating saving
-            if not self._me_type_dao.save(object_dto.type):
-                return False
+    @staticmethod
+    def _upsert_objects(object_dto_list: List[ObjectDto],
+                        failed_types: Set[str] = frozenset()) -> Set[str]:
+        """ upsert ObjectDtos, without their types, in a single round trip;
+            objects already in the saved index with the same type and
+            ancestors are not sent and unchanged objects are not written
 
-            # updating
-            new_object_model = MongoObjectDao._dto_to_model(
-                object_dto)
+        Args:
+            object_dto_list (List[ObjectDto]): list of ObjectDto
+            failed_types (Set[str], optional): names of the types not saved. Defaults to frozenset().
 
-            object_model.name = new_object_model.name
-            object_model.type = new_object_model.type
-            object_model.save()
+        Returns:
+            Set[str]: names of the ObjectDto not saved, or whose type was not
+        """
 
-            return True
+        object_dict = {ele.name: ele for ele in object_dto_list}
+        saved_index = MongoSavedIndex.get_saved_index()
+        object_fields = {}
+        now = MongoDao._now()
+        object_names = []
+        operations = []
 
-        return False
+        for object_dto in object_dict.values():
+            object_model = MongoObjectDao._dto_to_model(object_dto)
+            object_fields[object_dto.name] = (object_dto.type.name,
+                                              tuple(object_model.ancestors))
+
+            if saved_index.is_object_saved(object_dto.name,
+                                           object_fields[object_dto.name]):
+                continue
+
+            object_names.extend([object_dto.name] * 2)
+            operations.extend(MongoDao._to_upserts_if_changed(
+                object_model, ("type", "ancestors"), now))
+
+        failed_indexes = MongoDao._bulk_upsert(ObjectModel, operations)[1]
+        failed_names = MongoDao._get_failed_keys(object_names, failed_indexes)
+
+        failed_names.update(name for name, object_dto in object_dict.items()
+                            if object_dto.type.name in failed_types)
+
+        for object_name in set(object_names) - failed_names:
+            saved_index.set_object(object_name, object_fields[object_name])
+
+        return failed_names
 
     def save(self, object_dto: ObjectDto) -> bool:
         """ save or update a ObjectDto
@@ -206,10 +304,26 @@ class MongoObjectDao(ObjectDao, MongoDao):
             bool: succeed
         """
 
-        if self._exist_in_mongo(object_dto):
-            return self._update(object_dto)
+        return self.save_many([object_dto])[0]
+
+    def save_many(self, object_dto_list: List[ObjectDto]) -> List[bool]:
+        """ save or update a list of ObjectDto with one bulk write
+            per collection
 
-        return self._save(object_dto)
+        Args:
+            object_dto_list (List[ObjectDto]): list of ObjectDto to save or update
+
+        Returns:
+            List[bool]: succeed of each ObjectDto
+        """
+
+        # propagating saving
+        failed_types = MongoTypeDao._upsert_types(
+            [ele.type for ele in object_dto_list])
+
+        # saving
+        failed_names = self._upsert_objects(object_dto_list, failed_types)
+        return [ele.name not in failed_names for ele in object_dto_list]
 
     def delete(self, object_dto: ObjectDto) -> bool:
         """ delete a ObjectDto
@@ -227,10 +341,32 @@ class MongoObjectDao(ObjectDao, MongoDao):
         # check if object exists
         if object_model:
             object_model.delete()
+            MongoSavedIndex.get_saved_index().invalidate()
             return True
 
         return False
 
+    def delete_many(self, object_dto_list: List[ObjectDto]) -> List[bool]:
+        """ delete a list of ObjectDto with bulk deletes,
+            the facts using them are deleted too
+
+        Args:
+            object_dto_list (List[ObjectDto]): list of ObjectDto to delete
+
+        Returns:
+            List[bool]: succeed of each ObjectDto
+        """
+
+        object_names = [ele.name for ele in object_dto_list]
+        deleted_names = set(
+            ObjectModel.objects(name__in=object_names).scalar("name"))
+
+        if deleted_names:
+            ObjectModel.objects(name__in=list(deleted_names)).delete()
+            MongoSavedIndex.get_saved_index().invalidate()
+
+        return MongoDao._delete_results(object_names, deleted_names)
+
     def delete_all(self) -> bool:
         """ delete all objects
 
@@ -238,9 +374,10 @@ class MongoObjectDao(ObjectDao, MongoDao):
             bool: succeed
         """
 
-        object_dto_list = self.get_all()
-
-        for ele in object_dto_list:
-            self.delete(ele)
+        # cascading, facts with arguments
+        FactModel._get_collection().delete_many(
+            {"objects.0": {"$exists": True}})
 
+        ObjectModel._get_collection().delete_many({})
+        MongoSavedIndex.get_saved_index().invalidate()
         return True
@@ -0,0 +1,97 @@
+
+""" Mongo Saved Index """
+
+from typing import Dict, Hashable, Tuple
+
+from kant.kant_dao.mongo_dao.mongo_connection import get_alias
+
+
+class MongoSavedIndex:
+    """ Mongo Saved Index Class
+        stored fields of the objects and fluents written by the DAOs of
+        the current mongoengine alias, so the saves that cascade to them
+        skip the ones already stored; it is cleared by the deletes and the
+        type writes of the DAOs and when the alias is connected again,
+        the writes of other processes are not seen
+    """
+
+    __saved_indexes: Dict[str, "MongoSavedIndex"] = {}
+
+    def __init__(self) -> None:
+        self._objects: Dict[str, Tuple[Hashable, ...]] = {}
+        self._fluents: Dict[str, Tuple[Hashable, ...]] = {}
+
+    @staticmethod
+    def get_saved_index() -> "MongoSavedIndex":
+        """ Static Access Method
+            get the saved index shared by all mongo daos
+            of the current mongoengine alias
+
+        Returns:
+            MongoSavedIndex: saved index
+        """
+
+        alias = get_alias()
+
+        if alias not in MongoSavedIndex.__saved_indexes:
+            MongoSavedIndex.__saved_indexes.setdefault(
+                alias, MongoSavedIndex())
+
+        return MongoSavedIndex.__saved_indexes[alias]
+
+    def invalidate(self) -> None:
+        """ forget the saved objects and fluents
+        """
+
+        self._objects.clear()
+        self._fluents.clear()
+
+    def is_object_saved(self, object_name: str,
+                        fields: Tuple[Hashable, ...]) -> bool:
+        """ check if an object is stored with some fields
+
+        Args:
+            object_name (str): object name
+            fields (Tuple[Hashable, ...]): type name and ancestors
+
+        Returns:
+            bool: stored with the same fields?
+        """
+
+        return self._objects.get(object_name) == fields
+
+    def set_object(self, object_name: str,
+                   fields: Tuple[Hashable, ...]) -> None:
+        """ keep the stored fields of an object
+
+        Args:
+            object_name (str): object name
+            fields (Tuple[Hashable, ...]): type name and ancestors
+        """
+
+        self._objects[object_name] = fields
+
+    def is_fluent_saved(self, fluent_name: str,
+                        fields: Tuple[Hashable, ...]) -> bool:
+        """ check if a fluent is stored with some fields
+
+        Args:
+            fluent_name (str): fluent name
+            fields (Tuple[Hashable, ...]): is_numeric and type names
+
+        Returns:
+            bool: stored with the same fields?
+        """
+
+        return self._fluents.get(fluent_name) == fields
+
+    def set_fluent(self, fluent_name: str,
+                   fields: Tuple[Hashable, ...]) -> None:
+        """ keep the stored fields of a fluent
+
+        Args:
+            fluent_name (str): fluent name
+            fields (Tuple[Hashable, ...]): is_numeric and type names
+        """
+
+        self._fluents[fluent_name] = fields
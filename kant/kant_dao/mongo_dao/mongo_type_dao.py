@@ -1,12 +1,28 @@
 
 """ Mongo Type Dao """
 
-from typing import List
+import datetime
+from typing import Dict, List, Set
+from pymongo import UpdateMany, UpdateOne
+from mongoengine import QuerySet
+from mongoengine.connection import DEFAULT_CONNECTION_NAME
 
 from kant.kant_dao.dao_interface import TypeDao
-from kant.kant_dao.mongo_dao import MongoDao
-
-from kant.kant_dao.mongo_dao.mongo_models import TypeModel
+from kant.kant_dao.mongo_dao import (
+    MongoDao,
+    MongoIdentityMap,
+    MongoSavedIndex,
+    MongoTypeIndex
+)
+
+from kant.kant_dao.mongo_dao.mongo_models import (
+    TypeModel,
+    ObjectModel,
+    FluentModel,
+    FactModel,
+    ActionModel,
+    increase_domain_version
+)
 
 from kant.kant_dto import TypeDto
 
@@ -14,28 +30,29 @@ from kant.kant_dto import TypeDto
 class MongoTypeDao(TypeDao, MongoDao):
     """ Mongo Type Dao Class """
 
-    def __init__(self, uri: str = None, connect: bool = True) -> None:
+    def __init__(self, uri: str = None, connect: bool = True,
+                 alias: str = DEFAULT_CONNECTION_NAME) -> None:
 
         TypeDao.__init__(self)
-        MongoDao.__init__(self, uri, connect)
+        MongoDao.__init__(self, uri, connect, alias)
 
     @staticmethod
-    def _model_to_dto(type_model: TypeModel) -> TypeDto:
+    def _model_to_dto(type_model: TypeModel,
+                      identity_map: MongoIdentityMap = None) -> TypeDto:
         """ convert a Mongoengine type document into a TypeDto
 
         Args:
             type_model (TypeModel): Mongoengine type document
+            identity_map (MongoIdentityMap, optional): identity map. Defaults to None.
 
         Returns:
             TypeDto: TypeDto
         """
 
-        type_dto = TypeDto(type_model.name)
-
-        if type_model.father:
-            type_dto.father = MongoTypeDao._model_to_dto(type_model.father)
+        if identity_map is None:
+            identity_map = MongoIdentityMap()
 
-        return type_dto
+        return identity_map.get_type_dto(type_model)
 
     @staticmethod
     def _dto_to_model(type_dto: TypeDto) -> TypeModel:
@@ -57,6 +74,56 @@ class MongoTypeDao(TypeDao, MongoDao):
 
         return type_model
 
+    @staticmethod
+    def _update_ancestors(check_objects: bool = False) -> None:
+        """ update the ancestors of the types, and of the objects of the
+            types whose ancestors changed, from the stored fathers,
+            the type index is reloaded with them; type writes do not
+            write the ancestors so the changed ones can be found
+
+        Args:
+            check_objects (bool, optional): update the outdated objects of all
+                                            types, used to migrate stored objects.
+                                            Defaults to False.
+        """
+
+        type_collection = TypeModel._get_collection()
+        type_docs = list(type_collection.find(
+            {}, {"father": 1, "ancestors": 1}))
+
+        ancestors = MongoTypeIndex.get_closure(
+            {type_doc["_id"]: type_doc.get("father")
+             for type_doc in type_docs})
+        MongoTypeIndex.get_type_index().set_ancestors(ancestors)
+
+        changed_names = [type_doc["_id"] for type_doc in type_docs
+                         if type_doc.get("ancestors") !=
+                         list(ancestors[type_doc["_id"]])]
+
+        if changed_names:
+            type_collection.bulk_write(
+                [UpdateOne({"_id": type_name},
+                           {"$set": {"ancestors": list(ancestors[type_name])}})
+                 for type_name in changed_names],
+                ordered=False)
+            increase_domain_version()
+
+        if check_objects:
+            object_filters = [
+                {"type": type_name,
+                 "ancestors": {"$ne": list(ancestors[type_name])}}
+                for type_name in ancestors]
+        else:
+            object_filters = [{"type": type_name}
+                              for type_name in changed_names]
+
+        if object_filters:
+            ObjectModel._get_collection().bulk_write(
+                [UpdateMany(ele,
+                            {"$set": {"ancestors": list(ancestors[ele["type"]])}})
+                 for ele in object_filters],
+                ordered=False)
+
     def _exist_in_mongo(self, type_dto: TypeDto) -> bool:
         """ check if TypeDto exists
 
@@ -103,26 +170,63 @@ class MongoTypeDao(TypeDao, MongoDao):
 
         if type_model:
             type_model = type_model[0]
-            return MongoTypeDao._model_to_dto(type_model)
+            return MongoTypeDao._model_to_dto(type_model,
+                                              self._get_identity_map())
 
         return None
 
-    def get_all(self) -> List[TypeDto]:
-        """ get all TypeDto
+    def _get_by_queryset(self, type_model: QuerySet) -> List[TypeDto]:
+        """ get all TypeDto of a Mongoengine query
+
+        Args:
+            type_model (QuerySet): Mongoengine query
 
         Returns:
-            List[TypeDto]: list of all TypeDto
+            List[TypeDto]: list of TypeDto
         """
 
-        type_model = TypeModel.objects.order_by("name")
         type_dto_list = []
+        identity_map = self._get_identity_map()
 
         for ele in type_model:
-            type_dto = MongoTypeDao._model_to_dto(ele)
+            type_dto = MongoTypeDao._model_to_dto(ele, identity_map)
             type_dto_list.append(type_dto)
 
         return type_dto_list
 
+    def get_all(self) -> List[TypeDto]:
+        """ get all TypeDto
+
+        Returns:
+            List[TypeDto]: list of all TypeDto
+        """
+
+        return self._get_by_queryset(TypeModel.objects.order_by("name"))
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[TypeDto]:
+        """ get a page of TypeDto sorted by type name
+
+        Args:
+            after (str, optional): last type name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max TypeDto in the page. Defaults to 100.
+
+        Returns:
+            List[TypeDto]: list of TypeDto
+        """
+
+        return self._get_by_queryset(
+            MongoDao._get_page_queryset(TypeModel, "name", after, limit))
+
+    def count_all(self) -> int:
+        """ count all TypeDto without hydrating them
+
+        Returns:
+            int: number of TypeDto
+        """
+
+        return TypeModel.objects.count()
+
     def _save(self, type_dto: TypeDto) -> bool:
         """ save a TypeDto
             if the TypeDto is already saved return False, else return True
@@ -137,15 +241,7 @@ class MongoTypeDao(TypeDao, MongoDao):
         if self._exist_in_mongo(type_dto):
             return False
 
-        # propagating saving
-        if type_dto.father:
-            if not self.save(type_dto.father):
-                return False
-
-        # saving
-        type_model = MongoTypeDao._dto_to_model(type_dto)
-        type_model.save(force_insert=True)
-        return True
+        return self.save(type_dto)
 
     def _update(self, type_dto: TypeDto) -> bool:
         """ update a TypeDto
@@ -158,22 +254,173 @@ class MongoTypeDao(TypeDao, MongoDao):
             bool: succeed
         """
 
-        type_model = self._get_model(type_dto)
+        if not self._exist_in_mongo(type_dto):
+            return False
 
-        # check if type exists
-        if type_model:
+        return self.save(type_dto)
 
-            # propagating saving
-            if type_dto.father:
-                if not self.save(type_dto.father):
-                    return False
+    @staticmethod
+    def _get_chain(type_dto: TypeDto,
+                   type_dict: Dict[str, TypeDto] = None) -> List[str]:
+        """ get the names of a TypeDto and its fathers; a TypeDto without
+            father keeps the stored one, so its fathers are taken from
+            the type index
 
-            # updating
-            type_model.name = type_dto.name
-            type_model.save()
-            return True
+        Args:
+            type_dto (TypeDto): TypeDto
+            type_dict (Dict[str, TypeDto], optional): TypeDtos by name that replace
+                                                      the ones of the chain. Defaults to None.
 
-        return False
+        Returns:
+            List[str]: ancestor names, from the type to the root
+        """
+
+        chain = []
+
+        while type_dto is not None and type_dto.name not in chain:
+
+            if type_dict is not None:
+                type_dto = type_dict.get(type_dto.name, type_dto)
+
+            chain.append(type_dto.name)
+
+            if type_dto.father is None:
+                stored_chain = MongoTypeIndex.get_type_index().find_ancestors(
+                    type_dto.name) or ()
+                chain.extend(ele for ele in stored_chain[1:]
+                             if ele not in chain)
+
+            type_dto = type_dto.father
+
+        return chain
+
+    @staticmethod
+    def _update_descendants(ancestors: Dict[str, List[str]],
+                            now: datetime.datetime) -> None:
+        """ update the ancestors of the stored types below the written
+            types whose father changed, and of the objects of them all
+
+        Args:
+            ancestors (Dict[str, List[str]]): ancestor names of the written types
+            now (datetime.datetime): update date of the written types
+        """
+
+        type_collection = TypeModel._get_collection()
+
+        # written types have the update date of the write
+        ancestors = {type_doc["_id"]: ancestors[type_doc["_id"]]
+                     for type_doc in type_collection.find(
+                         {"_id": {"$in": list(ancestors)}, "update_date": now},
+                         {"_id": 1})}
+
+        # the stored ancestors of the descendants still name the written type
+        descendants = {}
+        for type_doc in type_collection.find(
+                {"ancestors": {"$in": list(ancestors)},
+                 "_id": {"$nin": list(ancestors)}},
+                {"ancestors": 1}):
+            old_ancestors = type_doc["ancestors"]
+            position = next(index for index, name in enumerate(old_ancestors)
+                            if name in ancestors)
+            descendants[type_doc["_id"]] = (
+                old_ancestors[:position] + ancestors[old_ancestors[position]])
+
+        if descendants:
+            type_collection.bulk_write(
+                [UpdateOne({"_id": type_name},
+                           {"$set": {"ancestors": type_ancestors}})
+                 for type_name, type_ancestors in descendants.items()],
+                ordered=False)
+
+        ancestors.update(descendants)
+
+        if ancestors:
+            ObjectModel._get_collection().bulk_write(
+                [UpdateMany({"type": type_name,
+                             "ancestors": {"$ne": type_ancestors}},
+                            {"$set": {"ancestors": type_ancestors}})
+                 for type_name, type_ancestors in ancestors.items()],
+                ordered=False)
+
+    @staticmethod
+    def _upsert_types(type_dto_list: List[TypeDto]) -> Set[str]:
+        """ upsert TypeDtos and their fathers in a single round trip,
+            their ancestors are taken from the father chain of the DTOs;
+            types already in the type index with the same ancestors are
+            not written, TypeDtos without father only insert the type, so
+            the stored father is kept, and the descendants and objects
+            are only updated if a stored father changed
+
+        Args:
+            type_dto_list (List[TypeDto]): list of TypeDto
+
+        Returns:
+            Set[str]: names of the TypeDto not saved, or whose fathers were not
+        """
+
+        type_dict: Dict[str, TypeDto] = {}
+
+        for type_dto in type_dto_list:
+            while type_dto is not None:
+
+                # a TypeDto with father replaces one without it
+                old_type_dto = type_dict.get(type_dto.name)
+                if old_type_dto is not None and (
+                        old_type_dto.father is not None or
+                        type_dto.father is None):
+                    break
+
+                type_dict[type_dto.name] = type_dto
+                type_dto = type_dto.father
+
+        type_index = MongoTypeIndex.get_type_index()
+
+        # types written by other processes are read once
+        if any(type_dto.father is None and
+               type_index.find_ancestors(type_name) is None
+               for type_name, type_dto in type_dict.items()):
+            type_index.invalidate()
+
+        now = MongoDao._now()
+        ancestors = {}
+        type_names = []
+        operations = []
+
+        for type_name, type_dto in type_dict.items():
+            ancestors[type_name] = MongoTypeDao._get_chain(
+                type_dto, type_dict)
+            stored_chain = type_index.find_ancestors(type_name)
+
+            if stored_chain is not None and (
+                    type_dto.father is None or
+                    list(stored_chain) == ancestors[type_name]):
+                continue
+
+            type_model = MongoTypeDao._dto_to_model(type_dto)
+            type_model.ancestors = ancestors[type_name]
+
+            if type_dto.father is None:
+                type_operations = MongoDao._to_upserts_if_changed(
+                    type_model, (), now)
+            else:
+                type_operations = MongoDao._to_upserts_if_changed(
+                    type_model, ("father", "ancestors"), now)
+
+            operations.extend(type_operations)
+            type_names.extend([type_name] * len(type_operations))
+
+        written, failed_indexes = MongoDao._bulk_upsert(TypeModel, operations)
+
+        if written:
+            MongoTypeDao._update_descendants(ancestors, now)
+            type_index.invalidate()
+            MongoSavedIndex.get_saved_index().invalidate()
+            increase_domain_version()
+
+        failed_names = MongoDao._get_failed_keys(type_names, failed_indexes)
+
+        return set(type_name for type_name in type_dict
+                   if failed_names.intersection(ancestors[type_name]))
 
     def save(self, type_dto: TypeDto) -> bool:
         """ save or update a TypeDto
@@ -186,10 +433,21 @@ class MongoTypeDao(TypeDao, MongoDao):
             bool: succeed
         """
 
-        if self._exist_in_mongo(type_dto):
-            return self._update(type_dto)
+        return self.save_many([type_dto])[0]
 
-        return self._save(type_dto)
+    def save_many(self, type_dto_list: List[TypeDto]) -> List[bool]:
+        """ save or update a list of TypeDto, and their fathers,
+            in a single bulk write
+
+        Args:
+            type_dto_list (List[TypeDto]): list of TypeDto to save or update
+
+        Returns:
+            List[bool]: succeed of each TypeDto
+        """
+
+        failed_names = self._upsert_types(type_dto_list)
+        return [ele.name not in failed_names for ele in type_dto_list]
 
     def delete(self, type_dto: TypeDto) -> bool:
         """ delete a TypeDto
@@ -215,10 +473,39 @@ class MongoTypeDao(TypeDao, MongoDao):
             for child in child_models:
                 child.delete()
 
+            MongoTypeIndex.get_type_index().invalidate()
+            MongoSavedIndex.get_saved_index().invalidate()
+            increase_domain_version()
             return True
 
         return False
 
+    def delete_many(self, type_dto_list: List[TypeDto]) -> List[bool]:
+        """ delete a list of TypeDto, and their childs, with bulk deletes
+
+        Args:
+            type_dto_list (List[TypeDto]): list of TypeDto to delete
+
+        Returns:
+            List[bool]: succeed of each TypeDto
+        """
+
+        type_names = [ele.name for ele in type_dto_list]
+        deleted_names = set(
+            TypeModel.objects(name__in=type_names).scalar("name"))
+
+        if deleted_names:
+            TypeModel.objects(name__in=list(deleted_names)).delete()
+
+            # delete childs
+            TypeModel.objects(father__in=list(deleted_names)).delete()
+
+            MongoTypeIndex.get_type_index().invalidate()
+            MongoSavedIndex.get_saved_index().invalidate()
+            increase_domain_version()
+
+        return MongoDao._delete_results(type_names, deleted_names)
+
     def delete_all(self) -> bool:
         """ delete all types
 
@@ -226,9 +513,26 @@ class MongoTypeDao(TypeDao, MongoDao):
             bool: succeed
         """
 
-        type_dto_list = self.get_all()
+        fact_collection = FactModel._get_collection()
+
+        # cascading objects, every object has a type
+        fact_collection.delete_many({"objects.0": {"$exists": True}})
+        ObjectModel._get_collection().delete_many({})
+
+        # cascading fluents with types
+        fluent_collection = FluentModel._get_collection()
+        fluent_names = [fluent_doc["_id"] for fluent_doc in
+                        fluent_collection.find(
+                            {"types.0": {"$exists": True}}, {"_id": 1})]
 
-        for ele in type_dto_list:
-            self.delete(ele)
+        if fluent_names:
+            fact_collection.delete_many({"fluent": {"$in": fluent_names}})
+            ActionModel._get_collection().delete_many(
+                {"_fluents": {"$in": fluent_names}})
+            fluent_collection.delete_many({"_id": {"$in": fluent_names}})
 
+        TypeModel._get_collection().delete_many({})
+        MongoTypeIndex.get_type_index().invalidate()
+        MongoSavedIndex.get_saved_index().invalidate()
+        increase_domain_version()
         return True
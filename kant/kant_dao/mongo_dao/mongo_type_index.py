@@ -0,0 +1,166 @@
+
+""" Mongo Type Index """
+
+from typing import Dict, List, Tuple
+
+from kant.kant_dao.mongo_dao.mongo_connection import get_alias
+from kant.kant_dao.mongo_dao.mongo_models import TypeModel
+
+
+class MongoTypeIndex:
+    """ Mongo Type Index Class
+        ancestor closure of every stored type, so checking if a type
+        is or inherits from another type is a lookup in its ancestor
+        chain; it is built from the type collection on demand, it
+        is reloaded or invalidated by the type writes and it is built
+        again when a type written by another process is not found
+    """
+
+    __type_indexes: Dict[str, "MongoTypeIndex"] = {}
+
+    def __init__(self) -> None:
+        self._ancestors: Dict[str, Tuple[str, ...]] = None
+
+    @staticmethod
+    def get_type_index() -> "MongoTypeIndex":
+        """ Static Access Method
+            get the type index shared by all mongo daos
+            of the current mongoengine alias
+
+        Returns:
+            MongoTypeIndex: type index
+        """
+
+        alias = get_alias()
+
+        if alias not in MongoTypeIndex.__type_indexes:
+            MongoTypeIndex.__type_indexes.setdefault(alias, MongoTypeIndex())
+
+        return MongoTypeIndex.__type_indexes[alias]
+
+    def invalidate(self) -> None:
+        """ forget the ancestor closure, it will be rebuilt on the next check
+        """
+
+        self._ancestors = None
+
+    def set_ancestors(self, ancestors: Dict[str, Tuple[str, ...]]) -> None:
+        """ load an already built ancestor closure
+
+        Args:
+            ancestors (Dict[str, Tuple[str, ...]]): ancestor names,
+                                                    from the type to the root, by type name
+        """
+
+        self._ancestors = ancestors
+
+    @staticmethod
+    def get_closure(fathers: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+        """ build the ancestor closure of a set of types
+
+        Args:
+            fathers (Dict[str, str]): father name, or None, by type name
+
+        Returns:
+            Dict[str, Tuple[str, ...]]: ancestor names, from the type to the root, by type name
+        """
+
+        ancestors = {}
+
+        for type_name in fathers:
+
+            # walk up until a type with known ancestors
+            chain = []
+            while (type_name is not None and
+                   type_name not in ancestors and
+                   type_name not in chain):
+                chain.append(type_name)
+                type_name = fathers.get(type_name)
+
+            known = ancestors.get(type_name, ())
+
+            for ele in reversed(chain):
+                known = (ele,) + known
+                ancestors[ele] = known
+
+        return ancestors
+
+    @staticmethod
+    def _build() -> Dict[str, Tuple[str, ...]]:
+        """ build the ancestor closure of the stored types with one query
+
+        Returns:
+            Dict[str, Tuple[str, ...]]: ancestor names, itself included, by type name
+        """
+
+        return MongoTypeIndex.get_closure(
+            {type_doc["_id"]: type_doc.get("father")
+             for type_doc in TypeModel._get_collection().find(
+                 {}, {"father": 1})})
+
+    def _get_chain(self, type_name: str) -> Tuple[str, ...]:
+        """ get the ancestor chain of a type, the closure is built
+            again once if the type is not in it, since other writers
+            may have stored it after the closure was built
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            Tuple[str, ...]: ancestor names, from the type to the root,
+                             empty if the type is not stored
+        """
+
+        ancestors = self._ancestors
+
+        if ancestors is None or type_name not in ancestors:
+            ancestors = MongoTypeIndex._build()
+            self._ancestors = ancestors
+
+        return ancestors.get(type_name, ())
+
+    def find_ancestors(self, type_name: str) -> Tuple[str, ...]:
+        """ get the ancestor chain of a type from the closure, it is
+            only built if it was invalidated, not when the type is missing
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            Tuple[str, ...]: ancestor names, from the type to the root,
+                             None if the type is not in the closure
+        """
+
+        if self._ancestors is None:
+            self._ancestors = MongoTypeIndex._build()
+
+        return self._ancestors.get(type_name)
+
+    def get_ancestors(self, type_name: str) -> List[str]:
+        """ get the names of a stored type and its fathers
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            List[str]: ancestor names, from the type to the root,
+                       empty if the type is not stored
+        """
+
+        return list(self._get_chain(type_name))
+
+    def is_subtype(self, type_name: str, father_name: str) -> bool:
+        """ check if a type is or inherit from another type
+
+        Args:
+            type_name (str): type to check
+            father_name (str): target type
+
+        Returns:
+            bool: is or inherit?
+        """
+
+        if type_name == father_name:
+            return True
+
+        return father_name in self._get_chain(type_name)
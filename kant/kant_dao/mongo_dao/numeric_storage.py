@@ -0,0 +1,20 @@
+
+""" Numeric Storage Enumeration """
+
+from enum import IntEnum, auto
+
+
+class NumericStorage(IntEnum):
+    """ Enum Class of the BSON types used to store numeric values
+        DECIMAL: 2 decimal place doubles read as Decimal, as DecimalField
+        DOUBLE: native doubles read as float
+        DECIMAL128: native Decimal128 read as float
+    """
+
+    def _generate_next_value_(self, _start, count, _last_values):
+        """Generate consecutive automatic numbers starting from zero."""
+        return count
+
+    DECIMAL = auto()
+    DOUBLE = auto()
+    DECIMAL128 = auto()
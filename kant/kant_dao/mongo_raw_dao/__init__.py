@@ -0,0 +1,7 @@
+
+from kant.kant_dao.mongo_raw_dao.mongo_raw_loader import MongoRawLoader
+from kant.kant_dao.mongo_raw_dao.mongo_raw_type_dao import MongoRawTypeDao
+from kant.kant_dao.mongo_raw_dao.mongo_raw_object_dao import MongoRawObjectDao
+from kant.kant_dao.mongo_raw_dao.mongo_raw_fluent_dao import MongoRawFluentDao
+from kant.kant_dao.mongo_raw_dao.mongo_raw_fact_dao import MongoRawFactDao
+from kant.kant_dao.mongo_raw_dao.mongo_raw_action_dao import MongoRawActionDao
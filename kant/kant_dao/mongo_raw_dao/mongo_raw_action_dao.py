@@ -0,0 +1,179 @@
+
+""" Mongo Raw Action Dao """
+
+from typing import Dict, Iterable, List
+from mongoengine import QuerySet
+
+from kant.kant_dao.mongo_dao import (
+    MongoActionDao,
+    MongoTypeIndex
+)
+from kant.kant_dao.mongo_dao.mongo_models import ActionModel
+from kant.kant_dao.mongo_raw_dao import MongoRawLoader
+
+from kant.kant_dto import (
+    ConditionEffectDto,
+    ActionDto,
+    ObjectDto
+)
+
+
+class MongoRawActionDao(MongoActionDao):
+    """ Mongo Raw Action Dao Class
+        reads raw BSON documents instead of Mongoengine documents
+    """
+
+    @staticmethod
+    def __condition_effect_document_to_dto(condition_effect_doc: dict,
+                                           parameter_dict: Dict[str, ObjectDto],
+                                           loader: MongoRawLoader
+                                           ) -> ConditionEffectDto:
+        """ convert a raw condition/effect document into a ConditionEffectDto
+
+        Args:
+            condition_effect_doc (dict): raw condition/effect document
+            parameter_dict (Dict[str, ObjectDto]): action parameters by name
+            loader (MongoRawLoader): loader with the referenced documents
+
+        Returns:
+            ConditionEffectDto: ConditionEffectDto
+        """
+
+        fluent_dto = loader.get_fluent_dto(condition_effect_doc["fluent"])
+
+        condition_effect_dto = ConditionEffectDto(
+            fluent_dto,
+            condition_effect=condition_effect_doc.get("condition_effect"),
+            time=condition_effect_doc.get("time"))
+
+        if fluent_dto.is_numeric:
+            condition_effect_dto.value = MongoRawLoader.to_numeric(
+                condition_effect_doc.get("numeric_value"))
+        else:
+            condition_effect_dto.value = condition_effect_doc.get(
+                "bool_value")
+
+        condition_effect_dto.objects = [
+            parameter_dict[parameter_doc["name"]]
+            for parameter_doc in condition_effect_doc.get("parameters", [])]
+
+        return condition_effect_dto
+
+    @staticmethod
+    def _document_to_dto(action_doc: dict, loader: MongoRawLoader) -> ActionDto:
+        """ convert a raw action document into a ActionDto
+
+        Args:
+            action_doc (dict): raw action document
+            loader (MongoRawLoader): loader with the referenced documents
+
+        Returns:
+            ActionDto: ActionDto
+        """
+
+        action_dto = ActionDto(action_doc["_id"])
+        action_dto.duration = action_doc.get("duration")
+        action_dto.durative = action_doc.get("durative")
+
+        parameters_list = []
+        conditions_list = []
+        effects_list = []
+        parameter_dict = {}
+
+        # ACTION PARAMS
+        for parameter_doc in action_doc.get("parameters", []):
+            object_dto = ObjectDto(loader.get_type_dto(parameter_doc["type"]),
+                                   parameter_doc["name"])
+            parameter_dict[parameter_doc["name"]] = object_dto
+            parameters_list.append(object_dto)
+
+        # ACTION CONDIS
+        for condition_doc in action_doc.get("conditions", []):
+            condition_effect_dto = MongoRawActionDao.__condition_effect_document_to_dto(
+                condition_doc, parameter_dict, loader)
+            conditions_list.append(condition_effect_dto)
+
+        # ACTION EFFECTS
+        for effect_doc in action_doc.get("effects", []):
+            condition_effect_dto = MongoRawActionDao.__condition_effect_document_to_dto(
+                effect_doc, parameter_dict, loader)
+            effects_list.append(condition_effect_dto)
+
+        action_dto.parameters = parameters_list
+        action_dto.conditions = conditions_list
+        action_dto.effects = effects_list
+
+        return action_dto
+
+    @staticmethod
+    def _documents_to_dtos(action_docs: Iterable[dict]) -> List[ActionDto]:
+        """ convert raw action documents into correct ActionDtos,
+            referenced documents are loaded in bulk
+
+        Args:
+            action_docs (Iterable[dict]): raw action documents
+
+        Returns:
+            List[ActionDto]: list of ActionDto
+        """
+
+        action_docs = list(action_docs)
+
+        fluent_names = []
+        type_names = []
+
+        for action_doc in action_docs:
+
+            for parameter_doc in action_doc.get("parameters", []):
+                type_names.append(parameter_doc["type"])
+
+            for condition_effect_doc in (action_doc.get("conditions", []) +
+                                         action_doc.get("effects", [])):
+                fluent_names.append(condition_effect_doc["fluent"])
+
+        loader = MongoRawLoader()
+        loader.load_fluents(fluent_names)
+        loader.load_types(type_names)
+
+        action_dto_list = []
+        type_index = MongoTypeIndex.get_type_index()
+
+        for ele in action_docs:
+            action_dto = MongoRawActionDao._document_to_dto(ele, loader)
+            if MongoActionDao._check_action_dto(action_dto, type_index):
+                action_dto_list.append(action_dto)
+
+        return action_dto_list
+
+    def get(self, action_name: str) -> ActionDto:
+        """ get a ActionDto with a given action name
+            return None if there is no with that action name
+
+        Args:
+            action_name (str): action name
+
+        Returns:
+            ActionDto: ActionDto of the action name
+        """
+
+        action_dto_list = MongoRawActionDao._documents_to_dtos(
+            ActionModel.objects(action_name=action_name).as_pymongo())
+
+        # check if action exists
+        if action_dto_list:
+            return action_dto_list[0]
+
+        return None
+
+    def _get_by_queryset(self, action_model: QuerySet) -> List[ActionDto]:
+        """ get all ActionDto of a Mongoengine query
+
+        Args:
+            action_model (QuerySet): Mongoengine query
+
+        Returns:
+            List[ActionDto]: list of ActionDto
+        """
+
+        return MongoRawActionDao._documents_to_dtos(
+            action_model.as_pymongo())
@@ -0,0 +1,128 @@
+
+""" Mongo Raw Fact Dao """
+
+from typing import Iterator, List
+
+from kant.kant_dao.mongo_dao import (
+    MongoFactDao,
+    MongoTypeIndex
+)
+from kant.kant_dao.mongo_dao.mongo_models import (
+    TypeModel,
+    ObjectModel,
+    FluentModel,
+    FactModel
+)
+from kant.kant_dao.mongo_raw_dao import MongoRawLoader
+
+from kant.kant_dto import FactDto
+
+
+class MongoRawFactDao(MongoFactDao):
+    """ Mongo Raw Fact Dao Class
+        reads raw BSON documents instead of Mongoengine documents,
+        facts are joined with their references in one aggregation
+    """
+
+    @staticmethod
+    def _document_to_dto(fact_doc: dict, loader: MongoRawLoader) -> FactDto:
+        """ convert a raw fact document into a FactDto
+
+        Args:
+            fact_doc (dict): raw fact document
+            loader (MongoRawLoader): loader with the referenced documents
+
+        Returns:
+            FactDto: FactDto
+        """
+
+        fluent_dto = loader.get_fluent_dto(fact_doc["fluent"])
+
+        object_list = [loader.get_object_dto(object_name)
+                       for object_name in fact_doc.get("objects", [])]
+
+        fact_dto = FactDto(
+            fluent_dto, object_list)
+
+        fact_dto.is_goal = fact_doc.get("is_goal")
+
+        if fact_dto.fluent.is_numeric:
+            fact_dto.value = MongoRawLoader.to_numeric(
+                fact_doc.get("numeric_value"))
+        else:
+            fact_dto.value = fact_doc.get("bool_value")
+
+        return fact_dto
+
+    @staticmethod
+    def _get_pipeline(query: dict) -> List[dict]:
+        """ build the aggregation pipeline that joins each fact document
+            with its fluent, its objects and all their types and fathers
+
+        Args:
+            query (dict): mongo filter of the fact documents
+
+        Returns:
+            List[dict]: aggregation pipeline
+        """
+
+        type_collection = TypeModel._get_collection_name()
+
+        return [
+            {"$match": query},
+            {"$lookup": {"from": FluentModel._get_collection_name(),
+                         "localField": "fluent",
+                         "foreignField": "_id",
+                         "as": "_fluent"}},
+            {"$unwind": "$_fluent"},
+            {"$lookup": {"from": ObjectModel._get_collection_name(),
+                         "localField": "objects",
+                         "foreignField": "_id",
+                         "as": "_objects"}},
+            {"$graphLookup": {"from": type_collection,
+                              "startWith": "$_fluent.types",
+                              "connectFromField": "father",
+                              "connectToField": "_id",
+                              "as": "_fluent_types"}},
+            {"$graphLookup": {"from": type_collection,
+                              "startWith": "$_objects.type",
+                              "connectFromField": "father",
+                              "connectToField": "_id",
+                              "as": "_object_types"}}
+        ]
+
+    def _iter_by_query(self, batch_size: int = None,
+                       **query) -> Iterator[FactDto]:
+        """ iterate over all correct FactDto that match a Mongoengine query,
+            fact documents are read already joined with their fluents,
+            objects and types, so the query is one aggregation
+
+        Args:
+            batch_size (int, optional): documents per cursor batch,
+                                        None for the driver default. Defaults to None.
+            query: Mongoengine query
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        options = {}
+        if batch_size is not None:
+            options["batchSize"] = batch_size
+
+        fact_docs = FactModel._get_collection().aggregate(
+            MongoRawFactDao._get_pipeline(FactModel.objects(**query)._query),
+            **options)
+
+        loader = MongoRawLoader()
+        type_index = MongoTypeIndex.get_type_index()
+
+        for ele in fact_docs:
+            loader.add_fluent_docs([ele["_fluent"]])
+            loader.add_object_docs(ele["_objects"])
+            loader.add_type_docs(ele.get("_fluent_types", []))
+            loader.add_type_docs(ele.get("_object_types", []))
+
+            fact_dto = MongoRawFactDao._document_to_dto(ele, loader)
+            if MongoFactDao._check_fact_dto(fact_dto, type_index):
+                yield fact_dto
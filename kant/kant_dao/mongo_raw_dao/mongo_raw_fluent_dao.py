@@ -0,0 +1,61 @@
+
+""" Mongo Raw Fluent Dao """
+
+from typing import List
+from mongoengine import QuerySet
+
+from kant.kant_dao.mongo_dao import MongoFluentDao
+from kant.kant_dao.mongo_raw_dao import MongoRawLoader
+
+from kant.kant_dto import FluentDto
+
+
+class MongoRawFluentDao(MongoFluentDao):
+    """ Mongo Raw Fluent Dao Class
+        reads raw BSON documents instead of Mongoengine documents
+    """
+
+    def get(self, fluent_name: str) -> FluentDto:
+        """ get a FluentDto with a given fluent name
+            return None if there is no with that fluent name
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            FluentDto: FluentDto of the fluent name
+        """
+
+        loader = MongoRawLoader()
+        loader.load_fluents([fluent_name])
+
+        # check if fluent exist
+        if loader.has_fluent(fluent_name):
+            return loader.get_fluent_dto(fluent_name)
+
+        return None
+
+    def _get_by_queryset(self, fluent_model: QuerySet) -> List[FluentDto]:
+        """ get all FluentDto of a Mongoengine query
+
+        Args:
+            fluent_model (QuerySet): Mongoengine query
+
+        Returns:
+            List[FluentDto]: list of FluentDto
+        """
+
+        fluent_docs = list(fluent_model.as_pymongo())
+
+        loader = MongoRawLoader()
+        loader.add_fluent_docs(fluent_docs)
+        loader.load_types(type_name for fluent_doc in fluent_docs
+                          for type_name in fluent_doc.get("types", []))
+
+        fluent_dto_list = []
+
+        for ele in fluent_docs:
+            fluent_dto = loader.get_fluent_dto(ele["_id"])
+            fluent_dto_list.append(fluent_dto)
+
+        return fluent_dto_list
@@ -0,0 +1,242 @@
+
+""" Mongo Raw Loader """
+
+from decimal import Decimal
+from typing import Dict, Iterable, List, Union
+
+from kant.kant_dao.mongo_dao.mongo_models import (
+    TypeModel,
+    ObjectModel,
+    FluentModel,
+    FactModel
+)
+
+from kant.kant_dto import (
+    TypeDto,
+    ObjectDto,
+    FluentDto
+)
+
+
+class MongoRawLoader:
+    """ Mongo Raw Loader Class
+        per-query cache of raw type, object and fluent documents;
+        referenced documents are loaded with one $in query per
+        collection instead of one dereference per reference,
+        and each one is hydrated once and shared by reference
+    """
+
+    def __init__(self) -> None:
+        self._type_docs: Dict[str, dict] = {}
+        self._object_docs: Dict[str, dict] = {}
+        self._fluent_docs: Dict[str, dict] = {}
+
+        self._type_dtos: Dict[str, TypeDto] = {}
+        self._object_dtos: Dict[str, ObjectDto] = {}
+        self._fluent_dtos: Dict[str, FluentDto] = {}
+
+    @staticmethod
+    def to_numeric(value: float) -> Union[float, Decimal]:
+        """ convert a BSON numeric value as the numeric value field does,
+            following the numeric storage mode
+
+        Args:
+            value (float): BSON value
+
+        Returns:
+            Union[float, Decimal]: float or decimal value
+        """
+
+        return FactModel._fields["numeric_value"].to_python(value)
+
+    def load_types(self, type_names: Iterable[str]) -> None:
+        """ load type documents and their fathers
+
+        Args:
+            type_names (Iterable[str]): type names
+        """
+
+        missing = {name for name in type_names
+                   if name is not None and name not in self._type_docs}
+
+        while missing:
+
+            for type_doc in TypeModel.objects(name__in=list(missing)).as_pymongo():
+                self._type_docs[type_doc["_id"]] = type_doc
+
+            # not found types are cached as None
+            for name in missing:
+                self._type_docs.setdefault(name, None)
+
+            missing = {type_doc.get("father")
+                       for type_doc in self._type_docs.values()
+                       if type_doc is not None}
+            missing = {name for name in missing
+                       if name is not None and name not in self._type_docs}
+
+    def load_objects(self, object_names: Iterable[str]) -> None:
+        """ load object documents and their types
+
+        Args:
+            object_names (Iterable[str]): object names
+        """
+
+        missing = {name for name in object_names
+                   if name not in self._object_docs}
+
+        if not missing:
+            return
+
+        for object_doc in ObjectModel.objects(name__in=list(missing)).as_pymongo():
+            self._object_docs[object_doc["_id"]] = object_doc
+
+        self.load_types(self._object_docs[name]["type"]
+                        for name in missing if name in self._object_docs)
+
+    def load_fluents(self, fluent_names: Iterable[str]) -> None:
+        """ load fluent documents and their types
+
+        Args:
+            fluent_names (Iterable[str]): fluent names
+        """
+
+        missing = {name for name in fluent_names
+                   if name not in self._fluent_docs}
+
+        if not missing:
+            return
+
+        for fluent_doc in FluentModel.objects(name__in=list(missing)).as_pymongo():
+            self._fluent_docs[fluent_doc["_id"]] = fluent_doc
+
+        type_names = []
+        for name in missing:
+            if name in self._fluent_docs:
+                type_names.extend(self._fluent_docs[name].get("types", []))
+
+        self.load_types(type_names)
+
+    def add_type_docs(self, type_docs: List[dict]) -> None:
+        """ add already read type documents to the cache
+
+        Args:
+            type_docs (List[dict]): type documents
+        """
+
+        for type_doc in type_docs:
+            self._type_docs[type_doc["_id"]] = type_doc
+
+    def add_object_docs(self, object_docs: List[dict]) -> None:
+        """ add already read object documents to the cache
+
+        Args:
+            object_docs (List[dict]): object documents
+        """
+
+        for object_doc in object_docs:
+            self._object_docs[object_doc["_id"]] = object_doc
+
+    def add_fluent_docs(self, fluent_docs: List[dict]) -> None:
+        """ add already read fluent documents to the cache
+
+        Args:
+            fluent_docs (List[dict]): fluent documents
+        """
+
+        for fluent_doc in fluent_docs:
+            self._fluent_docs[fluent_doc["_id"]] = fluent_doc
+
+    def has_object(self, object_name: str) -> bool:
+        """ check if an object document is loaded
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            bool: object loaded?
+        """
+
+        return object_name in self._object_docs
+
+    def has_fluent(self, fluent_name: str) -> bool:
+        """ check if a fluent document is loaded
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            bool: fluent loaded?
+        """
+
+        return fluent_name in self._fluent_docs
+
+    def get_type_dto(self, type_name: str) -> TypeDto:
+        """ get the TypeDto, with its fathers, from the loaded documents
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            TypeDto: TypeDto, None if the type is not loaded
+        """
+
+        if type_name in self._type_dtos:
+            return self._type_dtos[type_name]
+
+        type_doc = self._type_docs.get(type_name)
+
+        if type_doc is None:
+            return None
+
+        type_dto = TypeDto(type_doc["_id"])
+        self._type_dtos[type_name] = type_dto
+
+        if type_doc.get("father"):
+            type_dto.father = self.get_type_dto(type_doc["father"])
+
+        return type_dto
+
+    def get_object_dto(self, object_name: str) -> ObjectDto:
+        """ get the ObjectDto from the loaded documents
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            ObjectDto: ObjectDto
+        """
+
+        if object_name not in self._object_dtos:
+            object_doc = self._object_docs[object_name]
+
+            self._object_dtos[object_name] = ObjectDto(
+                self.get_type_dto(object_doc["type"]),
+                object_doc["_id"])
+
+        return self._object_dtos[object_name]
+
+    def get_fluent_dto(self, fluent_name: str) -> FluentDto:
+        """ get the FluentDto from the loaded documents
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            FluentDto: FluentDto
+        """
+
+        if fluent_name in self._fluent_dtos:
+            return self._fluent_dtos[fluent_name]
+
+        fluent_doc = self._fluent_docs[fluent_name]
+
+        type_dto_list = []
+        for type_name in fluent_doc.get("types", []):
+            type_dto_list.append(self.get_type_dto(type_name))
+
+        fluent_dto = FluentDto(fluent_doc["_id"],
+                               type_dto_list,
+                               fluent_doc.get("is_numeric"))
+        self._fluent_dtos[fluent_name] = fluent_dto
+
+        return fluent_dto
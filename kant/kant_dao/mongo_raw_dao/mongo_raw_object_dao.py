@@ -0,0 +1,60 @@
+
+""" Mongo Raw Object Dao """
+
+from typing import List
+from mongoengine import QuerySet
+
+from kant.kant_dao.mongo_dao import MongoObjectDao
+from kant.kant_dao.mongo_raw_dao import MongoRawLoader
+
+from kant.kant_dto import ObjectDto
+
+
+class MongoRawObjectDao(MongoObjectDao):
+    """ Mongo Raw Object Dao Class
+        reads raw BSON documents instead of Mongoengine documents
+    """
+
+    def get(self, object_name: str) -> ObjectDto:
+        """ get a ObjectDto with a given object name
+            return None if there is no with that object name
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            ObjectDto: ObjectDto of the object name
+        """
+
+        loader = MongoRawLoader()
+        loader.load_objects([object_name])
+
+        # check if object exists
+        if loader.has_object(object_name):
+            return loader.get_object_dto(object_name)
+
+        return None
+
+    def _get_by_queryset(self, object_model: QuerySet) -> List[ObjectDto]:
+        """ get all ObjectDto of a Mongoengine query
+
+        Args:
+            object_model (QuerySet): Mongoengine query
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+        object_docs = list(object_model.as_pymongo())
+
+        loader = MongoRawLoader()
+        loader.add_object_docs(object_docs)
+        loader.load_types(object_doc["type"] for object_doc in object_docs)
+
+        object_dto_list = []
+
+        for ele in object_docs:
+            object_dto = loader.get_object_dto(ele["_id"])
+            object_dto_list.append(object_dto)
+
+        return object_dto_list
@@ -0,0 +1,56 @@
+
+""" Mongo Raw Type Dao """
+
+from typing import List
+from mongoengine import QuerySet
+
+from kant.kant_dao.mongo_dao import MongoTypeDao
+from kant.kant_dao.mongo_raw_dao import MongoRawLoader
+
+from kant.kant_dto import TypeDto
+
+
+class MongoRawTypeDao(MongoTypeDao):
+    """ Mongo Raw Type Dao Class
+        reads raw BSON documents instead of Mongoengine documents
+    """
+
+    def get(self, type_name: str) -> TypeDto:
+        """ get a TypeDto with a given type name
+            return None if there is no with that type name
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            TypeDto: TypeDto of the type name
+        """
+
+        loader = MongoRawLoader()
+        loader.load_types([type_name])
+
+        return loader.get_type_dto(type_name)
+
+    def _get_by_queryset(self, type_model: QuerySet) -> List[TypeDto]:
+        """ get all TypeDto of a Mongoengine query
+
+        Args:
+            type_model (QuerySet): Mongoengine query
+
+        Returns:
+            List[TypeDto]: list of TypeDto
+        """
+
+        type_docs = list(type_model.as_pymongo())
+
+        loader = MongoRawLoader()
+        loader.add_type_docs(type_docs)
+        loader.load_types(type_doc.get("father") for type_doc in type_docs)
+
+        type_dto_list = []
+
+        for ele in type_docs:
+            type_dto = loader.get_type_dto(ele["_id"])
+            type_dto_list.append(type_dto)
+
+        return type_dto_list
@@ -0,0 +1,8 @@
+
+from kant.kant_dao.sqlite_dao.sqlite_database import SqliteDatabase
+from kant.kant_dao.sqlite_dao.sqlite_dao import SqliteDao
+from kant.kant_dao.sqlite_dao.sqlite_type_dao import SqliteTypeDao
+from kant.kant_dao.sqlite_dao.sqlite_object_dao import SqliteObjectDao
+from kant.kant_dao.sqlite_dao.sqlite_fluent_dao import SqliteFluentDao
+from kant.kant_dao.sqlite_dao.sqlite_fact_dao import SqliteFactDao
+from kant.kant_dao.sqlite_dao.sqlite_action_dao import SqliteActionDao
@@ -0,0 +1,540 @@
+
+""" Sqlite Action Dao """
+
+import sqlite3
+from typing import Dict, List
+
+from kant.kant_dao.dao_interface import ActionDao
+from kant.kant_dao.sqlite_dao import (
+    SqliteDao,
+    SqliteDatabase,
+    SqliteTypeDao,
+    SqliteFluentDao,
+    SqliteFactDao
+)
+
+from kant.kant_dao.sqlite_dao.sqlite_database import to_decimal
+
+from kant.kant_dto import (
+    ConditionEffectDto,
+    ActionDto,
+    ObjectDto,
+    FluentDto,
+    TypeDto
+)
+
+
+class SqliteActionDao(ActionDao, SqliteDao):
+    """ Sqlite Action Dao Class """
+
+    def __init__(self, sqlite_database: SqliteDatabase = None) -> None:
+
+        ActionDao.__init__(self)
+        SqliteDao.__init__(self, sqlite_database)
+
+        self._sql_type_dao = SqliteTypeDao(self.sqlite_database)
+        self._sql_fluent_dao = SqliteFluentDao(self.sqlite_database)
+
+    def __condition_effect_model_to_dto(self,
+                                        condition_effect_row: sqlite3.Row,
+                                        parameter_dict: Dict[str, ObjectDto]
+                                        ) -> ConditionEffectDto:
+        """ convert a sqlite condition/effect row into a ConditionEffectDto
+
+        Args:
+            condition_effect_row
+            (sqlite3.Row): sqlite condition/effect row
+
+            parameter_dict
+            (Dict[str, ObjectDto]): action parameters by name
+
+        Returns:
+            ConditionEffectDto: ConditionEffectDto
+        """
+
+        fluent_dto = self._sql_fluent_dao.get(condition_effect_row["fluent"])
+
+        condition_effect_dto = ConditionEffectDto(
+            fluent_dto,
+            condition_effect=condition_effect_row["condition_effect"],
+            time=condition_effect_row["time"])
+
+        if fluent_dto.is_numeric:
+            condition_effect_dto.value = to_decimal(
+                condition_effect_row["numeric_value"])
+        else:
+            condition_effect_dto.value = bool(
+                condition_effect_row["bool_value"])
+
+        parameter_rows = self.sqlite_database.fetch_all(
+            "SELECT parameter FROM condition_effect_parameter "
+            "WHERE condition_effect = ? ORDER BY position",
+            (condition_effect_row["id"],))
+
+        condition_effect_dto.objects = [
+            parameter_dict[parameter_row["parameter"]]
+            for parameter_row in parameter_rows]
+
+        return condition_effect_dto
+
+    def _model_to_dto(self, action_row: sqlite3.Row) -> ActionDto:
+        """ convert a sqlite action row into a ActionDto
+
+        Args:
+            action_row (sqlite3.Row): sqlite action row
+
+        Returns:
+            ActionDto: ActionDto
+        """
+
+        action_dto = ActionDto(action_row["name"])
+        action_dto.duration = action_row["duration"]
+        action_dto.durative = bool(action_row["durative"])
+
+        parameters_list = []
+        conditions_list = []
+        effects_list = []
+        parameter_dict = {}
+
+        # ACTION PARAMS
+        parameter_rows = self.sqlite_database.fetch_all(
+            "SELECT name, type FROM action_parameter "
+            "WHERE action = ? ORDER BY position",
+            (action_row["name"],))
+
+        for parameter_row in parameter_rows:
+            type_dto = self._sql_type_dao.get(parameter_row["type"])
+            object_dto = ObjectDto(type_dto, parameter_row["name"])
+            parameter_dict[parameter_row["name"]] = object_dto
+            parameters_list.append(object_dto)
+
+        # ACTION CONDIS AND EFFECTS
+        condition_effect_rows = self.sqlite_database.fetch_all(
+            "SELECT id, is_effect, fluent, bool_value, numeric_value, "
+            "condition_effect, time FROM condition_effect "
+            "WHERE action = ? ORDER BY is_effect, position",
+            (action_row["name"],))
+
+        for condition_effect_row in condition_effect_rows:
+            condition_effect_dto = self.__condition_effect_model_to_dto(
+                condition_effect_row, parameter_dict)
+
+            if condition_effect_row["is_effect"]:
+                effects_list.append(condition_effect_dto)
+            else:
+                conditions_list.append(condition_effect_dto)
+
+        # SET SAME OBJECT FOR FLUENTS AND TYPES
+
+        fluent_dict = {}
+        type_dict = {}
+
+        # conditions/effct
+        for condition_effect_dto in list(conditions_list + effects_list):
+
+            fluent_dto: FluentDto = condition_effect_dto.fluent
+
+            # new fluent
+            if not fluent_dto.name in fluent_dict:
+
+                type_list = []
+                for type_dto in fluent_dto.types:
+
+                    # new type
+                    if not type_dto.name in type_dict:
+                        type_dict[type_dto.name] = type_dto
+
+                    # type already exists
+                    else:
+                        type_dto = type_dict[type_dto.name]
+
+                    type_list.append(type_dto)
+
+                fluent_dto.types = type_list
+                fluent_dict[fluent_dto.name] = fluent_dto
+
+            # fluent alrredy exists
+            else:
+                fluent_dto = fluent_dict[fluent_dto.name]
+
+            condition_effect_dto.fluent = fluent_dto
+
+        # parameters
+        for parameter_dto in parameters_list:
+
+            type_dto: TypeDto = parameter_dto.type
+
+            if not type_dto.name in type_dict:
+                type_dict[type_dto.name] = type_dto
+            else:
+                type_dto = type_dict[type_dto.name]
+                parameter_dto.type = type_dto
+
+        action_dto.parameters = parameters_list
+        action_dto.conditions = conditions_list
+        action_dto.effects = effects_list
+
+        return action_dto
+
+    @staticmethod
+    def _check_condition_efect_dto(condition_effect_dto: ConditionEffectDto,
+                                   parameter_dtos: List[ObjectDto]) -> bool:
+        """ check if the types of the objects of a codition/effect dto are
+            the same as the types of its fluent and if that objects are action parameters
+
+        Args:
+            condition_effect_dto
+            (ConditionEffectDto): ConditionEffectDto
+
+            parameter_dtos
+            (List[ObjectDto]): action parameters
+
+        Returns:
+            bool: condition/effect is correct?
+        """
+
+        # check if fact is correct
+        if(len(condition_effect_dto.objects) !=
+           len(condition_effect_dto.fluent.types)):
+            return False
+
+        object_dtos = condition_effect_dto.objects
+        type_dtos = condition_effect_dto.fluent.types
+
+        for object_dto, type_dto in zip(object_dtos, type_dtos):
+
+            # check if condition/effect object type is a parameter
+            if not object_dto in parameter_dtos:
+                return False
+
+            # check if condition/effect object type is correct
+            if not SqliteFactDao._check_type_dto(object_dto.type, type_dto):
+                return False
+
+        return True
+
+    @staticmethod
+    def _check_action_dto(action_dto: ActionDto) -> bool:
+        """ check if a ActionDto is correct:
+            condition and effect must be correct (similar to fact)
+
+        Args:
+            action_dto (ActionDto): ActionDto to check
+
+        Returns:
+            bool: is ActionDto correct?
+        """
+
+        for condi_effect_dto in (action_dto.conditions +
+                                 action_dto.effects):
+            if(not action_dto.durative and condi_effect_dto.time):
+                return False
+            elif(action_dto.durative and not condi_effect_dto.time):
+                return False
+
+            if not SqliteActionDao._check_condition_efect_dto(condi_effect_dto,
+                                                              action_dto.parameters):
+                return False
+
+        return True
+
+    def _exist_in_sqlite(self, action_dto: ActionDto) -> bool:
+        """ check if ActionDto exists
+
+        Args:
+            action_dto (ActionDto): ActionDto
+
+        Returns:
+            bool: ActionDto exists?
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT 1 FROM action WHERE name = ?",
+            (action_dto.name,)) is not None
+
+    def _get_model(self, action_dto: ActionDto) -> sqlite3.Row:
+        """ get the sqlite action row corresponding to a give ActionDto
+
+        Args:
+            action_dto (ActionDto): ActionDto
+
+        Returns:
+            sqlite3.Row: sqlite action row
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT name, duration, durative FROM action WHERE name = ?",
+            (action_dto.name,))
+
+    def get(self, action_name: str) -> ActionDto:
+        """ get a ActionDto with a given action name
+            return None if there is no with that action name
+
+        Args:
+            action_name (str): action name
+
+        Returns:
+            ActionDto: ActionDto of the action name
+        """
+
+        action_row = self.sqlite_database.fetch_one(
+            "SELECT name, duration, durative FROM action WHERE name = ?",
+            (action_name,))
+
+        # check if action exists
+        if action_row:
+
+            action_dto = self._model_to_dto(action_row)
+
+            if not SqliteActionDao._check_action_dto(action_dto):
+                return None
+
+            return action_dto
+
+        return None
+
+    def get_all(self) -> List[ActionDto]:
+        """ get all ActionDto
+
+        Returns:
+            List[ActionDto]: list of all ActionDto
+        """
+
+        action_rows = self.sqlite_database.fetch_all(
+            "SELECT name, duration, durative FROM action ORDER BY name")
+        action_dto_list = []
+
+        for ele in action_rows:
+            action_dto = self._model_to_dto(ele)
+            if SqliteActionDao._check_action_dto(action_dto):
+                action_dto_list.append(action_dto)
+
+        return action_dto_list
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[ActionDto]:
+        """ get a page of ActionDto sorted by action name
+
+        Args:
+            after (str, optional): last action name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max ActionDto in the page. Defaults to 100.
+
+        Returns:
+            List[ActionDto]: list of ActionDto
+        """
+
+        action_rows = self._fetch_page(
+            "SELECT name, duration, durative FROM action", after, limit)
+        action_dto_list = []
+
+        for ele in action_rows:
+            action_dto = self._model_to_dto(ele)
+            if SqliteActionDao._check_action_dto(action_dto):
+                action_dto_list.append(action_dto)
+
+        return action_dto_list
+
+    def count_all(self) -> int:
+        """ count all ActionDto,
+            stored actions are counted without checking them
+
+        Returns:
+            int: number of ActionDto
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT COUNT(*) FROM action")[0]
+
+    def _propagate_saving(self, action_dto: ActionDto) -> bool:
+        """ save the types of the parameters and the fluents of the
+            conditions/effects of a ActionDto
+
+        Args:
+            action_dto (ActionDto): ActionDto
+
+        Returns:
+            bool: succeed
+        """
+
+        for parameter_dto in action_dto.parameters:
+            if not self._sql_type_dao.save(parameter_dto.type):
+                return False
+
+        fluent_dict = {}
+        for condi_effect_dto in (action_dto.conditions +
+                                 action_dto.effects):
+            fluent_dict[condi_effect_dto.fluent.name] = condi_effect_dto.fluent
+
+        for fluent_dto in fluent_dict.values():
+            if not self._sql_fluent_dao.save(fluent_dto):
+                return False
+
+        return True
+
+    def _insert_children(self, action_dto: ActionDto) -> None:
+        """ insert the parameter and condition/effect rows of a ActionDto
+
+        Args:
+            action_dto (ActionDto): ActionDto
+        """
+
+        self.sqlite_database.executemany(
+            "INSERT INTO action_parameter (action, position, name, type) "
+            "VALUES (?, ?, ?, ?)",
+            [(action_dto.name, position, parameter_dto.name,
+              parameter_dto.type.name)
+             for position, parameter_dto in enumerate(action_dto.parameters)])
+
+        for is_effect, condi_effect_dtos in ((False, action_dto.conditions),
+                                             (True, action_dto.effects)):
+
+            for position, condi_effect_dto in enumerate(condi_effect_dtos):
+
+                bool_value = None
+                numeric_value = None
+
+                if condi_effect_dto.fluent.is_numeric:
+                    numeric_value = float(condi_effect_dto.value)
+                else:
+                    bool_value = bool(condi_effect_dto.value)
+
+                cursor = self.sqlite_database.execute(
+                    "INSERT INTO condition_effect (action, is_effect, "
+                    "position, fluent, bool_value, numeric_value, "
+                    "condition_effect, time) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (action_dto.name, is_effect, position,
+                     condi_effect_dto.fluent.name, bool_value, numeric_value,
+                     condi_effect_dto.condition_effect, condi_effect_dto.time))
+
+                self.sqlite_database.executemany(
+                    "INSERT INTO condition_effect_parameter "
+                    "(condition_effect, position, parameter) "
+                    "VALUES (?, ?, ?)",
+                    [(cursor.lastrowid, object_position, object_dto.name)
+                     for object_position, object_dto
+                     in enumerate(condi_effect_dto.objects)])
+
+    def _save(self, action_dto: ActionDto) -> bool:
+        """ save a ActionDto
+            if the ActionDto is already saved return False, else return True
+
+        Args:
+            action_dto (ActionDto): ActionDto to save
+
+        Returns:
+            bool: succeed
+        """
+
+        if not self._check_action_dto(action_dto):
+            return False
+
+        with self.sqlite_database.transaction():
+
+            if self._exist_in_sqlite(action_dto):
+                return False
+
+            # propagate saving
+            if not self._propagate_saving(action_dto):
+                return False
+
+            # saving
+            now = SqliteDatabase.now()
+            self.sqlite_database.execute(
+                "INSERT INTO action (name, duration, durative, "
+                "creation_date, update_date) VALUES (?, ?, ?, ?, ?)",
+                (action_dto.name, action_dto.duration, action_dto.durative,
+                 now, now))
+            self._insert_children(action_dto)
+
+            return True
+
+    def _update(self, action_dto: ActionDto) -> bool:
+        """ update a ActionDto
+            if the ActionDto is not saved return False, else return True
+
+        Args:
+            action_dto (ActionDto): ActionDto to update
+
+        Returns:
+            bool: succeed
+        """
+
+        if not self._check_action_dto(action_dto):
+            return False
+
+        with self.sqlite_database.transaction():
+
+            # check if action exists
+            if self._exist_in_sqlite(action_dto):
+
+                # propagate saving
+                if not self._propagate_saving(action_dto):
+                    return False
+
+                # updating
+                self.sqlite_database.execute(
+                    "UPDATE action SET duration = ?, durative = ?, "
+                    "update_date = ? WHERE name = ?",
+                    (action_dto.duration, action_dto.durative,
+                     SqliteDatabase.now(), action_dto.name))
+                self.sqlite_database.execute(
+                    "DELETE FROM action_parameter WHERE action = ?",
+                    (action_dto.name,))
+                self.sqlite_database.execute(
+                    "DELETE FROM condition_effect WHERE action = ?",
+                    (action_dto.name,))
+                self._insert_children(action_dto)
+
+                return True
+
+            return False
+
+    def save(self, action_dto: ActionDto) -> bool:
+        """ save or update a ActionDto
+            if the ActionDto is not saved it will be saved, else it will be updated
+
+        Args:
+            action_dto (ActionDto): ActionDto to save or update
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            if self._exist_in_sqlite(action_dto):
+                return self._update(action_dto)
+
+            return self._save(action_dto)
+
+    def delete(self, action_dto: ActionDto) -> bool:
+        """ delete a ActionDto
+            if the ActionDto is not saved return False, else return True
+
+        Args:
+            action_dto (ActionDto): ActionDto to delete
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            cursor = self.sqlite_database.execute(
+                "DELETE FROM action WHERE name = ?", (action_dto.name,))
+
+            # check if action exists
+            return cursor.rowcount > 0
+
+    def delete_all(self) -> bool:
+        """ delete all actions
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+            self.sqlite_database.execute("DELETE FROM action")
+
+        return True
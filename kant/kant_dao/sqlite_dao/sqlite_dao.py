@@ -0,0 +1,82 @@
+
+""" Sqlite Dao Interface """
+
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import List
+from kant.kant_dao.sqlite_dao.sqlite_database import SqliteDatabase
+from kant.kant_dto import Dto
+
+
+class SqliteDao(ABC):
+    """ Sqlite Dao Abstract Class """
+
+    def __init__(self, sqlite_database: SqliteDatabase = None) -> None:
+
+        if sqlite_database is None:
+            sqlite_database = SqliteDatabase()
+
+        self.sqlite_database = sqlite_database
+
+    @property
+    def sqlite_database(self) -> SqliteDatabase:
+        return self._sqlite_database
+
+    @sqlite_database.setter
+    def sqlite_database(self, sqlite_database: SqliteDatabase) -> None:
+        self._sqlite_database = sqlite_database
+
+    def _fetch_page(self, select: str, after: str = None,
+                    limit: int = 100) -> List[sqlite3.Row]:
+        """ fetch a page of rows sorted by name, the page starts
+            after a name so it is read from the primary key index
+
+        Args:
+            select (str): select statement of a table with a name key
+            after (str, optional): last name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max rows in the page. Defaults to 100.
+
+        Returns:
+            List[sqlite3.Row]: rows
+        """
+
+        if after is None:
+            return self.sqlite_database.fetch_all(
+                select + " ORDER BY name LIMIT ?", (limit,))
+
+        return self.sqlite_database.fetch_all(
+            select + " WHERE name > ? ORDER BY name LIMIT ?", (after, limit))
+
+    @abstractmethod
+    def _get_model(self, dto: Dto) -> sqlite3.Row:
+        """ get the sqlite row corresponding to a give Dto
+
+        Args:
+            dto (Dto): Dto
+
+        Returns:
+            sqlite3.Row: sqlite row
+        """
+
+    @abstractmethod
+    def _exist_in_sqlite(self, dto: Dto) -> bool:
+        """ check if Dto exists
+
+        Args:
+            dto (Dto): Dto
+
+        Returns:
+            bool: Dto exists?
+        """
+
+    @abstractmethod
+    def _model_to_dto(self, model: sqlite3.Row) -> Dto:
+        """ convert a sqlite row into a Dto
+
+        Args:
+            model (sqlite3.Row): sqlite row
+
+        Returns:
+            Dto: Dto
+        """
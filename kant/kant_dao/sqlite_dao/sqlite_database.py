@@ -0,0 +1,407 @@
+
+""" Sqlite Database """
+
+import datetime
+import sqlite3
+from contextlib import contextmanager
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Iterator, Iterable, List, Union
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS type (
+    name TEXT PRIMARY KEY,
+    father TEXT,
+    creation_date TEXT NOT NULL,
+    update_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS type_father_idx ON type (father, name);
+
+CREATE TABLE IF NOT EXISTS object (
+    name TEXT PRIMARY KEY,
+    type TEXT NOT NULL REFERENCES type (name) ON DELETE CASCADE,
+    creation_date TEXT NOT NULL,
+    update_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS object_type_idx ON object (type, name);
+CREATE INDEX IF NOT EXISTS object_update_idx ON object (update_date);
+
+CREATE TABLE IF NOT EXISTS fluent (
+    name TEXT PRIMARY KEY,
+    is_numeric INTEGER NOT NULL,
+    creation_date TEXT NOT NULL,
+    update_date TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS fluent_type (
+    fluent TEXT NOT NULL REFERENCES fluent (name) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    type TEXT NOT NULL REFERENCES type (name),
+    PRIMARY KEY (fluent, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS fluent_type_type_idx ON fluent_type (type, fluent);
+
+CREATE TABLE IF NOT EXISTS fact (
+    id INTEGER PRIMARY KEY,
+    fluent TEXT NOT NULL REFERENCES fluent (name) ON DELETE CASCADE,
+    arguments TEXT NOT NULL,
+    is_goal INTEGER NOT NULL,
+    bool_value INTEGER,
+    numeric_value REAL,
+    creation_date TEXT NOT NULL,
+    update_date TEXT NOT NULL,
+    UNIQUE (fluent, arguments, is_goal)
+);
+CREATE INDEX IF NOT EXISTS fact_goal_idx ON fact (is_goal, fluent);
+CREATE INDEX IF NOT EXISTS fact_update_idx ON fact (update_date);
+
+CREATE TABLE IF NOT EXISTS fact_argument (
+    fact INTEGER NOT NULL REFERENCES fact (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    object TEXT NOT NULL REFERENCES object (name),
+    PRIMARY KEY (fact, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS fact_argument_object_idx
+    ON fact_argument (object, fact);
+
+CREATE TABLE IF NOT EXISTS action (
+    name TEXT PRIMARY KEY,
+    duration INTEGER NOT NULL,
+    durative INTEGER NOT NULL,
+    creation_date TEXT NOT NULL,
+    update_date TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS action_parameter (
+    action TEXT NOT NULL REFERENCES action (name) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (action, position)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS condition_effect (
+    id INTEGER PRIMARY KEY,
+    action TEXT NOT NULL REFERENCES action (name) ON DELETE CASCADE,
+    is_effect INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    fluent TEXT NOT NULL REFERENCES fluent (name),
+    bool_value INTEGER,
+    numeric_value REAL,
+    condition_effect TEXT,
+    time TEXT
+);
+CREATE INDEX IF NOT EXISTS condition_effect_action_idx
+    ON condition_effect (action, is_effect, position);
+CREATE INDEX IF NOT EXISTS condition_effect_fluent_idx
+    ON condition_effect (fluent, action);
+
+CREATE TABLE IF NOT EXISTS condition_effect_parameter (
+    condition_effect INTEGER NOT NULL
+        REFERENCES condition_effect (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    parameter TEXT NOT NULL,
+    PRIMARY KEY (condition_effect, position)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS type_delete_cascade BEFORE DELETE ON type
+BEGIN
+    DELETE FROM fluent WHERE name IN
+        (SELECT fluent FROM fluent_type WHERE type = OLD.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS object_delete_cascade BEFORE DELETE ON object
+BEGIN
+    DELETE FROM fact WHERE id IN
+        (SELECT fact FROM fact_argument WHERE object = OLD.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS fluent_delete_cascade BEFORE DELETE ON fluent
+BEGIN
+    DELETE FROM action WHERE name IN
+        (SELECT action FROM condition_effect WHERE fluent = OLD.name);
+END;
+
+CREATE TABLE IF NOT EXISTS fact_tombstone (
+    fluent TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    is_goal INTEGER NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fact_tombstone_date_idx ON fact_tombstone (date);
+
+CREATE TRIGGER IF NOT EXISTS fact_delete_tombstone AFTER DELETE ON fact
+BEGIN
+    INSERT INTO fact_tombstone (fluent, arguments, is_goal, date) VALUES
+        (OLD.fluent, OLD.arguments, OLD.is_goal, kant_date(0));
+    DELETE FROM fact_tombstone WHERE date < kant_date(-600);
+END;
+
+CREATE TABLE IF NOT EXISTS version (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO version (name, value) VALUES ('domain', 0);
+
+CREATE TRIGGER IF NOT EXISTS type_insert_version AFTER INSERT ON type
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+
+CREATE TRIGGER IF NOT EXISTS type_update_version AFTER UPDATE ON type
+WHEN OLD.father IS NOT NEW.father
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+
+CREATE TRIGGER IF NOT EXISTS type_delete_version AFTER DELETE ON type
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+
+CREATE TRIGGER IF NOT EXISTS fluent_insert_version AFTER INSERT ON fluent
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+
+CREATE TRIGGER IF NOT EXISTS fluent_update_version AFTER UPDATE ON fluent
+WHEN OLD.is_numeric IS NOT NEW.is_numeric
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+
+CREATE TRIGGER IF NOT EXISTS fluent_delete_version AFTER DELETE ON fluent
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+
+CREATE TRIGGER IF NOT EXISTS fluent_type_insert_version
+AFTER INSERT ON fluent_type
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+
+CREATE TRIGGER IF NOT EXISTS fluent_type_delete_version
+AFTER DELETE ON fluent_type
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+
+CREATE TRIGGER IF NOT EXISTS action_insert_version AFTER INSERT ON action
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+
+CREATE TRIGGER IF NOT EXISTS action_update_version AFTER UPDATE ON action
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+
+CREATE TRIGGER IF NOT EXISTS action_delete_version AFTER DELETE ON action
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'domain';
+END;
+"""
+
+
+def to_decimal(value: Union[float, Decimal]) -> Decimal:
+    """ convert a numeric value into a Decimal with 2 decimal places,
+        as mongoengine DecimalField does
+
+    Args:
+        value (Union[float, Decimal]): numeric value
+
+    Returns:
+        Decimal: decimal value
+    """
+
+    if value is None:
+        return None
+
+    return Decimal("%s" % value).quantize(Decimal("0.01"),
+                                          rounding=ROUND_HALF_UP)
+
+
+def join_names(names: Iterable[str]) -> str:
+    """ join object names into the text key stored in the fact table,
+        PDDL names cannot contain blanks
+
+    Args:
+        names (Iterable[str]): object names
+
+    Returns:
+        str: names key
+    """
+
+    return " ".join(names)
+
+
+class SqliteDatabase:
+    """ Sqlite Database Class
+        connection shared by the sqlite DAOs of a factory; tables are
+        normalized and the cascade rules of the Mongo models are
+        implemented with foreign keys and triggers
+    """
+
+    def __init__(self, uri: str = "kant.db") -> None:
+
+        self._uri = uri
+        self._transaction_depth = 0
+
+        self._connection = sqlite3.connect(
+            uri, uri=uri.startswith("file:"), isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+
+        # dates of the triggers, in the format of the dates saved by Python
+        self._connection.create_function("kant_date", 1, SqliteDatabase._date)
+
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def get_uri(self) -> str:
+        """ uri getter
+
+        Returns:
+            str: uri str
+        """
+
+        return self._uri
+
+    @staticmethod
+    def now() -> str:
+        """ current date in the format stored in the tables
+
+        Returns:
+            str: ISO date
+        """
+
+        return datetime.datetime.now().isoformat()
+
+    @staticmethod
+    def _date(seconds: float) -> str:
+        """ date some seconds after the current one, in the format of now
+
+        Args:
+            seconds (float): seconds, negative for a past date
+
+        Returns:
+            str: ISO date
+        """
+
+        return (datetime.datetime.now() +
+                datetime.timedelta(seconds=seconds)).isoformat()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """ open a transaction, nested transactions are batched into
+            the outer one, so a cascaded save is commited once
+
+        Yields:
+            Iterator[sqlite3.Connection]: connection
+        """
+
+        if self._transaction_depth == 0:
+            self._connection.execute("BEGIN")
+
+        self._transaction_depth += 1
+
+        try:
+            yield self._connection
+
+        except BaseException:
+            self._transaction_depth -= 1
+
+            if self._transaction_depth == 0:
+                self._connection.execute("ROLLBACK")
+
+            raise
+
+        self._transaction_depth -= 1
+
+        if self._transaction_depth == 0:
+            self._connection.execute("COMMIT")
+
+    def execute(self, sql: str, parameters: Iterable = ()) -> sqlite3.Cursor:
+        """ execute a sql statement
+
+        Args:
+            sql (str): sql statement
+            parameters (Iterable, optional): statement parameters. Defaults to ().
+
+        Returns:
+            sqlite3.Cursor: cursor
+        """
+
+        return self._connection.execute(sql, parameters)
+
+    def executemany(self, sql: str,
+                    parameters: Iterable[Iterable]) -> sqlite3.Cursor:
+        """ execute a sql statement for each parameters row
+
+        Args:
+            sql (str): sql statement
+            parameters (Iterable[Iterable]): rows of statement parameters
+
+        Returns:
+            sqlite3.Cursor: cursor
+        """
+
+        return self._connection.executemany(sql, parameters)
+
+    def fetch_all(self, sql: str, parameters: Iterable = ()) -> List[sqlite3.Row]:
+        """ execute a query and fetch all its rows
+
+        Args:
+            sql (str): sql query
+            parameters (Iterable, optional): query parameters. Defaults to ().
+
+        Returns:
+            List[sqlite3.Row]: rows
+        """
+
+        return self._connection.execute(sql, parameters).fetchall()
+
+    def iter_rows(self, sql: str, parameters: Iterable = (),
+                  batch_size: int = 100) -> Iterator[sqlite3.Row]:
+        """ execute a query and fetch its rows in batches
+
+        Args:
+            sql (str): sql query
+            parameters (Iterable, optional): query parameters. Defaults to ().
+            batch_size (int, optional): rows fetched per batch. Defaults to 100.
+
+        Yields:
+            Iterator[sqlite3.Row]: row
+        """
+
+        cursor = self._connection.execute(sql, parameters)
+
+        try:
+            rows = cursor.fetchmany(batch_size)
+            while rows:
+                yield from rows
+                rows = cursor.fetchmany(batch_size)
+
+        finally:
+            cursor.close()
+
+    def fetch_one(self, sql: str, parameters: Iterable = ()) -> sqlite3.Row:
+        """ execute a query and fetch its first row
+
+        Args:
+            sql (str): sql query
+            parameters (Iterable, optional): query parameters. Defaults to ().
+
+        Returns:
+            sqlite3.Row: row, None if there is no rows
+        """
+
+        return self._connection.execute(sql, parameters).fetchone()
+
+    def close(self) -> None:
+        """ close the connection
+        """
+
+        self._connection.close()
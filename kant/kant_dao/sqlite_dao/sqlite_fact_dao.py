@@ -0,0 +1,718 @@
+
+""" Sqlite Fact Dao """
+
+import datetime
+import sqlite3
+from typing import Iterable, Iterator, List, Dict
+
+from kant.kant_dao.dao_interface import FactDao
+from kant.kant_dao.dao_interface.fact_dao import FactKey
+from kant.kant_dao.sqlite_dao import (
+    SqliteDao,
+    SqliteDatabase,
+    SqliteFluentDao,
+    SqliteObjectDao
+)
+
+from kant.kant_dao.sqlite_dao.sqlite_database import (
+    to_decimal,
+    join_names
+)
+
+from kant.kant_dto import FactDto
+from kant.kant_dto.type_dto import TypeDto
+
+
+class SqliteFactDao(FactDao, SqliteDao):
+    """ Sqlite Fact Dao Class """
+
+    _FACT_COLUMNS = ("fact.id, fact.fluent, fact.arguments, fact.is_goal, "
+                     "fact.bool_value, fact.numeric_value")
+
+    def __init__(self, sqlite_database: SqliteDatabase = None) -> None:
+
+        FactDao.__init__(self)
+        SqliteDao.__init__(self, sqlite_database)
+
+        self._sql_object_dao = SqliteObjectDao(self.sqlite_database)
+        self._sql_fluent_dao = SqliteFluentDao(self.sqlite_database)
+
+    @staticmethod
+    def _add_fathers(type_dto: TypeDto, type_dict: Dict[str, TypeDto]) -> None:
+        """ add recursively type fathers to a dictionary
+
+        Args:
+            type_dto (TypeDto): starter type
+            type_dict (Dict[str, TypeDto]): dictionary
+        """
+
+        if not type_dto.name in type_dict:
+            type_dict[type_dto.name] = type_dto
+
+        if not type_dto.father is None:
+            SqliteFactDao._add_fathers(type_dto.father, type_dict)
+
+    def _model_to_dto(self, fact_row: sqlite3.Row) -> FactDto:
+        """ convert a sqlite fact row into a FactDto
+
+        Args:
+            fact_row (sqlite3.Row): sqlite fact row
+
+        Returns:
+            FactDto: FactDto
+        """
+
+        object_list = []
+        type_dict = {}
+
+        fluent_dto = self._sql_fluent_dao.get(fact_row["fluent"])
+
+        for type_dto in fluent_dto.types:
+            type_dict[type_dto.name] = type_dto
+
+        object_names = []
+        if fact_row["arguments"]:
+            object_names = fact_row["arguments"].split(" ")
+
+        for object_name in object_names:
+
+            object_dto = self._sql_object_dao.get(object_name)
+
+            SqliteFactDao._add_fathers(object_dto.type, type_dict)
+
+            object_dto.type = type_dict[object_dto.type.name]
+
+            object_list.append(object_dto)
+
+        fact_dto = FactDto(
+            fluent_dto, object_list)
+
+        fact_dto.is_goal = bool(fact_row["is_goal"])
+
+        if fact_dto.fluent.is_numeric:
+            fact_dto.value = to_decimal(fact_row["numeric_value"])
+        else:
+            fact_dto.value = bool(fact_row["bool_value"])
+
+        return fact_dto
+
+    @staticmethod
+    def _check_type_dto(type_dto_1: TypeDto, type_dto_2: TypeDto) -> bool:
+        """ check if a type is or inherit from another type
+
+        Args:
+            type_dto_1 (TypeDto): type to check
+            type_dto_2 (TypeDto): target type
+
+        Returns:
+            bool: is or inherit?
+        """
+
+        if type_dto_1 == type_dto_2:
+            return True
+        else:
+            if not type_dto_1.father is None:
+                return SqliteFactDao._check_type_dto(type_dto_1.father, type_dto_2)
+            else:
+                return False
+
+    @staticmethod
+    def _check_fact_dto(fact_dto: FactDto) -> bool:
+        """ check if the types of the objects of a fact dto are
+            the same as the types of its fluent
+
+        Args:
+            fact_dto (FactDto): fact dto
+
+        Returns:
+            bool: poposition is correct?
+        """
+
+        # check if fact is correct
+        if(len(fact_dto.objects) != len(fact_dto.fluent.types)):
+            return False
+
+        object_dtos = fact_dto.objects
+        type_dtos = fact_dto.fluent.types
+
+        for object_dto, type_dto in zip(object_dtos, type_dtos):
+            # check if fact is correct
+            if not SqliteFactDao._check_type_dto(object_dto.type, type_dto):
+                return False
+
+        return True
+
+    @staticmethod
+    def _get_key(fact_dto: FactDto) -> tuple:
+        """ get the natural key of a FactDto (fluent, arguments, is_goal)
+
+        Args:
+            fact_dto (FactDto): FactDto
+
+        Returns:
+            tuple: fact key
+        """
+
+        return (fact_dto.fluent.name,
+                join_names(object_dto.name for object_dto in fact_dto.objects),
+                bool(fact_dto.is_goal))
+
+    def _exist_in_sqlite(self, fact_dto: FactDto) -> bool:
+        """ check if FactDto exists
+
+        Args:
+            fact_dto (FactDto): FactDto
+
+        Returns:
+            bool: FactDto exists?
+        """
+
+        return self._get_model(fact_dto) is not None
+
+    def _get_model(self, fact_dto: FactDto) -> sqlite3.Row:
+        """ get the sqlite fact row corresponding to a give FactDto
+
+        Args:
+            fact_dto (FactDto): FactDto
+
+        Returns:
+            sqlite3.Row: sqlite fact row
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT " + SqliteFactDao._FACT_COLUMNS + " FROM fact "
+            "WHERE fluent = ? AND arguments = ? AND is_goal = ?",
+            SqliteFactDao._get_key(fact_dto))
+
+    def _iter_rows_to_dtos(self,
+                           fact_rows: Iterable[sqlite3.Row]) -> Iterator[FactDto]:
+        """ convert sqlite fact rows into correct FactDtos one by one
+
+        Args:
+            fact_rows (Iterable[sqlite3.Row]): sqlite fact rows
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        for ele in fact_rows:
+            fact_dto = self._model_to_dto(ele)
+            if SqliteFactDao._check_fact_dto(fact_dto):
+                yield fact_dto
+
+    def _rows_to_dtos(self, fact_rows: List[sqlite3.Row]) -> List[FactDto]:
+        """ convert sqlite fact rows into correct FactDtos
+
+        Args:
+            fact_rows (List[sqlite3.Row]): sqlite fact rows
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return list(self._iter_rows_to_dtos(fact_rows))
+
+    def get_by_fluent(self, fluent_name: str) -> List[FactDto]:
+        """ get all FactDto with a given fluent name
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return list(self.iter_by_fluent(fluent_name))
+
+    def count_by_fluent(self, fluent_name: str) -> int:
+        """ count all FactDto with a given fluent name,
+            stored facts are counted without checking them
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT COUNT(*) FROM fact WHERE fluent = ?",
+            (fluent_name,))[0]
+
+    def iter_by_fluent(self, fluent_name: str,
+                       batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto with a given fluent name,
+            facts are read and checked in batches
+
+        Args:
+            fluent_name (str): fluent name
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_rows_to_dtos(self.sqlite_database.iter_rows(
+            "SELECT " + SqliteFactDao._FACT_COLUMNS + " FROM fact "
+            "WHERE fluent = ? ORDER BY id",
+            (fluent_name,), batch_size))
+
+    def get_by_object(self, object_name: str,
+                      position: int = None) -> List[FactDto]:
+        """ get all FactDto that have a given object as argument
+
+        Args:
+            object_name (str): object name
+            position (int, optional): argument position of the object,
+                                      None for any position. Defaults to None.
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        if position is None:
+            fact_rows = self.sqlite_database.fetch_all(
+                "SELECT " + SqliteFactDao._FACT_COLUMNS + " FROM fact "
+                "WHERE id IN (SELECT fact FROM fact_argument "
+                "WHERE object = ?) ORDER BY id",
+                (object_name,))
+        else:
+            fact_rows = self.sqlite_database.fetch_all(
+                "SELECT " + SqliteFactDao._FACT_COLUMNS + " FROM fact "
+                "WHERE id IN (SELECT fact FROM fact_argument "
+                "WHERE object = ? AND position = ?) ORDER BY id",
+                (object_name, position))
+
+        return self._rows_to_dtos(fact_rows)
+
+    def exists_by_object(self, object_name: str) -> bool:
+        """ check if any stored fact has a given object as argument
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            bool: any FactDto with the object?
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT 1 FROM fact_argument WHERE object = ? LIMIT 1",
+            (object_name,)) is not None
+
+    def get_by_fluent_and_objects(self, fluent_name: str,
+                                  object_names: List[str]) -> List[FactDto]:
+        """ get all FactDto with a given fluent name and arguments,
+            that is, the fact and the goal if they exist
+
+        Args:
+            fluent_name (str): fluent name
+            object_names (List[str]): object names of the arguments
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._rows_to_dtos(self.sqlite_database.fetch_all(
+            "SELECT " + SqliteFactDao._FACT_COLUMNS + " FROM fact "
+            "WHERE fluent = ? AND arguments = ? ORDER BY id",
+            (fluent_name, join_names(object_names))))
+
+    def _iter_all(self, is_goal: bool = None,
+                  batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto
+            is_goal == None -> get all fact
+            is_goal == True -> gel all goals
+            is_goal == False -> getl no goals
+
+        Args:
+            is_goal (bool, optional): get all, all goals, all no goals?. Defaults to None.
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        if(is_goal is None):
+            fact_rows = self.sqlite_database.iter_rows(
+                "SELECT " + SqliteFactDao._FACT_COLUMNS + " FROM fact "
+                "ORDER BY id", (), batch_size)
+        else:
+            fact_rows = self.sqlite_database.iter_rows(
+                "SELECT " + SqliteFactDao._FACT_COLUMNS + " FROM fact "
+                "WHERE is_goal = ? ORDER BY id",
+                (bool(is_goal),), batch_size)
+
+        return self._iter_rows_to_dtos(fact_rows)
+
+    def _get_all(self, is_goal: bool = None) -> List[FactDto]:
+        """ get all FactDto
+            is_goal == None -> get all fact
+            is_goal == True -> gel all goals
+            is_goal == False -> getl no goals
+
+        Args:
+            is_goal (bool, optional): get all, all goals, all no goals?. Defaults to None.
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return list(self._iter_all(is_goal))
+
+    def get_goals(self) -> List[FactDto]:
+        """ get all FactDto that are goals
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._get_all(is_goal=True)
+
+    def count_goals(self) -> int:
+        """ count all FactDto that are goals,
+            stored facts are counted without checking them
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT COUNT(*) FROM fact WHERE is_goal = 1")[0]
+
+    def get_no_goals(self) -> List[FactDto]:
+        """ get all FactDto that are not goals
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._get_all(is_goal=False)
+
+    def get_all(self) -> List[FactDto]:
+        """ get all FactDto
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._get_all()
+
+    def count_all(self) -> int:
+        """ count all FactDto,
+            stored facts are counted without checking them
+
+        Returns:
+            int: number of FactDto
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT COUNT(*) FROM fact")[0]
+
+    def iter_goals(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto that are goals,
+            facts are read and checked in batches
+
+        Args:
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_all(True, batch_size)
+
+    def iter_no_goals(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto that are not goals,
+            facts are read and checked in batches
+
+        Args:
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_all(False, batch_size)
+
+    def iter_all(self, batch_size: int = 100) -> Iterator[FactDto]:
+        """ iterate over all FactDto,
+            facts are read and checked in batches
+
+        Args:
+            batch_size (int, optional): facts read per batch. Defaults to 100.
+
+        Yields:
+            Iterator[FactDto]: FactDto
+        """
+
+        return self._iter_all(batch_size=batch_size)
+
+    def _get_no_goals_by_numeric(self, is_numeric: bool) -> List[FactDto]:
+        """ get all FactDto that are not goals with bool or numeric value
+
+        Args:
+            is_numeric (bool): numeric or bool facts?
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._rows_to_dtos(self.sqlite_database.fetch_all(
+            "SELECT " + SqliteFactDao._FACT_COLUMNS + " FROM fact "
+            "JOIN fluent ON fact.fluent = fluent.name "
+            "WHERE fact.is_goal = 0 AND fluent.is_numeric = ? "
+            "ORDER BY fact.id",
+            (bool(is_numeric),)))
+
+    def get_bool_facts(self) -> List[FactDto]:
+        """ get all bool facts (facts with bool value)
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._get_no_goals_by_numeric(False)
+
+    def get_numeric_facts(self) -> List[FactDto]:
+        """ get all numeric functions (facts with numeric value)
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._get_no_goals_by_numeric(True)
+
+    def get_updated_since(self, date: datetime.datetime) -> List[FactDto]:
+        """ get all FactDto saved at or after a date
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[FactDto]: list of FactDto
+        """
+
+        return self._rows_to_dtos(self.sqlite_database.fetch_all(
+            "SELECT " + SqliteFactDao._FACT_COLUMNS + " FROM fact "
+            "WHERE update_date >= ? ORDER BY update_date",
+            (date.isoformat(),)))
+
+    def get_deleted_since(self, date: datetime.datetime) -> List[FactKey]:
+        """ get the natural keys of the facts deleted at or after a date,
+            they are kept by the fact_tombstone table for 10 minutes
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[FactKey]: (fluent name, object names, is_goal) of each fact
+        """
+
+        return [(ele["fluent"], tuple(ele["arguments"].split()),
+                 bool(ele["is_goal"]))
+                for ele in self.sqlite_database.fetch_all(
+                    "SELECT fluent, arguments, is_goal FROM fact_tombstone "
+                    "WHERE date >= ? ORDER BY date",
+                    (date.isoformat(),))]
+
+    def _write(self, fact_dto: FactDto, is_new: bool) -> None:
+        """ insert or update the rows of a FactDto,
+            its objects and fluent must be saved
+
+        Args:
+            fact_dto (FactDto): FactDto to write
+            is_new (bool): insert the FactDto?
+        """
+
+        bool_value = None
+        numeric_value = None
+
+        if fact_dto.fluent.is_numeric:
+            numeric_value = float(fact_dto.value)
+        else:
+            bool_value = bool(fact_dto.value)
+
+        now = SqliteDatabase.now()
+
+        if not is_new:
+            self.sqlite_database.execute(
+                "UPDATE fact SET bool_value = ?, numeric_value = ?, "
+                "update_date = ? "
+                "WHERE fluent = ? AND arguments = ? AND is_goal = ?",
+                (bool_value, numeric_value, now) +
+                SqliteFactDao._get_key(fact_dto))
+            return
+
+        cursor = self.sqlite_database.execute(
+            "INSERT INTO fact (fluent, arguments, is_goal, bool_value, "
+            "numeric_value, creation_date, update_date) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            SqliteFactDao._get_key(fact_dto) +
+            (bool_value, numeric_value, now, now))
+
+        self.sqlite_database.executemany(
+            "INSERT INTO fact_argument (fact, position, object) "
+            "VALUES (?, ?, ?)",
+            [(cursor.lastrowid, position, object_dto.name)
+             for position, object_dto in enumerate(fact_dto.objects)])
+
+    def _save(self, fact_dto: FactDto) -> bool:
+        """ save a FactDto
+            if the FactDto is already saved return False, else return True
+
+        Args:
+            fact_dto (FactDto): FactDto to save
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            if self._exist_in_sqlite(fact_dto):
+                return False
+
+            if not SqliteFactDao._check_fact_dto(fact_dto):
+                return False
+
+            # propagating saving
+            for object_dto in fact_dto.objects:
+                if not self._sql_object_dao.save(object_dto):
+                    return False
+
+            if not self._sql_fluent_dao.save(fact_dto.fluent):
+                return False
+
+            # saving
+            self._write(fact_dto, True)
+            return True
+
+    def _update(self, fact_dto: FactDto) -> bool:
+        """ update a FactDto
+            if the FactDto is not saved return False, else return True
+
+        Args:
+            fact_dto (FactDto): FactDto to update
+
+        Returns:
+            bool: succeed
+        """
+
+        if not SqliteFactDao._check_fact_dto(fact_dto):
+            return False
+
+        with self.sqlite_database.transaction():
+
+            # check if fact exists
+            if self._exist_in_sqlite(fact_dto):
+
+                # propagating saving
+                for object_dto in fact_dto.objects:
+                    if not self._sql_object_dao.save(object_dto):
+                        return False
+
+                if not self._sql_fluent_dao.save(fact_dto.fluent):
+                    return False
+
+                # updating
+                self._write(fact_dto, False)
+                return True
+
+            return False
+
+    def save(self, fact_dto: FactDto) -> bool:
+        """ save or update a FactDto
+            if the FactDto is not saved it will be saved, else it will be updated
+
+        Args:
+            fact_dto (FactDto): FactDto to save or update
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            if self._exist_in_sqlite(fact_dto):
+                return self._update(fact_dto)
+
+            return self._save(fact_dto)
+
+    def save_many(self, fact_dto_list: List[FactDto]) -> List[bool]:
+        """ save or update a list of FactDto in a single transaction,
+            the objects and fluents shared by the facts are saved once
+
+        Args:
+            fact_dto_list (List[FactDto]): list of FactDto to save or update
+
+        Returns:
+            List[bool]: succeed of each FactDto
+        """
+
+        results = []
+        object_results: Dict[str, bool] = {}
+        fluent_results: Dict[str, bool] = {}
+
+        with self.sqlite_database.transaction():
+
+            for fact_dto in fact_dto_list:
+
+                if not SqliteFactDao._check_fact_dto(fact_dto):
+                    results.append(False)
+                    continue
+
+                # propagating saving
+                for object_dto in fact_dto.objects:
+                    if object_dto.name not in object_results:
+                        object_results[object_dto.name] = \
+                            self._sql_object_dao.save(object_dto)
+
+                fluent_dto = fact_dto.fluent
+                if fluent_dto.name not in fluent_results:
+                    fluent_results[fluent_dto.name] = \
+                        self._sql_fluent_dao.save(fluent_dto)
+
+                if (not fluent_results[fluent_dto.name] or
+                        not all(object_results[ele.name]
+                                for ele in fact_dto.objects)):
+                    results.append(False)
+                    continue
+
+                # saving
+                self._write(fact_dto, not self._exist_in_sqlite(fact_dto))
+                results.append(True)
+
+        return results
+
+    def delete(self, fact_dto: FactDto) -> bool:
+        """ delete a FactDto
+            if the FactDto is not saved return False, else return True
+
+        Args:
+            fact_dto (FactDto): FactDto to delete
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            cursor = self.sqlite_database.execute(
+                "DELETE FROM fact "
+                "WHERE fluent = ? AND arguments = ? AND is_goal = ?",
+                SqliteFactDao._get_key(fact_dto))
+
+            # check if fact exists
+            return cursor.rowcount > 0
+
+    def delete_all(self) -> bool:
+        """ delete all facts
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+            self.sqlite_database.execute("DELETE FROM fact")
+
+        return True
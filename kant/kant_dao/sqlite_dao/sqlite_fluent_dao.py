@@ -0,0 +1,288 @@
+
+""" Sqlite Fluent Dao """
+
+import sqlite3
+from typing import List
+
+from kant.kant_dao.dao_interface import FluentDao
+from kant.kant_dao.sqlite_dao import (
+    SqliteDao,
+    SqliteDatabase,
+    SqliteTypeDao
+)
+
+from kant.kant_dto import FluentDto
+
+
+class SqliteFluentDao(FluentDao, SqliteDao):
+    """ Sqlite Fluent Dao Class """
+
+    def __init__(self, sqlite_database: SqliteDatabase = None) -> None:
+
+        FluentDao.__init__(self)
+        SqliteDao.__init__(self, sqlite_database)
+
+        self._sql_type_dao = SqliteTypeDao(self.sqlite_database)
+
+    def _model_to_dto(self, fluent_row: sqlite3.Row) -> FluentDto:
+        """ convert a sqlite fluent row into a FluentDto
+
+        Args:
+            fluent_row (sqlite3.Row): sqlite fluent row
+
+        Returns:
+            FluentDto: FluentDto
+        """
+
+        type_rows = self.sqlite_database.fetch_all(
+            "SELECT type FROM fluent_type WHERE fluent = ? ORDER BY position",
+            (fluent_row["name"],))
+
+        type_dto_list = []
+
+        for type_row in type_rows:
+            type_dto = self._sql_type_dao.get(type_row["type"])
+            type_dto_list.append(type_dto)
+
+        fluent_dto = FluentDto(
+            fluent_row["name"],
+            type_dto_list,
+            bool(fluent_row["is_numeric"]))
+
+        return fluent_dto
+
+    def _exist_in_sqlite(self, fluent_dto: FluentDto) -> bool:
+        """ check if FluentDto exists
+
+        Args:
+            fluent_dto (FluentDto): FluentDto
+
+        Returns:
+            bool: FluentDto exists?
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT 1 FROM fluent WHERE name = ?",
+            (fluent_dto.name,)) is not None
+
+    def _get_model(self, fluent_dto: FluentDto) -> sqlite3.Row:
+        """ get the sqlite fluent row corresponding to a give FluentDto
+
+        Args:
+            fluent_dto (FluentDto): FluentDto
+
+        Returns:
+            sqlite3.Row: sqlite fluent row
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT name, is_numeric FROM fluent WHERE name = ?",
+            (fluent_dto.name,))
+
+    def get(self, fluent_name: str) -> FluentDto:
+        """ get a FluentDto with a given fluent name
+            return None if there is no with that fluent name
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            FluentDto: FluentDto of the fluent name
+        """
+
+        fluent_row = self.sqlite_database.fetch_one(
+            "SELECT name, is_numeric FROM fluent WHERE name = ?",
+            (fluent_name,))
+
+        # check if fluent exist
+        if fluent_row:
+            return self._model_to_dto(fluent_row)
+
+        return None
+
+    def get_all(self) -> List[FluentDto]:
+        """ get all FluentDto
+
+        Returns:
+            List[FluentDto]: list of all FluentDto
+        """
+
+        fluent_rows = self.sqlite_database.fetch_all(
+            "SELECT name, is_numeric FROM fluent ORDER BY name")
+        fluent_dto_list = []
+
+        for ele in fluent_rows:
+            fluent_dto = self._model_to_dto(ele)
+            fluent_dto_list.append(fluent_dto)
+
+        return fluent_dto_list
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[FluentDto]:
+        """ get a page of FluentDto sorted by fluent name
+
+        Args:
+            after (str, optional): last fluent name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max FluentDto in the page. Defaults to 100.
+
+        Returns:
+            List[FluentDto]: list of FluentDto
+        """
+
+        fluent_rows = self._fetch_page(
+            "SELECT name, is_numeric FROM fluent", after, limit)
+        fluent_dto_list = []
+
+        for ele in fluent_rows:
+            fluent_dto = self._model_to_dto(ele)
+            fluent_dto_list.append(fluent_dto)
+
+        return fluent_dto_list
+
+    def count_all(self) -> int:
+        """ count all FluentDto
+
+        Returns:
+            int: number of FluentDto
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT COUNT(*) FROM fluent")[0]
+
+    def _insert_types(self, fluent_dto: FluentDto) -> None:
+        """ insert the type rows of a FluentDto
+
+        Args:
+            fluent_dto (FluentDto): FluentDto
+        """
+
+        self.sqlite_database.executemany(
+            "INSERT INTO fluent_type (fluent, position, type) "
+            "VALUES (?, ?, ?)",
+            [(fluent_dto.name, position, type_dto.name)
+             for position, type_dto in enumerate(fluent_dto.types)])
+
+    def _save(self, fluent_dto: FluentDto) -> bool:
+        """ save a FluentDto
+            if the FluentDto is already saved return False, else return True
+
+        Args:
+            fluent_dto (FluentDto): FluentDto to save
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            if self._exist_in_sqlite(fluent_dto):
+                return False
+
+            # propagating saving
+            for type_dto in fluent_dto.types:
+                if not self._sql_type_dao.save(type_dto):
+                    return False
+
+            # saving
+            now = SqliteDatabase.now()
+            self.sqlite_database.execute(
+                "INSERT INTO fluent (name, is_numeric, creation_date, "
+                "update_date) VALUES (?, ?, ?, ?)",
+                (fluent_dto.name, fluent_dto.is_numeric, now, now))
+            self._insert_types(fluent_dto)
+
+            return True
+
+    def _update(self, fluent_dto: FluentDto) -> bool:
+        """ update a FluentDto
+            if the FluentDto is not saved return False, else return True
+
+        Args:
+            fluent_dto (FluentDto): FluentDto to update
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            # check if fluent exists
+            if self._exist_in_sqlite(fluent_dto):
+
+                # propagating saving
+                for type_dto in fluent_dto.types:
+                    if not self._sql_type_dao.save(type_dto):
+                        return False
+
+                # updating
+                self.sqlite_database.execute(
+                    "UPDATE fluent SET is_numeric = ?, update_date = ? "
+                    "WHERE name = ?",
+                    (fluent_dto.is_numeric, SqliteDatabase.now(),
+                     fluent_dto.name))
+
+                # the type rows are only rewritten if they changed,
+                # so saving a fluent again does not change the domain
+                type_names = [row[0] for row in self.sqlite_database.fetch_all(
+                    "SELECT type FROM fluent_type WHERE fluent = ? "
+                    "ORDER BY position", (fluent_dto.name,))]
+
+                if type_names != [type_dto.name
+                                  for type_dto in fluent_dto.types]:
+                    self.sqlite_database.execute(
+                        "DELETE FROM fluent_type WHERE fluent = ?",
+                        (fluent_dto.name,))
+                    self._insert_types(fluent_dto)
+
+                return True
+
+            return False
+
+    def save(self, fluent_dto: FluentDto) -> bool:
+        """ save or update a FluentDto
+            if the FluentDto is not saved it will be saved, else it will be updated
+
+        Args:
+            fluent_dto (FluentDto): FluentDto to save or update
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            if self._exist_in_sqlite(fluent_dto):
+                return self._update(fluent_dto)
+
+            return self._save(fluent_dto)
+
+    def delete(self, fluent_dto: FluentDto) -> bool:
+        """ delete a FluentDto
+            if the FluentDto is not saved return False, else return True
+
+        Args:
+            fluent_dto (FluentDto): FluentDto to delete
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            cursor = self.sqlite_database.execute(
+                "DELETE FROM fluent WHERE name = ?", (fluent_dto.name,))
+
+            # check if fluent exists
+            return cursor.rowcount > 0
+
+    def delete_all(self) -> bool:
+        """ delete all fluents
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+            self.sqlite_database.execute("DELETE FROM fluent")
+
+        return True
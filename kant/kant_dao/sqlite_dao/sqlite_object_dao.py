@@ -0,0 +1,307 @@
+
+""" Sqlite Object Dao """
+
+import datetime
+import sqlite3
+from typing import List
+
+from kant.kant_dao.dao_interface import ObjectDao
+from kant.kant_dao.sqlite_dao import (
+    SqliteDao,
+    SqliteDatabase,
+    SqliteTypeDao
+)
+
+from kant.kant_dto import ObjectDto
+
+
+class SqliteObjectDao(ObjectDao, SqliteDao):
+    """ Sqlite Object Dao Class """
+
+    # objects of a type and of its descendant types
+    _SUBTYPE_OBJECTS_QUERY = """
+        WITH RECURSIVE subtype (name) AS (
+            SELECT ?
+            UNION
+            SELECT type.name FROM type JOIN subtype ON type.father = subtype.name
+        )
+        SELECT name, type FROM object
+        WHERE type IN (SELECT name FROM subtype) ORDER BY name
+    """
+
+    def __init__(self, sqlite_database: SqliteDatabase = None) -> None:
+
+        ObjectDao.__init__(self)
+        SqliteDao.__init__(self, sqlite_database)
+
+        self._sql_type_dao = SqliteTypeDao(self.sqlite_database)
+
+    def _model_to_dto(self, object_row: sqlite3.Row) -> ObjectDto:
+        """ convert a sqlite object row into a ObjectDto
+
+        Args:
+            object_row (sqlite3.Row): sqlite object row
+
+        Returns:
+            ObjectDto: ObjectDto
+        """
+
+        type_dto = self._sql_type_dao.get(object_row["type"])
+
+        object_dto = ObjectDto(type_dto,
+                               object_row["name"])
+
+        return object_dto
+
+    def _exist_in_sqlite(self, object_dto: ObjectDto) -> bool:
+        """ check if ObjectDto exists
+
+        Args:
+            object_dto (ObjectDto): ObjectDto
+
+        Returns:
+            bool: ObjectDto exists?
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT 1 FROM object WHERE name = ?",
+            (object_dto.name,)) is not None
+
+    def _get_model(self, object_dto: ObjectDto) -> sqlite3.Row:
+        """ get the sqlite object row corresponding to a give ObjectDto
+
+        Args:
+            object_dto (ObjectDto): ObjectDto
+
+        Returns:
+            sqlite3.Row: sqlite object row
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT name, type FROM object WHERE name = ?",
+            (object_dto.name,))
+
+    def get(self, object_name: str) -> ObjectDto:
+        """ get a ObjectDto with a given object name
+            return None if there is no with that object name
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            ObjectDto: ObjectDto of the object name
+        """
+
+        object_row = self.sqlite_database.fetch_one(
+            "SELECT name, type FROM object WHERE name = ?",
+            (object_name,))
+
+        # check if object exists
+        if object_row:
+            return self._model_to_dto(object_row)
+
+        return None
+
+    def get_all(self) -> List[ObjectDto]:
+        """ get all ObjectDto
+
+        Returns:
+            List[ObjectDto]: list of all ObjectDto
+        """
+
+        object_rows = self.sqlite_database.fetch_all(
+            "SELECT name, type FROM object ORDER BY name")
+        object_dto_list = []
+
+        for ele in object_rows:
+            object_dto = self._model_to_dto(ele)
+            object_dto_list.append(object_dto)
+
+        return object_dto_list
+
+    def get_by_type(self, type_name: str,
+                    include_subtypes: bool = True) -> List[ObjectDto]:
+        """ get all ObjectDto of a given type sorted by object name,
+            subtypes are found with a recursive query over the fathers
+
+        Args:
+            type_name (str): type name
+            include_subtypes (bool, optional): get also the objects of
+                                               the subtypes? Defaults to True.
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+        if include_subtypes:
+            object_rows = self.sqlite_database.fetch_all(
+                SqliteObjectDao._SUBTYPE_OBJECTS_QUERY, (type_name,))
+        else:
+            object_rows = self.sqlite_database.fetch_all(
+                "SELECT name, type FROM object WHERE type = ? ORDER BY name",
+                (type_name,))
+
+        object_dto_list = []
+
+        for ele in object_rows:
+            object_dto = self._model_to_dto(ele)
+            object_dto_list.append(object_dto)
+
+        return object_dto_list
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[ObjectDto]:
+        """ get a page of ObjectDto sorted by object name
+
+        Args:
+            after (str, optional): last object name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max ObjectDto in the page. Defaults to 100.
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+        object_rows = self._fetch_page(
+            "SELECT name, type FROM object", after, limit)
+        object_dto_list = []
+
+        for ele in object_rows:
+            object_dto = self._model_to_dto(ele)
+            object_dto_list.append(object_dto)
+
+        return object_dto_list
+
+    def count_all(self) -> int:
+        """ count all ObjectDto
+
+        Returns:
+            int: number of ObjectDto
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT COUNT(*) FROM object")[0]
+
+    def get_updated_since(self, date: datetime.datetime) -> List[ObjectDto]:
+        """ get all ObjectDto saved at or after a date
+
+        Args:
+            date (datetime.datetime): date
+
+        Returns:
+            List[ObjectDto]: list of ObjectDto
+        """
+
+        object_rows = self.sqlite_database.fetch_all(
+            "SELECT name, type FROM object WHERE update_date >= ? "
+            "ORDER BY update_date", (date.isoformat(),))
+
+        return [self._model_to_dto(ele) for ele in object_rows]
+
+    def _save(self, object_dto: ObjectDto) -> bool:
+        """ save a ObjectDto
+            if the ObjectDto is already saved return False, else return True
+
+        Args:
+            object_dto (ObjectDto): ObjectDto to save
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            if self._exist_in_sqlite(object_dto):
+                return False
+
+            # propagating saving
+            if not self._sql_type_dao.save(object_dto.type):
+                return False
+
+            # saving
+            now = SqliteDatabase.now()
+            self.sqlite_database.execute(
+                "INSERT INTO object (name, type, creation_date, update_date) "
+                "VALUES (?, ?, ?, ?)",
+                (object_dto.name, object_dto.type.name, now, now))
+
+            return True
+
+    def _update(self, object_dto: ObjectDto) -> bool:
+        """ update a ObjectDto
+            if the ObjectDto is not saved return False, else return True
+
+        Args:
+            object_dto (ObjectDto): ObjectDto to update
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            # check if object exists
+            if self._exist_in_sqlite(object_dto):
+
+                # propagating saving
+                if not self._sql_type_dao.save(object_dto.type):
+                    return False
+
+                # updating
+                self.sqlite_database.execute(
+                    "UPDATE object SET type = ?, update_date = ? "
+                    "WHERE name = ?",
+                    (object_dto.type.name, SqliteDatabase.now(),
+                     object_dto.name))
+
+                return True
+
+            return False
+
+    def save(self, object_dto: ObjectDto) -> bool:
+        """ save or update a ObjectDto
+            if the ObjectDto is not saved it will be saved, else it will be updated
+
+        Args:
+            object_dto (ObjectDto): ObjectDto to save or update
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            if self._exist_in_sqlite(object_dto):
+                return self._update(object_dto)
+
+            return self._save(object_dto)
+
+    def delete(self, object_dto: ObjectDto) -> bool:
+        """ delete a ObjectDto
+            if the ObjectDto is not saved return False, else return True
+
+        Args:
+            object_dto (ObjectDto): ObjectDto to delete
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            cursor = self.sqlite_database.execute(
+                "DELETE FROM object WHERE name = ?", (object_dto.name,))
+
+            # check if object exists
+            return cursor.rowcount > 0
+
+    def delete_all(self) -> bool:
+        """ delete all objects
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+            self.sqlite_database.execute("DELETE FROM object")
+
+        return True
@@ -0,0 +1,298 @@
+
+""" Sqlite Type Dao """
+
+import sqlite3
+from typing import Dict, List
+
+from kant.kant_dao.dao_interface import TypeDao
+from kant.kant_dao.sqlite_dao import (
+    SqliteDao,
+    SqliteDatabase
+)
+
+from kant.kant_dto import TypeDto
+
+
+class SqliteTypeDao(TypeDao, SqliteDao):
+    """ Sqlite Type Dao Class """
+
+    # type and its ancestors, from the type to the root
+    _ANCESTORS_QUERY = """
+        WITH RECURSIVE ancestor (name, father, depth) AS (
+            SELECT name, father, 0 FROM type WHERE name = ?
+            UNION ALL
+            SELECT type.name, type.father, ancestor.depth + 1
+            FROM type JOIN ancestor ON type.name = ancestor.father
+        )
+        SELECT name, father FROM ancestor ORDER BY depth
+    """
+
+    def __init__(self, sqlite_database: SqliteDatabase = None) -> None:
+
+        TypeDao.__init__(self)
+        SqliteDao.__init__(self, sqlite_database)
+
+    @staticmethod
+    def _rows_to_dto(type_name: str, father_dict: Dict[str, str]) -> TypeDto:
+        """ build a TypeDto and its fathers from a dict of type fathers
+
+        Args:
+            type_name (str): type name
+            father_dict (Dict[str, str]): father name of each type
+
+        Returns:
+            TypeDto: TypeDto
+        """
+
+        type_dto = TypeDto(type_name)
+        father_name = father_dict.get(type_name)
+
+        if father_name and father_name in father_dict:
+            type_dto.father = SqliteTypeDao._rows_to_dto(
+                father_name, father_dict)
+
+        return type_dto
+
+    def _model_to_dto(self, type_row: sqlite3.Row) -> TypeDto:
+        """ convert a sqlite type row into a TypeDto
+
+        Args:
+            type_row (sqlite3.Row): sqlite type row
+
+        Returns:
+            TypeDto: TypeDto
+        """
+
+        type_dto = TypeDto(type_row["name"])
+
+        if type_row["father"]:
+            type_dto.father = self.get(type_row["father"])
+
+        return type_dto
+
+    def _exist_in_sqlite(self, type_dto: TypeDto) -> bool:
+        """ check if TypeDto exists
+
+        Args:
+            type_dto (TypeDto): TypeDto
+
+        Returns:
+            bool: TypeDto exists?
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT 1 FROM type WHERE name = ?",
+            (type_dto.name,)) is not None
+
+    def _get_model(self, type_dto: TypeDto) -> sqlite3.Row:
+        """ get the sqlite type row corresponding to a give TypeDto
+
+        Args:
+            type_dto (TypeDto): TypeDto
+
+        Returns:
+            sqlite3.Row: sqlite type row
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT name, father FROM type WHERE name = ?",
+            (type_dto.name,))
+
+    def get(self, type_name: str) -> TypeDto:
+        """ get a TypeDto with a given type name
+            return None if there is no with that type name
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            TypeDto: TypeDto of the type name
+        """
+
+        type_rows = self.sqlite_database.fetch_all(
+            SqliteTypeDao._ANCESTORS_QUERY, (type_name,))
+
+        type_dto = None
+
+        for type_row in reversed(type_rows):
+            type_dto = TypeDto(type_row["name"], type_dto)
+
+        return type_dto
+
+    def get_all(self) -> List[TypeDto]:
+        """ get all TypeDto
+
+        Returns:
+            List[TypeDto]: list of all TypeDto
+        """
+
+        type_rows = self.sqlite_database.fetch_all(
+            "SELECT name, father FROM type ORDER BY name")
+
+        father_dict = {}
+        for type_row in type_rows:
+            father_dict[type_row["name"]] = type_row["father"]
+
+        type_dto_list = []
+
+        for type_row in type_rows:
+            type_dto = SqliteTypeDao._rows_to_dto(type_row["name"],
+                                                  father_dict)
+            type_dto_list.append(type_dto)
+
+        return type_dto_list
+
+    def get_page(self, after: str = None, limit: int = 100) -> List[TypeDto]:
+        """ get a page of TypeDto sorted by type name
+
+        Args:
+            after (str, optional): last type name of the previous page,
+                                   None for the first page. Defaults to None.
+            limit (int, optional): max TypeDto in the page. Defaults to 100.
+
+        Returns:
+            List[TypeDto]: list of TypeDto
+        """
+
+        type_rows = self._fetch_page(
+            "SELECT name, father FROM type", after, limit)
+        type_dto_list = []
+
+        for ele in type_rows:
+            type_dto = self._model_to_dto(ele)
+            type_dto_list.append(type_dto)
+
+        return type_dto_list
+
+    def count_all(self) -> int:
+        """ count all TypeDto
+
+        Returns:
+            int: number of TypeDto
+        """
+
+        return self.sqlite_database.fetch_one(
+            "SELECT COUNT(*) FROM type")[0]
+
+    def _save(self, type_dto: TypeDto) -> bool:
+        """ save a TypeDto
+            if the TypeDto is already saved return False, else return True
+
+        Args:
+            type_dto (TypeDto): TypeDto to save
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            if self._exist_in_sqlite(type_dto):
+                return False
+
+            # propagating saving
+            if type_dto.father:
+                if not self.save(type_dto.father):
+                    return False
+
+            # saving
+            now = SqliteDatabase.now()
+            self.sqlite_database.execute(
+                "INSERT INTO type (name, father, creation_date, update_date) "
+                "VALUES (?, ?, ?, ?)",
+                (type_dto.name,
+                 type_dto.father.name if type_dto.father else None,
+                 now, now))
+
+            return True
+
+    def _update(self, type_dto: TypeDto) -> bool:
+        """ update a TypeDto
+            if the TypeDto is not saved return False, else return True
+
+        Args:
+            type_dto (TypeDto): TypeDto to update
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            # check if type exists
+            if self._exist_in_sqlite(type_dto):
+
+                # a type without father keeps the stored one
+                if not type_dto.father:
+                    return True
+
+                # propagating saving
+                if not self.save(type_dto.father):
+                    return False
+
+                # updating
+                self.sqlite_database.execute(
+                    "UPDATE type SET father = ?, update_date = ? "
+                    "WHERE name = ?",
+                    (type_dto.father.name,
+                     SqliteDatabase.now(),
+                     type_dto.name))
+
+                return True
+
+            return False
+
+    def save(self, type_dto: TypeDto) -> bool:
+        """ save or update a TypeDto
+            if the TypeDto is not saved it will be saved, else it will be updated
+
+        Args:
+            type_dto (TypeDto): TypeDto to save or update
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            if self._exist_in_sqlite(type_dto):
+                return self._update(type_dto)
+
+            return self._save(type_dto)
+
+    def delete(self, type_dto: TypeDto) -> bool:
+        """ delete a TypeDto
+            if the TypeDto is not saved return False, else return True
+
+        Args:
+            type_dto (TypeDto): TypeDto to delete
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+
+            # check if type exists
+            if self._exist_in_sqlite(type_dto):
+
+                # delete childs
+                self.sqlite_database.execute(
+                    "DELETE FROM type WHERE name = ? OR father = ?",
+                    (type_dto.name, type_dto.name))
+
+                return True
+
+            return False
+
+    def delete_all(self) -> bool:
+        """ delete all types
+
+        Returns:
+            bool: succeed
+        """
+
+        with self.sqlite_database.transaction():
+            self.sqlite_database.execute("DELETE FROM type")
+
+        return True
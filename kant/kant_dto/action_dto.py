@@ -1,7 +1,8 @@
 
 """ Action Dto """
 
-from typing import Any, List
+import io
+from typing import Any, List, TextIO
 from kant.kant_dto.dto import Dto
 from kant.kant_dto.condition_effect_dto import ConditionEffectDto
 from kant.kant_dto.object_dto import ObjectDto
@@ -87,42 +88,49 @@ class ActionDto(Dto):
             self._effects = []
 
     def to_pddl(self) -> str:
-        string = "(:"
+        stream = io.StringIO()
+        self.write_pddl(stream)
+        return stream.getvalue()
+
+    def write_pddl(self, stream: TextIO) -> None:
+        write = stream.write
+        write("(:")
 
         # durative
         if self.durative:
-            string += "durative-"
-        string += "action " + self.name
+            write("durative-")
+        write("action ")
+        write(self.name)
 
         # parameters
-        string += "\n\t:parameters ("
+        write("\n\t:parameters (")
         for parameter in self.parameters:
-            string += " ?" + parameter.name + " - " + \
-                parameter.type.name
-        string += ")"
+            write(" ?")
+            write(parameter.name)
+            write(" - ")
+            write(parameter.type.name)
+        write(")")
 
         # duration
         if self.durative:
-            string += "\n\t:duration (= ?duration " + str(self.duration) + ")"
+            write("\n\t:duration (= ?duration ")
+            write(str(self.duration))
+            write(")")
 
         # conditions
         if self.durative:
-            string += "\n\t:condition (and"
+            write("\n\t:condition (and")
         else:
-            string += "\n\t:precondition (and"
-        for condi in self.conditions:
-            string += "\n\t\t" + str(condi)
-        string += "\n\t)"
+            write("\n\t:precondition (and")
+        Dto.write_pddl_list(stream, self.conditions, "\n\t\t", "")
+        write("\n\t)")
 
         # effects
-        string += "\n\t:effect (and"
-        for effect in self.effects:
-            string += "\n\t\t" + str(effect)
-        string += "\n\t)"
-
-        string += "\n)"
+        write("\n\t:effect (and")
+        Dto.write_pddl_list(stream, self.effects, "\n\t\t", "")
+        write("\n\t)")
 
-        return string
+        write("\n)")
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, ActionDto):
@@ -1,7 +1,7 @@
 
 """ Condition/Effect Dto """
 
-from typing import Any, List, Union
+from typing import Any, List, TextIO, Union
 from kant.kant_dto.fact_dto import FactDto
 from kant.kant_dto.fluent_dto import FluentDto
 from kant.kant_dto.object_dto import ObjectDto
@@ -61,27 +61,43 @@ class ConditionEffectDto(FactDto):
 
         self._condition_effect = condition_effect
 
-    def to_pddl(self) -> str:
+    def write_pddl(self, stream: TextIO) -> None:
+        write = stream.write
+        is_numeric = self.fluent.is_numeric
+        is_negated = not is_numeric and not self.value
 
-        string = "(" + self.fluent.name
+        if self._time:
+            write("(")
+            write(self._time)
+            write(" ")
+
+        if is_numeric:
+            write("(")
+            write(self.condition_effect)
+            write(" ")
+
+        elif is_negated:
+            write("(not ")
+
+        write("(")
+        write(self.fluent.name)
 
         for object in self.objects:
-            string += " ?" + object.name
+            write(" ?")
+            write(object.name)
 
-        string += ")"
+        write(")")
 
-        if self.fluent.is_numeric:
-            string = "(" + self.condition_effect + " " + \
-                string + " " + str(self.value) + ")"
+        if is_numeric:
+            write(" ")
+            write(str(self.value))
+            write(")")
 
-        else:
-            if not self.value:
-                string = "(not " + string + ")"
+        elif is_negated:
+            write(")")
 
         if self._time:
-            string = "(" + self._time + " " + string + ")"
-
-        return string
+            write(")")
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, ConditionEffectDto):
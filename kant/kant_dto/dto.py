@@ -1,7 +1,9 @@
 
 """ Dto Abstract Class """
 
+import io
 from abc import ABC, abstractmethod
+from typing import Iterable, TextIO
 
 
 class Dto(ABC):
@@ -15,6 +17,59 @@ class Dto(ABC):
             str: PDDL text
         """
 
+    def write_pddl(self, stream: TextIO) -> None:
+        """ write the PDDL text of this DTO into a text stream,
+            DTOs made of many parts write them one by one
+            instead of joining them into intermediate strings
+
+        Args:
+            stream (TextIO): text stream
+        """
+
+        stream.write(self.to_pddl())
+
+    @staticmethod
+    def write_pddl_list(stream: TextIO,
+                        dto_list: Iterable["Dto"],
+                        prefix: str = "",
+                        suffix: str = "\n") -> None:
+        """ write the PDDL text of many DTOs into a text stream,
+            each one between a prefix and a suffix
+
+        Args:
+            stream (TextIO): text stream
+            dto_list (Iterable[Dto]): DTOs to write, it may be a generator
+            prefix (str, optional): text before each DTO. Defaults to "".
+            suffix (str, optional): text after each DTO. Defaults to "\\n".
+        """
+
+        write = stream.write
+
+        for dto in dto_list:
+            write(prefix)
+            dto.write_pddl(stream)
+            write(suffix)
+
+    @staticmethod
+    def to_pddl_list(dto_list: Iterable["Dto"],
+                     prefix: str = "",
+                     suffix: str = "\n") -> str:
+        """ generate the PDDL text of many DTOs in a shared buffer,
+            each one between a prefix and a suffix
+
+        Args:
+            dto_list (Iterable[Dto]): DTOs to render, it may be a generator
+            prefix (str, optional): text before each DTO. Defaults to "".
+            suffix (str, optional): text after each DTO. Defaults to "\\n".
+
+        Returns:
+            str: PDDL text
+        """
+
+        stream = io.StringIO()
+        Dto.write_pddl_list(stream, dto_list, prefix, suffix)
+        return stream.getvalue()
+
     def __str__(self) -> str:
         return self.to_pddl()
 
@@ -1,7 +1,8 @@
 
 """ Fact Dto """
 
-from typing import List, Union, Any
+import io
+from typing import List, Union, Any, TextIO
 from kant.kant_dto.dto import Dto
 from kant.kant_dto.fluent_dto import FluentDto
 from kant.kant_dto.object_dto import ObjectDto
@@ -70,17 +71,30 @@ class FactDto(Dto):
         self._is_goal = is_goal
 
     def to_pddl(self) -> str:
-        string = "(" + self.fluent.name
+        stream = io.StringIO()
+        self.write_pddl(stream)
+        return stream.getvalue()
 
-        for object in self._objects:
-            string += " " + object.name
+    def write_pddl(self, stream: TextIO) -> None:
+        write = stream.write
+        is_numeric = self.fluent.is_numeric
+
+        if is_numeric:
+            write("(= ")
 
-        string += ")"
+        write("(")
+        write(self.fluent.name)
+
+        for object in self._objects:
+            write(" ")
+            write(object.name)
 
-        if self.fluent.is_numeric:
-            string = "(= " + string + " " + str(self.value) + ")"
+        write(")")
 
-        return string
+        if is_numeric:
+            write(" ")
+            write(str(self.value))
+            write(")")
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, FactDto):
@@ -1,7 +1,8 @@
 
 """ Fluent Dto """
 
-from typing import Any, List
+import io
+from typing import Any, List, TextIO
 from kant.kant_dto.dto import Dto
 from kant.kant_dto.type_dto import TypeDto
 
@@ -50,17 +51,24 @@ class FluentDto(Dto):
         self._is_numeric = is_numeric
 
     def to_pddl(self) -> str:
-        string = "(" + self.name
-
-        if self.types:
-            for i in range(len(self.types)):
-                aux_type = self.types[i]
-                type_name = aux_type.name
-                string += " ?" + type_name[0] + str(i) + " - " + type_name
-
-        string += ")"
-
-        return string
+        stream = io.StringIO()
+        self.write_pddl(stream)
+        return stream.getvalue()
+
+    def write_pddl(self, stream: TextIO) -> None:
+        write = stream.write
+        write("(")
+        write(self.name)
+
+        for i, type_dto in enumerate(self.types):
+            type_name = type_dto.name
+            write(" ?")
+            write(type_name[0])
+            write(str(i))
+            write(" - ")
+            write(type_name)
+
+        write(")")
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, FluentDto):
@@ -0,0 +1,5 @@
+from kant.kant_pddl.pddl_parser import PddlParser
+from kant.kant_pddl.pddl_loader import PddlLoader
+from kant.kant_pddl.pddl_domain_builder import PddlDomainBuilder
+from kant.kant_pddl.pddl_problem_writer import PddlProblemWriter
+from kant.kant_pddl.pddl_problem_builder import PddlProblemBuilder
@@ -0,0 +1,156 @@
+
+""" PDDL Domain Builder """
+
+import io
+from typing import List, TextIO
+
+from kant.kant_dao import DaoFactoryMethod
+from kant.kant_dao.dao_factory.dao_factories import DaoFactory
+from kant.kant_dto import (
+    Dto,
+    TypeDto,
+    FluentDto,
+    ActionDto
+)
+
+
+class PddlDomainBuilder:
+    """ PDDL Domain Builder Class
+        renders the types, predicates, functions and actions of a domain
+        from the DAOs; the rendered domain is kept with the domain version
+        of the factory, so it is only rendered again after a write of the
+        types, the fluents or the actions
+    """
+
+    def __init__(self, dao_factory: DaoFactory = None) -> None:
+
+        if dao_factory is None:
+            dao_factory = DaoFactoryMethod.get_dao_factory()
+
+        self.dao_factory = dao_factory
+
+    @property
+    def dao_factory(self) -> DaoFactory:
+        return self._dao_factory
+
+    @dao_factory.setter
+    def dao_factory(self, dao_factory: DaoFactory) -> None:
+        self._dao_factory = dao_factory
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """ forget the rendered domain, it will be rendered on the next build
+        """
+
+        self._version = None
+        self._domain_name = None
+        self._domain = None
+
+    @staticmethod
+    def render(type_dtos: List[TypeDto],
+               fluent_dtos: List[FluentDto],
+               action_dtos: List[ActionDto],
+               domain_name: str = "domain") -> str:
+        """ render a PDDL domain
+
+        Args:
+            type_dtos (List[TypeDto]): TypeDto of the domain
+            fluent_dtos (List[FluentDto]): FluentDto of the domain
+            action_dtos (List[ActionDto]): ActionDto of the domain
+            domain_name (str, optional): domain name. Defaults to "domain".
+
+        Returns:
+            str: PDDL domain
+        """
+
+        stream = io.StringIO()
+
+        stream.write("(define (domain " + domain_name + ")\n")
+
+        # requirements
+        stream.write("(:requirements :typing")
+        if any(ele.durative for ele in action_dtos):
+            stream.write(" :durative-actions")
+        if any(ele.is_numeric for ele in fluent_dtos):
+            stream.write(" :numeric-fluents")
+        stream.write(")\n")
+
+        # types
+        stream.write("(:types\n")
+        Dto.write_pddl_list(
+            stream, sorted(type_dtos, key=lambda ele: ele.name), "\t")
+        stream.write(")\n")
+
+        # predicates and functions
+        fluent_dtos = sorted(fluent_dtos, key=lambda ele: ele.name)
+
+        stream.write("(:predicates\n")
+        Dto.write_pddl_list(
+            stream, (ele for ele in fluent_dtos if not ele.is_numeric), "\t")
+        stream.write(")\n")
+
+        stream.write("(:functions\n")
+        Dto.write_pddl_list(
+            stream, (ele for ele in fluent_dtos if ele.is_numeric), "\t")
+        stream.write(")\n")
+
+        # actions
+        Dto.write_pddl_list(
+            stream, sorted(action_dtos, key=lambda ele: ele.name))
+
+        stream.write(")\n")
+
+        return stream.getvalue()
+
+    def build(self, domain_name: str = "domain") -> str:
+        """ get the PDDL domain of the DAOs, it is rendered again only
+            if the domain version changed; factories that do not track
+            the domain version are rendered every time
+
+        Args:
+            domain_name (str, optional): domain name. Defaults to "domain".
+
+        Returns:
+            str: PDDL domain
+        """
+
+        # read before rendering, a concurrent write renders it again
+        version = self.dao_factory.get_domain_version()
+
+        if (version is not None and
+                version == self._version and
+                domain_name == self._domain_name):
+            return self._domain
+
+        domain = PddlDomainBuilder.render(
+            self.dao_factory.create_type_dao().get_all(),
+            self.dao_factory.create_fluent_dao().get_all(),
+            self.dao_factory.create_action_dao().get_all(),
+            domain_name)
+
+        self._version = version
+        self._domain_name = domain_name
+        self._domain = domain
+
+        return domain
+
+    def write(self, stream: TextIO, domain_name: str = "domain") -> None:
+        """ write the PDDL domain
+
+        Args:
+            stream (TextIO): text stream
+            domain_name (str, optional): domain name. Defaults to "domain".
+        """
+
+        stream.write(self.build(domain_name))
+
+    def write_file(self, path: str, domain_name: str = "domain") -> None:
+        """ write the PDDL domain into a file
+
+        Args:
+            path (str): file path
+            domain_name (str, optional): domain name. Defaults to "domain".
+        """
+
+        with open(path, "w") as stream:
+            self.write(stream, domain_name)
@@ -0,0 +1,170 @@
+
+""" PDDL Loader """
+
+from typing import List, TextIO
+
+from kant.kant_dao import DaoFactoryMethod
+from kant.kant_dao.dao_factory.dao_factories import DaoFactory
+from kant.kant_dto import (
+    TypeDto,
+    ObjectDto,
+    FluentDto,
+    FactDto,
+    ActionDto
+)
+from kant.kant_pddl.pddl_parser import PddlParser
+
+
+class PddlLoader:
+    """ PDDL Loader Class
+        loads PDDL domains and problems into the DAOs with bulk writes in
+        dependency order: types, fluents and objects are written before
+        the actions and facts using them, and facts are written in batches
+        while the problem is parsed; each load starts its parser with the
+        stored types, objects and fluents, so problems can be loaded after
+        their domain and the stored fathers are kept
+    """
+
+    def __init__(self,
+                 dao_factory: DaoFactory = None,
+                 batch_size: int = 1000) -> None:
+
+        if dao_factory is None:
+            dao_factory = DaoFactoryMethod.get_dao_factory()
+
+        self.dao_factory = dao_factory
+        self.batch_size = batch_size
+
+    @property
+    def dao_factory(self) -> DaoFactory:
+        return self._dao_factory
+
+    @dao_factory.setter
+    def dao_factory(self, dao_factory: DaoFactory) -> None:
+        self._dao_factory = dao_factory
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size: int) -> None:
+        self._batch_size = batch_size
+
+    def _create_parser(self) -> PddlParser:
+        """ create the parser of a load with the stored types, objects
+            and fluents, so the writes made since the last load are seen
+
+        Returns:
+            PddlParser: parser
+        """
+
+        parser = PddlParser()
+        parser.add_types(self.dao_factory.create_type_dao().get_all())
+        parser.add_objects(self.dao_factory.create_object_dao().get_all())
+        parser.add_fluents(self.dao_factory.create_fluent_dao().get_all())
+
+        return parser
+
+    def load_domain(self, stream: TextIO) -> bool:
+        """ load a PDDL domain, its types, constants,
+            fluents and actions
+
+        Args:
+            stream (TextIO): text stream
+
+        Returns:
+            bool: succeed
+        """
+
+        type_dtos: List[TypeDto] = []
+        object_dtos: List[ObjectDto] = []
+        fluent_dtos: List[FluentDto] = []
+        action_dtos: List[ActionDto] = []
+
+        for dto in self._create_parser().parse_domain(stream):
+
+            if isinstance(dto, TypeDto):
+                type_dtos.append(dto)
+
+            elif isinstance(dto, ObjectDto):
+                object_dtos.append(dto)
+
+            elif isinstance(dto, FluentDto):
+                fluent_dtos.append(dto)
+
+            else:
+                action_dtos.append(dto)
+
+        results = self.dao_factory.create_type_dao().save_many(type_dtos)
+        results += self.dao_factory.create_fluent_dao().save_many(fluent_dtos)
+        results += self.dao_factory.create_object_dao().save_many(object_dtos)
+        results += self.dao_factory.create_action_dao().save_many(action_dtos)
+
+        return all(results)
+
+    def load_problem(self, stream: TextIO) -> bool:
+        """ load a PDDL problem, its objects and its init and goal facts;
+            its fluents must be stored or loaded before
+
+        Args:
+            stream (TextIO): text stream
+
+        Returns:
+            bool: succeed
+        """
+
+        object_dao = self.dao_factory.create_object_dao()
+        fact_dao = self.dao_factory.create_fact_dao()
+
+        results = []
+        object_dtos: List[ObjectDto] = []
+        fact_dtos: List[FactDto] = []
+
+        for dto in self._create_parser().parse_problem(stream):
+
+            if isinstance(dto, ObjectDto):
+                object_dtos.append(dto)
+                continue
+
+            # objects are declared before the facts
+            if object_dtos:
+                results += object_dao.save_many(object_dtos)
+                object_dtos = []
+
+            fact_dtos.append(dto)
+
+            if len(fact_dtos) >= self.batch_size:
+                results += fact_dao.save_many(fact_dtos)
+                fact_dtos = []
+
+        results += object_dao.save_many(object_dtos)
+        results += fact_dao.save_many(fact_dtos)
+
+        return all(results)
+
+    def load_domain_file(self, path: str) -> bool:
+        """ load a PDDL domain file
+
+        Args:
+            path (str): file path
+
+        Returns:
+            bool: succeed
+        """
+
+        with open(path) as stream:
+            return self.load_domain(stream)
+
+    def load_problem_file(self, path: str) -> bool:
+        """ load a PDDL problem file
+
+        Args:
+            path (str): file path
+
+        Returns:
+            bool: succeed
+        """
+
+        with open(path) as stream:
+            return self.load_problem(stream)
@@ -0,0 +1,597 @@
+
+""" PDDL Parser """
+
+import re
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple, Union
+
+from kant.kant_dto import (
+    Dto,
+    TypeDto,
+    ObjectDto,
+    FluentDto,
+    FactDto,
+    ConditionEffectDto,
+    ActionDto
+)
+
+# an expression is a token or a list of expressions
+Expression = Union[str, List["Expression"]]
+
+TOKEN_PATTERN = re.compile(r"[()]|[^\s()]+")
+COMMENT_PATTERN = re.compile(r";[^\n]*")
+
+TIMES = (ConditionEffectDto.AT_START,
+         ConditionEffectDto.AT_END,
+         ConditionEffectDto.OVER_ALL)
+
+
+class PddlParser:
+    """ PDDL Parser Class
+        streaming parser of PDDL domains and problems that yields DTOs;
+        types, objects and fluents are kept by name, so every DTO of
+        the same element is shared and each one is created once;
+        the init and goal facts are parsed one by one
+    """
+
+    def __init__(self, chunk_size: int = 65536) -> None:
+
+        self.chunk_size = chunk_size
+
+        self._types: Dict[str, TypeDto] = {}
+        self._objects: Dict[str, ObjectDto] = {}
+        self._fluents: Dict[str, FluentDto] = {}
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
+    def add_types(self, type_dtos: Iterable[TypeDto]) -> None:
+        """ make some types known, like the stored ones, so
+            the parsed DTOs keep their fathers
+
+        Args:
+            type_dtos (Iterable[TypeDto]): TypeDto
+        """
+
+        for type_dto in type_dtos:
+            self._types.setdefault(type_dto.name, type_dto)
+
+    def add_objects(self, object_dtos: Iterable[ObjectDto]) -> None:
+        """ make some objects known, so the facts can use them
+
+        Args:
+            object_dtos (Iterable[ObjectDto]): ObjectDto
+        """
+
+        for object_dto in object_dtos:
+            self._objects.setdefault(object_dto.name, object_dto)
+
+    def add_fluents(self, fluent_dtos: Iterable[FluentDto]) -> None:
+        """ make some fluents known, so problems can be
+            parsed without their domain
+
+        Args:
+            fluent_dtos (Iterable[FluentDto]): FluentDto
+        """
+
+        for fluent_dto in fluent_dtos:
+            self._fluents.setdefault(fluent_dto.name, fluent_dto)
+
+    def _iter_tokens(self, stream: TextIO) -> Iterator[str]:
+        """ split a text stream into tokens, it is read by chunks
+            and cut at line ends so tokens and comments are not split
+
+        Args:
+            stream (TextIO): text stream
+
+        Yields:
+            Iterator[str]: token
+        """
+
+        rest = ""
+
+        while True:
+            chunk = stream.read(self.chunk_size)
+
+            if not chunk:
+                break
+
+            text = rest + chunk
+            cut = text.rfind("\n") + 1
+            rest = text[cut:]
+
+            yield from TOKEN_PATTERN.findall(
+                COMMENT_PATTERN.sub("", text[:cut]))
+
+        yield from TOKEN_PATTERN.findall(COMMENT_PATTERN.sub("", rest))
+
+    @staticmethod
+    def _read_list(tokens: Iterator[str]) -> List[Expression]:
+        """ read the rest of a list, its opening parenthesis
+            has already been read
+
+        Args:
+            tokens (Iterator[str]): tokens
+
+        Returns:
+            List[Expression]: list items
+        """
+
+        stack = [[]]
+
+        for token in tokens:
+
+            if token == "(":
+                stack.append([])
+
+            elif token == ")":
+                expression = stack.pop()
+
+                if not stack:
+                    return expression
+
+                stack[-1].append(expression)
+
+            else:
+                stack[-1].append(token)
+
+        raise ValueError("PDDL parentheses are not balanced")
+
+    @staticmethod
+    def _expect(tokens: Iterator[str], expected: str) -> None:
+        """ read a token that must be a keyword or a parenthesis
+
+        Args:
+            tokens (Iterator[str]): tokens
+            expected (str): expected token
+        """
+
+        token = next(tokens, None)
+
+        if token is None or token.lower() != expected:
+            raise ValueError("PDDL expected '" + expected +
+                             "' but found '" + str(token) + "'")
+
+    @staticmethod
+    def _iter_sections(tokens: Iterator[str], kind: str) -> Iterator[str]:
+        """ read the header of a domain or problem and iterate its
+            sections, each section body must be read by the caller
+
+        Args:
+            tokens (Iterator[str]): tokens
+            kind (str): "domain" or "problem"
+
+        Yields:
+            Iterator[str]: section keyword, in lower case
+        """
+
+        PddlParser._expect(tokens, "(")
+        PddlParser._expect(tokens, "define")
+        PddlParser._expect(tokens, "(")
+        PddlParser._expect(tokens, kind)
+        PddlParser._read_list(tokens)
+
+        for token in tokens:
+
+            if token == ")":
+                return
+
+            if token != "(":
+                raise ValueError("PDDL unexpected token '" + token + "'")
+
+            yield next(tokens, "").lower()
+
+        raise ValueError("PDDL parentheses are not balanced")
+
+    @staticmethod
+    def _parse_typed_list(items: List[Expression],
+                          default_type: str = "object") -> List[Tuple[str, str]]:
+        """ parse a typed list, like "?r - robot ?s ?d - wp"
+
+        Args:
+            items (List[Expression]): typed list items
+            default_type (str, optional): type of the untyped names. Defaults to "object".
+
+        Returns:
+            List[Tuple[str, str]]: name and type name of each item
+        """
+
+        typed_list = []
+        names = []
+        index = 0
+
+        while index < len(items):
+            item = items[index]
+
+            if item == "-":
+                if index + 1 == len(items) or isinstance(items[index + 1], list):
+                    raise ValueError("PDDL typed list without type")
+
+                typed_list.extend((name, items[index + 1]) for name in names)
+                names = []
+                index += 2
+
+            else:
+                names.append(item)
+                index += 1
+
+        typed_list.extend((name, default_type) for name in names)
+
+        return typed_list
+
+    def _get_type(self, type_name: str) -> TypeDto:
+        """ get the shared TypeDto of a type name
+
+        Args:
+            type_name (str): type name
+
+        Returns:
+            TypeDto: TypeDto
+        """
+
+        type_dto = self._types.get(type_name)
+
+        if type_dto is None:
+            type_dto = TypeDto(type_name)
+            self._types[type_name] = type_dto
+
+        return type_dto
+
+    def _get_object(self, object_name: str) -> ObjectDto:
+        """ get the shared ObjectDto of an object name
+
+        Args:
+            object_name (str): object name
+
+        Returns:
+            ObjectDto: ObjectDto
+        """
+
+        object_dto = self._objects.get(object_name)
+
+        if object_dto is None:
+            raise ValueError("PDDL unknown object '" + str(object_name) + "'")
+
+        return object_dto
+
+    def _get_fluent(self, fluent_name: str) -> FluentDto:
+        """ get the shared FluentDto of a fluent name
+
+        Args:
+            fluent_name (str): fluent name
+
+        Returns:
+            FluentDto: FluentDto
+        """
+
+        fluent_dto = self._fluents.get(fluent_name)
+
+        if fluent_dto is None:
+            raise ValueError("PDDL unknown fluent '" + str(fluent_name) + "'")
+
+        return fluent_dto
+
+    def _parse_types(self, items: List[Expression]) -> Iterator[TypeDto]:
+        """ parse the types section
+
+        Args:
+            items (List[Expression]): section items
+
+        Yields:
+            Iterator[TypeDto]: TypeDto, fathers before their childs
+        """
+
+        type_dtos = {}
+
+        # untyped types are roots, as they are rendered
+        for type_name, father_name in PddlParser._parse_typed_list(items,
+                                                                   None):
+            type_dto = self._get_type(type_name)
+
+            if father_name is not None and type_name != father_name:
+                type_dto.father = self._get_type(father_name)
+
+            type_dtos[type_name] = type_dto
+
+        # fathers first, so they are saved before their childs
+        yielded = set()
+        for type_dto in type_dtos.values():
+            chain = []
+
+            while type_dto is not None and type_dto.name not in yielded:
+                chain.append(type_dto)
+                yielded.add(type_dto.name)
+                type_dto = type_dto.father
+
+            yield from reversed(chain)
+
+    def _parse_objects(self, items: List[Expression]) -> Iterator[ObjectDto]:
+        """ parse an objects or constants section
+
+        Args:
+            items (List[Expression]): section items
+
+        Yields:
+            Iterator[ObjectDto]: ObjectDto
+        """
+
+        for object_name, type_name in PddlParser._parse_typed_list(items):
+            object_dto = ObjectDto(self._get_type(type_name), object_name)
+            self._objects[object_name] = object_dto
+            yield object_dto
+
+    def _parse_fluents(self, items: List[Expression],
+                       is_numeric: bool) -> Iterator[FluentDto]:
+        """ parse a predicates or functions section
+
+        Args:
+            items (List[Expression]): section items
+            is_numeric (bool): functions section?
+
+        Yields:
+            Iterator[FluentDto]: FluentDto
+        """
+
+        for item in items:
+
+            # function result types, like "- number", are skipped
+            if not isinstance(item, list):
+                continue
+
+            fluent_dto = FluentDto(
+                item[0],
+                [self._get_type(type_name) for _, type_name
+                 in PddlParser._parse_typed_list(item[1:])],
+                is_numeric=is_numeric)
+            self._fluents[fluent_dto.name] = fluent_dto
+            yield fluent_dto
+
+    @staticmethod
+    def _iter_conjunction(expression: Expression) -> Iterator[Expression]:
+        """ iterate the items of an "and", other expressions are single items
+
+        Args:
+            expression (Expression): expression
+
+        Yields:
+            Iterator[Expression]: expression
+        """
+
+        if not expression:
+            return
+
+        if isinstance(expression[0], str) and expression[0].lower() == "and":
+            for item in expression[1:]:
+                yield from PddlParser._iter_conjunction(item)
+
+        else:
+            yield expression
+
+    @staticmethod
+    def _to_number(token: Expression) -> float:
+        """ parse a numeric value
+
+        Args:
+            token (Expression): numeric token
+
+        Returns:
+            float: value
+        """
+
+        try:
+            return float(token)
+        except (TypeError, ValueError):
+            raise ValueError("PDDL numeric expressions are not supported: " +
+                             str(token)) from None
+
+    def _parse_condition_effect(
+            self, expression: Expression,
+            parameters: Dict[str, ObjectDto]) -> ConditionEffectDto:
+        """ parse a condition or effect of an action
+
+        Args:
+            expression (Expression): condition or effect
+            parameters (Dict[str, ObjectDto]): action parameters by name
+
+        Returns:
+            ConditionEffectDto: ConditionEffectDto
+        """
+
+        time = None
+        if (len(expression) == 3 and isinstance(expression[1], str) and
+                isinstance(expression[2], list) and
+                (expression[0] + " " + expression[1]).lower() in TIMES):
+            time = (expression[0] + " " + expression[1]).lower()
+            expression = expression[2]
+
+        value = True
+        condition_effect = None
+
+        if expression[0].lower() == "not":
+            value = False
+            expression = expression[1]
+
+        elif len(expression) == 3 and isinstance(expression[1], list):
+            condition_effect = expression[0].lower()
+            value = PddlParser._to_number(expression[2])
+            expression = expression[1]
+
+        object_dtos = []
+        for name in expression[1:]:
+            object_dto = None
+            if isinstance(name, str):
+                object_dto = parameters.get(name.lstrip("?"))
+
+            if object_dto is None:
+                raise ValueError("PDDL unknown parameter '" + str(name) + "'")
+
+            object_dtos.append(object_dto)
+
+        return ConditionEffectDto(self._get_fluent(expression[0]),
+                                  object_dtos, value, time, condition_effect)
+
+    def _parse_action(self, keyword: str,
+                      items: List[Expression]) -> ActionDto:
+        """ parse an action or durative action section
+
+        Args:
+            keyword (str): section keyword
+            items (List[Expression]): section items
+
+        Returns:
+            ActionDto: ActionDto
+        """
+
+        action_dto = ActionDto(items[0],
+                               durative=keyword == ":durative-action")
+        fields = {items[index].lower(): items[index + 1]
+                  for index in range(1, len(items) - 1, 2)}
+
+        parameters = {}
+        for name, type_name in PddlParser._parse_typed_list(
+                fields.get(":parameters", [])):
+            name = name.lstrip("?")
+            parameters[name] = ObjectDto(self._get_type(type_name), name)
+        action_dto.parameters = list(parameters.values())
+
+        duration = fields.get(":duration")
+        if duration:
+            action_dto.duration = int(PddlParser._to_number(duration[-1]))
+
+        action_dto.conditions = [
+            self._parse_condition_effect(ele, parameters)
+            for ele in PddlParser._iter_conjunction(
+                fields.get(":condition", fields.get(":precondition")))]
+
+        action_dto.effects = [
+            self._parse_condition_effect(ele, parameters)
+            for ele in PddlParser._iter_conjunction(fields.get(":effect"))]
+
+        return action_dto
+
+    def _parse_fact(self, expression: Expression, is_goal: bool) -> FactDto:
+        """ parse an init or goal fact
+
+        Args:
+            expression (Expression): fact
+            is_goal (bool): goal fact?
+
+        Returns:
+            FactDto: FactDto
+        """
+
+        value = None
+
+        if expression[0].lower() == "not":
+            value = False
+            expression = expression[1]
+
+        elif expression[0] == "=":
+            value = PddlParser._to_number(expression[2])
+            expression = expression[1]
+
+        if not isinstance(expression, list) or not expression:
+            raise ValueError("PDDL fact not supported: " + str(expression))
+
+        return FactDto(self._get_fluent(expression[0]),
+                       [self._get_object(ele) for ele in expression[1:]],
+                       value, is_goal)
+
+    def parse_domain(self, stream: TextIO) -> Iterator[Dto]:
+        """ parse a PDDL domain, types, constants and fluents are yielded
+            before the actions using them; requirements are ignored
+
+        Args:
+            stream (TextIO): text stream
+
+        Yields:
+            Iterator[Dto]: TypeDto, ObjectDto, FluentDto and ActionDto
+        """
+
+        tokens = self._iter_tokens(stream)
+
+        for keyword in PddlParser._iter_sections(tokens, "domain"):
+            items = PddlParser._read_list(tokens)
+
+            if keyword == ":types":
+                yield from self._parse_types(items)
+
+            elif keyword == ":constants":
+                yield from self._parse_objects(items)
+
+            elif keyword == ":predicates":
+                yield from self._parse_fluents(items, False)
+
+            elif keyword == ":functions":
+                yield from self._parse_fluents(items, True)
+
+            elif keyword in (":action", ":durative-action"):
+                yield self._parse_action(keyword, items)
+
+    def parse_problem(self, stream: TextIO) -> Iterator[Dto]:
+        """ parse a PDDL problem, the init facts are parsed one by one;
+            the fluents must be known, from the parsed domain or added
+
+        Args:
+            stream (TextIO): text stream
+
+        Yields:
+            Iterator[Dto]: ObjectDto and FactDto
+        """
+
+        tokens = self._iter_tokens(stream)
+
+        for keyword in PddlParser._iter_sections(tokens, "problem"):
+
+            if keyword == ":init":
+                for token in tokens:
+
+                    if token == ")":
+                        break
+
+                    if token != "(":
+                        raise ValueError("PDDL fact not supported: " + token)
+
+                    yield self._parse_fact(PddlParser._read_list(tokens),
+                                           False)
+
+                continue
+
+            items = PddlParser._read_list(tokens)
+
+            if keyword == ":objects":
+                yield from self._parse_objects(items)
+
+            elif keyword == ":goal" and items:
+                for expression in PddlParser._iter_conjunction(items[0]):
+                    yield self._parse_fact(expression, True)
+
+    def parse_domain_file(self, path: str) -> Iterator[Dto]:
+        """ parse a PDDL domain file
+
+        Args:
+            path (str): file path
+
+        Yields:
+            Iterator[Dto]: TypeDto, ObjectDto, FluentDto and ActionDto
+        """
+
+        with open(path) as stream:
+            yield from self.parse_domain(stream)
+
+    def parse_problem_file(self, path: str) -> Iterator[Dto]:
+        """ parse a PDDL problem file
+
+        Args:
+            path (str): file path
+
+        Yields:
+            Iterator[Dto]: ObjectDto and FactDto
+        """
+
+        with open(path) as stream:
+            yield from self.parse_problem(stream)
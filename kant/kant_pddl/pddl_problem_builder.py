@@ -0,0 +1,384 @@
+
+""" PDDL Problem Builder """
+
+import datetime
+import io
+from typing import Dict, Iterable, List, TextIO
+
+from kant.kant_dao import DaoFactoryMethod
+from kant.kant_dao.dao_factory.dao_factories import DaoFactory
+from kant.kant_dao.dao_interface.fact_dao import FactKey
+from kant.kant_dto import FactDto, ObjectDto
+from kant.kant_pddl.pddl_problem_writer import PddlProblemWriter
+
+
+class PddlProblemBuilder:
+    """ PDDL Problem Builder Class
+        keeps the rendered line of each fact by its natural key; each
+        build asks the fact DAO for the facts saved or deleted since the
+        last one and renders again only those lines. Changes that are not
+        tracked are detected with the domain version, the object names
+        and the number of facts, and the problem is rendered in full
+    """
+
+    # saves are read from a bit before the last refresh,
+    # for the precision of the stored dates and the concurrent writes
+    MARGIN = datetime.timedelta(seconds=1)
+
+    def __init__(self,
+                 dao_factory: DaoFactory = None,
+                 batch_size: int = 1000) -> None:
+
+        if dao_factory is None:
+            dao_factory = DaoFactoryMethod.get_dao_factory()
+
+        self.batch_size = batch_size
+        self.dao_factory = dao_factory
+
+    @property
+    def dao_factory(self) -> DaoFactory:
+        return self._dao_factory
+
+    @dao_factory.setter
+    def dao_factory(self, dao_factory: DaoFactory) -> None:
+        self._dao_factory = dao_factory
+        self.invalidate()
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size: int) -> None:
+        self._batch_size = batch_size
+
+    def invalidate(self) -> None:
+        """ forget the rendered problem, it will be rendered
+            in full on the next build
+        """
+
+        self._since = None
+        self._version = None
+        self._offset = 0
+
+        # type name by object name and the rendered objects section
+        self._object_types: Dict[str, str] = None
+        self._objects = None
+
+        # init and goal lines by fact natural key and the joined sections
+        self._lines: Dict[bool, Dict[FactKey, str]] = {False: {}, True: {}}
+        self._sections: Dict[bool, str] = {False: None, True: None}
+
+        self._names = None
+        self._problem = None
+
+    @staticmethod
+    def _get_key(fact_dto: FactDto) -> FactKey:
+        """ get the natural key of a FactDto
+
+        Args:
+            fact_dto (FactDto): FactDto
+
+        Returns:
+            FactKey: fluent name, object names and is_goal
+        """
+
+        return (fact_dto.fluent.name,
+                tuple(ele.name for ele in fact_dto.objects),
+                bool(fact_dto.is_goal))
+
+    @staticmethod
+    def _render_fact(fact_dto: FactDto) -> str:
+        """ render the line of a fact, empty for false bool facts
+            of the init
+
+        Args:
+            fact_dto (FactDto): FactDto
+
+        Returns:
+            str: PDDL line
+        """
+
+        stream = io.StringIO()
+        PddlProblemWriter._write_facts(stream, (fact_dto,), fact_dto.is_goal)
+        return stream.getvalue()
+
+    @staticmethod
+    def _render_objects(object_dtos: Iterable[ObjectDto]) -> str:
+        """ render the objects section, grouped by type
+
+        Args:
+            object_dtos (Iterable[ObjectDto]): ObjectDto sorted by name
+
+        Returns:
+            str: PDDL objects section
+        """
+
+        objects_by_type: Dict[str, List[str]] = {}
+
+        for object_dto in object_dtos:
+            objects_by_type.setdefault(
+                object_dto.type.name, []).append(object_dto.name)
+
+        stream = io.StringIO()
+        stream.write("(:objects\n")
+
+        for type_name in sorted(objects_by_type):
+            stream.write("\t")
+
+            for object_name in objects_by_type[type_name]:
+                stream.write(object_name + " ")
+
+            stream.write("- " + type_name + "\n")
+
+        stream.write(")\n")
+
+        return stream.getvalue()
+
+    def _set_fact(self, fact_dto: FactDto) -> bool:
+        """ render the line of a fact again
+
+        Args:
+            fact_dto (FactDto): FactDto
+
+        Returns:
+            bool: the line changed?
+        """
+
+        is_goal = bool(fact_dto.is_goal)
+        lines = self._lines[is_goal]
+        fact_key = PddlProblemBuilder._get_key(fact_dto)
+        line = PddlProblemBuilder._render_fact(fact_dto)
+
+        if lines.get(fact_key) == line:
+            return False
+
+        lines[fact_key] = line
+        self._sections[is_goal] = None
+        return True
+
+    def _delete_fact(self, fact_key: FactKey) -> bool:
+        """ forget the line of a deleted fact
+
+        Args:
+            fact_key (FactKey): fact natural key
+
+        Returns:
+            bool: the fact was rendered?
+        """
+
+        is_goal = fact_key[2]
+
+        if self._lines[is_goal].pop(fact_key, None) is None:
+            return False
+
+        self._sections[is_goal] = None
+        return True
+
+    def _refresh_objects(self, since: datetime.datetime) -> bool:
+        """ render the objects section again if an object was saved
+            with a new type or deleted; facts save their objects,
+            so most saved objects are not changed
+
+        Args:
+            since (datetime.datetime): date of the last refresh,
+                                       None to render it anyway
+
+        Returns:
+            bool: the objects changed?
+        """
+
+        object_dao = self.dao_factory.create_object_dao()
+
+        if since is not None:
+            object_dtos = object_dao.get_updated_since(since)
+
+            if (object_dtos is not None and
+                    all(self._object_types.get(ele.name) == ele.type.name
+                        for ele in object_dtos) and
+                    object_dao.count_all() == len(self._object_types)):
+                return False
+
+        object_dtos = object_dao.get_all()
+        objects = PddlProblemBuilder._render_objects(object_dtos)
+
+        self._object_types = {ele.name: ele.type.name for ele in object_dtos}
+
+        if objects == self._objects:
+            return False
+
+        self._objects = objects
+        return True
+
+    def _rebuild_facts(self) -> None:
+        """ render the lines of all facts
+        """
+
+        fact_dao = self.dao_factory.create_fact_dao()
+
+        self._lines = {False: {}, True: {}}
+        self._sections = {False: None, True: None}
+
+        for fact_dto in fact_dao.iter_all(self.batch_size):
+            self._set_fact(fact_dto)
+
+        # facts read but not checked by the DAO are not rendered
+        self._offset = (fact_dao.count_all() -
+                        len(self._lines[False]) - len(self._lines[True]))
+
+    def _update_facts(self, since: datetime.datetime) -> bool:
+        """ render the lines of the facts saved or deleted since a date
+
+        Args:
+            since (datetime.datetime): date
+
+        Returns:
+            bool: the facts changed? None if the fact DAO
+                  does not track the changes or missed some of them
+        """
+
+        fact_dao = self.dao_factory.create_fact_dao()
+
+        deleted_keys = fact_dao.get_deleted_since(since)
+        fact_dtos = fact_dao.get_updated_since(since)
+
+        if deleted_keys is None or fact_dtos is None:
+            return None
+
+        changed = False
+        saved_keys = set()
+
+        for fact_dto in fact_dtos:
+            saved_keys.add(PddlProblemBuilder._get_key(fact_dto))
+            changed = self._set_fact(fact_dto) or changed
+
+        # a fact deleted and saved again is in both lists
+        for fact_key in deleted_keys:
+            if fact_key not in saved_keys:
+                changed = self._delete_fact(fact_key) or changed
+
+        # deletions not kept, such as the cascaded ones, change the count
+        if (len(self._lines[False]) + len(self._lines[True]) +
+                self._offset != fact_dao.count_all()):
+            return None
+
+        return changed
+
+    def refresh(self) -> bool:
+        """ render again the parts of the problem changed since the last
+            refresh; everything is rendered on the first one, after a
+            change of the domain or the deletion of an object, and when
+            the DAOs do not track the changes
+
+        Returns:
+            bool: the problem changed?
+        """
+
+        # read before rendering, a concurrent write is read again
+        now = datetime.datetime.now()
+        version = self.dao_factory.get_domain_version()
+
+        since = None
+        if (self._since is not None and
+                version is not None and version == self._version):
+            since = self._since - PddlProblemBuilder.MARGIN
+
+        object_types = self._object_types
+        changed = self._refresh_objects(since)
+
+        # deleted objects cascade to their facts
+        if (object_types is not None and
+                not object_types.keys() <= self._object_types.keys()):
+            since = None
+
+        facts_changed = None
+        if since is not None:
+            facts_changed = self._update_facts(since)
+
+        if facts_changed is None:
+            self._rebuild_facts()
+            facts_changed = True
+
+        self._since = now
+        self._version = version
+
+        if changed or facts_changed:
+            self._problem = None
+            return True
+
+        return False
+
+    def _get_section(self, is_goal: bool) -> str:
+        """ get the joined lines of the init or the goal
+
+        Args:
+            is_goal (bool): goal section?
+
+        Returns:
+            str: PDDL lines
+        """
+
+        section = self._sections[is_goal]
+
+        if section is None:
+            section = "".join(self._lines[is_goal].values())
+            self._sections[is_goal] = section
+
+        return section
+
+    def build(self, problem_name: str = "problem",
+              domain_name: str = "domain") -> str:
+        """ get the PDDL problem of the DAOs, only the facts changed
+            since the last build are rendered again
+
+        Args:
+            problem_name (str, optional): problem name. Defaults to "problem".
+            domain_name (str, optional): domain name. Defaults to "domain".
+
+        Returns:
+            str: PDDL problem
+        """
+
+        self.refresh()
+
+        if (self._problem is not None and
+                self._names == (problem_name, domain_name)):
+            return self._problem
+
+        self._problem = "".join((
+            "(define (problem " + problem_name + ")\n",
+            "(:domain " + domain_name + ")\n",
+            self._objects,
+            "(:init\n", self._get_section(False), ")\n",
+            "(:goal (and\n", self._get_section(True), "))\n",
+            ")\n"))
+        self._names = (problem_name, domain_name)
+
+        return self._problem
+
+    def write(self, stream: TextIO,
+              problem_name: str = "problem",
+              domain_name: str = "domain") -> None:
+        """ write the PDDL problem
+
+        Args:
+            stream (TextIO): text stream
+            problem_name (str, optional): problem name. Defaults to "problem".
+            domain_name (str, optional): domain name. Defaults to "domain".
+        """
+
+        stream.write(self.build(problem_name, domain_name))
+
+    def write_file(self, path: str,
+                   problem_name: str = "problem",
+                   domain_name: str = "domain") -> None:
+        """ write the PDDL problem into a file
+
+        Args:
+            path (str): file path
+            problem_name (str, optional): problem name. Defaults to "problem".
+            domain_name (str, optional): domain name. Defaults to "domain".
+        """
+
+        with open(path, "w") as stream:
+            self.write(stream, problem_name, domain_name)
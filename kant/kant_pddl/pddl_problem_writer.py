@@ -0,0 +1,156 @@
+
+""" PDDL Problem Writer """
+
+from typing import Iterator, TextIO
+
+from kant.kant_dao import DaoFactoryMethod
+from kant.kant_dao.dao_factory.dao_factories import DaoFactory
+from kant.kant_dto import FactDto
+
+
+class PddlProblemWriter:
+    """ PDDL Problem Writer Class
+        streams the objects, init and goal sections of a problem from
+        the DAOs to a text stream; objects are read one type at a time
+        and facts in batches, so the whole problem is never in memory
+    """
+
+    def __init__(self,
+                 dao_factory: DaoFactory = None,
+                 batch_size: int = 1000) -> None:
+
+        if dao_factory is None:
+            dao_factory = DaoFactoryMethod.get_dao_factory()
+
+        self.dao_factory = dao_factory
+        self.batch_size = batch_size
+
+    @property
+    def dao_factory(self) -> DaoFactory:
+        return self._dao_factory
+
+    @dao_factory.setter
+    def dao_factory(self, dao_factory: DaoFactory) -> None:
+        self._dao_factory = dao_factory
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size: int) -> None:
+        self._batch_size = batch_size
+
+    @staticmethod
+    def _write_facts(stream: TextIO, fact_dtos: Iterator[FactDto],
+                     is_goal: bool) -> None:
+        """ write a fact per line, false bool facts are left out
+            of the init and negated in the goal
+
+        Args:
+            stream (TextIO): text stream
+            fact_dtos (Iterator[FactDto]): FactDto to write
+            is_goal (bool): write goal facts?
+        """
+
+        for fact_dto in fact_dtos:
+
+            if fact_dto.fluent.is_numeric or fact_dto.value:
+                stream.write("\t")
+                fact_dto.write_pddl(stream)
+                stream.write("\n")
+
+            elif is_goal:
+                stream.write("\t(not ")
+                fact_dto.write_pddl(stream)
+                stream.write(")\n")
+
+    def write_objects(self, stream: TextIO) -> None:
+        """ write the objects section, grouped by type
+
+        Args:
+            stream (TextIO): text stream
+        """
+
+        object_dao = self.dao_factory.create_object_dao()
+
+        stream.write("(:objects\n")
+
+        type_names = sorted(type_dto.name for type_dto in
+                            self.dao_factory.create_type_dao().get_all())
+
+        for type_name in type_names:
+            object_dtos = object_dao.get_by_type(type_name,
+                                                include_subtypes=False)
+
+            if object_dtos:
+                stream.write("\t")
+
+                for object_dto in object_dtos:
+                    stream.write(object_dto.name + " ")
+
+                stream.write("- " + type_name + "\n")
+
+        stream.write(")\n")
+
+    def write_init(self, stream: TextIO) -> None:
+        """ write the init section
+
+        Args:
+            stream (TextIO): text stream
+        """
+
+        stream.write("(:init\n")
+        PddlProblemWriter._write_facts(
+            stream,
+            self.dao_factory.create_fact_dao().iter_no_goals(self.batch_size),
+            False)
+        stream.write(")\n")
+
+    def write_goal(self, stream: TextIO) -> None:
+        """ write the goal section
+
+        Args:
+            stream (TextIO): text stream
+        """
+
+        stream.write("(:goal (and\n")
+        PddlProblemWriter._write_facts(
+            stream,
+            self.dao_factory.create_fact_dao().iter_goals(self.batch_size),
+            True)
+        stream.write("))\n")
+
+    def write(self, stream: TextIO,
+              problem_name: str = "problem",
+              domain_name: str = "domain") -> None:
+        """ write a PDDL problem
+
+        Args:
+            stream (TextIO): text stream
+            problem_name (str, optional): problem name. Defaults to "problem".
+            domain_name (str, optional): domain name. Defaults to "domain".
+        """
+
+        stream.write("(define (problem " + problem_name + ")\n")
+        stream.write("(:domain " + domain_name + ")\n")
+
+        self.write_objects(stream)
+        self.write_init(stream)
+        self.write_goal(stream)
+
+        stream.write(")\n")
+
+    def write_file(self, path: str,
+                   problem_name: str = "problem",
+                   domain_name: str = "domain") -> None:
+        """ write a PDDL problem into a file
+
+        Args:
+            path (str): file path
+            problem_name (str, optional): problem name. Defaults to "problem".
+            domain_name (str, optional): domain name. Defaults to "domain".
+        """
+
+        with open(path, "w") as stream:
+            self.write(stream, problem_name, domain_name)
@@ -258,3 +258,18 @@ class TestActionDao(unittest.TestCase):
 \t)
 )""",
                          str(self.action_dto))
+
+    def test_action_dao_get_page(self):
+        for action_name in ("navigation", "charge", "pick"):
+            self.action_dto.name = action_name
+            self.action_dao.save(self.action_dto)
+        self.assertEqual(["charge", "navigation"],
+                         [ele.name for ele in
+                          self.action_dao.get_page(limit=2)])
+        self.assertEqual(["pick"],
+                         [ele.name for ele in
+                          self.action_dao.get_page("navigation", 2)])
+
+    def test_action_dao_count_all(self):
+        self.action_dao.save(self.action_dto)
+        self.assertEqual(1, self.action_dao.count_all())
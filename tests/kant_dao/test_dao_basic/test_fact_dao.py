@@ -1,3 +1,5 @@
+import datetime
+import time
 import unittest
 from kant.kant_dao import DaoFactoryMethod
 from kant.kant_dto import (
@@ -145,6 +147,22 @@ class TestFactDao(unittest.TestCase):
         result = self.fact_dao.save(self.fact_dto)
         result = self.fact_dao.save(self.fact_dto)
         self.assertTrue(result)
+        self.assertEqual(1, len(self.fact_dao.get_all()))
+
+    def test_fact_dao_save_update_numeric_value(self):
+        self.fact_dao.save(self.bat_fact_dto)
+        self.bat_fact_dto.value = 30
+        result = self.fact_dao.save(self.bat_fact_dto)
+        self.assertTrue(result)
+        self.assertEqual(1, len(self.fact_dao.get_numeric_facts()))
+        self.assertEqual("(= (battery_level rb1) 30.00)",
+                         str(self.fact_dao.get_numeric_facts()[0]))
+
+    def test_fact_dao_save_update_false_incorrect_fact_types(self):
+        self.fact_dto.objects.reverse()
+        result = self.fact_dao.save(self.fact_dto)
+        self.assertFalse(result)
+        self.assertEqual(0, len(self.fact_dao.get_all()))
 
     def test_fact_dao_delete_false_fact_not_exist(self):
         result = self.fact_dao.delete(self.fact_dto)
@@ -171,3 +189,130 @@ class TestFactDao(unittest.TestCase):
         self.fact_dto = self.fact_dao.get_by_fluent("battery_level")[0]
         self.fact_dto.fluent.types[0].name = "bot"
         self.assertEqual("rb1 - bot", str(self.fact_dto.objects[0]))
+
+    def test_fact_dao_save_many(self):
+        wrong_fact_dto = FactDto(self.at, [self.wp1, self.rb1])
+        result = self.fact_dao.save_many(
+            [self.fact_dto, wrong_fact_dto, self.bat_fact_dto])
+        self.assertEqual([True, False, True], result)
+        self.assertEqual(1, len(self.fact_dao.get_bool_facts()))
+        self.assertEqual(1, len(self.fact_dao.get_numeric_facts()))
+        self.assertEqual(2, len(self.object_dao.get_all()))
+
+    def test_fact_dao_save_many_update(self):
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto])
+        self.bat_fact_dto.value = 50
+        result = self.fact_dao.save_many([self.bat_fact_dto])
+        self.assertEqual([True], result)
+        self.assertEqual(2, len(self.fact_dao.get_all()))
+        self.assertEqual(
+            50, self.fact_dao.get_by_fluent("battery_level")[0].value)
+
+    def test_fact_dao_delete_many(self):
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto])
+        result = self.fact_dao.delete_many(
+            [self.bat_fact_dto, self.bat_fact_dto, self.fact_dto])
+        self.assertEqual([True, False, True], result)
+        self.assertEqual(0, len(self.fact_dao.get_all()))
+
+    def test_fact_dao_updated_and_deleted_since(self):
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto])
+        time.sleep(0.01)
+        date = datetime.datetime.now() - datetime.timedelta(milliseconds=5)
+        self.bat_fact_dto.value = 50
+        self.fact_dao.save(self.bat_fact_dto)
+        self.fact_dao.delete(self.fact_dto)
+        self.assertEqual(["(= (battery_level rb1) 50.00)"],
+                         [str(ele) for ele in
+                          self.fact_dao.get_updated_since(date)])
+        self.assertEqual([("at", ("rb1", "wp1"), False)],
+                         self.fact_dao.get_deleted_since(date))
+
+    def test_fact_dao_delete_many_objects(self):
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto])
+        result = self.object_dao.delete_many([self.wp1])
+        self.assertEqual([True], result)
+        self.assertEqual(1, len(self.fact_dao.get_all()))
+
+    def test_fact_dao_delete_all_objects(self):
+        no_objects_fact_dto = FactDto(FluentDto("ready"))
+        self.fact_dao.save_many([self.fact_dto, no_objects_fact_dto])
+        result = self.object_dao.delete_all()
+        self.assertTrue(result)
+        self.assertEqual(["(ready)"],
+                         [str(ele) for ele in self.fact_dao.get_all()])
+
+    def test_fact_dao_delete_all_types(self):
+        no_objects_fact_dto = FactDto(FluentDto("ready"))
+        self.fact_dao.save_many(
+            [self.fact_dto, self.bat_fact_dto, no_objects_fact_dto])
+        result = self.type_dao.delete_all()
+        self.assertTrue(result)
+        self.assertEqual(0, len(self.object_dao.get_all()))
+        self.assertEqual(["ready"],
+                         [ele.name for ele in self.fluent_dao.get_all()])
+        self.assertEqual(["(ready)"],
+                         [str(ele) for ele in self.fact_dao.get_all()])
+
+    def test_fact_dao_get_by_object(self):
+        wp2 = ObjectDto(self.wp_type, "wp2")
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto,
+                                 FactDto(self.at, [self.rb1, wp2])])
+        self.assertEqual(3, len(self.fact_dao.get_by_object("rb1")))
+        self.assertEqual(["(at rb1 wp1)"],
+                         [str(ele) for ele in self.fact_dao.get_by_object("wp1")])
+        self.assertEqual(3, len(self.fact_dao.get_by_object("rb1", 0)))
+        self.assertEqual(0, len(self.fact_dao.get_by_object("rb1", 1)))
+        self.assertEqual(0, len(self.fact_dao.get_by_object("wp3")))
+
+    def test_fact_dao_get_by_fluent_and_objects(self):
+        goal_fact_dto = FactDto(self.at, [self.rb1, self.wp1], is_goal=True)
+        self.fact_dao.save_many([self.fact_dto, goal_fact_dto,
+                                 self.bat_fact_dto])
+        fact_dto_list = self.fact_dao.get_by_fluent_and_objects(
+            "at", ["rb1", "wp1"])
+        self.assertEqual(2, len(fact_dto_list))
+        self.assertEqual([False, True],
+                         sorted(ele.is_goal for ele in fact_dto_list))
+        self.assertEqual([], self.fact_dao.get_by_fluent_and_objects(
+            "at", ["wp1", "rb1"]))
+
+    def test_fact_dao_iter_all(self):
+        wp2 = ObjectDto(self.wp_type, "wp2")
+        goal_fact_dto = FactDto(self.at, [self.rb1, wp2], is_goal=True)
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto,
+                                 goal_fact_dto])
+        self.assertEqual(sorted(str(ele) for ele in self.fact_dao.get_all()),
+                         sorted(str(ele) for ele in
+                                self.fact_dao.iter_all(batch_size=1)))
+        self.assertEqual(["(at rb1 wp2)"],
+                         [str(ele) for ele in
+                          self.fact_dao.iter_goals(batch_size=1)])
+        self.assertEqual(2, len(list(self.fact_dao.iter_no_goals(2))))
+
+    def test_fact_dao_iter_by_fluent(self):
+        wp2 = ObjectDto(self.wp_type, "wp2")
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto,
+                                 FactDto(self.at, [self.rb1, wp2])])
+        fact_dto_iter = self.fact_dao.iter_by_fluent("at", batch_size=1)
+        self.assertEqual("at", next(fact_dto_iter).fluent.name)
+        self.assertEqual(1, len(list(fact_dto_iter)))
+        self.assertEqual([], list(self.fact_dao.iter_by_fluent("on")))
+
+    def test_fact_dao_count(self):
+        goal_fact_dto = FactDto(self.at, [self.rb1, self.wp1], is_goal=True)
+        self.fact_dao.save_many([self.fact_dto, goal_fact_dto,
+                                 self.bat_fact_dto])
+        self.assertEqual(3, self.fact_dao.count_all())
+        self.assertEqual(1, self.fact_dao.count_goals())
+        self.assertEqual(2, self.fact_dao.count_by_fluent("at"))
+        self.assertEqual(0, self.fact_dao.count_by_fluent("on"))
+        self.assertEqual(2, self.object_dao.count_all())
+        self.assertEqual(2, self.fluent_dao.count_all())
+
+    def test_fact_dao_exists_by_object(self):
+        self.fact_dao.save(self.bat_fact_dto)
+        self.object_dao.save(self.wp1)
+        self.assertTrue(self.fact_dao.exists_by_object("rb1"))
+        self.assertFalse(self.fact_dao.exists_by_object("wp1"))
+        self.assertFalse(self.fact_dao.exists_by_object("wp3"))
@@ -26,6 +26,20 @@ class TestPredicateDao(unittest.TestCase):
         self.type_dao.delete_all()
         self.fluent_dao.delete_all()
 
+    def test_fluent_dao_domain_version(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+
+        version = dao_factory.get_domain_version()
+        self.fluent_dao.save(self.fluent_dto)
+        self.assertNotEqual(version, dao_factory.get_domain_version())
+
+        version = dao_factory.get_domain_version()
+        self.fluent_dao.save(self.fluent_dto)
+        self.assertEqual(version, dao_factory.get_domain_version())
+
+        self.fluent_dao.delete(self.fluent_dto)
+        self.assertNotEqual(version, dao_factory.get_domain_version())
+
     def test_fluent_dao_save_true(self):
         result = self.fluent_dao._save(self.fluent_dto)
         self.assertTrue(result)
@@ -103,3 +117,13 @@ class TestPredicateDao(unittest.TestCase):
         result = self.fluent_dao.delete_all()
         self.assertTrue(result)
         self.assertEqual(0, len(self.fluent_dao.get_all()))
+
+    def test_fluent_dao_get_page(self):
+        self.fluent_dao.save_many([self.fluent_dto, self.battery_level])
+        self.assertEqual(["battery_level"],
+                         [ele.name for ele in
+                          self.fluent_dao.get_page(limit=1)])
+        fluent_dto_list = self.fluent_dao.get_page("battery_level")
+        self.assertEqual(["robot_at"],
+                         [ele.name for ele in fluent_dto_list])
+        self.assertEqual(2, len(fluent_dto_list[0].types))
@@ -1,3 +1,5 @@
+import datetime
+import time
 import unittest
 from kant.kant_dao import DaoFactoryMethod
 from kant.kant_dao.dao_interface.dao import Dao
@@ -31,6 +33,14 @@ class TestObjectDao(unittest.TestCase):
         result = self.object_dao._save(self.object_dto)
         self.assertFalse(result)
 
+    def test_object_dao_get_updated_since(self):
+        self.object_dao.save(ObjectDto(self.object_dto.type, "rb0"))
+        time.sleep(0.01)
+        date = datetime.datetime.now() - datetime.timedelta(milliseconds=5)
+        self.object_dao.save(self.object_dto)
+        self.assertEqual(["rb1"], [ele.name for ele in
+                                   self.object_dao.get_updated_since(date)])
+
     def test_object_dao_get_none(self):
         self.object_dto = self.object_dao.get("rb1")
         self.assertIsNone(self.object_dto)
@@ -78,3 +88,39 @@ class TestObjectDao(unittest.TestCase):
         result = self.object_dao.delete_all()
         self.assertTrue(result)
         self.assertEqual(0, len(self.object_dao.get_all()))
+
+    def test_object_dao_get_page(self):
+        self.object_dao.save_many(
+            [ObjectDto(self.object_dto.type, name)
+             for name in ("rb3", "rb1", "rb2")])
+        object_dto_list = self.object_dao.get_page(limit=2)
+        self.assertEqual(["rb1", "rb2"],
+                         [ele.name for ele in object_dto_list])
+        self.assertEqual("robot", object_dto_list[0].type.name)
+        self.assertEqual(["rb3"],
+                         [ele.name for ele in
+                          self.object_dao.get_page("rb2", 2)])
+
+    def test_object_dao_get_by_type(self):
+        wp_type = TypeDto("wp")
+        self.object_dao.save_many(
+            [self.object_dto, ObjectDto(self.object_dto.type.father, "box"),
+             ObjectDto(wp_type, "wp1")])
+        self.assertEqual(["box", "rb1"],
+                         [ele.name for ele in
+                          self.object_dao.get_by_type("object")])
+        self.assertEqual(["box"],
+                         [ele.name for ele in
+                          self.object_dao.get_by_type("object", False)])
+        self.assertEqual(["rb1"],
+                         [ele.name for ele in
+                          self.object_dao.get_by_type("robot")])
+        self.assertEqual([], self.object_dao.get_by_type("door"))
+
+    def test_object_dao_type_without_father_keeps_father(self):
+        self.type_dao.save(self.object_dto.type)
+        self.object_dao.save(ObjectDto(TypeDto("robot"), "rb1"))
+        self.assertEqual("object", self.type_dao.get("robot").father.name)
+        self.assertEqual(["rb1"],
+                         [ele.name for ele in
+                          self.object_dao.get_by_type("object")])
@@ -72,3 +72,34 @@ class TestTypeDao(unittest.TestCase):
         result = self.type_dao.delete_all()
         self.assertTrue(result)
         self.assertEqual(0, len(self.type_dao.get_all()))
+
+    def test_type_dao_save_many(self):
+        wp_type = TypeDto("wp")
+        result = self.type_dao.save_many([self.type_dto, wp_type])
+        self.assertEqual([True, True], result)
+        self.assertEqual(3, len(self.type_dao.get_all()))
+
+    def test_type_dao_delete_many(self):
+        wp_type = TypeDto("wp")
+        self.type_dao.save_many([self.type_dto, wp_type])
+        result = self.type_dao.delete_many(
+            [wp_type, TypeDto("door"), self.type_dto.father])
+        self.assertEqual([True, False, True], result)
+        self.assertEqual(0, len(self.type_dao.get_all()))
+
+    def test_type_dao_get_page(self):
+        self.type_dao.save_many(
+            [self.type_dto, TypeDto("wp"), TypeDto("zone")])
+        type_dto_list = self.type_dao.get_page(limit=2)
+        self.assertEqual(["object", "robot"],
+                         [ele.name for ele in type_dto_list])
+        self.assertEqual("object", type_dto_list[1].father.name)
+        self.assertEqual(["wp", "zone"],
+                         [ele.name for ele in
+                          self.type_dao.get_page("robot", 2)])
+        self.assertEqual([], self.type_dao.get_page("zone"))
+
+    def test_type_dao_count_all(self):
+        self.assertEqual(0, self.type_dao.count_all())
+        self.type_dao.save_many([self.type_dto, TypeDto("wp")])
+        self.assertEqual(3, self.type_dao.count_all())
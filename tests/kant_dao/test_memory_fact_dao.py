@@ -0,0 +1,17 @@
+
+from .test_dao_basic.test_fact_dao import TestFactDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+
+
+class TestMemoryFactDao(TestFactDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MEMORY)
+
+
+del(TestFactDao)
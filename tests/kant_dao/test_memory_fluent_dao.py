@@ -0,0 +1,17 @@
+
+from .test_dao_basic.test_fluent_dao import TestPredicateDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+
+
+class TestMemoryFluentDao(TestPredicateDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MEMORY)
+
+
+del(TestPredicateDao)
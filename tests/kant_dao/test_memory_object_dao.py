@@ -0,0 +1,31 @@
+
+from .test_dao_basic.test_object_dao import TestObjectDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+from kant.kant_dto import TypeDto, ObjectDto
+
+
+class TestMemoryObjectDao(TestObjectDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MEMORY)
+
+    def test_object_dao_sorted_names(self):
+        wp_type = TypeDto("wp")
+        self.object_dao.save_many([ObjectDto(wp_type, "wp2"),
+                                   self.object_dto,
+                                   ObjectDto(wp_type, "wp1")])
+        self.object_dao.save(self.object_dto)
+        self.assertEqual(["rb1", "wp1", "wp2"],
+                         self.object_dao.memory_store.object_names)
+
+        self.type_dao.delete(wp_type)
+        self.assertEqual(["rb1"], self.object_dao.memory_store.object_names)
+        self.assertEqual([], self.object_dao.get_page("rb1"))
+
+
+del(TestObjectDao)
@@ -0,0 +1,17 @@
+
+from .test_dao_basic.test_type_dao import TestTypeDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+
+
+class TestMemoryTypeDao(TestTypeDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MEMORY)
+
+
+del(TestTypeDao)
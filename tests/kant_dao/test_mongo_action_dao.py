@@ -4,13 +4,34 @@ from kant.kant_dao.dao_factory import (
     DaoFactoryMethod,
     DaoFamilies
 )
+from kant.kant_dao.mongo_dao import NumericStorage
+from kant.kant_dao.mongo_dao.mongo_models import ActionModel
 
 
 class TestMongoActionDao(TestActionDao):
 
-    DaoFactoryMethod.clear_dao_factory()
-    DaoFactoryMethod(DaoFamilies.MONGO,
-                     uri="mongodb://localhost:27017/kant_tests")
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MONGO,
+                         uri="mongodb://localhost:27017/kant_tests")
+
+    def test_action_dao_migrate_numeric_values(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+        try:
+            dao_factory.set_numeric_storage(NumericStorage.DOUBLE)
+            self.action_dto.effects[2].value = 10.125
+            self.action_dao.save(self.action_dto)
+            self.assertEqual(
+                10.125, self.action_dao.get("navigation").effects[2].value)
+        finally:
+            dao_factory.set_numeric_storage(NumericStorage.DECIMAL)
+
+        dao_factory.migrate_numeric_values()
+        action_doc = ActionModel._get_collection().find_one()
+        self.assertEqual(30.0, action_doc["conditions"][1]["numeric_value"])
+        self.assertEqual(10.13, action_doc["effects"][2]["numeric_value"])
+        self.assertNotIn("numeric_value", action_doc["effects"][0])
 
 
 del(TestActionDao)
@@ -1,16 +1,275 @@
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from mongoengine.connection import get_db
 from .test_dao_basic.test_fact_dao import TestFactDao
 from kant.kant_dao.dao_factory import (
     DaoFactoryMethod,
     DaoFamilies
 )
+from kant.kant_dao.dao_factory.dao_factories import MongoDaoFactory
+from bson import Decimal128
+from kant.kant_dao.mongo_dao import MongoDao, MongoIdentityMap, NumericStorage
+from kant.kant_dao.mongo_dao.mongo_connection import connect, disconnect
+from kant.kant_dao.mongo_dao.mongo_models import (
+    FactModel,
+    FluentModel,
+    ObjectModel,
+    ensure_indexes
+)
+from kant.kant_dto import TypeDto, ObjectDto, FluentDto, FactDto
 
 
 class TestMongoFactDao(TestFactDao):
 
-    DaoFactoryMethod.clear_dao_factory()
-    DaoFactoryMethod(DaoFamilies.MONGO,
-                     uri="mongodb://localhost:27017/kant_tests")
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MONGO,
+                         uri="mongodb://localhost:27017/kant_tests")
+
+    def test_fact_dao_shared(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+        self.assertIs(self.fact_dao, dao_factory.create_fact_dao())
+        dao_factory.set_uri(dao_factory.get_uri())
+        self.assertIsNot(self.fact_dao, dao_factory.create_fact_dao())
+
+    def test_fact_dao_alias_per_factory(self):
+        dao_factory = MongoDaoFactory(
+            uri="mongodb://localhost:27017/kant_tests_alias",
+            alias="kant_tests_alias")
+        fact_dao = dao_factory.create_fact_dao()
+        try:
+            with ThreadPoolExecutor(2) as executor:
+                list(executor.map(lambda ele: ele[0].save(ele[1]),
+                                  [(self.fact_dao, self.fact_dto),
+                                   (fact_dao, self.bat_fact_dto)]))
+            self.assertEqual(["at"], [ele.fluent.name
+                                      for ele in self.fact_dao.get_all()])
+            self.assertEqual(["battery_level"], [ele.fluent.name
+                                                 for ele in fact_dao.get_all()])
+        finally:
+            get_db("kant_tests_alias").client.drop_database("kant_tests_alias")
+            disconnect("kant_tests_alias")
+
+    def test_fact_dao_lazy_connection(self):
+        dao_factory = MongoDaoFactory(
+            uri="mongodb://localhost:27017/kant_tests",
+            alias="kant_tests_lazy")
+        try:
+            self.assertRaises(Exception, get_db, "kant_tests_lazy")
+            fact_dao = dao_factory.create_fact_dao()
+            self.assertFalse(connect("mongodb://localhost:27017/kant_tests",
+                                     "kant_tests_lazy"))
+            self.assertIs(get_db("kant_tests_lazy").client,
+                          get_db().client)
+            self.assertEqual(0, fact_dao.count_all())
+        finally:
+            disconnect("kant_tests_lazy")
+
+    def test_fact_dao_indexes_on_first_query(self):
+        dao_factory = MongoDaoFactory(
+            uri="mongodb://localhost:27017/kant_tests",
+            alias="kant_tests_indexes")
+        try:
+            with mock.patch("kant.kant_dao.dao_factory.dao_factories."
+                            "mongo_dao_factory.ensure_indexes") as indexes:
+                fact_dao = dao_factory.create_fact_dao()
+                dao_factory.create_fluent_dao()
+                indexes.assert_not_called()
+                self.assertEqual(0, fact_dao.count_all())
+                self.assertEqual(0, fact_dao.count_all())
+                indexes.assert_called_once_with()
+        finally:
+            disconnect("kant_tests_indexes")
+
+    def test_fact_dao_legacy_documents(self):
+        uri = "mongodb://localhost:27017/kant_tests_legacy"
+        connect(uri, "kant_tests_legacy")
+        legacy_db = get_db("kant_tests_legacy")
+        try:
+            legacy_db["type"].insert_one({"_id": "robot"})
+            legacy_db["object"].insert_many(
+                [{"_id": "rb1", "type": "robot"},
+                 {"_id": "rb2", "type": "robot"}])
+            legacy_db["fluent"].insert_one(
+                {"_id": "robot_at", "types": ["robot"]})
+            legacy_db["fact"].insert_many(
+                [{"fluent": "robot_at", "objects": ["rb1"],
+                  "bool_value": True, "is_goal": False},
+                 {"fluent": "robot_at", "objects": ["rb2"],
+                  "bool_value": True, "is_goal": False}])
+
+            fact_dao = MongoDaoFactory(
+                uri=uri, alias="kant_tests_legacy").create_fact_dao()
+            self.assertEqual(2, len(fact_dao.get_bool_facts()))
+            self.assertEqual(
+                ["rb2"], [ele.objects[0].name
+                          for ele in fact_dao.get_by_fluent_and_objects(
+                              "robot_at", ["rb2"])])
+        finally:
+            legacy_db.client.drop_database("kant_tests_legacy")
+            disconnect("kant_tests_legacy")
+
+    def test_fact_dao_natural_key_index(self):
+        index_info = FactModel._get_collection().index_information()
+        self.assertTrue(
+            index_info["fluent_1_arguments_key_1_is_goal_1"]["unique"])
+        self.assertIn("objects_1", index_info)
+        self.assertIn("is_goal_1_is_numeric_1", index_info)
+
+    def test_fact_dao_type_from_other_writer(self):
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto])
+        self.assertEqual(2, len(self.fact_dao.get_all()))
+
+        database = FactModel._get_db()
+        database["type"].insert_one(
+            {"_id": "drone", "father": "robot",
+             "ancestors": ["drone", "robot", "object"]})
+        database["object"].insert_one(
+            {"_id": "dr1", "type": "drone",
+             "ancestors": ["drone", "robot", "object"]})
+        database["fact"].delete_many({"fluent": "battery_level"})
+        database["fact"].insert_one(
+            {"fluent": "battery_level", "objects": ["dr1"],
+             "arguments_key": "dr1", "is_numeric": True,
+             "numeric_value": Decimal128("10.00"), "is_goal": False})
+
+        self.assertEqual(2, self.fact_dao.count_all())
+        self.assertEqual(2, len(self.fact_dao.get_all()))
+
+    def test_fact_dao_unchanged_cascade_not_written(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+        self.assertEqual([True, True], self.fact_dao.save_many(
+            [self.fact_dto, self.bat_fact_dto]))
+        object_date = ObjectModel.objects(name="rb1")[0].update_date
+        fluent_date = FluentModel.objects(name="at")[0].update_date
+        version = dao_factory.get_domain_version()
+
+        time.sleep(0.01)
+        self.bat_fact_dto.value = 50
+        self.assertEqual([True, True], self.fact_dao.save_many(
+            [self.fact_dto, self.bat_fact_dto]))
+        self.assertEqual(object_date,
+                         ObjectModel.objects(name="rb1")[0].update_date)
+        self.assertEqual(fluent_date,
+                         FluentModel.objects(name="at")[0].update_date)
+        self.assertEqual(version, dao_factory.get_domain_version())
+
+    def test_fact_dao_known_cascade_not_sent(self):
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto])
+        self.bat_fact_dto.value = 50
+
+        with mock.patch.object(MongoDao, "_bulk_upsert",
+                               side_effect=MongoDao._bulk_upsert) as bulk_upsert:
+            self.assertEqual([True, True], self.fact_dao.save_many(
+                [self.fact_dto, self.bat_fact_dto]))
+
+        self.assertEqual([FactModel], [ele.args[0] for ele in
+                                       bulk_upsert.call_args_list
+                                       if ele.args[1]])
+        self.assertEqual(50, self.fact_dao.get_numeric_facts()[0].value)
+
+    def test_fact_dao_is_numeric_updated(self):
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto])
+        self.fluent_dao.save(
+            FluentDto("at", self.at.types, is_numeric=True))
+        self.assertEqual(2, FactModel.objects(is_numeric=True).count())
+        self.fluent_dao.save(self.at)
+        self.assertEqual(1, len(self.fact_dao.get_bool_facts()))
+        self.assertEqual(1, len(self.fact_dao.get_numeric_facts()))
+
+    def test_fact_dao_is_numeric_backfilled(self):
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto])
+        FactModel._get_collection().update_many(
+            {}, {"$unset": {"is_numeric": "", "arguments_key": ""}})
+        self.assertEqual(2, FactModel.objects(is_numeric=None).count())
+        ensure_indexes()
+        self.assertEqual(0, FactModel.objects(arguments_key=None).count())
+        self.assertEqual(1, len(self.fact_dao.get_bool_facts()))
+        self.assertEqual(1, len(self.fact_dao.get_numeric_facts()))
+
+    def test_fact_dao_identity_map_per_query(self):
+        wp2 = ObjectDto(self.wp_type, "wp2")
+        self.fact_dao.save_many(
+            [self.fact_dto, FactDto(self.at, [self.rb1, wp2])])
+        fact_dto_list = self.fact_dao.get_all()
+        self.assertIs(fact_dto_list[0].fluent, fact_dto_list[1].fluent)
+        self.assertIs(fact_dto_list[0].objects[0],
+                      fact_dto_list[1].objects[0])
+        self.assertIsNot(fact_dto_list[0].fluent,
+                         self.fact_dao.get_all()[0].fluent)
+
+    def test_fact_dao_identity_map_per_session(self):
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto])
+        self.fact_dao.identity_map = MongoIdentityMap()
+        rb1 = self.fact_dao.get_by_fluent("at")[0].objects[0]
+        self.assertIs(rb1,
+                      self.fact_dao.get_by_fluent("battery_level")[0].objects[0])
+        self.fact_dao.identity_map = None
+
+    def test_fact_dao_type_index_invalidated(self):
+        self.fact_dao.save(self.fact_dto)
+        self.assertEqual(1, len(self.fact_dao.get_all()))
+        self.type_dao.save(TypeDto("robot", father=self.wp_type))
+        self.assertEqual(0, len(self.fact_dao.get_all()))
+
+    def test_fact_dao_iter_identity_map(self):
+        wp2 = ObjectDto(self.wp_type, "wp2")
+        self.fact_dao.save_many(
+            [self.fact_dto, FactDto(self.at, [self.rb1, wp2])])
+        fact_dto_list = list(self.fact_dao.iter_all(batch_size=1))
+        self.assertIs(fact_dto_list[0].fluent, fact_dto_list[1].fluent)
+
+    def test_fact_dao_double_numeric_storage(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+        self.fact_dao.save(self.bat_fact_dto)
+        try:
+            dao_factory.set_numeric_storage(NumericStorage.DOUBLE)
+            self.bat_fact_dto.value = 12.345
+            self.fact_dao.save(self.bat_fact_dto)
+            fact_doc = FactModel._get_collection().find_one()
+            self.assertEqual(12.345, fact_doc["numeric_value"])
+            value = self.fact_dao.get_numeric_facts()[0].value
+            self.assertIsInstance(value, float)
+            self.assertEqual(12.345, value)
+
+            dao_factory.set_numeric_storage(NumericStorage.DECIMAL128)
+            dao_factory.migrate_numeric_values()
+            fact_doc = FactModel._get_collection().find_one()
+            self.assertEqual(Decimal128("12.345"), fact_doc["numeric_value"])
+            self.assertEqual(12.345,
+                             self.fact_dao.get_numeric_facts()[0].value)
+        finally:
+            dao_factory.set_numeric_storage(NumericStorage.DECIMAL)
+
+        dao_factory.migrate_numeric_values()
+        fact_doc = FactModel._get_collection().find_one()
+        self.assertEqual(12.35, fact_doc["numeric_value"])
+
+    def test_fact_dao_numeric_storage_per_alias(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+        try:
+            dao_factory.set_numeric_storage(NumericStorage.DOUBLE)
+            other_factory = MongoDaoFactory(
+                uri="mongodb://localhost:27017/kant_tests_alias",
+                numeric_storage=NumericStorage.DECIMAL128,
+                alias="kant_tests_alias")
+            MongoDaoFactory(uri=dao_factory.get_uri())
+
+            self.assertEqual(NumericStorage.DOUBLE,
+                             dao_factory.get_numeric_storage())
+            self.assertEqual(NumericStorage.DECIMAL128,
+                             other_factory.get_numeric_storage())
+
+            self.bat_fact_dto.value = 12.345
+            self.fact_dao.save(self.bat_fact_dto)
+            fact_doc = FactModel._get_collection().find_one()
+            self.assertEqual(12.345, fact_doc["numeric_value"])
+        finally:
+            dao_factory.set_numeric_storage(NumericStorage.DECIMAL)
+            other_factory.set_numeric_storage(NumericStorage.DECIMAL)
 
 
 del(TestFactDao)
@@ -6,11 +6,13 @@ from kant.kant_dao.dao_factory import (
 )
 
 
-class TestMongoFluentteDao(TestPredicateDao):
+class TestMongoFluentDao(TestPredicateDao):
 
-    DaoFactoryMethod.clear_dao_factory()
-    DaoFactoryMethod(DaoFamilies.MONGO,
-                     uri="mongodb://localhost:27017/kant_tests")
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MONGO,
+                         uri="mongodb://localhost:27017/kant_tests")
 
 
 del(TestPredicateDao)
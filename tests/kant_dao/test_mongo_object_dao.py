@@ -4,13 +4,29 @@ from kant.kant_dao.dao_factory import (
     DaoFactoryMethod,
     DaoFamilies
 )
+from kant.kant_dao.mongo_dao.mongo_models import ObjectModel
+from kant.kant_dto import TypeDto
 
 
 class TestMongoObjectDao(TestObjectDao):
 
-    DaoFactoryMethod.clear_dao_factory()
-    DaoFactoryMethod(DaoFamilies.MONGO,
-                     uri="mongodb://localhost:27017/kant_tests")
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MONGO,
+                         uri="mongodb://localhost:27017/kant_tests")
+
+    def test_object_dao_ancestors_updated(self):
+        self.object_dao.save(self.object_dto)
+        self.assertEqual(["robot", "object"],
+                         ObjectModel.objects(name="rb1")[0].ancestors)
+        self.type_dao.save(TypeDto("robot", father=TypeDto("agent")))
+        self.assertEqual(["robot", "agent"],
+                         ObjectModel.objects(name="rb1")[0].ancestors)
+        self.assertEqual(["rb1"],
+                         [ele.name for ele in
+                          self.object_dao.get_by_type("agent")])
+        self.assertEqual([], self.object_dao.get_by_type("object"))
 
 
 del(TestObjectDao)
@@ -0,0 +1,18 @@
+
+from .test_dao_basic.test_action_dao import TestActionDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+
+
+class TestMongoRawActionDao(TestActionDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MONGO_RAW,
+                         uri="mongodb://localhost:27017/kant_tests")
+
+
+del(TestActionDao)
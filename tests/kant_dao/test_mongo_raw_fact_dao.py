@@ -0,0 +1,32 @@
+
+from .test_dao_basic.test_fact_dao import TestFactDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+from kant.kant_dao.mongo_raw_dao import MongoRawFactDao
+
+
+class TestMongoRawFactDao(TestFactDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MONGO_RAW,
+                         uri="mongodb://localhost:27017/kant_tests")
+
+    def test_fact_dao_shared(self):
+        self.assertIsInstance(self.fact_dao, MongoRawFactDao)
+        self.assertIs(self.fact_dao,
+                      DaoFactoryMethod.get_dao_factory().create_fact_dao())
+
+    def test_fact_dao_aggregation_type_ancestors(self):
+        self.fact_dao.save_many([self.fact_dto, self.bat_fact_dto])
+        fact_dto_list = self.fact_dao.get_by_fluent("battery_level")
+        self.assertEqual("object",
+                         fact_dto_list[0].objects[0].type.father.name)
+        self.assertIs(fact_dto_list[0].objects[0].type,
+                      fact_dto_list[0].fluent.types[0])
+
+
+del(TestFactDao)
@@ -0,0 +1,18 @@
+
+from .test_dao_basic.test_fluent_dao import TestPredicateDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+
+
+class TestMongoRawFluentDao(TestPredicateDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MONGO_RAW,
+                         uri="mongodb://localhost:27017/kant_tests")
+
+
+del(TestPredicateDao)
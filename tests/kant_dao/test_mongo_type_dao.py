@@ -1,16 +1,59 @@
-
+import time
 from .test_dao_basic.test_type_dao import TestTypeDao
 from kant.kant_dao.dao_factory import (
     DaoFactoryMethod,
     DaoFamilies
 )
+from kant.kant_dao.mongo_dao import MongoObjectDao
+from kant.kant_dao.mongo_dao.mongo_models import ObjectModel, TypeModel
+from kant.kant_dto import TypeDto, ObjectDto
 
 
 class TestMongoTypeDao(TestTypeDao):
 
-    DaoFactoryMethod.clear_dao_factory()
-    DaoFactoryMethod(DaoFamilies.MONGO,
-                     uri="mongodb://localhost:27017/kant_tests")
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MONGO,
+                         uri="mongodb://localhost:27017/kant_tests")
+
+    def test_type_dao_unchanged_not_written(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+        self.type_dao.save(self.type_dto)
+        update_date = TypeModel.objects(name="robot")[0].update_date
+        version = dao_factory.get_domain_version()
+
+        time.sleep(0.01)
+        self.type_dao.save(self.type_dto)
+        self.assertEqual(update_date,
+                         TypeModel.objects(name="robot")[0].update_date)
+        self.assertEqual(version, dao_factory.get_domain_version())
+
+    def test_type_dao_descendants_updated(self):
+        drone_type = TypeDto("drone", father=self.type_dto)
+        object_dao = DaoFactoryMethod.get_dao_factory().create_object_dao()
+        self.assertIsInstance(object_dao, MongoObjectDao)
+        object_dao.save(ObjectDto(drone_type, "dr1"))
+
+        self.type_dao.save(TypeDto("robot", father=TypeDto("agent")))
+        self.assertEqual(["drone", "robot", "agent"],
+                         TypeModel.objects(name="drone")[0].ancestors)
+        self.assertEqual(["drone", "robot", "agent"],
+                         ObjectModel.objects(name="dr1")[0].ancestors)
+        self.assertEqual(["dr1"], [ele.name for ele in
+                                   object_dao.get_by_type("agent")])
+
+    def test_type_dao_ancestors_migrated(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+        object_dao = dao_factory.create_object_dao()
+        object_dao.save(ObjectDto(self.type_dto, "rb1"))
+        ObjectModel._get_collection().update_many(
+            {}, {"$unset": {"ancestors": ""}})
+        self.assertEqual([], object_dao.get_by_type("robot"))
+
+        dao_factory.migrate_documents()
+        self.assertEqual(["rb1"], [ele.name for ele in
+                                   object_dao.get_by_type("robot")])
 
 
 del(TestTypeDao)
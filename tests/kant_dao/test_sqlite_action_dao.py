@@ -0,0 +1,17 @@
+
+from .test_dao_basic.test_action_dao import TestActionDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+
+
+class TestSqliteActionDao(TestActionDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.SQLITE, uri=":memory:")
+
+
+del(TestActionDao)
@@ -0,0 +1,25 @@
+
+import datetime
+from .test_dao_basic.test_fact_dao import TestFactDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+
+
+class TestSqliteFactDao(TestFactDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.SQLITE, uri=":memory:")
+
+    def test_fact_dao_deleted_since_same_millisecond(self):
+        self.fact_dao.save(self.fact_dto)
+        date = datetime.datetime.now()
+        self.fact_dao.delete(self.fact_dto)
+        self.assertEqual([("at", ("rb1", "wp1"), False)],
+                         self.fact_dao.get_deleted_since(date))
+
+
+del(TestFactDao)
@@ -0,0 +1,17 @@
+
+from .test_dao_basic.test_object_dao import TestObjectDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+
+
+class TestSqliteObjectDao(TestObjectDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.SQLITE, uri=":memory:")
+
+
+del(TestObjectDao)
@@ -0,0 +1,17 @@
+
+from .test_dao_basic.test_type_dao import TestTypeDao
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+
+
+class TestSqliteTypeDao(TestTypeDao):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.SQLITE, uri=":memory:")
+
+
+del(TestTypeDao)
@@ -1,4 +1,5 @@
 from calendar import c
+import io
 import unittest
 from kant.kant_dto.type_dto import TypeDto
 from kant.kant_dto.fluent_dto import FluentDto
@@ -145,6 +146,13 @@ class TestActionDto(unittest.TestCase):
 )""",
                          str(self.action_dto))
 
+    def test_action_dto_write_pddl(self):
+        stream = io.StringIO()
+        stream.write("; action\n")
+        self.action_dto.write_pddl(stream)
+        self.assertEqual("; action\n" + str(self.action_dto),
+                         stream.getvalue())
+
     def test_action_dto_get_name(self):
         self.assertEqual("navigation", self.action_dto.name)
 
@@ -1,4 +1,6 @@
+import io
 import unittest
+from kant.kant_dto.dto import Dto
 from kant.kant_dto.type_dto import TypeDto
 from kant.kant_dto.fluent_dto import FluentDto
 from kant.kant_dto.fact_dto import FactDto
@@ -37,6 +39,20 @@ class TestFactDto(unittest.TestCase):
         self.assertEqual("(robot_at)",
                          str(self.fact_dto))
 
+    def test_fact_dto_write_pddl(self):
+        stream = io.StringIO()
+        self.bat_fact_dto.write_pddl(stream)
+        self.assertEqual(str(self.bat_fact_dto), stream.getvalue())
+
+    def test_fact_dto_to_pddl_list(self):
+        self.assertEqual("\t(robot_at rb1 wp1)\n"
+                         "\t(= (battery_level rb1) 100)\n",
+                         Dto.to_pddl_list(
+                             [self.fact_dto, self.bat_fact_dto], "\t"))
+
+    def test_fact_dto_to_pddl_list_empty(self):
+        self.assertEqual("", Dto.to_pddl_list([]))
+
     def test_fact_dto_get_fluent(self):
         self.assertEqual("(robot_at ?r0 - robot ?w1 - wp)",
                          str(self.fact_dto.fluent))
@@ -0,0 +1,118 @@
+import io
+import os
+import tempfile
+import unittest
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+from kant.kant_dto import (
+    TypeDto,
+    ObjectDto,
+    FluentDto,
+    ConditionEffectDto,
+    ActionDto
+)
+from kant.kant_pddl import PddlDomainBuilder
+
+
+class TestPddlDomainBuilder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MEMORY)
+
+    def setUp(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+
+        self.type_dao = dao_factory.create_type_dao()
+        self.fluent_dao = dao_factory.create_fluent_dao()
+        self.action_dao = dao_factory.create_action_dao()
+
+        robot_type = TypeDto("robot", father=TypeDto("object"))
+        wp_type = TypeDto("wp")
+
+        self.robot_at = FluentDto("robot_at", [robot_type, wp_type])
+        self.battery_level = FluentDto(
+            "battery_level", [robot_type], is_numeric=True)
+
+        r = ObjectDto(robot_type, "r")
+        s = ObjectDto(wp_type, "s")
+        d = ObjectDto(wp_type, "d")
+
+        self.action_dto = ActionDto(
+            "navigation", [r, s, d],
+            [ConditionEffectDto(self.robot_at, [r, s],
+                                time=ConditionEffectDto.AT_START)],
+            [ConditionEffectDto(self.robot_at, [r, s],
+                                time=ConditionEffectDto.AT_START,
+                                value=False),
+             ConditionEffectDto(self.robot_at, [r, d],
+                                time=ConditionEffectDto.AT_END)])
+
+        self.fluent_dao.save(self.battery_level)
+        self.action_dao.save(self.action_dto)
+
+        self.builder = PddlDomainBuilder()
+
+    def tearDown(self):
+        self.action_dao.delete_all()
+        self.fluent_dao.delete_all()
+        self.type_dao.delete_all()
+
+    def test_pddl_domain_builder_build(self):
+        domain = self.builder.build("test_domain")
+
+        self.assertTrue(domain.startswith(
+            "(define (domain test_domain)\n"
+            "(:requirements :typing :durative-actions :numeric-fluents)\n"
+            "(:types\n"
+            "\tobject\n"
+            "\trobot - object\n"
+            "\twp\n"
+            ")\n"
+            "(:predicates\n"
+            "\t(robot_at ?r0 - robot ?w1 - wp)\n"
+            ")\n"
+            "(:functions\n"
+            "\t(battery_level ?r0 - robot)\n"
+            ")\n"))
+        self.assertIn(self.action_dto.to_pddl(), domain)
+        self.assertTrue(domain.endswith(")\n)\n"))
+
+    def test_pddl_domain_builder_cached(self):
+        domain = self.builder.build()
+        self.assertIs(domain, self.builder.build())
+        self.assertIsNot(domain, self.builder.build("other_domain"))
+
+    def test_pddl_domain_builder_fact_write_cached(self):
+        domain = self.builder.build()
+        self.fluent_dao.save(self.robot_at)
+        self.assertIs(domain, self.builder.build())
+
+    def test_pddl_domain_builder_fluent_write_invalidates(self):
+        domain = self.builder.build()
+        self.fluent_dao.save(FluentDto("is_charged", [TypeDto("robot")]))
+        new_domain = self.builder.build()
+        self.assertIsNot(domain, new_domain)
+        self.assertIn("\t(is_charged ?r0 - robot)\n", new_domain)
+
+    def test_pddl_domain_builder_action_write_invalidates(self):
+        domain = self.builder.build()
+        self.action_dao.delete(self.action_dto)
+        new_domain = self.builder.build()
+        self.assertNotIn("navigation", new_domain)
+        self.assertNotEqual(domain, new_domain)
+
+    def test_pddl_domain_builder_write_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "domain.pddl")
+            self.builder.write_file(path)
+
+            with open(path) as domain_file:
+                self.assertEqual(self.builder.build(), domain_file.read())
+
+        stream = io.StringIO()
+        self.builder.write(stream)
+        self.assertEqual(self.builder.build(), stream.getvalue())
@@ -0,0 +1,189 @@
+import io
+import os
+import tempfile
+import unittest
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+from kant.kant_dto import TypeDto
+from kant.kant_pddl import (
+    PddlDomainBuilder,
+    PddlLoader,
+    PddlParser,
+    PddlProblemWriter
+)
+
+DOMAIN = """; test domain
+(define (domain test_domain)
+(:requirements :typing :durative-actions :numeric-fluents)
+(:types
+    robot - vehicle
+    wp vehicle
+)
+(:predicates
+    (robot_at ?r - robot ?w - wp) ; robot position
+    (charged)
+)
+(:functions
+    (battery_level ?r - robot) - number
+)
+(:durative-action navigation
+    :parameters (?r - robot ?s ?d - wp)
+    :duration (= ?duration 5)
+    :condition (and
+        (at start (robot_at ?r ?s))
+        (over all (> (battery_level ?r) 30))
+    )
+    :effect (and
+        (at start (not (robot_at ?r ?s)))
+        (at end (robot_at ?r ?d))
+        (at end (decrease (battery_level ?r) 10))
+    )
+)
+(:action charge
+    :parameters (?r - robot)
+    :precondition (not (charged))
+    :effect (charged)
+)
+)
+"""
+
+PROBLEM = """(define (problem test_problem)
+(:domain test_domain)
+(:objects
+    rb1 - robot
+    wp1 wp2 - wp
+)
+(:init
+    (robot_at rb1 wp1)
+    (= (battery_level rb1) 100)
+)
+(:goal (and
+    (robot_at rb1 wp2)
+    (not (robot_at rb1 wp1))
+))
+)
+"""
+
+
+class TestPddlLoader(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MEMORY)
+
+    def setUp(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+
+        self.type_dao = dao_factory.create_type_dao()
+        self.object_dao = dao_factory.create_object_dao()
+        self.fluent_dao = dao_factory.create_fluent_dao()
+        self.fact_dao = dao_factory.create_fact_dao()
+        self.action_dao = dao_factory.create_action_dao()
+
+        self.loader = PddlLoader(batch_size=1)
+
+    def tearDown(self):
+        self.action_dao.delete_all()
+        self.fact_dao.delete_all()
+        self.object_dao.delete_all()
+        self.fluent_dao.delete_all()
+        self.type_dao.delete_all()
+
+    def test_pddl_parser_shared_dtos(self):
+        parser = PddlParser(chunk_size=16)
+        dtos = list(parser.parse_domain(io.StringIO(DOMAIN)))
+
+        self.assertEqual(["vehicle", "robot", "wp"],
+                         [ele.name for ele in dtos[:3]])
+        self.assertIs(dtos[0], dtos[1].father)
+
+        navigation = dtos[-2]
+        self.assertIs(dtos[3], navigation.conditions[0].fluent)
+        self.assertIs(dtos[1], navigation.parameters[0].type)
+
+    def test_pddl_loader_domain(self):
+        self.assertTrue(self.loader.load_domain(io.StringIO(DOMAIN)))
+
+        self.assertEqual(3, len(self.type_dao.get_all()))
+        self.assertEqual("vehicle", self.type_dao.get("robot").father.name)
+        self.assertTrue(self.fluent_dao.get("battery_level").is_numeric)
+        self.assertEqual(2, len(self.action_dao.get_all()))
+
+        navigation = self.action_dao.get("navigation")
+        self.assertEqual(5, navigation.duration)
+        self.assertEqual(
+            "(:durative-action navigation\n"
+            "\t:parameters ( ?r - robot ?s - wp ?d - wp)\n"
+            "\t:duration (= ?duration 5)\n"
+            "\t:condition (and\n"
+            "\t\t(at start (robot_at ?r ?s))\n"
+            "\t\t(over all (> (battery_level ?r) 30.00))\n"
+            "\t)\n"
+            "\t:effect (and\n"
+            "\t\t(at start (not (robot_at ?r ?s)))\n"
+            "\t\t(at end (robot_at ?r ?d))\n"
+            "\t\t(at end (decrease (battery_level ?r) 10.00))\n"
+            "\t)\n"
+            ")", str(navigation))
+
+        charge = self.action_dao.get("charge")
+        self.assertFalse(charge.durative)
+        self.assertFalse(charge.conditions[0].value)
+
+    def test_pddl_loader_problem(self):
+        self.loader.load_domain(io.StringIO(DOMAIN))
+
+        # a new loader starts with the stored knowledge
+        loader = PddlLoader(batch_size=1)
+        self.assertTrue(loader.load_problem(io.StringIO(PROBLEM)))
+
+        self.assertEqual(3, len(self.object_dao.get_all()))
+        self.assertEqual("vehicle", self.type_dao.get("robot").father.name)
+        self.assertEqual(2, len(self.fact_dao.get_no_goals()))
+        self.assertEqual(2, len(self.fact_dao.get_goals()))
+
+        stream = io.StringIO()
+        PddlProblemWriter().write_goal(stream)
+        self.assertEqual(["\t(not (robot_at rb1 wp1))",
+                          "\t(robot_at rb1 wp2)"],
+                         sorted(stream.getvalue().splitlines()[1:-1]))
+
+    def test_pddl_loader_writes_between_loads(self):
+        self.loader.load_domain(io.StringIO(DOMAIN))
+        self.type_dao.save(TypeDto("robot", father=TypeDto("agent")))
+        self.fluent_dao.delete(self.fluent_dao.get("battery_level"))
+
+        with self.assertRaises(ValueError):
+            self.loader.load_problem(io.StringIO(PROBLEM))
+
+        self.assertEqual("agent", self.type_dao.get("robot").father.name)
+        self.assertIsNone(self.fluent_dao.get("battery_level"))
+
+    def test_pddl_loader_round_trip(self):
+        self.loader.load_domain(io.StringIO(DOMAIN))
+        self.loader.load_problem(io.StringIO(PROBLEM))
+        domain = PddlDomainBuilder().build()
+
+        with tempfile.TemporaryDirectory() as directory:
+            domain_path = os.path.join(directory, "domain.pddl")
+            problem_path = os.path.join(directory, "problem.pddl")
+
+            PddlDomainBuilder().write_file(domain_path)
+            PddlProblemWriter().write_file(problem_path)
+
+            self.tearDown()
+
+            loader = PddlLoader()
+            self.assertTrue(loader.load_domain_file(domain_path))
+            self.assertTrue(loader.load_problem_file(problem_path))
+
+        self.assertEqual(domain, PddlDomainBuilder().build())
+        self.assertEqual(4, len(self.fact_dao.get_all()))
+
+    def test_pddl_parser_unknown_fluent(self):
+        parser = PddlParser()
+        with self.assertRaises(ValueError):
+            list(parser.parse_problem(io.StringIO(PROBLEM)))
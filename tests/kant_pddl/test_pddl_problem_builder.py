@@ -0,0 +1,150 @@
+import io
+import os
+import tempfile
+import unittest
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+from kant.kant_dto import (
+    TypeDto,
+    ObjectDto,
+    FluentDto,
+    FactDto
+)
+from kant.kant_pddl import PddlProblemBuilder, PddlProblemWriter
+
+
+class TestPddlProblemBuilder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MEMORY)
+
+    def setUp(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+
+        self.type_dao = dao_factory.create_type_dao()
+        self.object_dao = dao_factory.create_object_dao()
+        self.fluent_dao = dao_factory.create_fluent_dao()
+        self.fact_dao = dao_factory.create_fact_dao()
+
+        self.object_type = TypeDto("object")
+        self.robot_type = TypeDto("robot", father=self.object_type)
+        self.wp_type = TypeDto("wp")
+
+        self.robot_at = FluentDto(
+            "robot_at", [self.robot_type, self.wp_type])
+        self.battery_level = FluentDto(
+            "battery_level", [self.robot_type], is_numeric=True)
+
+        self.rb1 = ObjectDto(self.robot_type, "rb1")
+        self.wp1 = ObjectDto(self.wp_type, "wp1")
+        self.wp2 = ObjectDto(self.wp_type, "wp2")
+
+        self.battery_fact = FactDto(self.battery_level, [self.rb1],
+                                    value=100)
+        self.at_wp1_fact = FactDto(self.robot_at, [self.rb1, self.wp1])
+        self.goal_fact = FactDto(self.robot_at, [self.rb1, self.wp2],
+                                 is_goal=True)
+
+        self.fact_dao.save_many([self.battery_fact,
+                                 self.at_wp1_fact,
+                                 self.goal_fact])
+
+        self.builder = PddlProblemBuilder(batch_size=2)
+
+    def tearDown(self):
+        self.object_dao.delete_all()
+        self.fluent_dao.delete_all()
+        self.fact_dao.delete_all()
+        self.type_dao.delete_all()
+
+    def assert_written(self, problem: str) -> None:
+        stream = io.StringIO()
+        PddlProblemWriter().write(stream)
+        self.assertEqual(stream.getvalue(), problem)
+
+    def test_pddl_problem_builder_build(self):
+        self.assertEqual("(define (problem problem)\n"
+                         "(:domain domain)\n"
+                         "(:objects\n"
+                         "\trb1 - robot\n"
+                         "\twp1 wp2 - wp\n"
+                         ")\n"
+                         "(:init\n"
+                         "\t(= (battery_level rb1) 100.00)\n"
+                         "\t(robot_at rb1 wp1)\n"
+                         ")\n"
+                         "(:goal (and\n"
+                         "\t(robot_at rb1 wp2)\n"
+                         "))\n"
+                         ")\n", self.builder.build())
+
+    def test_pddl_problem_builder_cached(self):
+        problem = self.builder.build()
+        self.assertFalse(self.builder.refresh())
+        self.assertIs(problem, self.builder.build())
+
+    def test_pddl_problem_builder_names(self):
+        problem = self.builder.build("p1", "d1")
+        self.assertTrue(problem.startswith("(define (problem p1)\n"
+                                           "(:domain d1)\n"))
+
+    def test_pddl_problem_builder_updated_facts(self):
+        self.builder.build()
+        self.battery_fact.value = 50
+        self.at_wp1_fact.value = False
+        self.fact_dao.save_many([self.battery_fact, self.at_wp1_fact])
+        self.assertTrue(self.builder.refresh())
+        problem = self.builder.build()
+        self.assertIn("\t(= (battery_level rb1) 50.00)\n", problem)
+        self.assertNotIn("(robot_at rb1 wp1)", problem)
+        self.assert_written(problem)
+
+    def test_pddl_problem_builder_saved_and_deleted_facts(self):
+        self.builder.build()
+        self.fact_dao.delete(self.goal_fact)
+        self.fact_dao.save(FactDto(self.robot_at, [self.rb1, self.wp2]))
+        problem = self.builder.build()
+        self.assertIn("\t(robot_at rb1 wp2)\n)\n", problem)
+        self.assertIn("(:goal (and\n))\n", problem)
+        self.assert_written(problem)
+
+    def test_pddl_problem_builder_deleted_object(self):
+        self.builder.build()
+        self.object_dao.delete(self.wp1)
+        problem = self.builder.build()
+        self.assertNotIn("wp1", problem)
+        self.assert_written(problem)
+
+    def test_pddl_problem_builder_deleted_fluent(self):
+        self.builder.build()
+        self.fluent_dao.delete(self.battery_level)
+        problem = self.builder.build()
+        self.assertNotIn("battery_level", problem)
+        self.assert_written(problem)
+
+    def test_pddl_problem_builder_untracked_delete(self):
+        self.builder.build()
+        self.fact_dao.memory_store.deleted_facts.clear()
+        self.fact_dao.delete(self.at_wp1_fact)
+        self.fact_dao.memory_store.deleted_facts.clear()
+        problem = self.builder.build()
+        self.assertNotIn("(robot_at rb1 wp1)", problem)
+        self.assert_written(problem)
+
+    def test_pddl_problem_builder_invalidate(self):
+        problem = self.builder.build()
+        self.builder.invalidate()
+        self.assertTrue(self.builder.refresh())
+        self.assertEqual(problem, self.builder.build())
+
+    def test_pddl_problem_builder_write_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "problem.pddl")
+            self.builder.write_file(path)
+
+            with open(path) as stream:
+                self.assertEqual(self.builder.build(), stream.read())
@@ -0,0 +1,101 @@
+import io
+import os
+import tempfile
+import unittest
+from kant.kant_dao.dao_factory import (
+    DaoFactoryMethod,
+    DaoFamilies
+)
+from kant.kant_dto import (
+    TypeDto,
+    ObjectDto,
+    FluentDto,
+    FactDto
+)
+from kant.kant_pddl import PddlProblemWriter
+
+
+class TestPddlProblemWriter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        DaoFactoryMethod.clear_dao_factory()
+        DaoFactoryMethod(DaoFamilies.MEMORY)
+
+    def setUp(self):
+        dao_factory = DaoFactoryMethod.get_dao_factory()
+
+        self.type_dao = dao_factory.create_type_dao()
+        self.object_dao = dao_factory.create_object_dao()
+        self.fluent_dao = dao_factory.create_fluent_dao()
+        self.fact_dao = dao_factory.create_fact_dao()
+
+        self.object_type = TypeDto("object")
+        self.robot_type = TypeDto("robot", father=self.object_type)
+        self.wp_type = TypeDto("wp")
+
+        self.robot_at = FluentDto(
+            "robot_at", [self.robot_type, self.wp_type])
+        self.battery_level = FluentDto(
+            "battery_level", [self.robot_type], is_numeric=True)
+
+        self.rb1 = ObjectDto(self.robot_type, "rb1")
+        self.wp1 = ObjectDto(self.wp_type, "wp1")
+        self.wp2 = ObjectDto(self.wp_type, "wp2")
+
+        self.fact_dao.save_many([
+            FactDto(self.robot_at, [self.rb1, self.wp1]),
+            FactDto(self.robot_at, [self.rb1, self.wp2], value=False),
+            FactDto(self.battery_level, [self.rb1], value=100),
+            FactDto(self.robot_at, [self.rb1, self.wp2], is_goal=True),
+            FactDto(self.robot_at, [self.rb1, self.wp1], value=False,
+                    is_goal=True)])
+
+        self.writer = PddlProblemWriter(batch_size=2)
+
+    def tearDown(self):
+        self.object_dao.delete_all()
+        self.fluent_dao.delete_all()
+        self.fact_dao.delete_all()
+        self.type_dao.delete_all()
+
+    def test_pddl_problem_writer_objects(self):
+        stream = io.StringIO()
+        self.writer.write_objects(stream)
+        self.assertEqual("(:objects\n"
+                         "\trb1 - robot\n"
+                         "\twp1 wp2 - wp\n"
+                         ")\n", stream.getvalue())
+
+    def test_pddl_problem_writer_init(self):
+        stream = io.StringIO()
+        self.writer.write_init(stream)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual("(:init", lines[0])
+        self.assertEqual(["\t(= (battery_level rb1) 100.00)",
+                          "\t(robot_at rb1 wp1)"], sorted(lines[1:-1]))
+        self.assertEqual(")", lines[-1])
+
+    def test_pddl_problem_writer_goal(self):
+        stream = io.StringIO()
+        self.writer.write_goal(stream)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(["\t(not (robot_at rb1 wp1))",
+                          "\t(robot_at rb1 wp2)"], sorted(lines[1:-1]))
+        self.assertEqual("(:goal (and", lines[0])
+        self.assertEqual("))", lines[-1])
+
+    def test_pddl_problem_writer_write_file(self):
+        stream = io.StringIO()
+        self.writer.write(stream, "test_problem", "test_domain")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "problem.pddl")
+            self.writer.write_file(path, "test_problem", "test_domain")
+
+            with open(path) as problem_file:
+                self.assertEqual(stream.getvalue(), problem_file.read())
+
+        self.assertTrue(stream.getvalue().startswith(
+            "(define (problem test_problem)\n(:domain test_domain)\n"))
+        self.assertTrue(stream.getvalue().endswith("))\n)\n"))